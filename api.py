@@ -1,18 +1,434 @@
 import requests
 import os
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import parse_qsl, urlencode
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
-def make_asa_api_call(endpoint):
-    # Documentation: https://app.americansocceranalysis.com/api/v1/__docs__/#/
-    url_stub = 'https://app.americansocceranalysis.com/api/v1/'
-    request_url = '{}{}'.format(url_stub, endpoint)
-    response = requests.get(request_url)
+# Documentation: https://app.americansocceranalysis.com/api/v1/__docs__/#/
+ASA_API_URL = 'https://app.americansocceranalysis.com/api/v1/'
 
-    if response.status_code == 200:
+# Client defaults: sustained request rate and burst allowed by the token bucket,
+# requests in flight at once, and retry policy for 429 and 5xx responses.
+RATE_LIMIT_PER_SECOND = 4
+RATE_LIMIT_BURST = 4
+MAX_CONCURRENT_REQUESTS = 4
+MAX_RETRIES = 4
+BACKOFF_SECONDS = 1.0
+MAX_BACKOFF_SECONDS = 30.0
+TIMEOUT_SECONDS = 30
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Raw response cache: ASA_API_CACHE_DB overrides the file ('' disables caching) and
+# ASA_API_OFFLINE=1 replays cached responses without touching the network.
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'api_cache.db')
+# Seconds a cached response is served without asking the API again. Anything older is
+# revalidated with its ETag/Last-Modified, or re-fetched if the API sent neither.
+CURRENT_SEASON_TTL_SECONDS = 0
+REFERENCE_TTL_SECONDS = 0
+
+def get_cache_ttl(endpoint):
+    """
+    Returns how long a cached response for an endpoint stays fresh.
+
+    Closed seasons never change, so their season endpoints are kept forever. So are
+    per-game endpoints: ingestion re-fetches a game with `refresh=True` when its
+    `last_updated_utc` moves (see data/db_game_watermarks.py). Everything else, i.e.
+    the current season and reference lists such as players or teams, is revalidated.
+
+    Args:
+        endpoint (str): Endpoint relative to the API root.
+
+    Returns:
+        float | None: Seconds the response stays fresh, or None for forever.
+    """
+    params = dict(parse_qsl(str(endpoint).partition('?')[2]))
+    if 'game_id' in params:
+        return None
+    season = params.get('season_name', '')
+    if season.isdigit():
+        return None if int(season) < datetime.now().year else CURRENT_SEASON_TTL_SECONDS
+    return REFERENCE_TTL_SECONDS
+
+def make_cache_key(endpoint):
+    """
+    Builds a canonical hash of an endpoint, so query parameter order does not matter.
+
+    Args:
+        endpoint (str): Endpoint relative to the API root.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    path, _, query = str(endpoint).partition('?')
+    canonical = path.strip('/') + '?' + urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+class ResponseCache:
+    def __init__(self, db_path):
+        """
+        A thread-safe store of raw API responses in a SQLite file, keyed by
+        `make_cache_key()` and kept zlib-compressed with their ETag/Last-Modified.
+
+        Like `SimulationCache`, it lives in its own database file rather than nwsl.db,
+        so caching a response never writes to the data the site serves.
+
+        Args:
+            db_path (str): Path of the SQLite file.
+
+        Example:
+            >>> cache = ResponseCache('data/api_cache.db')
+            >>> cache.put('nwsl/teams', b'[...]', etag='"abc"')
+            >>> cache.get('nwsl/teams')['body']
+            b'[...]'
+        """
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self._create_table()
+
+    def get(self, endpoint):
+        """
+        Returns the cached response for an endpoint, or None.
+
+        Returns:
+            dict | None: "body" (bytes), "fetched_at" (float), "etag" and "last_modified" (str | None).
+        """
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute('''
+            SELECT body, fetched_at, etag, last_modified FROM api_responses WHERE cache_key = ?
+        ''', (make_cache_key(endpoint),)).fetchone()
+        conn.close()
+        if row is None:
+            return None
+        return {'body': zlib.decompress(row[0]), 'fetched_at': row[1], 'etag': row[2], 'last_modified': row[3]}
+
+    def put(self, endpoint, body, etag=None, last_modified=None):
+        """Stores a successful response body (bytes) with its validators."""
+        with self.lock:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('''
+                INSERT OR REPLACE INTO api_responses (cache_key, endpoint, fetched_at, etag, last_modified, body)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (make_cache_key(endpoint), str(endpoint), time.time(), etag, last_modified, zlib.compress(body)))
+            conn.commit()
+            conn.close()
+
+    def touch(self, endpoint):
+        """Marks a cached response as fresh again, e.g. after a 304 Not Modified."""
+        with self.lock:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('UPDATE api_responses SET fetched_at = ? WHERE cache_key = ?',
+                         (time.time(), make_cache_key(endpoint)))
+            conn.commit()
+            conn.close()
+
+    def clear(self):
+        """Removes every cached response."""
+        with self.lock:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('DELETE FROM api_responses')
+            conn.commit()
+            conn.close()
+
+    def _create_table(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS api_responses (
+            cache_key TEXT PRIMARY KEY,
+            endpoint TEXT,
+            fetched_at REAL,
+            etag TEXT,
+            last_modified TEXT,
+            body BLOB
+        )
+        ''')
+        conn.commit()
+        conn.close()
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        """
+        Thread-safe token bucket: `acquire()` blocks until a token is available.
+
+        Tokens refill continuously at `rate` per second up to `capacity`, so
+        callers can burst up to `capacity` requests and then settle at `rate`.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (int): Maximum tokens held, i.e. the burst size.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Takes one token, sleeping until one is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class AsaApiClient:
+    def __init__(self, base_url=ASA_API_URL, rate=RATE_LIMIT_PER_SECOND, burst=RATE_LIMIT_BURST,
+                 max_workers=MAX_CONCURRENT_REQUESTS, max_retries=MAX_RETRIES, backoff=BACKOFF_SECONDS,
+                 timeout=TIMEOUT_SECONDS, cache=None, offline=False):
+        """
+        Client for the American Soccer Analysis API that reuses connections,
+        rate-limits itself and retries transient failures.
+
+        All requests go through one `requests.Session` whose connection pool is
+        sized for `max_workers`, so keep-alive connections are shared. Every
+        attempt, retries included, first takes a token from the bucket. 429 and
+        5xx responses and connection errors are retried with exponential
+        backoff, honouring a 429's Retry-After header.
+
+        With a `cache`, successful responses are stored raw and served again while
+        fresh (see `get_cache_ttl()`); stale ones are revalidated with a conditional
+        request. With `offline`, only the cache is used.
+
+        Args:
+            base_url (str, optional): API root, e.g. a local stub server in tests. Defaults to ASA_API_URL.
+            rate (float, optional): Sustained requests per second. Defaults to RATE_LIMIT_PER_SECOND.
+            burst (int, optional): Requests allowed back to back. Defaults to RATE_LIMIT_BURST.
+            max_workers (int, optional): Requests in flight at once, across every thread using the client
+                (e.g. parallel pipeline steps each calling `get_many()`). Defaults to MAX_CONCURRENT_REQUESTS.
+            max_retries (int, optional): Retries after the first attempt. Defaults to MAX_RETRIES.
+            backoff (float, optional): First retry delay in seconds, doubled per retry. Defaults to BACKOFF_SECONDS.
+            timeout (float, optional): Per-attempt timeout in seconds. Defaults to TIMEOUT_SECONDS.
+            cache (ResponseCache, optional): Raw response store. Defaults to None (no caching).
+            offline (bool, optional): Serve every request from `cache`, whatever its age. Defaults to False.
+
+        Example:
+            >>> client = AsaApiClient()
+            >>> status, players = client.get('nwsl/players')
+            >>> results = client.get_many([f'nwsl/games/shots?game_id={game_id}' for game_id in game_ids])
+        """
+        self.base_url = base_url
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.cache = cache
+        self.offline = offline
+        self.bucket = TokenBucket(rate, burst)
+        self.slots = threading.BoundedSemaphore(max_workers)
+        self.session = requests.Session()
+        self.session.mount(base_url, HTTPAdapter(pool_connections=1, pool_maxsize=max_workers))
+        self.stats_lock = threading.Lock()
+        self.stats = defaultdict(lambda: {'calls': 0, 'cache_hits': 0, 'attempts': 0, 'errors': 0, 'latencies': []})
+
+    def get(self, endpoint, refresh=False):
+        """
+        Fetches one endpoint, from the cache when fresh, retrying transient failures.
+
+        Args:
+            endpoint (str): Path and query relative to `base_url`, e.g. 'nwsl/players'.
+            refresh (bool, optional): Revalidate a cached response even if it is still
+                fresh, e.g. for a game known to have changed. Defaults to False.
+
+        Returns:
+            list: [status_code (int), parsed JSON body]. The last response is returned
+                  if retries run out on a 429/5xx.
+
+        Raises:
+            requests.RequestException: If the final attempt fails to connect or times out.
+            LookupError: If the client is offline and the endpoint is not cached.
+        """
+        key = str(endpoint).split('?')[0]
+        cached = self.cache.get(endpoint) if self.cache is not None else None
+        if cached is not None and (self.offline or (not refresh and self._is_fresh(endpoint, cached))):
+            self._record_hit(key)
+            return [200, json.loads(cached['body'])]
+        if self.offline:
+            raise LookupError(f'{endpoint} is not in the API response cache.')
+
+        headers = {}
+        if cached is not None and cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached is not None and cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+        response = self._send(endpoint, key, headers)
+
+        if response.status_code == 304 and cached is not None:
+            self.cache.touch(endpoint)
+            return [200, json.loads(cached['body'])]
+        if response.status_code == 200 and self.cache is not None:
+            self.cache.put(endpoint, response.content, response.headers.get('ETag'),
+                           response.headers.get('Last-Modified'))
+        return [response.status_code, response.json()]
+
+    def get_many(self, endpoints, refresh=False):
+        """
+        Fetches several endpoints concurrently, at most `max_workers` at a time.
+
+        Args:
+            endpoints (Iterable[str]): Endpoints as accepted by `get()`.
+            refresh (bool, optional): Passed to `get()`. Defaults to False.
+
+        Returns:
+            list[list]: One [status_code, body] per endpoint, in input order.
+        """
+        endpoints = list(endpoints)
+        if len(endpoints) <= 1:
+            return [self.get(endpoint, refresh) for endpoint in endpoints]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda endpoint: self.get(endpoint, refresh), endpoints))
+
+    def get_stats(self):
+        """
+        Returns request latency and error counts per endpoint path (query string removed).
+
+        Returns:
+            dict: Per endpoint path:
+                - calls (int): `get()` calls completed.
+                - cache_hits (int): Calls served from the response cache without a request.
+                - attempts (int): HTTP attempts, retries included.
+                - errors (int): Attempts that failed or returned a status other than 200/304.
+                - mean_ms, p95_ms, max_ms (float): Attempt latency, 0 if every call was a cache hit.
+        """
+        with self.stats_lock:
+            stats = {}
+            for key, entry in self.stats.items():
+                latencies = sorted(entry['latencies']) or [0.0]
+                stats[key] = {
+                    'calls': entry['calls'],
+                    'cache_hits': entry['cache_hits'],
+                    'attempts': entry['attempts'],
+                    'errors': entry['errors'],
+                    'mean_ms': round(sum(latencies) / len(latencies) * 1000, 1),
+                    'p95_ms': round(latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] * 1000, 1),
+                    'max_ms': round(latencies[-1] * 1000, 1)
+                }
+            return stats
+
+    def print_stats(self):
+        """Prints `get_stats()` as a table, e.g. at the end of setup.py or update.py."""
+        print(f'\n{"endpoint":<32} {"calls":>6} {"cached":>7} {"attempts":>9} {"errors":>7} {"mean ms":>8} {"p95 ms":>8} {"max ms":>8}')
+        for key, entry in sorted(self.get_stats().items()):
+            print(f'{key:<32} {entry["calls"]:>6} {entry["cache_hits"]:>7} {entry["attempts"]:>9} {entry["errors"]:>7} '
+                  f'{entry["mean_ms"]:>8.1f} {entry["p95_ms"]:>8.1f} {entry["max_ms"]:>8.1f}')
+
+    def close(self):
+        """Closes the pooled connections."""
+        self.session.close()
+
+    def _send(self, endpoint, key, headers):
+        request_url = '{}{}'.format(self.base_url, endpoint)
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            try:
+                with self.slots:
+                    start = time.perf_counter()
+                    response = self.session.get(request_url, headers=headers, timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout):
+                self._record(key, start, error=True, final=attempt == self.max_retries)
+                if attempt == self.max_retries:
+                    raise
+                delay = self._get_delay(attempt, None)
+            else:
+                retry = response.status_code in RETRY_STATUSES and attempt < self.max_retries
+                self._record(key, start, error=response.status_code not in (200, 304), final=not retry)
+                if not retry:
+                    return response
+                delay = self._get_delay(attempt, response)
+                print(f'Response {response.status_code} from {endpoint}, retrying in {delay:.1f}s...')
+            attempt += 1
+            time.sleep(delay)
+
+    def _is_fresh(self, endpoint, cached):
+        ttl = get_cache_ttl(endpoint)
+        return ttl is None or time.time() - cached['fetched_at'] < ttl
+
+    def _get_delay(self, attempt, response):
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), MAX_BACKOFF_SECONDS)
+            except ValueError:
+                pass
+        return min(self.backoff * 2 ** attempt, MAX_BACKOFF_SECONDS)
+
+    def _record(self, key, start, error, final):
+        elapsed = time.perf_counter() - start
+        with self.stats_lock:
+            entry = self.stats[key]
+            entry['attempts'] += 1
+            entry['errors'] += int(error)
+            entry['calls'] += int(final)
+            entry['latencies'].append(elapsed)
+
+    def _record_hit(self, key):
+        with self.stats_lock:
+            entry = self.stats[key]
+            entry['calls'] += 1
+            entry['cache_hits'] += 1
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """
+    Returns the process-wide AsaApiClient, creating it on first use.
+
+    It caches raw responses in ASA_API_CACHE_DB (default data/api_cache.db; set it to
+    an empty string to disable caching) and replays them without network access when
+    ASA_API_OFFLINE=1.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            cache_path = os.environ.get('ASA_API_CACHE_DB', DEFAULT_CACHE_PATH)
+            _client = AsaApiClient(cache=ResponseCache(cache_path) if cache_path else None,
+                                   offline=os.environ.get('ASA_API_OFFLINE') == '1')
+        return _client
+
+def make_asa_api_call(endpoint, refresh=False):
+    client = get_client()
+    request_url = '{}{}'.format(client.base_url, endpoint)
+    response = client.get(endpoint, refresh)
+
+    if response[0] == 200:
         print('API Call Successful.')
     else:
         print('There was an error during the API call.')
-        print('Response:', response.status_code)
+        print('Response:', response[0])
     print('Endpoint:', endpoint)
     print('Request url:', request_url)
-    return [response.status_code, response.json()]
+    return response
+
+def make_asa_api_calls(endpoints, refresh=False):
+    """
+    Fetches several endpoints concurrently through the shared client.
+
+    Args:
+        endpoints (Iterable[str]): Endpoints relative to the API root.
+        refresh (bool, optional): Revalidate cached responses even if still fresh. Defaults to False.
+
+    Returns:
+        list[list]: One [status_code, parsed JSON body] per endpoint, in input order.
+    """
+    endpoints = list(endpoints)
+    responses = get_client().get_many(endpoints, refresh)
+    failed = [endpoint for endpoint, response in zip(endpoints, responses) if response[0] != 200]
+    print(f'{len(endpoints) - len(failed)}/{len(endpoints)} API calls successful.')
+    for endpoint in failed:
+        print('There was an error during the API call for endpoint:', endpoint)
+    return responses
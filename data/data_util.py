@@ -1,5 +1,9 @@
 from collections import defaultdict
+import hashlib
 import os
+import sqlite3
+import threading
+import time
 from datetime import datetime
 import pytz
 
@@ -7,6 +11,20 @@ import pytz
 MINIMUM_MINUTES = 270 # ~3 full games
 ALL_SEASONS = [2025, 2024, 2023, 2022, 2021, 2020, 2019, 2018, 2017, 2016]
 
+# Read connection pool: idle connections kept per database file, and the
+# PRAGMAs applied to every pooled reader (256 MB memory map, 16 MB page cache).
+MAX_IDLE_READ_CONNECTIONS = 8
+READ_PRAGMAS = [
+    'PRAGMA mmap_size = 268435456',
+    'PRAGMA cache_size = -16000',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA query_only = ON'
+]
+WRITE_PRAGMAS = [
+    'PRAGMA synchronous = NORMAL',
+    'PRAGMA busy_timeout = 5000'
+]
+
 def aggregate_position_data(filtered_players, stats_to_track):
     """
     Calculate averages, minimums, and maximums for players grouped by position.
@@ -63,12 +81,388 @@ def get_db_path():
 
     Returns:
         str: The full absolute path to the 'nwsl.db' file located in the same
-             directory as this script.
+             directory as this script, or the path in the NWSL_DB_PATH environment
+             variable when it is set.
     """
+    if os.environ.get('NWSL_DB_PATH'):
+        return os.path.abspath(os.environ['NWSL_DB_PATH'])
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     db_path = os.path.join(BASE_DIR, 'nwsl.db')
     return db_path
 
+class PooledConnection:
+    def __init__(self, pool, connection):
+        """
+        A pooled read connection handed out by `get_read_connection()`.
+
+        It behaves like the `sqlite3.Connection` the getters used to open:
+        `row_factory` can be set on it, and `close()` ends its use. The row
+        factory applies only to cursors created through this handle, so callers
+        sharing the underlying connection never see each other's setting, and
+        `close()` returns the connection to the pool instead of closing it.
+
+        Args:
+            pool (ConnectionPool): The pool the connection belongs to.
+            connection (sqlite3.Connection): The underlying read-only connection.
+
+        Example:
+            >>> conn = get_read_connection()
+            >>> conn.row_factory = sqlite3.Row
+            >>> conn.cursor().execute('SELECT * FROM team_info').fetchall()
+            >>> conn.close()
+        """
+        self.pool = pool
+        self.connection = connection
+        self.row_factory = None
+
+    def cursor(self):
+        """Returns a cursor on the pooled connection using this handle's row factory."""
+        if self.connection is None:
+            raise sqlite3.ProgrammingError('Cannot operate on a closed database.')
+        cursor = self.connection.cursor()
+        cursor.row_factory = self.row_factory
+        return cursor
+
+    def execute(self, sql, parameters=()):
+        """Executes a statement on a new cursor, like `sqlite3.Connection.execute()`."""
+        return self.cursor().execute(sql, parameters)
+
+    def commit(self):
+        """Does nothing: pooled connections are read-only, so there is never anything to commit."""
+
+    def close(self):
+        """Returns the connection to its pool. Further use of this handle raises."""
+        if self.connection is not None:
+            self.pool.release(self.connection)
+            self.connection = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class ConnectionPool:
+    def __init__(self, db_path, max_idle=MAX_IDLE_READ_CONNECTIONS):
+        """
+        A thread-safe pool of read-only connections to one SQLite file.
+
+        Connections are opened on demand with `READ_PRAGMAS` applied and kept
+        for reuse once released, up to `max_idle` of them. Each connection is
+        used by one thread at a time. If the database file is replaced (a
+        different inode), idle connections to the old file are discarded.
+
+        Args:
+            db_path (str): Path of the SQLite file.
+            max_idle (int, optional): Idle connections to keep. Defaults to 8.
+
+        Attributes:
+            opened (int): Connections opened over the pool's lifetime.
+            acquired (int): Times a connection was handed out.
+        """
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self.idle = []
+        self.file_id = None
+        self.opened = 0
+        self.acquired = 0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Returns an idle connection, or opens a new one."""
+        file_id = _get_file_id(self.db_path)
+        with self.lock:
+            if file_id != self.file_id:
+                stale, self.idle = self.idle, []
+                self.file_id = file_id
+            else:
+                stale = []
+            connection = self.idle.pop() if self.idle else None
+            self.acquired += 1
+        for old in stale:
+            old.close()
+        if connection is None:
+            connection = self._open()
+        return connection
+
+    def release(self, connection):
+        """Takes a connection back, closing it if the pool already holds `max_idle`."""
+        if connection.in_transaction:
+            connection.rollback()
+        with self.lock:
+            if len(self.idle) < self.max_idle and _get_file_id(self.db_path) == self.file_id:
+                self.idle.append(connection)
+                return
+        connection.close()
+
+    def close_all(self):
+        """Closes every idle connection."""
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for connection in idle:
+            connection.close()
+
+    def _open(self):
+        connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        _enable_wal(connection)
+        for pragma in READ_PRAGMAS:
+            connection.execute(pragma)
+        with self.lock:
+            self.opened += 1
+        return connection
+
+_read_pools = {}
+_read_pools_lock = threading.Lock()
+
+# Per-table totals accumulated by write_rows()
+_write_stats = defaultdict(lambda: {'rows': 0, 'batches': 0, 'seconds': 0.0})
+_write_stats_lock = threading.Lock()
+
+def get_read_pool(db_path=None):
+    """
+    Returns the read connection pool for a database file, creating it on first use.
+
+    Args:
+        db_path (str, optional): Path of the SQLite file. Defaults to `get_db_path()`.
+
+    Returns:
+        ConnectionPool: The pool for that file.
+    """
+    db_path = db_path or get_db_path()
+    with _read_pools_lock:
+        pool = _read_pools.get(db_path)
+        if pool is None:
+            pool = _read_pools[db_path] = ConnectionPool(db_path)
+    return pool
+
+def get_read_connection(db_path=None):
+    """
+    Returns a read-only connection to the database from the shared pool.
+
+    Use it exactly like a fresh `sqlite3.connect(get_db_path())`: set
+    `row_factory` if needed, query through `cursor()` or `execute()`, and call
+    `close()` when done, which returns the connection to the pool.
+
+    Args:
+        db_path (str, optional): Path of the SQLite file. Defaults to `get_db_path()`.
+
+    Returns:
+        PooledConnection: A handle to a pooled connection with `READ_PRAGMAS` applied.
+    """
+    pool = get_read_pool(db_path)
+    return PooledConnection(pool, pool.acquire())
+
+def get_write_connection(db_path=None):
+    """
+    Opens a dedicated connection for inserts, deletes and schema changes.
+
+    Writers never share the read pool: each call opens its own connection in
+    WAL mode with `WRITE_PRAGMAS` applied, so readers keep serving pages while
+    a writer holds its transaction. Close it when done.
+
+    Args:
+        db_path (str, optional): Path of the SQLite file. Defaults to `get_db_path()`.
+
+    Returns:
+        sqlite3.Connection: The writable connection.
+    """
+    connection = sqlite3.connect(db_path or get_db_path())
+    _enable_wal(connection)
+    for pragma in WRITE_PRAGMAS:
+        connection.execute(pragma)
+    return connection
+
+def write_rows(table, statement, rows, conn=None):
+    """
+    Writes a batch of rows with one `executemany` inside one explicit transaction.
+
+    Ingestion maps each API payload to a list of tuples and hands it here, so a
+    table's rows for a season cost one commit instead of one per row. If `conn`
+    already has an open transaction (e.g. a DELETE of the rows being replaced),
+    the rows join it and the commit covers both. Throughput is printed and
+    accumulated per table for `get_write_stats()`.
+
+    Args:
+        table (str): Table name, used for reporting.
+        statement (str): Parameterised INSERT/REPLACE statement.
+        rows (Iterable[tuple]): Parameters for each row.
+        conn (sqlite3.Connection, optional): Open write connection. Defaults to a new
+            connection from `get_write_connection()`, which is closed afterwards.
+
+    Returns:
+        int: Number of rows written.
+
+    Example:
+        >>> write_rows('team_info', 'INSERT OR REPLACE INTO team_info VALUES (?, ?, ?, ?)', rows)
+        14 rows written to team_info in 0.002s (7,000 rows/s).
+        14
+    """
+    rows = list(rows)
+    own_conn = conn is None
+    if own_conn:
+        conn = get_write_connection()
+    start = time.perf_counter()
+    try:
+        if not conn.in_transaction:
+            conn.execute('BEGIN')
+        conn.executemany(statement, rows)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        if own_conn:
+            conn.close()
+    elapsed = time.perf_counter() - start
+
+    with _write_stats_lock:
+        stats = _write_stats[table]
+        stats['rows'] += len(rows)
+        stats['seconds'] += elapsed
+        stats['batches'] += 1
+    print(f'{len(rows)} rows written to {table} in {elapsed:.3f}s ({_get_rate(len(rows), elapsed):,.0f} rows/s).')
+    return len(rows)
+
+def get_write_stats():
+    """
+    Returns the rows written per table by `write_rows()` since the last reset.
+
+    Returns:
+        dict: Per table name:
+            - rows (int): Rows written.
+            - batches (int): `write_rows()` calls.
+            - seconds (float): Time spent writing.
+            - rows_per_second (float): rows / seconds.
+    """
+    with _write_stats_lock:
+        return {table: dict(stats, rows_per_second=_get_rate(stats['rows'], stats['seconds']))
+                for table, stats in _write_stats.items()}
+
+def reset_write_stats():
+    """Clears the per-table totals reported by `get_write_stats()`."""
+    with _write_stats_lock:
+        _write_stats.clear()
+
+def print_write_stats():
+    """Prints the per-table write totals, e.g. at the end of setup.py or update.py."""
+    stats = get_write_stats()
+    print(f'\n{"table":<28} {"rows":>9} {"batches":>8} {"seconds":>9} {"rows/s":>11}')
+    for table, table_stats in sorted(stats.items()):
+        print(f'{table:<28} {table_stats["rows"]:>9,} {table_stats["batches"]:>8} '
+              f'{table_stats["seconds"]:>9.3f} {table_stats["rows_per_second"]:>11,.0f}')
+
+def _get_rate(rows, seconds):
+    return rows / seconds if seconds > 0 else 0.0
+
+def close_read_connections():
+    """Closes every idle pooled read connection, e.g. before replacing the database file."""
+    with _read_pools_lock:
+        pools = list(_read_pools.values())
+    for pool in pools:
+        pool.close_all()
+
+def _enable_wal(connection):
+    # Switching journal mode writes to the file header, which a read-only file refuses
+    try:
+        connection.execute('PRAGMA journal_mode = WAL')
+    except sqlite3.OperationalError:
+        pass
+
+def _get_file_id(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_dev, stat.st_ino)
+
+def get_data_generation():
+    """
+    Returns the data generation counter, which the ingestion pipeline bumps once
+    per run (see `bump_data_generation()`).
+
+    Every in-process cache of database contents (page_cache.py, figure_cache.py,
+    shot stores, simulation contexts and cached simulations) is keyed by it. It
+    does not move with each write during a run, or with writes that leave the
+    data alone (migrations, checkpoints), so caches are rebuilt once per update.
+
+    Returns:
+        int: The current generation, 0 for a database that has never been updated
+             or has not been migrated to include the counter yet.
+    """
+    row = _get_data_generation_row()
+    return row[0] if row else 0
+
+def get_data_updated_at():
+    """
+    Returns when the data generation was last bumped.
+
+    Returns:
+        datetime | None: UTC time of the last bump, or None if there has been none.
+    """
+    row = _get_data_generation_row()
+    return datetime.fromisoformat(row[1]) if row else None
+
+def get_tables_checksum(tables):
+    """
+    Returns a digest of the rows in some tables, independent of row order.
+
+    Lets a step that rewrites a whole table (e.g. INSERT OR REPLACE of every
+    player) tell whether its contents actually changed.
+
+    Args:
+        tables (Iterable[str]): Table names.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    conn = get_read_connection()
+    try:
+        for table in tables:
+            digest.update(table.encode())
+            # Replaced rows get new rowids, so sort rather than rely on rowid order
+            for row in sorted(repr(tuple(row)) for row in conn.execute(f'SELECT * FROM {table}')):
+                digest.update(row.encode())
+    finally:
+        conn.close()
+    return digest.hexdigest()
+
+def _get_data_generation_row():
+    conn = get_read_connection()
+    try:
+        return conn.execute('SELECT generation, updated_at FROM data_generation WHERE id = 1').fetchone()
+    except sqlite3.OperationalError as e:
+        # A database older than the migration that adds the counter: serve it rather than fail every page
+        if 'no such table' in str(e):
+            return None
+        raise
+    finally:
+        conn.close()
+
+def bump_data_generation():
+    """
+    Increments the data generation counter, invalidating everything cached against it.
+
+    Returns:
+        int: The new generation.
+    """
+    conn = get_write_connection()
+    try:
+        conn.execute('BEGIN')
+        conn.execute('''
+            INSERT INTO data_generation (id, generation, updated_at) VALUES (1, 1, ?)
+            ON CONFLICT (id) DO UPDATE SET generation = generation + 1, updated_at = excluded.updated_at
+        ''', (datetime.now(pytz.utc).isoformat(timespec='seconds'),))
+        generation = conn.execute('SELECT generation FROM data_generation WHERE id = 1').fetchone()[0]
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    print(f'Data generation is now {generation}.')
+    return generation
+
 def validate_id(id):
     """
     Validates that a game ID is a non-empty string.
@@ -1,9 +1,8 @@
-from .data_util import get_db_path, MINIMUM_MINUTES
+from .data_util import MINIMUM_MINUTES, get_write_connection
 from .db_player_xgoals import get_top_player_xgoals_stat
 from .db_player_goals_added import get_all_players_goals_added_by_season
 from .db_game_shots import get_shots_by_type
 from .data_util import get_range, normalize, get_range, verify_minimum_minutes
-import sqlite3
 
 def update_attacker_strength(season):
     """
@@ -62,7 +61,7 @@ def update_attacker_strength(season):
     min_drib, max_drib = get_range(qualified, 'dribbling_ga')
 
     # Open database connection
-    conn = sqlite3.connect(get_db_path())
+    conn = get_write_connection()
     cursor = conn.cursor()
 
     # Calculate strength score for each qualified attacker
@@ -1,10 +1,9 @@
-from .data_util import get_db_path, MINIMUM_MINUTES
+from .data_util import MINIMUM_MINUTES, get_write_connection
 from .db_player_xgoals import get_top_player_xgoals_stat
 from .db_player_xpass import get_all_player_xpass
 from .db_player_goals_added import get_all_players_goals_added_by_season
 from .db_game_shots import get_shots_by_type
 from .data_util import get_range, normalize, verify_minimum_minutes
-import sqlite3
 
 def update_defender_strength(season):
     """
@@ -75,7 +74,7 @@ def update_defender_strength(season):
     min_pga, max_pga = get_range(qualified, 'passing_ga')
 
     # Step 7: Connect to the database
-    conn = sqlite3.connect(get_db_path())
+    conn = get_write_connection()
     cursor = conn.cursor()
 
     # Step 8: Calculate normalized strength and update each qualified defender
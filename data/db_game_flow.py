@@ -1,9 +1,17 @@
-from api import make_asa_api_call
-from .data_util import get_db_path, validate_id
+from api import make_asa_api_call, make_asa_api_calls
+from .data_util import validate_id, get_read_connection, get_write_connection, write_rows
 import sqlite3
 from datetime import datetime
 import pytz
 
+INSERT_GAME_FLOW_SQL = '''
+    INSERT OR REPLACE INTO game_flow (
+        game_id, period_id, expanded_minute, 
+        home_team_id, home_team_value, 
+        away_team_id, away_team_value
+    ) VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
 def insert_flow_by_game_id(game_id): # pragma: no cover
     """
     Inserts game flow data into the local SQLite database for a specific game.
@@ -19,8 +27,60 @@ def insert_flow_by_game_id(game_id): # pragma: no cover
     print('Inserting game flow for game ID:', game_id)
     api_string = 'nwsl/games/game-flow?game_id={}'.format(str(game_id))
     game_flow_data = make_asa_api_call(api_string)[1]
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
+    write_rows('game_flow', INSERT_GAME_FLOW_SQL, _get_game_flow_rows(game_flow_data))
+
+def insert_flow_by_game_ids(game_ids, refresh=False): # pragma: no cover
+    """
+    Fetches game flow data for several games (e.g. a season) concurrently and writes it in one transaction.
+
+    Args:
+        game_ids (Iterable[str]): Games to fetch flow data for.
+        refresh (bool, optional): Revalidate cached API responses (see `api.get_cache_ttl()`);
+            needed unless the games are from a closed season. Defaults to False.
+
+    Returns:
+        int: Number of flow rows written.
+    """
+    return write_rows('game_flow', INSERT_GAME_FLOW_SQL, _fetch_game_flow_rows(game_ids, refresh))
+
+def replace_flow_by_game_ids(game_ids): # pragma: no cover
+    """
+    Re-fetches game flow data for some games and swaps it in, in one transaction.
+
+    Used by incremental updates, so flow points the API no longer returns for a
+    changed game do not linger.
+
+    Args:
+        game_ids (Iterable[str]): Games whose flow data changed.
+
+    Returns:
+        int: Number of flow rows written.
+    """
+    game_ids = list(game_ids)
+    rows = _fetch_game_flow_rows(game_ids, refresh=True)
+
+    conn = get_write_connection()
+    try:
+        conn.execute('BEGIN')
+        conn.executemany('DELETE FROM game_flow WHERE game_id = ?', [(game_id,) for game_id in game_ids])
+        return write_rows('game_flow', INSERT_GAME_FLOW_SQL, rows, conn=conn)
+    finally:
+        conn.close()
+
+def _fetch_game_flow_rows(game_ids, refresh):
+    game_ids = list(game_ids)
+    for game_id in game_ids:
+        validate_id(game_id)
+    print(f'Fetching game flow for {len(game_ids)} games...')
+    responses = make_asa_api_calls(('nwsl/games/game-flow?game_id={}'.format(str(game_id)) for game_id in game_ids), refresh)
+    rows = []
+    for _, game_flow_data in responses:
+        rows.extend(_get_game_flow_rows(game_flow_data))
+    return rows
+
+def _get_game_flow_rows(game_flow_data):
+    # Maps an ASA game flow payload to INSERT_GAME_FLOW_SQL parameters
+    rows = []
     for flow in game_flow_data:
         game_id = flow.get('game_id', 'Unknown Game ID')
         period_id = flow.get('period_id', 0)
@@ -30,20 +90,12 @@ def insert_flow_by_game_id(game_id): # pragma: no cover
         away_team_id = flow.get('away_team_id', 'Unknown Away Team ID')
         away_team_value = flow.get('away_team_value', 0.0)
 
-        cursor.execute('''
-        INSERT OR REPLACE INTO game_flow (
-            game_id, period_id, expanded_minute, 
-            home_team_id, home_team_value, 
-            away_team_id, away_team_value
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        rows.append((
             game_id, period_id, expanded_minute, 
             home_team_id, home_team_value, 
             away_team_id, away_team_value
         ))
-        conn.commit()
-    cursor.close()
-    conn.close()
+    return rows
 
 def get_game_flow_by_game_id(game_id):
     """
@@ -59,8 +111,7 @@ def get_game_flow_by_game_id(game_id):
     """
     validate_id(game_id)
     print('Fetching game flow for game ID:', game_id)
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = '''
@@ -87,5 +138,6 @@ def get_game_flow_by_game_id(game_id):
     rows = cursor.fetchall()
     conn.commit()
     cursor.close()
+    conn.close()
     print('Game flow fetched for game ID:', game_id)
     return rows
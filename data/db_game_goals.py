@@ -1,7 +1,14 @@
-from .data_util import get_db_path, validate_id
+from .data_util import validate_id, validate_season, get_read_connection, get_write_connection, write_rows
 import sqlite3
 from .db_game_shots import get_shots_by_game_id
 
+INSERT_GAME_GOAL_SQL = '''
+    INSERT OR IGNORE INTO game_goals (
+        game_id, shooter_player_id, assist_player_id, 
+        team_id, expanded_minute, pattern_of_play
+    ) VALUES (?, ?, ?, ?, ?, ?)
+'''
+
 def insert_game_goals_by_game_id(game_id): # pragma: no cover
     """
     Inserts goal-related shot data into the game_goals table for a specific game.
@@ -21,29 +28,35 @@ def insert_game_goals_by_game_id(game_id): # pragma: no cover
         print(f"No shot data found for game {game_id}")
         return
 
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
+    rows = [(
+        game_id, shot["shooter_player_id"], shot["assist_player_id"],
+        shot["team_id"], shot["expanded_minute"], shot["pattern_of_play"]
+    ) for shot in game_shot_data if shot["goal"] == 1]
+    write_rows('game_goals', INSERT_GAME_GOAL_SQL, rows)
+
+def insert_game_goals_by_season(season): # pragma: no cover
+    """
+    Inserts the goals among a season's stored shots into the game_goals table in one transaction.
 
-    for shot in game_shot_data:
-        if shot["goal"] == 1:
-            shooter_id = shot["shooter_player_id"]
-            assist_id = shot["assist_player_id"]
-            team_id = shot["team_id"]
-            expanded_minute = shot["expanded_minute"]
-            pattern_of_play = shot["pattern_of_play"]
+    Run after the season's shots are loaded (see `insert_game_shots_by_season()`).
 
-            cursor.execute('''
-                INSERT OR IGNORE INTO game_goals (
-                    game_id, shooter_player_id, assist_player_id, 
-                    team_id, expanded_minute, pattern_of_play
-                ) VALUES (?, ?, ?, ?, ?, ?)
-            ''', (
-                game_id, shooter_id, assist_id, 
-                team_id, expanded_minute, pattern_of_play
-            ))
-            conn.commit()
-    cursor.close()
+    Args:
+        season (int): The season whose goals should be inserted.
+
+    Returns:
+        int: Number of goal rows written.
+    """
+    validate_season(season)
+    print(f"Inserting goal shots for season {season}")
+    conn = get_read_connection()
+    rows = conn.execute('''
+        SELECT game_id, shooter_player_id, assist_player_id,
+               team_id, expanded_minute, pattern_of_play
+        FROM game_shots
+        WHERE season = ? AND goal = 1
+    ''', (season,)).fetchall()
     conn.close()
+    return write_rows('game_goals', INSERT_GAME_GOAL_SQL, rows)
 
 def get_goals_by_game_id(game_id):
     """
@@ -59,8 +72,7 @@ def get_goals_by_game_id(game_id):
     """
     validate_id(game_id)
     print('Fetching goal records for game id:', game_id)
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     cursor.execute('''
@@ -72,3 +84,36 @@ def get_goals_by_game_id(game_id):
     conn.close()
     print(f'{len(rows)} goal(s) returned.')
     return rows
+
+def replace_game_goals_by_game_ids(game_ids): # pragma: no cover
+    """
+    Rebuilds the game_goals rows of some games from their stored shots, in one transaction.
+
+    Run after the games' shots are replaced (see `replace_game_shots_by_game_ids()`),
+    so a corrected or disallowed goal does not linger.
+
+    Args:
+        game_ids (Iterable[str]): Games whose shots changed.
+
+    Returns:
+        int: Number of goal rows written.
+    """
+    game_ids = list(game_ids)
+    for game_id in game_ids:
+        validate_id(game_id)
+    print(f"Replacing goal shots for {len(game_ids)} games")
+    conn = get_write_connection()
+    try:
+        rows = []
+        for game_id in game_ids:
+            rows.extend(conn.execute('''
+                SELECT game_id, shooter_player_id, assist_player_id,
+                       team_id, expanded_minute, pattern_of_play
+                FROM game_shots
+                WHERE game_id = ? AND goal = 1
+            ''', (game_id,)).fetchall())
+        conn.execute('BEGIN')
+        conn.executemany('DELETE FROM game_goals WHERE game_id = ?', [(game_id,) for game_id in game_ids])
+        return write_rows('game_goals', INSERT_GAME_GOAL_SQL, rows, conn=conn)
+    finally:
+        conn.close()
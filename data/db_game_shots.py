@@ -1,7 +1,42 @@
-from api import make_asa_api_call
-from .data_util import get_db_path, validate_id, validate_season
+from api import make_asa_api_call, make_asa_api_calls
+from .data_util import validate_id, validate_season, get_read_connection, get_write_connection, write_rows
+from .shot_store import get_shot_store
+from .db_team_season_summary import get_team_season_summary
 import sqlite3
 
+INSERT_GAME_SHOT_SQL = '''
+    INSERT OR REPLACE INTO game_shots (
+        game_id,
+        period_id,
+        expanded_minute,
+        game_minute,
+        team_id,
+        shooter_player_id,
+        assist_player_id,
+        shot_location_x,
+        shot_location_y,
+        shot_end_location_x,
+        shot_end_location_y,
+        distance_from_goal,
+        distance_from_goal_yds,
+        blocked,
+        blocked_x,
+        blocked_y,
+        goal,
+        own_goal,
+        home_score,
+        away_score,
+        shot_xg,
+        shot_psxg,
+        head,
+        assist_through_ball,
+        assist_cross,
+        pattern_of_play,
+        shot_order,
+        season
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
 def insert_all_game_shots(game_id, season): # pragma: no cover
     """
     Inserts shot-level data into the game_shots table for a specific game and season.
@@ -17,9 +52,79 @@ def insert_all_game_shots(game_id, season): # pragma: no cover
     validate_season(season)
     print(f'Attempting to insert all shots for game {game_id}, season: {season}...')
     shots_data = make_asa_api_call(f'nwsl/games/shots?game_id={game_id}')[1]
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
+    write_rows('game_shots', INSERT_GAME_SHOT_SQL, _get_game_shot_rows(shots_data, season))
+    print(f'All shots for game {game_id} successfully entered into the database.')
+
+def insert_game_shots_by_season(season, game_ids, replace=False, refresh=False): # pragma: no cover
+    """
+    Fetches the shots for every game in a season concurrently and writes them in one transaction.
+
+    Args:
+        season (int): The season the games belong to.
+        game_ids (Iterable[str]): Games to fetch shots for.
+        replace (bool, optional): Delete the season's existing shots in the same
+            transaction first (see `delete_all_game_shots_for_season()`), so readers
+            never see the season half-loaded. Defaults to False.
+        refresh (bool, optional): Revalidate cached API responses (see `api.get_cache_ttl()`);
+            needed unless the season is closed. Defaults to False.
+
+    Returns:
+        int: Number of shots written.
+    """
+    validate_season(season)
+    rows = _fetch_game_shot_rows(season, game_ids, refresh)
+
+    conn = get_write_connection()
+    try:
+        if replace:
+            print(f'Replacing shot data for season {season}...')
+            conn.execute('BEGIN')
+            conn.execute('DELETE FROM game_shots WHERE season = ?', (season,))
+        return write_rows('game_shots', INSERT_GAME_SHOT_SQL, rows, conn=conn)
+    finally:
+        conn.close()
+
+def replace_game_shots_by_game_ids(season, game_ids): # pragma: no cover
+    """
+    Re-fetches the shots for some of a season's games and swaps them in, in one transaction.
+
+    Used by incremental updates: only the given games' existing shots are deleted,
+    so the rest of the season is left untouched.
 
+    Args:
+        season (int): The season the games belong to.
+        game_ids (Iterable[str]): Games whose shots changed.
+
+    Returns:
+        int: Number of shots written.
+    """
+    validate_season(season)
+    game_ids = list(game_ids)
+    rows = _fetch_game_shot_rows(season, game_ids, refresh=True)
+
+    conn = get_write_connection()
+    try:
+        print(f'Replacing shot data for {len(game_ids)} games in season {season}...')
+        conn.execute('BEGIN')
+        conn.executemany('DELETE FROM game_shots WHERE game_id = ?', [(game_id,) for game_id in game_ids])
+        return write_rows('game_shots', INSERT_GAME_SHOT_SQL, rows, conn=conn)
+    finally:
+        conn.close()
+
+def _fetch_game_shot_rows(season, game_ids, refresh):
+    game_ids = list(game_ids)
+    for game_id in game_ids:
+        validate_id(game_id)
+    print(f'Fetching shots for {len(game_ids)} games, season: {season}...')
+    responses = make_asa_api_calls((f'nwsl/games/shots?game_id={game_id}' for game_id in game_ids), refresh)
+    rows = []
+    for _, shots_data in responses:
+        rows.extend(_get_game_shot_rows(shots_data, season))
+    return rows
+
+def _get_game_shot_rows(shots_data, season):
+    # Maps an ASA game shots payload to INSERT_GAME_SHOT_SQL parameters
+    rows = []
     for shot in shots_data:
         game_id_val = shot.get('game_id', 'Unknown')
         period_id = shot.get('period_id', -1)
@@ -49,38 +154,7 @@ def insert_all_game_shots(game_id, season): # pragma: no cover
         pattern_of_play = shot.get('pattern_of_play', 'Unknown')
         shot_order = shot.get('shot_order', -1)
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO game_shots (
-                game_id,
-                period_id,
-                expanded_minute,
-                game_minute,
-                team_id,
-                shooter_player_id,
-                assist_player_id,
-                shot_location_x,
-                shot_location_y,
-                shot_end_location_x,
-                shot_end_location_y,
-                distance_from_goal,
-                distance_from_goal_yds,
-                blocked,
-                blocked_x,
-                blocked_y,
-                goal,
-                own_goal,
-                home_score,
-                away_score,
-                shot_xg,
-                shot_psxg,
-                head,
-                assist_through_ball,
-                assist_cross,
-                pattern_of_play,
-                shot_order,
-                season
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        rows.append((
             game_id_val, period_id, expanded_minute, game_minute, team_id,
             shooter_player_id, assist_player_id, shot_location_x, shot_location_y,
             shot_end_location_x, shot_end_location_y, round(distance_from_goal, 1),
@@ -88,10 +162,7 @@ def insert_all_game_shots(game_id, season): # pragma: no cover
             goal, own_goal, home_score, away_score, round(shot_xg, 2), round(shot_psxg, 2),
             head, assist_through_ball, assist_cross, pattern_of_play, shot_order, season
         ))
-        conn.commit()
-
-    conn.close()
-    print(f'All shots for game {game_id} successfully entered into the database.')
+    return rows
 
 def get_shots_by_game_id(game_id):
     """
@@ -105,7 +176,7 @@ def get_shots_by_game_id(game_id):
     """
     validate_id(game_id)
     print(f'Fetching all shots for game {game_id}...')
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -140,7 +211,7 @@ def get_shots_by_type(shot_type, season):
     if shot_type not in available_shot_types:
         raise ValueError(f"Invalid shot type. Available types are: {', '.join(available_shot_types)}")
 
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -160,45 +231,41 @@ def get_total_psxg_by_team_and_season(team_id, season):
     """
     Retrieves the total post-shot expected goals (PSxG) for a given team and season.
 
+    Reads the team's team_season_summary row, which ingestion refreshes after
+    loading the season's shots.
+
     Args:
         team_id (str): The unique identifier for the team.
         season (int): The season to filter shot data by.
 
     Returns:
-        float: The total PSxG value for the specified team and season.
+        float: The total PSxG value for the specified team and season, or 0.0 if the team has no shots.
     """
     validate_id(team_id)
     validate_season(season)
     print(f'Fetching total PSxG for team {team_id} in season {season}...')
-    conn = sqlite3.connect(get_db_path())
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    cursor.execute('''
-        SELECT shot_psxg FROM game_shots
-        WHERE team_id = ? AND season = ?
-    ''', (team_id, season))
-    
-    rows = cursor.fetchall()
-    conn.close()
-
-    total_psxg = sum(row['shot_psxg'] for row in rows if row['shot_psxg'] is not None)
+    summary = get_team_season_summary(team_id, season)
+    total_psxg = float(summary['psxg']) if summary else 0.0
     print(f'Total PSxG for team {team_id} in season {season}: {total_psxg:.2f}')
     return total_psxg
 
-def get_total_psxg_by_game_id(game_id):
+def get_total_psxg_by_game_id(game_id, season=None):
     """
     Retrieves the total post-shot expected goals (PSxG) for both teams in a specific game.
 
     Args:
         game_id (str): The unique identifier for the game.
+        season (int, optional): The game's season. When given, the totals are read from the
+            season's cached `ShotStore` instead of queried. Defaults to None.
 
     Returns:
         dict[str, float]: A dictionary mapping team IDs to their total PSxG values for the game.
     """
     validate_id(game_id)
     print(f'Fetching total PSxG for both teams in game {game_id}...')
-    conn = sqlite3.connect(get_db_path())
+    if season is not None:
+        return get_shot_store(season).get_game_psxg(game_id)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -221,12 +288,14 @@ def get_total_psxg_by_game_id(game_id):
 
     return {team_id: round(total, 2) for team_id, total in psxg_by_team.items()}
 
-def get_total_shots_by_game_id(game_id):
+def get_total_shots_by_game_id(game_id, season=None):
     """
     Retrieves the total number of shots taken by each team in a specific game.
 
     Args:
         game_id (str): The unique identifier for the game to fetch shot counts for.
+        season (int, optional): The game's season. When given, the counts are read from the
+            season's cached `ShotStore` instead of queried. Defaults to None.
 
     Returns:
         dict[str, int]: A dictionary mapping team IDs to the total number of shots 
@@ -234,7 +303,9 @@ def get_total_shots_by_game_id(game_id):
     """
     validate_id(game_id)
     print(f'Fetching total shots for both teams in game {game_id}...')
-    conn = sqlite3.connect(get_db_path())
+    if season is not None:
+        return get_shot_store(season).get_game_shot_counts(game_id)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -257,12 +328,14 @@ def get_total_shots_by_game_id(game_id):
     return shots_by_team
 
 
-def get_total_shots_on_target_by_game_id(game_id):
+def get_total_shots_on_target_by_game_id(game_id, season=None):
     """
     Retrieves the total number of shots on target for both teams in a specific game.
 
     Args:
         game_id (str): The unique identifier for the game to analyze.
+        season (int, optional): The game's season. When given, the counts are read from the
+            season's cached `ShotStore` instead of queried. Defaults to None.
 
     Returns:
         dict[str, int]: A dictionary where each key is a team_id and the corresponding value 
@@ -273,7 +346,9 @@ def get_total_shots_on_target_by_game_id(game_id):
     """
     validate_id(game_id)
     print(f'Fetching total shots on target for both teams in game {game_id}...')
-    conn = sqlite3.connect(get_db_path())
+    if season is not None:
+        return get_shot_store(season).get_game_shots_on_target(game_id)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -320,7 +395,7 @@ def get_shots_for_team(team_id, season):
     validate_id(team_id)
     print(f'Fetching all shots for team {team_id} in season {season}...')
     
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -342,6 +417,9 @@ def get_avg_shots_for_team(team_id, season):
     """
     Calculates the average number of shots per game for a team in a given season.
 
+    Games are those in which the team took at least one shot, read from the
+    team's team_season_summary row.
+
     Args:
         team_id (str): The unique identifier for the team.
         season (int): The season to consider.
@@ -351,29 +429,9 @@ def get_avg_shots_for_team(team_id, season):
     """
     validate_id(team_id)
     print(f'Calculating average shots per game for team {team_id} in season {season}...')
-
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
-
-    # Total shots taken by the team
-    cursor.execute('''
-        SELECT COUNT(*) FROM game_shots
-        WHERE team_id = ?
-          AND season = ?
-    ''', (team_id, season))
-    total_shots = cursor.fetchone()[0]
-
-    # Total games the team played in
-    cursor.execute('''
-        SELECT COUNT(DISTINCT game_id) FROM game_shots
-        WHERE team_id = ?
-          AND season = ?
-    ''', (team_id, season))
-    total_games = cursor.fetchone()[0]
-
-    conn.close()
-
-    avg_shots = total_shots / total_games if total_games > 0 else 0.0
+    summary = get_team_season_summary(team_id, season)
+    avg_shots = float(summary['shots_per_game']) if summary else 0.0
+    total_games = summary['games_with_shots'] if summary else 0
     print(f'Team {team_id} averaged {avg_shots:.2f} shots per game over {total_games} games.')
     return avg_shots
 
@@ -391,7 +449,7 @@ def get_penalty_kicks_for_team(team_id, season):
     validate_id(team_id)
     print(f'Fetching all penalty kicks for team {team_id} in season {season}...')
     
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -422,7 +480,7 @@ def delete_all_game_shots_for_season(season):  # pragma: no cover
     """
     print(f"Removing old shot data for season {season}...")
     validate_season(season)
-    conn = sqlite3.connect(get_db_path())
+    conn = get_write_connection()
     cursor = conn.cursor()
     cursor.execute("DELETE FROM game_shots WHERE season = ?", (season,))
     conn.commit()
@@ -0,0 +1,104 @@
+'''
+game_team_summary holds one row per game and team with the shot aggregates
+the game page shows (shots, shots on target, PSxG, xG and goals), so the page
+reads them with one primary-key lookup instead of re-reading the game's shots
+once per statistic. The game_team_summary ingestion step rebuilds a season's
+rows after its shots are loaded.
+'''
+from .data_util import validate_id, validate_season, get_read_connection, get_write_connection
+import sqlite3
+
+def update_game_team_summary(season):
+    """
+    Rebuilds a season's per-game team aggregates from game_shots, in one transaction.
+
+    Run after the season's shots are loaded (see `insert_game_shots_by_season()`).
+
+    Args:
+        season (int): The season to summarise.
+
+    Returns:
+        int: Number of (game, team) rows written.
+    """
+    validate_season(season)
+    print(f'Updating game team summary for season {season}...')
+    conn = get_write_connection()
+    try:
+        conn.execute('BEGIN')
+        rows = _refresh_game_team_summary(conn, season)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    print(f'Game team summary updated with {rows} rows in season {season}.')
+    return rows
+
+def get_game_team_summary(game_id):
+    """
+    Retrieves each team's shot aggregates for a game.
+
+    A shot is on target when it was not blocked and has a positive PSxG, the
+    rule used by `db_game_shots.get_total_shots_on_target_by_game_id()`.
+
+    Args:
+        game_id (str): The game ID.
+
+    Returns:
+        dict[str, sqlite3.Row]: Team ID to its row, with "shots", "shots_on_target",
+            "psxg", "xg" and "goals". Teams without a shot are absent.
+
+    Example:
+        >>> summary = get_game_team_summary(game_id)
+        >>> {team_id: row['shots'] for team_id, row in summary.items()}
+        {'KPqjw8PQ6v': 14, 'zeQZeazqKw': 9}
+    """
+    validate_id(game_id)
+    print(f'Fetching team summary for game {game_id}...')
+    conn = get_read_connection()
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT *
+        FROM game_team_summary
+        WHERE game_id = ?
+        ORDER BY team_id
+    ''', (game_id,))
+    rows = cursor.fetchall()
+    conn.close()
+    return {row['team_id']: row for row in rows}
+
+def refresh_all_game_team_summaries(conn):
+    """
+    Rebuilds every season's rows on an open connection, inside the caller's transaction.
+
+    Used by the migration that creates the table, so existing databases have it
+    filled without re-ingesting.
+
+    Args:
+        conn (sqlite3.Connection): Open write connection.
+    """
+    seasons = [row[0] for row in conn.execute('SELECT DISTINCT season FROM game_shots WHERE season IS NOT NULL')]
+    for season in seasons:
+        _refresh_game_team_summary(conn, season)
+
+def _refresh_game_team_summary(conn, season):
+    # Delete first so games whose shots were removed do not keep stale rows
+    conn.execute('DELETE FROM game_team_summary WHERE season = ?', (season,))
+    cursor = conn.execute('''
+        INSERT INTO game_team_summary (game_id, team_id, season, shots, shots_on_target, psxg, xg, goals)
+        SELECT
+            game_id,
+            team_id,
+            season,
+            COUNT(*),
+            COUNT(CASE WHEN shot_psxg > 0 AND COALESCE(blocked, 0) = 0 THEN 1 END),
+            ROUND(TOTAL(shot_psxg), 2),
+            ROUND(TOTAL(shot_xg), 2),
+            COUNT(CASE WHEN goal = 1 THEN 1 END)
+        FROM game_shots
+        WHERE season = ? AND game_id IS NOT NULL AND team_id IS NOT NULL
+        GROUP BY game_id, team_id
+    ''', (season,))
+    return cursor.rowcount
@@ -0,0 +1,65 @@
+from .data_util import validate_id, validate_season, get_read_connection, write_rows
+from datetime import datetime, timezone
+
+def get_changed_game_ids(season):
+    """
+    Lists a season's games whose shots, flow and goals need (re-)ingesting.
+
+    A game needs ingesting when it has no watermark yet, or when the
+    `last_updated_utc` the API reported for it (stored in `games`) differs from
+    the one recorded by `set_game_watermarks()` after its last ingest. Run after
+    `insert_all_games_by_season()` so `games` is current.
+
+    Args:
+        season (int): The season to check.
+
+    Returns:
+        list[str]: Game IDs of new or changed games, in kickoff order.
+    """
+    validate_season(season)
+    print(f'Checking for new or changed games in {season}...')
+    conn = get_read_connection()
+    rows = conn.execute('''
+        SELECT
+            gm.game_id
+        FROM
+            games AS gm
+            LEFT JOIN game_watermarks AS wm ON wm.game_id = gm.game_id
+        WHERE
+            gm.season = ?
+            AND (wm.game_id IS NULL OR wm.last_updated_utc IS NOT gm.last_updated_utc)
+        ORDER BY
+            gm.date_time_utc ASC
+    ''', (season,)).fetchall()
+    conn.close()
+    game_ids = [row[0] for row in rows]
+    print(f'{len(game_ids)} new or changed games in {season}.')
+    return game_ids
+
+def set_game_watermarks(game_ids):
+    """
+    Records that games have been ingested at their current `games.last_updated_utc`.
+
+    Call only once the games' shots, flow and goals are written, so a failed run
+    leaves them marked as changed for the next one.
+
+    Args:
+        game_ids (Iterable[str]): Games just ingested.
+
+    Returns:
+        int: Number of watermarks written.
+    """
+    ingested_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    conn = get_read_connection()
+    rows = []
+    for game_id in game_ids:
+        validate_id(game_id)
+        row = conn.execute('SELECT season, last_updated_utc FROM games WHERE game_id = ?', (game_id,)).fetchone()
+        if row is not None:
+            rows.append((game_id, row[0], row[1], ingested_at))
+    conn.close()
+    return write_rows('game_watermarks', '''
+        INSERT OR REPLACE INTO game_watermarks (
+            game_id, season, last_updated_utc, ingested_at
+        ) VALUES (?, ?, ?, ?)
+    ''', rows)
@@ -1,5 +1,5 @@
 from api import make_asa_api_call
-from .data_util import get_db_path, validate_id, validate_season, convert_utc_to_est
+from .data_util import validate_id, validate_season, convert_utc_to_est, get_read_connection, write_rows
 import sqlite3
 
 def insert_all_games_by_season(season): # pragma: no cover
@@ -16,8 +16,7 @@ def insert_all_games_by_season(season): # pragma: no cover
     print('Inserting games by season for:', season)
     api_string = 'nwsl/games?season_name={}&stage_name=Regular Season'.format(str(season))
     games_data = make_asa_api_call(api_string)[1]
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
+    rows = []
     for game in games_data:
         game_id = game.get('game_id', 'Unknown Game ID')
         date_time_utc = game.get('date_time_utc', 'Unknown Date/Time')
@@ -39,24 +38,23 @@ def insert_all_games_by_season(season): # pragma: no cover
         last_updated_utc = game.get('last_updated_utc', 'Unknown Last Updated Time')
         last_updated_est = convert_utc_to_est(last_updated_utc)
 
-        cursor.execute('''
-        INSERT OR REPLACE INTO games (
+        rows.append((
             game_id, date_time_utc, date_time_est, home_score, away_score, 
             home_team_id, away_team_id, referee_id, stadium_id, 
             home_manager_id, away_manager_id, expanded_minutes, 
             season_name, matchday, attendance, knockout_game, status,
-            last_updated_utc, last_updated_est, season
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+            last_updated_utc, last_updated_est, int(season)
+        ))
+
+    write_rows('games', '''
+        INSERT OR REPLACE INTO games (
             game_id, date_time_utc, date_time_est, home_score, away_score, 
             home_team_id, away_team_id, referee_id, stadium_id, 
             home_manager_id, away_manager_id, expanded_minutes, 
             season_name, matchday, attendance, knockout_game, status,
-            last_updated_utc, last_updated_est, int(season)
-        ))
-        conn.commit()
-    cursor.close()
-    conn.close()
+            last_updated_utc, last_updated_est, season
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
 
 def get_all_games_by_season(season):
     """
@@ -71,8 +69,7 @@ def get_all_games_by_season(season):
     """
     validate_season(season)
     print('Fetching games for: {}'.format(season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = '''
@@ -122,8 +119,7 @@ def get_game_by_id(game_id):
     """
     validate_id(game_id)
     print('Fetching game: {}'.format(game_id))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = '''
@@ -165,8 +161,7 @@ def get_game_ids_by_season(season):
     """
     validate_season(season)
     print('Fetching game IDs for: {}'.format(season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = '''
@@ -199,8 +194,7 @@ def get_latest_manager_id_by_team_and_season(team_id, season):
     validate_season(season)
     validate_id(team_id)
     print(f'Fetching most recent manager for team: {team_id} in season: {season}')
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     cursor = conn.cursor()
     
     query = '''
@@ -243,8 +237,7 @@ def get_team_record_by_season(team_id, season):
     validate_season(season)
     validate_id(team_id)
     print(f'Fetching record for team: {team_id} in season: {season}')
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     cursor = conn.cursor()
 
     query = '''
@@ -308,8 +301,7 @@ def get_team_game_results(team_id, season):
     validate_season(season)
     validate_id(team_id)
     print(f'Fetching game results for team: {team_id} in season: {season}')
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -388,8 +380,7 @@ def get_most_recent_home_stadium_id(team_id, season):
     validate_season(season)
     validate_id(team_id)
     print(f'Getting most recent home game stadium for team {team_id} in season {season}')
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     cursor = conn.cursor()
 
     query = '''
@@ -407,4 +398,64 @@ def get_most_recent_home_stadium_id(team_id, season):
     result = cursor.fetchone()
     conn.close()
 
-    return result[0] if result else None
\ No newline at end of file
+    return result[0] if result else None
+
+def get_played_games_by_season(season):
+    """
+    Retrieves the teams and final scores of every completed game in a season.
+
+    Args:
+        season (int): The season year to filter games by.
+
+    Returns:
+        list[sqlite3.Row]: Rows with game_id, home_team_id, away_team_id, home_score and away_score.
+    """
+    validate_season(season)
+    print(f'Fetching played games for: {season}')
+    conn = get_read_connection()
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    query = '''
+        SELECT game_id, home_team_id, away_team_id, home_score, away_score
+        FROM games
+        WHERE season = ?
+          AND home_score IS NOT NULL
+          AND away_score IS NOT NULL
+        ORDER BY date_time_utc ASC
+    '''
+
+    cursor.execute(query, (season,))
+    rows = cursor.fetchall()
+    conn.close()
+    return rows
+
+def get_unplayed_games_by_season(season):
+    """
+    Retrieves the remaining fixtures of a season, i.e. games without a final score.
+
+    Args:
+        season (int): The season year to filter games by.
+
+    Returns:
+        list[sqlite3.Row]: Rows with game_id, date_time_utc, matchday, home_team_id and away_team_id,
+        ordered by kickoff time.
+    """
+    validate_season(season)
+    print(f'Fetching unplayed games for: {season}')
+    conn = get_read_connection()
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    query = '''
+        SELECT game_id, date_time_utc, matchday, home_team_id, away_team_id
+        FROM games
+        WHERE season = ?
+          AND home_score IS NULL
+        ORDER BY date_time_utc ASC
+    '''
+
+    cursor.execute(query, (season,))
+    rows = cursor.fetchall()
+    conn.close()
+    return rows
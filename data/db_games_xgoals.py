@@ -1,5 +1,5 @@
 from api import make_asa_api_call
-from .data_util import get_db_path, validate_id, validate_season
+from .data_util import validate_id, validate_season, get_read_connection, write_rows
 import sqlite3
 
 def insert_all_games_xgoals_by_season(season): # pragma: no cover
@@ -9,7 +9,7 @@ def insert_all_games_xgoals_by_season(season): # pragma: no cover
     This function calls the ASA API to retrieve expected goals data for all 
     regular season games in the specified NWSL season. It parses the response 
     and inserts each game record into the local `games_xgoals` table using 
-    INSERT OR REPLACE.
+    INSERT OR REPLACE, in one transaction.
 
     Args:
         season (int): 
@@ -22,8 +22,7 @@ def insert_all_games_xgoals_by_season(season): # pragma: no cover
     print('Inserting games by season for:', season)
     api_string = 'nwsl/games/xgoals?season_name={}&stage_name=Regular Season'.format(str(season))
     games_data = make_asa_api_call(api_string)[1]
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
+    rows = []
     for game in games_data:
         game_id = game.get('game_id', 'Unknown Game ID')
         date_time_utc = game.get('date_time_utc', 'Unknown Date/Time')
@@ -42,22 +41,21 @@ def insert_all_games_xgoals_by_season(season): # pragma: no cover
         home_xpoints = round(game.get('home_xpoints', 0.0), 2)
         away_xpoints = round(game.get('away_xpoints', 0.0), 2)
     
-        cursor.execute('''
-        INSERT OR REPLACE INTO games_xgoals (
+        rows.append((
             game_id, date_time_utc, home_team_id, home_goals, home_team_xgoals,
             home_player_xgoals, away_team_id, away_goals, away_team_xgoals,
             away_player_xgoals, goal_difference, team_xgoal_difference,
-            player_xgoal_difference, final_score_difference, home_xpoints, away_xpoints, season
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+            player_xgoal_difference, final_score_difference, home_xpoints, away_xpoints, int(season)
+        ))
+
+    write_rows('games_xgoals', '''
+        INSERT OR REPLACE INTO games_xgoals (
             game_id, date_time_utc, home_team_id, home_goals, home_team_xgoals,
             home_player_xgoals, away_team_id, away_goals, away_team_xgoals,
             away_player_xgoals, goal_difference, team_xgoal_difference,
-            player_xgoal_difference, final_score_difference, home_xpoints, away_xpoints, int(season)
-        ))
-        conn.commit()
-    cursor.close()
-    conn.close()
+            player_xgoal_difference, final_score_difference, home_xpoints, away_xpoints, season
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
 
 def get_all_games_xgoals_by_season(season):
     """
@@ -76,8 +74,7 @@ def get_all_games_xgoals_by_season(season):
     """
     validate_season(season)
     print('Fetching games xgoals for: {}'.format(season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM games_xgoals WHERE season = ?', (season,))
@@ -104,8 +101,7 @@ def get_game_xgoals_by_id(game_id):
     """
     validate_id(game_id)
     print('Fetching game xgoals for: {}'.format(game_id))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM games_xgoals WHERE game_id = ?', (game_id,))
@@ -1,5 +1,5 @@
 from api import make_asa_api_call
-from .data_util import generate_player_season_id, aggregate_position_data, MINIMUM_MINUTES, get_db_path, validate_season, validate_id
+from .data_util import generate_player_season_id, aggregate_position_data, MINIMUM_MINUTES, validate_season, validate_id, get_read_connection, get_write_connection, write_rows
 import sqlite3
 
 def get_goalkeeper_goals_added_by_season(player_id, season):
@@ -27,8 +27,7 @@ def get_goalkeeper_goals_added_by_season(player_id, season):
     validate_season(season)
     print('Fetching goalkeeper xgoals for:{}, Season: {}'.format(player_id, season))
     obj_id = generate_player_season_id(player_id=player_id, season=str(season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = '''
@@ -77,8 +76,7 @@ def get_all_goalkeeper_goals_added_by_season(season):
     """
     validate_season(season)
     print('Fetching all goalkeeper goals added for season: {}'.format(season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = '''
@@ -129,7 +127,7 @@ def insert_goalkeeper_goals_added_by_season(season): # pragma: no cover
     """
     validate_season(season)
     print(f'Inserting data for goalkeepers (goals added) for season: {season}')
-    conn = sqlite3.connect(get_db_path())
+    conn = get_write_connection()
 
     stats_to_track = [
         'claiming_goals_added_raw',
@@ -223,7 +221,7 @@ def insert_keeper_data(conn, keepers_data, position_data, stats_to_track, season
         season (int): The season year.
     """
     validate_season(season)
-    cursor = conn.cursor()
+    rows = []
     for keeper in keepers_data:
         player_id = keeper.get('player_id', 'Unknown Player ID')
         obj_id = generate_player_season_id(player_id=player_id, season=str(season))
@@ -294,89 +292,7 @@ def insert_keeper_data(conn, keepers_data, position_data, stats_to_track, season
         position_min = {f"min_{stat}": round(position_data.get(general_position, {}).get(f"min_{stat}", 0), 2) for stat in stats_to_track}
         position_max = {f"max_{stat}": round(position_data.get(general_position, {}).get(f"max_{stat}", 0), 2) for stat in stats_to_track}
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO goalkeeper_goals_added (
-                id,
-                player_id,
-                team_id,
-                season,
-                claiming_goals_added_raw,
-                claiming_goals_added_above_avg,
-                claiming_count_actions,
-                fielding_goals_added_raw,
-                fielding_goals_added_above_avg,
-                fielding_count_actions,
-                handling_goals_added_raw,
-                handling_goals_added_above_avg,
-                handling_count_actions,
-                passing_goals_added_raw,
-                passing_goals_added_above_avg,
-                passing_count_actions,
-                shotstopping_goals_added_raw,
-                shotstopping_goals_added_above_avg,
-                shotstopping_count_actions,
-                sweeping_goals_added_raw,
-                sweeping_goals_added_above_avg,
-                sweeping_count_actions,
-                avg_claiming_goals_added_raw,
-                avg_claiming_goals_added_above_avg,
-                avg_claiming_count_actions,
-                avg_fielding_goals_added_raw,
-                avg_fielding_goals_added_above_avg,
-                avg_fielding_count_actions,
-                avg_handling_goals_added_raw,
-                avg_handling_goals_added_above_avg,
-                avg_handling_count_actions,
-                avg_passing_goals_added_raw,
-                avg_passing_goals_added_above_avg,
-                avg_passing_count_actions,
-                avg_shotstopping_goals_added_raw,
-                avg_shotstopping_goals_added_above_avg,
-                avg_shotstopping_count_actions,
-                avg_sweeping_goals_added_raw,
-                avg_sweeping_goals_added_above_avg,
-                avg_sweeping_count_actions,
-                min_claiming_goals_added_raw,
-                min_claiming_goals_added_above_avg,
-                min_claiming_count_actions,
-                min_fielding_goals_added_raw,
-                min_fielding_goals_added_above_avg,
-                min_fielding_count_actions,
-                min_handling_goals_added_raw,
-                min_handling_goals_added_above_avg,
-                min_handling_count_actions,
-                min_passing_goals_added_raw,
-                min_passing_goals_added_above_avg,
-                min_passing_count_actions,
-                min_shotstopping_goals_added_raw,
-                min_shotstopping_goals_added_above_avg,
-                min_shotstopping_count_actions,
-                min_sweeping_goals_added_raw,
-                min_sweeping_goals_added_above_avg,
-                min_sweeping_count_actions,
-                max_claiming_goals_added_raw,
-                max_claiming_goals_added_above_avg,
-                max_claiming_count_actions,
-                max_fielding_goals_added_raw,
-                max_fielding_goals_added_above_avg,
-                max_fielding_count_actions,
-                max_handling_goals_added_raw,
-                max_handling_goals_added_above_avg,
-                max_handling_count_actions,
-                max_passing_goals_added_raw,
-                max_passing_goals_added_above_avg,
-                max_passing_count_actions,
-                max_shotstopping_goals_added_raw,
-                max_shotstopping_goals_added_above_avg,
-                max_shotstopping_count_actions,
-                max_sweeping_goals_added_raw,
-                max_sweeping_goals_added_above_avg,
-                max_sweeping_count_actions
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        rows.append((
             obj_id,
             player_id,
             team_id,
@@ -458,4 +374,86 @@ def insert_keeper_data(conn, keepers_data, position_data, stats_to_track, season
             position_max['max_sweeping_count_actions']
         ))
         
-    conn.commit()
\ No newline at end of file
+    write_rows('goalkeeper_goals_added', '''
+        INSERT OR REPLACE INTO goalkeeper_goals_added (
+            id,
+            player_id,
+            team_id,
+            season,
+            claiming_goals_added_raw,
+            claiming_goals_added_above_avg,
+            claiming_count_actions,
+            fielding_goals_added_raw,
+            fielding_goals_added_above_avg,
+            fielding_count_actions,
+            handling_goals_added_raw,
+            handling_goals_added_above_avg,
+            handling_count_actions,
+            passing_goals_added_raw,
+            passing_goals_added_above_avg,
+            passing_count_actions,
+            shotstopping_goals_added_raw,
+            shotstopping_goals_added_above_avg,
+            shotstopping_count_actions,
+            sweeping_goals_added_raw,
+            sweeping_goals_added_above_avg,
+            sweeping_count_actions,
+            avg_claiming_goals_added_raw,
+            avg_claiming_goals_added_above_avg,
+            avg_claiming_count_actions,
+            avg_fielding_goals_added_raw,
+            avg_fielding_goals_added_above_avg,
+            avg_fielding_count_actions,
+            avg_handling_goals_added_raw,
+            avg_handling_goals_added_above_avg,
+            avg_handling_count_actions,
+            avg_passing_goals_added_raw,
+            avg_passing_goals_added_above_avg,
+            avg_passing_count_actions,
+            avg_shotstopping_goals_added_raw,
+            avg_shotstopping_goals_added_above_avg,
+            avg_shotstopping_count_actions,
+            avg_sweeping_goals_added_raw,
+            avg_sweeping_goals_added_above_avg,
+            avg_sweeping_count_actions,
+            min_claiming_goals_added_raw,
+            min_claiming_goals_added_above_avg,
+            min_claiming_count_actions,
+            min_fielding_goals_added_raw,
+            min_fielding_goals_added_above_avg,
+            min_fielding_count_actions,
+            min_handling_goals_added_raw,
+            min_handling_goals_added_above_avg,
+            min_handling_count_actions,
+            min_passing_goals_added_raw,
+            min_passing_goals_added_above_avg,
+            min_passing_count_actions,
+            min_shotstopping_goals_added_raw,
+            min_shotstopping_goals_added_above_avg,
+            min_shotstopping_count_actions,
+            min_sweeping_goals_added_raw,
+            min_sweeping_goals_added_above_avg,
+            min_sweeping_count_actions,
+            max_claiming_goals_added_raw,
+            max_claiming_goals_added_above_avg,
+            max_claiming_count_actions,
+            max_fielding_goals_added_raw,
+            max_fielding_goals_added_above_avg,
+            max_fielding_count_actions,
+            max_handling_goals_added_raw,
+            max_handling_goals_added_above_avg,
+            max_handling_count_actions,
+            max_passing_goals_added_raw,
+            max_passing_goals_added_above_avg,
+            max_passing_count_actions,
+            max_shotstopping_goals_added_raw,
+            max_shotstopping_goals_added_above_avg,
+            max_shotstopping_count_actions,
+            max_sweeping_goals_added_raw,
+            max_sweeping_goals_added_above_avg,
+            max_sweeping_count_actions
+        ) VALUES (
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows, conn=conn)
\ No newline at end of file
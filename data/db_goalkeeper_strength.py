@@ -1,8 +1,7 @@
-from .data_util import get_db_path, MINIMUM_MINUTES
+from .data_util import MINIMUM_MINUTES, get_write_connection
 from .db_goalkeeper_goals_added import get_all_goalkeeper_goals_added_by_season
 from .db_goalkeeper_xgoals import get_all_goalkeepers_xgoals_by_season
 from .data_util import get_range, normalize, get_range, verify_minimum_minutes
-import sqlite3
 
 def update_goalkeeper_strength(season):
     """
@@ -59,7 +58,7 @@ def update_goalkeeper_strength(season):
     min_sw, max_sw = get_range(qualified, 'sweeping_ga')
 
     # DB connection
-    conn = sqlite3.connect(get_db_path())
+    conn = get_write_connection()
     cursor = conn.cursor()
 
     # Loop through all qualified goalkeepers and compute their strength score
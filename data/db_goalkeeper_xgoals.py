@@ -1,11 +1,10 @@
 from api import make_asa_api_call
-from .data_util import aggregate_position_data, generate_player_season_id, MINIMUM_MINUTES, get_db_path, validate_id
+from .data_util import aggregate_position_data, generate_player_season_id, MINIMUM_MINUTES, validate_id, get_read_connection, get_write_connection, write_rows
 import sqlite3
 
 def get_all_goalkeepers_xgoals_by_season(season):
     print('Fetching all goalkeepers xgoals for season: {}'.format(season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = '''
@@ -40,8 +39,7 @@ def get_all_goalkeepers_xgoals_by_season(season):
 def get_goalkeeper_xgoals_by_season(player_id, season):
     print('Fetching goalkeeper xgoals for {} season: {}'.format(player_id, season))
     obj_id = generate_player_season_id(player_id=player_id, season=str(season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     obj_id = generate_player_season_id(player_id=player_id, season=str(season))
@@ -77,7 +75,7 @@ INSERT XGOALS DATA
 '''
 def insert_goalkeeper_xgoals_by_season(season): # pragma: no cover
     print(f'Inserting data for goalkeepers (xgoal) for season: {season}')
-    conn = sqlite3.connect(get_db_path())
+    conn = get_write_connection()
 
     stats_to_track = [
     'minutes_played', 'shots_faced', 'goals_conceded', 'saves', 'share_headed_shots',
@@ -139,7 +137,7 @@ def insert_keeper_data(conn, keepers_data, position_data, stats_to_track, season
         stats_to_track (list): List of stats to track for avg, min, and max.
         season (int): The season year.
     """
-    cursor = conn.cursor()
+    rows = []
     for keeper in keepers_data:
         player_id = keeper.get('player_id', 'Unknown Player ID')
         obj_id = generate_player_season_id(player_id=player_id, season=str(season))
@@ -154,26 +152,7 @@ def insert_keeper_data(conn, keepers_data, position_data, stats_to_track, season
         position_min = {f"min_{stat}": round(position_data.get(general_position, {}).get(f"min_{stat}", 0), 2) for stat in stats_to_track}
         position_max = {f"max_{stat}": round(position_data.get(general_position, {}).get(f"max_{stat}", 0), 2) for stat in stats_to_track}
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO goalkeeper_xgoals (
-                id, player_id, team_id, season, minutes_played, shots_faced, goals_conceded, 
-                saves, share_headed_shots, xgoals_gk_faced, goals_minus_xgoals_gk,
-                goals_divided_by_xgoals_gk,
-                avg_minutes_played, avg_shots_faced, avg_goals_conceded, avg_saves, avg_share_headed_shots, 
-                avg_xgoals_gk_faced, avg_goals_minus_xgoals_gk, avg_goals_divided_by_xgoals_gk,
-                min_minutes_played, min_shots_faced, min_goals_conceded, min_saves, min_share_headed_shots, 
-                min_xgoals_gk_faced, min_goals_minus_xgoals_gk, min_goals_divided_by_xgoals_gk,
-                max_minutes_played, max_shots_faced, max_goals_conceded, max_saves, max_share_headed_shots, 
-                max_xgoals_gk_faced, max_goals_minus_xgoals_gk, max_goals_divided_by_xgoals_gk,
-                save_perc, avg_save_perc, min_save_perc, max_save_perc
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?
-            )
-        ''', (
+        rows.append((
             obj_id,
             player_id,
             team_id,
@@ -220,7 +199,26 @@ def insert_keeper_data(conn, keepers_data, position_data, stats_to_track, season
             position_max['max_save_perc']
             ))
         
-    conn.commit()
+    write_rows('goalkeeper_xgoals', '''
+        INSERT OR REPLACE INTO goalkeeper_xgoals (
+            id, player_id, team_id, season, minutes_played, shots_faced, goals_conceded, 
+            saves, share_headed_shots, xgoals_gk_faced, goals_minus_xgoals_gk,
+            goals_divided_by_xgoals_gk,
+            avg_minutes_played, avg_shots_faced, avg_goals_conceded, avg_saves, avg_share_headed_shots, 
+            avg_xgoals_gk_faced, avg_goals_minus_xgoals_gk, avg_goals_divided_by_xgoals_gk,
+            min_minutes_played, min_shots_faced, min_goals_conceded, min_saves, min_share_headed_shots, 
+            min_xgoals_gk_faced, min_goals_minus_xgoals_gk, min_goals_divided_by_xgoals_gk,
+            max_minutes_played, max_shots_faced, max_goals_conceded, max_saves, max_share_headed_shots, 
+            max_xgoals_gk_faced, max_goals_minus_xgoals_gk, max_goals_divided_by_xgoals_gk,
+            save_perc, avg_save_perc, min_save_perc, max_save_perc
+        ) VALUES (
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+            ?, ?, ?, ?, ?, ?, ?, ?,
+            ?, ?, ?, ?, ?, ?, ?, ?,
+            ?, ?, ?, ?, ?, ?, ?, ?,
+            ?, ?, ?, ?
+        )
+    ''', rows, conn=conn)
 
 def get_goalkeepers_for_team(team_id, season, limit = 1):
     """
@@ -240,7 +238,7 @@ def get_goalkeepers_for_team(team_id, season, limit = 1):
     validate_id(team_id)
     print(f'Fetching primary goalkeeper for team {team_id} in season {season}...')
 
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
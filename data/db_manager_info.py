@@ -1,5 +1,5 @@
 from api import make_asa_api_call
-from .data_util import get_db_path
+from .data_util import get_read_connection, write_rows
 import sqlite3
 
 def insert_all_manager_info(): # pragma: no cover
@@ -18,22 +18,21 @@ def insert_all_manager_info(): # pragma: no cover
     """
     print('Attempting to insert all managers info...')
     managers_data = make_asa_api_call('nwsl/managers')[1]
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
+    rows = []
     for manager in managers_data:
         manager_id = manager.get('manager_id', 'Unknown ID')
         manager_name = manager.get('manager_name', 'Unknown Name')
         nationality = manager.get('nationality', 'Unknown Nationality')
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO manager_info (
-                manager_id,
-                manager_name,
-                nationality
-            ) VALUES (?, ?, ?)
-        ''', (manager_id, manager_name, nationality))
-        conn.commit()
-    conn.close()
+        rows.append((manager_id, manager_name, nationality))
+
+    write_rows('manager_info', '''
+        INSERT OR REPLACE INTO manager_info (
+            manager_id,
+            manager_name,
+            nationality
+        ) VALUES (?, ?, ?)
+    ''', rows)
     print('All managers info successfully entered into the database.')
 
 def get_manager_by_id(manager_id):
@@ -48,7 +47,7 @@ def get_manager_by_id(manager_id):
         information if found, or None if no match is found.
     """
     print('Attempting to get manager info by ID:', manager_id)
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -1,10 +1,9 @@
-from .data_util import get_db_path, MINIMUM_MINUTES
+from .data_util import MINIMUM_MINUTES, get_write_connection
 from .db_player_xgoals import get_top_player_xgoals_stat
 from .db_player_xpass import get_all_player_xpass
 from .db_player_goals_added import get_all_players_goals_added_by_season
 from .db_game_shots import get_shots_by_type
 from .data_util import get_range, normalize, get_range, verify_minimum_minutes
-import sqlite3
 
 def update_midfielder_strength(season):
     players_xgoals = get_top_player_xgoals_stat(season)
@@ -46,7 +45,7 @@ def update_midfielder_strength(season):
     min_iga, max_iga = get_range(qualified, 'interrupting_ga')
 
     # DB update
-    conn = sqlite3.connect(get_db_path())
+    conn = get_write_connection()
     cursor = conn.cursor()
 
     for p in qualified:
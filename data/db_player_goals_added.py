@@ -1,6 +1,6 @@
 from api import make_asa_api_call
 import sqlite3
-from .data_util import aggregate_position_data, generate_player_season_id, MINIMUM_MINUTES, get_db_path
+from .data_util import aggregate_position_data, generate_player_season_id, MINIMUM_MINUTES, get_read_connection, get_write_connection, write_rows
 
 def insert_player_goals_added_by_season(season, conn=None): # pragma: no cover
     """
@@ -25,7 +25,7 @@ def insert_player_goals_added_by_season(season, conn=None): # pragma: no cover
     print(f'Inserting data for players (goals added) for season: {season}')
     close_connection = False
     if conn is None:
-        conn = sqlite3.connect(get_db_path())
+        conn = get_write_connection()
         close_connection = True
 
     stats_to_track = [
@@ -127,7 +127,7 @@ def insert_player_data(conn, players_data, position_data, stats_to_track, season
     Returns:
         None: All data is committed directly to the provided database connection.
     """
-    cursor = conn.cursor()
+    rows = []
 
     for player in players_data:
         player_id = player.get('player_id', 'Unknown Player ID')
@@ -195,38 +195,7 @@ def insert_player_data(conn, players_data, position_data, stats_to_track, season
 
 
         # Insert data into database explicitly
-        cursor.execute('''
-            INSERT OR REPLACE INTO player_goals_added (
-                id, player_id, team_id, general_position, minutes_played,
-                dribbling_goals_added_raw, dribbling_goals_added_above_avg, dribbling_count_actions,
-                fouling_goals_added_raw, fouling_goals_added_above_avg, fouling_count_actions,
-                interrupting_goals_added_raw, interrupting_goals_added_above_avg, interrupting_count_actions,
-                passing_goals_added_raw, passing_goals_added_above_avg, passing_count_actions,
-                receiving_goals_added_raw, receiving_goals_added_above_avg, receiving_count_actions,
-                shooting_goals_added_raw, shooting_goals_added_above_avg, shooting_count_actions,
-                avg_dribbling_goals_added_raw, avg_dribbling_goals_added_above_avg, avg_dribbling_count_actions,
-                avg_fouling_goals_added_raw, avg_fouling_goals_added_above_avg, avg_fouling_count_actions,
-                avg_interrupting_goals_added_raw, avg_interrupting_goals_added_above_avg, avg_interrupting_count_actions,
-                avg_passing_goals_added_raw, avg_passing_goals_added_above_avg, avg_passing_count_actions,
-                avg_receiving_goals_added_raw, avg_receiving_goals_added_above_avg, avg_receiving_count_actions,
-                avg_shooting_goals_added_raw, avg_shooting_goals_added_above_avg, avg_shooting_count_actions,
-                min_dribbling_goals_added_raw, min_dribbling_goals_added_above_avg, min_dribbling_count_actions,
-                min_fouling_goals_added_raw, min_fouling_goals_added_above_avg, min_fouling_count_actions,
-                min_interrupting_goals_added_raw, min_interrupting_goals_added_above_avg, min_interrupting_count_actions,
-                min_passing_goals_added_raw, min_passing_goals_added_above_avg, min_passing_count_actions,
-                min_receiving_goals_added_raw, min_receiving_goals_added_above_avg, min_receiving_count_actions,
-                min_shooting_goals_added_raw, min_shooting_goals_added_above_avg, min_shooting_count_actions,
-                max_dribbling_goals_added_raw, max_dribbling_goals_added_above_avg, max_dribbling_count_actions,
-                max_fouling_goals_added_raw, max_fouling_goals_added_above_avg, max_fouling_count_actions,
-                max_interrupting_goals_added_raw, max_interrupting_goals_added_above_avg, max_interrupting_count_actions,
-                max_passing_goals_added_raw, max_passing_goals_added_above_avg, max_passing_count_actions,
-                max_receiving_goals_added_raw, max_receiving_goals_added_above_avg, max_receiving_count_actions,
-                max_shooting_goals_added_raw, max_shooting_goals_added_above_avg, max_shooting_count_actions,
-                season
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                       ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                       ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        rows.append((
             obj_id, player_id, team_id, general_position, minutes_played,
             dribbling_goals_added_raw, dribbling_goals_added_above_avg, dribbling_count_actions,
             fouling_goals_added_raw, fouling_goals_added_above_avg, fouling_count_actions,
@@ -255,7 +224,38 @@ def insert_player_data(conn, players_data, position_data, stats_to_track, season
             int(season)
         ))
 
-    conn.commit()
+    write_rows('player_goals_added', '''
+        INSERT OR REPLACE INTO player_goals_added (
+            id, player_id, team_id, general_position, minutes_played,
+            dribbling_goals_added_raw, dribbling_goals_added_above_avg, dribbling_count_actions,
+            fouling_goals_added_raw, fouling_goals_added_above_avg, fouling_count_actions,
+            interrupting_goals_added_raw, interrupting_goals_added_above_avg, interrupting_count_actions,
+            passing_goals_added_raw, passing_goals_added_above_avg, passing_count_actions,
+            receiving_goals_added_raw, receiving_goals_added_above_avg, receiving_count_actions,
+            shooting_goals_added_raw, shooting_goals_added_above_avg, shooting_count_actions,
+            avg_dribbling_goals_added_raw, avg_dribbling_goals_added_above_avg, avg_dribbling_count_actions,
+            avg_fouling_goals_added_raw, avg_fouling_goals_added_above_avg, avg_fouling_count_actions,
+            avg_interrupting_goals_added_raw, avg_interrupting_goals_added_above_avg, avg_interrupting_count_actions,
+            avg_passing_goals_added_raw, avg_passing_goals_added_above_avg, avg_passing_count_actions,
+            avg_receiving_goals_added_raw, avg_receiving_goals_added_above_avg, avg_receiving_count_actions,
+            avg_shooting_goals_added_raw, avg_shooting_goals_added_above_avg, avg_shooting_count_actions,
+            min_dribbling_goals_added_raw, min_dribbling_goals_added_above_avg, min_dribbling_count_actions,
+            min_fouling_goals_added_raw, min_fouling_goals_added_above_avg, min_fouling_count_actions,
+            min_interrupting_goals_added_raw, min_interrupting_goals_added_above_avg, min_interrupting_count_actions,
+            min_passing_goals_added_raw, min_passing_goals_added_above_avg, min_passing_count_actions,
+            min_receiving_goals_added_raw, min_receiving_goals_added_above_avg, min_receiving_count_actions,
+            min_shooting_goals_added_raw, min_shooting_goals_added_above_avg, min_shooting_count_actions,
+            max_dribbling_goals_added_raw, max_dribbling_goals_added_above_avg, max_dribbling_count_actions,
+            max_fouling_goals_added_raw, max_fouling_goals_added_above_avg, max_fouling_count_actions,
+            max_interrupting_goals_added_raw, max_interrupting_goals_added_above_avg, max_interrupting_count_actions,
+            max_passing_goals_added_raw, max_passing_goals_added_above_avg, max_passing_count_actions,
+            max_receiving_goals_added_raw, max_receiving_goals_added_above_avg, max_receiving_count_actions,
+            max_shooting_goals_added_raw, max_shooting_goals_added_above_avg, max_shooting_count_actions,
+            season
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                   ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+                   ?, ?, ?, ?, ?, ?, ?)
+    ''', rows, conn=conn)
 
 def get_player_goals_added_by_season(player_id, season):
     """
@@ -272,8 +272,7 @@ def get_player_goals_added_by_season(player_id, season):
     """
     print('Fetching player goals added for:{}, Season: {}'.format(player_id, season))
     obj_id = generate_player_season_id(player_id=player_id, season=str(season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = f'''
@@ -315,8 +314,7 @@ def get_all_players_goals_added_by_season(season):
         including player info and team info, for the specified season.
     """
     print('Fetching all players goals added. Season: {}'.format(season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = f'''
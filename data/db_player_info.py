@@ -1,5 +1,5 @@
 from api import make_asa_api_call
-from .data_util import get_db_path
+from .data_util import get_read_connection, write_rows
 import sqlite3
 
 def insert_all_players_info():
@@ -15,9 +15,8 @@ def insert_all_players_info():
     """
     print('Attempting  to insert all players info...')
     players_data = make_asa_api_call('nwsl/players')[1]
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    player_rows = []
+    season_rows = []
     for player in players_data:
         player_id = player.get('player_id', 'Unknown ID')
         player_name = player.get('player_name', 'Unknown Name')
@@ -36,51 +35,47 @@ def insert_all_players_info():
         # If the season is empty, it is returned as a dict. Otherwise it is a list.
         if isinstance(season_names, list):
             for season in season_names:
-                _insert_player_season_entry(player_id, season, cursor)
+                season_rows.append(_get_player_season_row(player_id, season))
         elif isinstance(season_names, str):
-            _insert_player_season_entry(player_id, season_names, cursor)
+            season_rows.append(_get_player_season_row(player_id, season_names))
         else:
             print('No season associated with player:', player_id)
         
-        cursor.execute('''
-        INSERT OR REPLACE INTO player_info (
+        player_rows.append((
             player_id, player_name, player_first_name, player_last_name, birth_date, height_ft, height_in, nationality,
             primary_broad_position, primary_general_position, secondary_broad_position,
             secondary_general_position
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        ))
+
+    write_rows('player_seasons', '''
+        INSERT OR REPLACE INTO player_seasons (
+            season_player_id, player_id, year
+        ) VALUES (?, ?, ?)
+    ''', season_rows)
+    write_rows('player_info', '''
+        INSERT OR REPLACE INTO player_info (
             player_id, player_name, player_first_name, player_last_name, birth_date, height_ft, height_in, nationality,
             primary_broad_position, primary_general_position, secondary_broad_position,
             secondary_general_position
-        ))
-        conn.commit()
-    conn.close()
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', player_rows)
     print('All players info successfully entered into the database.')
 
-def _insert_player_season_entry(player_id, season, cursor):
+def _get_player_season_row(player_id, season):
     """
-    Inserts or updates a player's season data into the `player_seasons` table.
+    Builds a player's `player_seasons` row.
 
     Args:
         player_id (str): The unique identifier for the player.
         season (str): The season year as a string.
-        cursor (sqlite3.Cursor): The database cursor to execute SQL commands.
 
-    Notes:
-        - Constructs a unique `season_player_id` by concatenating the `player_id`
-          and the `season`.
-        - The `player_seasons` table is expected to have columns `season_player_id`,
-          `player_id`, and `year`.
+    Returns:
+        tuple: (season_player_id, player_id, year), where `season_player_id` is the
+               `player_id` and the `season` concatenated.
     """
     season_int = int(season)
     season_player_id = '{}{}'.format(player_id, season)
-    cursor.execute('''
-        INSERT OR REPLACE INTO player_seasons (
-            season_player_id, player_id, year
-        ) VALUES (?, ?, ?)
-        ''', (
-            season_player_id, player_id, season_int
-        ))
+    return (season_player_id, player_id, season_int)
 
 def _split_player_name(name):
     """
@@ -124,8 +119,7 @@ def get_all_players_info():
         list: A list of SQLite Row objects containing player information.
     """
     print('Fetching all players info from the database...')
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM player_info')
@@ -149,8 +143,7 @@ def get_all_player_seasons():
         list: A list of SQLite Row objects containing player season data.
     """
     print('Fetching all player seasons from the database...')
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM player_seasons')
@@ -173,8 +166,7 @@ def get_player_seasons(player_id):
         list: A list of SQLite Row objects containing season data for the specified player.
     """
     print('Fetching seasons for:', player_id)
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM player_seasons WHERE player_id = ?', (player_id,))
@@ -198,8 +190,7 @@ def get_player_info_by_id(player_id):
                      if no matching record is found.
     """
     print('Fetching player info for:', player_id)
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM player_info WHERE player_id = ?', (player_id,))
@@ -213,7 +204,7 @@ def get_player_name_map():
     """
     Returns a dictionary mapping player_id → player_name from player_info table.
     """
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -1,5 +1,5 @@
 from api import make_asa_api_call
-from .data_util import aggregate_position_data, generate_player_season_id, MINIMUM_MINUTES, get_db_path
+from .data_util import aggregate_position_data, generate_player_season_id, MINIMUM_MINUTES, get_read_connection, get_write_connection, write_rows
 import sqlite3
 
 def get_all_player_xgoal_by_team(team_id: str, season: int):
@@ -18,8 +18,7 @@ def get_all_player_xgoal_by_team(team_id: str, season: int):
         ValueError: If no data is found for the given team and season.
     """
     print(f'Fetching all player xGoals for team_id={team_id}, season={season}')
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -68,8 +67,7 @@ def get_player_xgoal_data_all_seasons(player_id: str):
         PlayerDataNotFoundError: If no data is found for the given player and season.
     """
     print('Fetching player xgoals for:{}, All Seasons'.format(player_id))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = '''
@@ -119,8 +117,7 @@ def get_player_xgoal_data(player_id: str, season: int):
     """
     print('Fetching player xgoals for:{}, Season: {}'.format(player_id, season))
     obj_id = generate_player_season_id(player_id=player_id, season=str(season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = '''
@@ -167,8 +164,7 @@ def get_top_player_xgoals_stat(season, sorting_stat: str='goals', limit: int=Non
         list[sqlite3.Row]: A list of rows containing player data, sorted and limited as specified.
     """
     print('Players - Fetching top {} sorted by {} for: {}.'.format(limit, sorting_stat, season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = f'''
@@ -219,8 +215,7 @@ def get_player_xgoals_minimum_shots(season, sorting_stat, limit, minimum_shots):
         list[sqlite3.Row]: A list of rows containing player data, limited, filtered, and sorted as specified.
     """
     print('Players - Fetching {} player xgoals sorted by {} for: {} season.'.format(limit, sorting_stat, season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = f'''
@@ -265,8 +260,7 @@ def get_defender_minutes_played(season, sorting_stat, limit):
         list[sqlite3.Row]: A list of rows containing player data, limited and sorted as specified.
     """
     print('Players - Fetching {} minutes played sorted by {} for: {}.'.format(limit, sorting_stat, season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = f'''
@@ -317,8 +311,7 @@ def get_minutes_played_non_df(season, sorting_stat, limit):
         list: A list of rows (SQLite Row objects) containing player data that matches the query.
     """
     print('Players - Fetching {} minutes played sorted by {} for: {}.'.format(limit, sorting_stat, season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = f'''
@@ -362,8 +355,7 @@ def get_player_xgoals_ids_by_season(season):
         list: A list of IDs from the player_xgoals table for the specified season.
     """
     print(f"Fetching all player xgoals IDs for season: {season}")
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = lambda cursor, row: row[0]  # Return only the first column (id)
     cursor = conn.cursor()
     
@@ -395,7 +387,7 @@ def insert_player_xgoals_by_season(season):
         None
     """
     print(f'Inserting data for players (xgoal) for season: {season}')
-    conn = sqlite3.connect(get_db_path())
+    conn = get_write_connection()
 
     stats_to_track = [
     'minutes_played', 'shots', 'shots_on_target', 'shots_on_target_perc', 'goals',
@@ -461,7 +453,7 @@ def insert_player_data(conn, players_data, position_data, stats_to_track, season
         stats_to_track (list): List of stats to track.
         season (int): The season year.
     """
-    cursor = conn.cursor()
+    rows = []
 
     for player in players_data:
         player_id = player.get('player_id', 'Unknown Player ID')
@@ -478,28 +470,7 @@ def insert_player_data(conn, players_data, position_data, stats_to_track, season
         position_min = {f"min_{stat}": round(position_data.get(general_position, {}).get(f"min_{stat}", 0), 2) for stat in stats_to_track}
         position_max = {f"max_{stat}": round(position_data.get(general_position, {}).get(f"max_{stat}", 0), 2) for stat in stats_to_track}
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO player_xgoals (
-                id, player_id, team_id, general_position, season,
-                minutes_played, shots, shots_on_target, shots_on_target_perc, goals,
-                xgoals, xplace, goals_minus_xgoals, primary_assists_minus_xassists,
-                key_passes, primary_assists, xassists, xgoals_plus_xassists,
-                points_added, xpoints_added,
-                avg_minutes_played, avg_shots, avg_shots_on_target, avg_shots_on_target_perc, avg_goals, avg_xgoals,
-                avg_xplace, avg_goals_minus_xgoals, avg_primary_assists_minus_xassists, avg_key_passes,
-                avg_primary_assists, avg_xassists, avg_xgoals_plus_xassists, avg_points_added, avg_xpoints_added,
-                min_minutes_played, min_shots, min_shots_on_target, min_shots_on_target_perc, min_goals, min_xgoals,
-                min_xplace, min_goals_minus_xgoals, min_primary_assists_minus_xassists, min_key_passes,
-                min_primary_assists, min_xassists, min_xgoals_plus_xassists, min_points_added, min_xpoints_added,
-                max_minutes_played, max_shots, max_shots_on_target, max_shots_on_target_perc, max_goals, max_xgoals,
-                max_xplace, max_goals_minus_xgoals, max_primary_assists_minus_xassists, max_key_passes,
-                max_primary_assists, max_xassists, max_xgoals_plus_xassists, max_points_added, max_xpoints_added
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-            )
-        ''', (
+        rows.append((
             obj_id, player_id, team_id, general_position, int(season),
             player_stats['minutes_played'], player_stats['shots'], player_stats['shots_on_target'],
             player_stats['shots_on_target_perc'], player_stats['goals'], player_stats['xgoals'], player_stats['xplace'],
@@ -526,7 +497,28 @@ def insert_player_data(conn, players_data, position_data, stats_to_track, season
             position_max['max_xgoals_plus_xassists'], position_max['max_points_added'], position_max['max_xpoints_added']
         ))
 
-    conn.commit()
+    write_rows('player_xgoals', '''
+        INSERT OR REPLACE INTO player_xgoals (
+            id, player_id, team_id, general_position, season,
+            minutes_played, shots, shots_on_target, shots_on_target_perc, goals,
+            xgoals, xplace, goals_minus_xgoals, primary_assists_minus_xassists,
+            key_passes, primary_assists, xassists, xgoals_plus_xassists,
+            points_added, xpoints_added,
+            avg_minutes_played, avg_shots, avg_shots_on_target, avg_shots_on_target_perc, avg_goals, avg_xgoals,
+            avg_xplace, avg_goals_minus_xgoals, avg_primary_assists_minus_xassists, avg_key_passes,
+            avg_primary_assists, avg_xassists, avg_xgoals_plus_xassists, avg_points_added, avg_xpoints_added,
+            min_minutes_played, min_shots, min_shots_on_target, min_shots_on_target_perc, min_goals, min_xgoals,
+            min_xplace, min_goals_minus_xgoals, min_primary_assists_minus_xassists, min_key_passes,
+            min_primary_assists, min_xassists, min_xgoals_plus_xassists, min_points_added, min_xpoints_added,
+            max_minutes_played, max_shots, max_shots_on_target, max_shots_on_target_perc, max_goals, max_xgoals,
+            max_xplace, max_goals_minus_xgoals, max_primary_assists_minus_xassists, max_key_passes,
+            max_primary_assists, max_xassists, max_xgoals_plus_xassists, max_points_added, max_xpoints_added
+        ) VALUES (
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        )
+    ''', rows, conn=conn)
 
 '''
 XGOALS || XASSISTS PER 90   
@@ -536,9 +528,7 @@ def calculate_and_update_xgxa90(season):
     Calculate xGoals + xAssists per 90 and update the database for each player.
     """
     rows = get_top_player_xgoals_stat(season)
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    updates = []
     for row in rows:
         player_stats = dict(row)
         xgoals = player_stats.get('xgoals', 0)
@@ -550,22 +540,20 @@ def calculate_and_update_xgxa90(season):
         else:
             xgoals_xassists_per_90 = 0
 
-        cursor.execute('''
-            UPDATE player_xgoals
-            SET xgoals_xassists_per_90 = ?
-            WHERE id = ?
-        ''', (xgoals_xassists_per_90, player_stats['id']))
-    conn.commit()
-    conn.close()
+        updates.append((xgoals_xassists_per_90, player_stats['id']))
+
+    write_rows('player_xgoals', '''
+        UPDATE player_xgoals
+        SET xgoals_xassists_per_90 = ?
+        WHERE id = ?
+    ''', updates)
 
 
 def update_position_aggregates(rows, position_data):
     """
     Update position-specific averages, minimums, and maximums in the database.
     """
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    updates = []
     for row in rows:
         player_stats = dict(row)
         position = player_stats.get('general_position', 'Unknown General Position')
@@ -574,14 +562,13 @@ def update_position_aggregates(rows, position_data):
         max_ = position_data[position].get(f"max_xgoals_xassists_per_90", 0)
         min_ = position_data[position].get(f"min_xgoals_xassists_per_90", 0)
 
-        cursor.execute('''
-            UPDATE player_xgoals
-            SET avg_xgoals_xassists_per_90 = ?, max_xgoals_xassists_per_90 = ?, min_xgoals_xassists_per_90 = ?
-            WHERE id = ?
-        ''', (avg, max_, min_, player_stats['id']))
-    
-    conn.commit()
-    conn.close()
+        updates.append((avg, max_, min_, player_stats['id']))
+
+    write_rows('player_xgoals', '''
+        UPDATE player_xgoals
+        SET avg_xgoals_xassists_per_90 = ?, max_xgoals_xassists_per_90 = ?, min_xgoals_xassists_per_90 = ?
+        WHERE id = ?
+    ''', updates)
 
 def update_xgoals_xassists_per_90(season):
     """
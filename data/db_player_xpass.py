@@ -1,5 +1,5 @@
 from api import make_asa_api_call
-from .data_util import aggregate_position_data, generate_player_season_id, MINIMUM_MINUTES, get_db_path
+from .data_util import aggregate_position_data, generate_player_season_id, MINIMUM_MINUTES, get_read_connection, get_write_connection
 import sqlite3
 
 def insert_player_xpass_by_season(season, conn=None):
@@ -16,8 +16,7 @@ def insert_player_xpass_by_season(season, conn=None):
     print(f'Inserting data for players (xpass) for season: {season}')
     close_connection = False
     if conn is None:
-        db_path = get_db_path()
-        conn = sqlite3.connect(db_path)
+        conn = get_write_connection()
         close_connection = True
 
     stats_to_track = [
@@ -54,7 +53,7 @@ def fetch_players_xpass_data(season: int, excluded_positions: list = None):
     return [player for player in players_data if player.get('general_position') not in excluded_positions]
 
 def insert_player_data(conn, players_data, position_data, stats_to_track, season):
-    cursor = conn.cursor()
+    rows = []
 
     for player in players_data:
         player_id = player.get('player_id', 'Unknown Player ID')
@@ -81,26 +80,7 @@ def insert_player_data(conn, players_data, position_data, stats_to_track, season
         position_max = {f"max_{stat}": round(position_data.get(general_position, {}).get(f"max_{stat}", 0), 2) for stat in stats_to_track}
         
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO player_xpass (
-                id, player_id, team_id, general_position, minutes_played, attempted_passes,
-                pass_completion_percentage, xpass_completion_percentage, passes_completed_over_expected,
-                passes_completed_over_expected_p100, avg_distance_yds, avg_vertical_distance_yds,
-                share_team_touches, count_games, season,
-                avg_minutes_played, min_minutes_played, max_minutes_played,
-                avg_attempted_passes, min_attempted_passes, max_attempted_passes,
-                avg_pass_completion_percentage, min_pass_completion_percentage, max_pass_completion_percentage,
-                avg_xpass_completion_percentage, min_xpass_completion_percentage, max_xpass_completion_percentage,
-                avg_passes_completed_over_expected, min_passes_completed_over_expected, max_passes_completed_over_expected,
-                avg_passes_completed_over_expected_p100, min_passes_completed_over_expected_p100, max_passes_completed_over_expected_p100,
-                avg_avg_distance_yds, min_avg_distance_yds, max_avg_distance_yds,
-                avg_avg_vertical_distance_yds, min_avg_vertical_distance_yds, max_avg_vertical_distance_yds,
-                avg_share_team_touches, min_share_team_touches, max_share_team_touches,
-                avg_count_games, min_count_games, max_count_games
-            ) VALUES (
-                ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
-            )
-        ''', (
+        rows.append((
             obj_id, player_id, team_id, general_position, minutes_played, attempted_passes,
             pass_completion_percentage, xpass_completion_percentage, passes_completed_over_expected,
             passes_completed_over_expected_p100, avg_distance_yds, avg_vertical_distance_yds,
@@ -117,13 +97,31 @@ def insert_player_data(conn, players_data, position_data, stats_to_track, season
             position_avg['avg_count_games'], position_min['min_count_games'], position_max['max_count_games']
         ))
 
-    conn.commit()
+    write_rows('player_xpass', '''
+        INSERT OR REPLACE INTO player_xpass (
+            id, player_id, team_id, general_position, minutes_played, attempted_passes,
+            pass_completion_percentage, xpass_completion_percentage, passes_completed_over_expected,
+            passes_completed_over_expected_p100, avg_distance_yds, avg_vertical_distance_yds,
+            share_team_touches, count_games, season,
+            avg_minutes_played, min_minutes_played, max_minutes_played,
+            avg_attempted_passes, min_attempted_passes, max_attempted_passes,
+            avg_pass_completion_percentage, min_pass_completion_percentage, max_pass_completion_percentage,
+            avg_xpass_completion_percentage, min_xpass_completion_percentage, max_xpass_completion_percentage,
+            avg_passes_completed_over_expected, min_passes_completed_over_expected, max_passes_completed_over_expected,
+            avg_passes_completed_over_expected_p100, min_passes_completed_over_expected_p100, max_passes_completed_over_expected_p100,
+            avg_avg_distance_yds, min_avg_distance_yds, max_avg_distance_yds,
+            avg_avg_vertical_distance_yds, min_avg_vertical_distance_yds, max_avg_vertical_distance_yds,
+            avg_share_team_touches, min_share_team_touches, max_share_team_touches,
+            avg_count_games, min_count_games, max_count_games
+        ) VALUES (
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        )
+    ''', rows, conn=conn)
 
 def get_player_xpass(player_id, season):
     print('Fetching player xpass for:{}, Season: {}'.format(player_id, season))
     obj_id = generate_player_season_id(player_id=player_id, season=str(season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = '''
@@ -155,8 +153,7 @@ def get_player_xpass(player_id, season):
 
 def get_all_player_xpass(season):
     print('Fetching all players xpass for season: {}'.format(season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = '''
@@ -1,33 +1,31 @@
 from api import make_asa_api_call
-from .data_util import get_db_path
+from .data_util import get_read_connection, write_rows
 import sqlite3
 
 def insert_all_referee_info():
     print('Attempting to insert all referee info...')
     referees_data = make_asa_api_call('nwsl/referees')[1]
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
+    rows = []
 
     for referee in referees_data:
         referee_id = referee.get('referee_id', 'Unknown ID')
         referee_name = referee.get('referee_name', 'Unknown Name')
         nationality = referee.get('nationality', 'Unknown Nationality')
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO referee_info (
-                referee_id,
-                referee_name,
-                nationality
-            ) VALUES (?, ?, ?)
-        ''', (referee_id, referee_name, nationality))
-        conn.commit()
+        rows.append((referee_id, referee_name, nationality))
 
-    conn.close()
+    write_rows('referee_info', '''
+        INSERT OR REPLACE INTO referee_info (
+            referee_id,
+            referee_name,
+            nationality
+        ) VALUES (?, ?, ?)
+    ''', rows)
     print('All referee info successfully entered into the database.')
 
 def get_referee_by_id(referee_id):
     print('Attempting to get referee info by ID:', referee_id)
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
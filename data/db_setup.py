@@ -1,9 +1,43 @@
-import sqlite3
-from .data_util import get_db_path
-
-def create_tables(): # pragma: no cover
+from .data_util import get_write_connection
+
+# Secondary indexes for the getters' WHERE clauses, created by migration 2. Lookups by
+# game_id on game_shots, game_flow and game_goals are already served by their primary
+# key / UNIQUE indexes.
+INDEXES = [
+    # Serves the season shot store load in its (team, game, shot order) sort order, and
+    # covers the (team_id, season) totals including COUNT(DISTINCT game_id)
+    'CREATE INDEX IF NOT EXISTS idx_game_shots_season_order ON game_shots (season, team_id, game_id, shot_order)',
+    'CREATE INDEX IF NOT EXISTS idx_game_shots_pattern_season ON game_shots (pattern_of_play, season)',
+    'CREATE INDEX IF NOT EXISTS idx_games_season_date ON games (season, date_time_utc)',
+    'CREATE INDEX IF NOT EXISTS idx_games_home_team_season ON games (home_team_id, season)',
+    'CREATE INDEX IF NOT EXISTS idx_games_away_team_season ON games (away_team_id, season)',
+    'CREATE INDEX IF NOT EXISTS idx_games_xgoals_season ON games_xgoals (season)',
+    'CREATE INDEX IF NOT EXISTS idx_player_seasons_player ON player_seasons (player_id)',
+    'CREATE INDEX IF NOT EXISTS idx_player_xgoals_season_team ON player_xgoals (season, team_id)',
+    'CREATE INDEX IF NOT EXISTS idx_player_xgoals_player ON player_xgoals (player_id)',
+    'CREATE INDEX IF NOT EXISTS idx_player_xpass_season ON player_xpass (season)',
+    'CREATE INDEX IF NOT EXISTS idx_player_goals_added_season ON player_goals_added (season)',
+    'CREATE INDEX IF NOT EXISTS idx_goalkeeper_xgoals_season_team ON goalkeeper_xgoals (season, team_id)',
+    'CREATE INDEX IF NOT EXISTS idx_goalkeeper_goals_added_season ON goalkeeper_goals_added (season)',
+    # Covers the league and per-team xGA / shots against averages used by the simulator
+    'CREATE INDEX IF NOT EXISTS idx_team_xgoals_season_team ON team_xgoals (season, team_id, count_games, xgoals_against, shots_against)',
+    'CREATE INDEX IF NOT EXISTS idx_team_xpass_season ON team_xpass (season)',
+    'CREATE INDEX IF NOT EXISTS idx_team_strength_history_season ON team_strength_history (season, team_id, count_games)'
+]
+
+def create_tables(conn=None): # pragma: no cover
+    """
+    Creates the base tables (migration 1). Later schema changes live in
+    `data/migrations.py`; use `apply_migrations()` to build a usable database.
+
+    Args:
+        conn (sqlite3.Connection, optional): Open write connection; the caller commits.
+            Defaults to a new connection that is committed and closed.
+    """
+    own_conn = conn is None
     # Connect to SQLite database (or create it if it doesn't exist)
-    conn = sqlite3.connect(get_db_path())
+    if own_conn:
+        conn = get_write_connection()
     cursor = conn.cursor()
 
     print('Starting to build tables...')
@@ -950,6 +984,7 @@ def create_tables(): # pragma: no cover
 
 
     # Commit the changes and close the connection
-    conn.commit()
-    conn.close()
+    if own_conn:
+        conn.commit()
+        conn.close()
     print('Tables built.')
\ No newline at end of file
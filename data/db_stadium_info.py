@@ -1,12 +1,11 @@
 from api import make_asa_api_call
-from .data_util import get_db_path
+from .data_util import get_read_connection, write_rows
 import sqlite3
 
 def insert_all_stadium_info():
     print('Attempting to insert all stadium info...')
     stadia_data = make_asa_api_call('nwsl/stadia')[1]
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
+    rows = []
 
     for stadium in stadia_data:
         stadium_id = stadium.get('stadium_id', 'Unknown ID')
@@ -25,38 +24,37 @@ def insert_all_stadium_info():
         field_x = stadium.get('field_x', -1)
         field_y = stadium.get('field_y', -1)
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO stadium_info (
-                stadium_id,
-                stadium_name,
-                capacity,
-                year_built,
-                roof,
-                turf,
-                street,
-                city,
-                province,
-                country,
-                postal_code,
-                latitude,
-                longitude,
-                field_x,
-                field_y
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        rows.append((
             stadium_id, stadium_name, capacity, year_built, roof, turf,
             street, city, province, country, postal_code,
             latitude, longitude, field_x, field_y
         ))
-        conn.commit()
 
-    conn.close()
+    write_rows('stadium_info', '''
+        INSERT OR REPLACE INTO stadium_info (
+            stadium_id,
+            stadium_name,
+            capacity,
+            year_built,
+            roof,
+            turf,
+            street,
+            city,
+            province,
+            country,
+            postal_code,
+            latitude,
+            longitude,
+            field_x,
+            field_y
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
     print('All stadium info successfully entered into the database.')
 
 
 def get_stadium_by_id(stadium_id):
     print('Attempting to get stadium info by ID:', stadium_id)
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -1,14 +1,12 @@
 from api import make_asa_api_call
-from .data_util import get_db_path
+from .data_util import get_read_connection, write_rows
 import sqlite3
 
 def insert_team_goals_added_by_season(season):
     print('Inserting goals added by season (teams) for:', season)
     api_string = 'nwsl/teams/goals-added?season_name={}&stage_name=Regular Season'.format(str(season))
     teams_data = make_asa_api_call(api_string)[1]
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    rows = []
 
     for team in teams_data:
         team_id = team.get('team_id', 'Unknown Team ID')
@@ -37,18 +35,7 @@ def insert_team_goals_added_by_season(season):
             else:
                 print(f"No action found for: {action_type}")
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO team_goals_added (
-                id, team_id, minutes, 
-                dribbling_num_actions_for, dribbling_goals_added_for, dribbling_num_actions_against, dribbling_goals_added_against, 
-                shooting_num_actions_for, shooting_goals_added_for, shooting_num_actions_against, shooting_goals_added_against, 
-                passing_num_actions_for, passing_goals_added_for, passing_num_actions_against, passing_goals_added_against, 
-                interrupting_num_actions_for, interrupting_goals_added_for, interrupting_num_actions_against, interrupting_goals_added_against, 
-                receiving_num_actions_for, receiving_goals_added_for, receiving_num_actions_against, receiving_goals_added_against, 
-                claiming_num_actions_for, claiming_goals_added_for, claiming_num_actions_against, claiming_goals_added_against, 
-                fouling_num_actions_for, fouling_goals_added_for, fouling_num_actions_against, fouling_goals_added_against, season
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        rows.append((
             obj_id, team_id, minutes,
             int(actions['Dribbling']['num_actions_for']),
             round(actions['Dribbling']['goals_added_for'], 1),
@@ -80,15 +67,24 @@ def insert_team_goals_added_by_season(season):
             round(actions['Fouling']['goals_added_against'], 1),
             int(season)
         ))
-        conn.commit()
-    cursor.close()
-    conn.close()
+
+    write_rows('team_goals_added', '''
+        INSERT OR REPLACE INTO team_goals_added (
+            id, team_id, minutes, 
+            dribbling_num_actions_for, dribbling_goals_added_for, dribbling_num_actions_against, dribbling_goals_added_against, 
+            shooting_num_actions_for, shooting_goals_added_for, shooting_num_actions_against, shooting_goals_added_against, 
+            passing_num_actions_for, passing_goals_added_for, passing_num_actions_against, passing_goals_added_against, 
+            interrupting_num_actions_for, interrupting_goals_added_for, interrupting_num_actions_against, interrupting_goals_added_against, 
+            receiving_num_actions_for, receiving_goals_added_for, receiving_num_actions_against, receiving_goals_added_against, 
+            claiming_num_actions_for, claiming_goals_added_for, claiming_num_actions_against, claiming_goals_added_against, 
+            fouling_num_actions_for, fouling_goals_added_for, fouling_num_actions_against, fouling_goals_added_against, season
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
 
 def get_team_goals_added_by_season(team_id, season):
     print('Fetching team goals added for:{}, Season: {}'.format(team_id, season))
     obj_id = team_id + str(season)
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = f'''
@@ -112,12 +108,10 @@ def get_team_goals_added_by_season(team_id, season):
     return row 
 
 import sqlite3
-from .data_util import get_db_path
 
 def get_all_teams_goals_added_by_season(season):
     print(f'Fetching all team goals added stats for Season: {season}')
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
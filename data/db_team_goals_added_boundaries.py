@@ -1,6 +1,6 @@
 import sqlite3
 from .db_team_goals_added import get_all_teams_goals_added_by_season
-from .data_util import get_db_path
+from .data_util import get_read_connection, get_write_connection
 
 def insert_team_goals_add_boundaries(season):
     """
@@ -36,7 +36,7 @@ def aggregate_season_stats(team_data, stats_to_track):
     return result
 
 def insert_goals_add_boundaries_to_db(season_data):
-    conn = sqlite3.connect(get_db_path())
+    conn = get_write_connection()
     cursor = conn.cursor()
 
     cursor.execute('''
@@ -217,7 +217,7 @@ def insert_goals_add_boundaries_to_db(season_data):
 
 def get_team_goals_add_boundaries_by_season(season):
     print('Attempting to get team goals added boundaries for season:', season)
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
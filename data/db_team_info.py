@@ -1,35 +1,31 @@
 from api import make_asa_api_call
-from .data_util import get_db_path
+from .data_util import get_read_connection, write_rows
 import sqlite3
 
 def insert_team_info():
     print('Attempting  to insert all teams info...')
     teams_data = make_asa_api_call('nwsl/teams')[1]
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    rows = []
     for team in teams_data:
         team_id = team.get('team_id', 'Unknown ID')
         team_name = team.get('team_name', 'Unknown Name')
         team_short_name = team.get('team_short_name', 'Unknown Short Name')
         team_abbreviation = team.get('team_abbreviation', 'Unknown Abbreviation')
 
-        cursor.execute('''
-        INSERT OR REPLACE INTO team_info (
-            team_id, team_name, team_short_name, team_abbreviation
-        ) VALUES (?, ?, ?, ?)
-        ''', (
+        rows.append((
             team_id, team_name, team_short_name, team_abbreviation
         ))
 
-        conn.commit()
-    conn.close()
+    write_rows('team_info', '''
+        INSERT OR REPLACE INTO team_info (
+            team_id, team_name, team_short_name, team_abbreviation
+        ) VALUES (?, ?, ?, ?)
+    ''', rows)
     print('All teams info successfully entered into the database.')
 
 def get_all_teams_info():
     print('Fetching all teams info from the database...')
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM team_info')
@@ -41,8 +37,7 @@ def get_all_teams_info():
 
 def get_team_info_by_id(team_id):
     print('Fetching team information for team id:', team_id)
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     cursor.execute('SELECT * FROM team_info WHERE team_id = ?', (team_id,))
@@ -56,7 +51,7 @@ def get_team_name_map():
     """
     Returns a dictionary mapping team_id → team_name from team_info table.
     """
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -70,7 +65,7 @@ def get_team_abbreviation_map():
     """
     Returns a dictionary mapping team_id → team_abbreviation from team_info table.
     """
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -0,0 +1,196 @@
+'''
+team_season_summary holds one row per team and season, so the team-level
+shot totals and per-game rates are primary-key lookups instead of scans of
+game_shots and team_xgoals. Two ingestion steps maintain it: the shot columns
+from game_shots (before team_xgoals, which reads PSxG and penalty totals from
+here) and the defensive columns from team_xgoals (after it).
+'''
+from .data_util import validate_id, validate_season, get_read_connection, get_write_connection
+import sqlite3
+
+SHOT_COLUMNS = ['shots', 'games_with_shots', 'shots_per_game', 'psxg',
+                'penalty_shots', 'penalty_xg', 'penalty_psxg', 'penalty_goals']
+DEFENSE_COLUMNS = ['count_games', 'xgoals_against', 'shots_against', 'xga_per_game', 'shots_against_per_game',
+                   'league_xga_per_game', 'league_shots_against_per_game']
+
+def update_team_season_shot_summary(season):
+    """
+    Recomputes a season's shot totals per team from game_shots, in one transaction.
+
+    Run after the season's shots are loaded (see `insert_game_shots_by_season()`).
+
+    Args:
+        season (int): The season to summarise.
+
+    Returns:
+        int: Number of teams with shots.
+    """
+    validate_season(season)
+    print(f'Updating team shot summary for season {season}...')
+    conn = get_write_connection()
+    try:
+        conn.execute('BEGIN')
+        teams = _refresh_shot_summary(conn, season)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    print(f'Team shot summary updated for {teams} teams in season {season}.')
+    return teams
+
+def update_team_season_defense_summary(season):
+    """
+    Copies a season's goals and shots against per team from team_xgoals, with
+    per-game rates and league averages, in one transaction.
+
+    Run after `insert_teams_xgoals_by_season()`.
+
+    Args:
+        season (int): The season to summarise.
+
+    Returns:
+        int: Number of teams in team_xgoals.
+    """
+    validate_season(season)
+    print(f'Updating team defensive summary for season {season}...')
+    conn = get_write_connection()
+    try:
+        conn.execute('BEGIN')
+        teams = _refresh_defense_summary(conn, season)
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    print(f'Team defensive summary updated for {teams} teams in season {season}.')
+    return teams
+
+def get_team_season_summary(team_id, season):
+    """
+    Retrieves a team's summary row for a season.
+
+    Args:
+        team_id (str): The team ID.
+        season (int): The season year.
+
+    Returns:
+        sqlite3.Row | None: The row (see SHOT_COLUMNS and DEFENSE_COLUMNS), or None if the
+            team has neither shots nor a team_xgoals row that season.
+    """
+    validate_id(team_id)
+    conn = get_read_connection()
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT *
+        FROM team_season_summary
+        WHERE season = ? AND team_id = ?
+    ''', (season, team_id))
+    row = cursor.fetchone()
+    conn.close()
+    return row
+
+def get_league_season_summary(season):
+    """
+    Retrieves a season's league-wide averages.
+
+    Every team row of a season carries the same league columns, so one row is enough.
+
+    Args:
+        season (int): The season year.
+
+    Returns:
+        sqlite3.Row | None: "league_xga_per_game" and "league_shots_against_per_game", or None
+            if the season has no team_xgoals rows.
+    """
+    conn = get_read_connection()
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute('''
+        SELECT league_xga_per_game, league_shots_against_per_game
+        FROM team_season_summary
+        WHERE season = ? AND count_games IS NOT NULL
+        LIMIT 1
+    ''', (season,))
+    row = cursor.fetchone()
+    conn.close()
+    return row
+
+def refresh_all_team_season_summaries(conn):
+    """
+    Rebuilds every season's summary on an open connection, inside the caller's transaction.
+
+    Used by the migration that creates the table, so existing databases have it
+    filled without re-ingesting.
+
+    Args:
+        conn (sqlite3.Connection): Open write connection.
+    """
+    seasons = {row[0] for row in conn.execute('SELECT DISTINCT season FROM game_shots WHERE season IS NOT NULL')}
+    seasons |= {row[0] for row in conn.execute('SELECT DISTINCT season FROM team_xgoals WHERE season IS NOT NULL')}
+    for season in sorted(seasons):
+        _refresh_shot_summary(conn, season)
+        _refresh_defense_summary(conn, season)
+
+def _refresh_shot_summary(conn, season):
+    # Zero first so a team whose shots were removed does not keep stale totals
+    conn.execute(f'''
+        UPDATE team_season_summary
+        SET {', '.join(f'{column} = 0' for column in SHOT_COLUMNS)}
+        WHERE season = ?
+    ''', (season,))
+    cursor = conn.execute(f'''
+        INSERT INTO team_season_summary (season, team_id, {', '.join(SHOT_COLUMNS)})
+        SELECT
+            season,
+            team_id,
+            COUNT(*),
+            COUNT(DISTINCT game_id),
+            CAST(COUNT(*) AS REAL) / COUNT(DISTINCT game_id),
+            TOTAL(shot_psxg),
+            SUM(pattern_of_play = 'Penalty'),
+            TOTAL(CASE WHEN pattern_of_play = 'Penalty' THEN shot_xg END),
+            TOTAL(CASE WHEN pattern_of_play = 'Penalty' THEN shot_psxg END),
+            SUM(pattern_of_play = 'Penalty' AND goal = 1)
+        FROM game_shots
+        WHERE season = ?
+        GROUP BY team_id
+        ON CONFLICT (season, team_id) DO UPDATE SET
+            {', '.join(f'{column} = excluded.{column}' for column in SHOT_COLUMNS)}
+    ''', (season,))
+    return cursor.rowcount
+
+def _refresh_defense_summary(conn, season):
+    conn.execute(f'''
+        UPDATE team_season_summary
+        SET {', '.join(f'{column} = NULL' for column in DEFENSE_COLUMNS)}
+        WHERE season = ?
+    ''', (season,))
+    cursor = conn.execute(f'''
+        INSERT INTO team_season_summary (season, team_id, {', '.join(DEFENSE_COLUMNS)})
+        SELECT
+            tx.season,
+            tx.team_id,
+            tx.count_games,
+            tx.xgoals_against,
+            tx.shots_against,
+            CASE WHEN tx.count_games > 0 THEN CAST(tx.xgoals_against AS REAL) / tx.count_games END,
+            CASE WHEN tx.count_games > 0 THEN CAST(tx.shots_against AS REAL) / tx.count_games END,
+            league.xga_per_game,
+            league.shots_against_per_game
+        FROM team_xgoals AS tx
+        JOIN (
+            SELECT
+                CASE WHEN SUM(count_games) > 0 THEN TOTAL(xgoals_against) / SUM(count_games) END AS xga_per_game,
+                CASE WHEN SUM(count_games) > 0 THEN TOTAL(shots_against) / SUM(count_games) END AS shots_against_per_game
+            FROM team_xgoals
+            WHERE season = ?
+        ) AS league
+        WHERE tx.season = ?
+        ON CONFLICT (season, team_id) DO UPDATE SET
+            {', '.join(f'{column} = excluded.{column}' for column in DEFENSE_COLUMNS)}
+    ''', (season, season))
+    return cursor.rowcount
@@ -1,10 +1,9 @@
 import sqlite3
-from .data_util import get_db_path
+from .data_util import get_read_connection, get_write_connection
 
 def insert_team_strength(xgd_contrib, gd_contrib, xp_contrib, p_contrib, gdmxgd_contrib, gfdiff_contrib, psxgdiff_contrib, season, team_id):
     print('Attempting to insert team strength...')
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_write_connection()
     cursor = conn.cursor()
     cursor.execute('''
         INSERT OR REPLACE INTO team_strength (
@@ -37,8 +36,7 @@ def insert_team_strength(xgd_contrib, gd_contrib, xp_contrib, p_contrib, gdmxgd_
 
 def get_team_strength(team_id, season):
     print(f'Fetching team strength for {team_id} in {season}...')
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
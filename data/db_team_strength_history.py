@@ -1,9 +1,9 @@
 import sqlite3
-from .data_util import get_db_path
+from .data_util import get_read_connection
 
 def get_team_strength_history_by_season(season):
     print('Attempting to get team strength history with team info for season:', season)
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
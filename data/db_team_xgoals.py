@@ -2,9 +2,10 @@ from api import make_asa_api_call
 from datetime import datetime, timedelta
 import sqlite3
 from sklearn.preprocessing import MinMaxScaler
-from .data_util import get_db_path
+from .data_util import get_read_connection, get_write_connection, write_rows
 from .db_team_strength import insert_team_strength
-from .db_game_shots import get_total_psxg_by_team_and_season, get_penalty_kicks_for_team
+from .db_game_shots import get_total_psxg_by_team_and_season
+from .db_team_season_summary import get_team_season_summary, get_league_season_summary
 import copy
 
 def insert_teams_xgoals_by_season(season):
@@ -36,13 +37,13 @@ def insert_teams_xgoals_by_season(season):
 
         # Create adjusted version for strength calculation
         adjusted = copy.deepcopy(team)
-        penalty_shots = get_penalty_kicks_for_team(team_id, season)
-        penalty_xg = sum(s['shot_xg'] for s in penalty_shots)
-        penalty_psxg = sum(s['shot_psxg'] for s in penalty_shots)
+        summary = get_team_season_summary(team_id, season)
+        penalty_xg = summary['penalty_xg'] if summary else 0.0
+        penalty_psxg = summary['penalty_psxg'] if summary else 0.0
         print(team_id)
         print("penalty_xg", penalty_xg)
         print("penalty_psxg", penalty_psxg)
-        penalty_goals = sum(1 for s in penalty_shots if s['goal'] == 1)
+        penalty_goals = summary['penalty_goals'] if summary else 0
 
         adjusted['xgoal_difference'] -= penalty_xg
         adjusted['psxg_xg_diff'] -= (penalty_psxg - penalty_xg)
@@ -55,8 +56,7 @@ def insert_teams_xgoals_by_season(season):
     feature_mins, feature_maxs = calculate_feature_min_max(adjusted_teams)
 
     # Step 3: Insert data into database
-    conn = sqlite3.connect(get_db_path())
-    cursor = conn.cursor()
+    rows = []
 
     for team, adjusted in zip(teams_data, adjusted_teams):
         team_id = team.get('team_id', 'Unknown Team ID')
@@ -64,15 +64,7 @@ def insert_teams_xgoals_by_season(season):
 
         team_strength = calculate_team_strength(adjusted, feature_mins, feature_maxs, season)
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO team_xgoals (
-                id, team_id, count_games, shots_for, shots_against, goals_for, 
-                goals_against, goal_difference, xgoals_for, xgoals_against, 
-                xgoal_difference, goal_difference_minus_xgoal_difference, 
-                points, xpoints, season, predicted_points, point_diff, 
-                goalfor_xgoalfor_diff, psxg, psxg_xg_diff, team_strength
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        rows.append((
             obj_id,
             team_id,
             team.get('count_games', 0),
@@ -96,8 +88,15 @@ def insert_teams_xgoals_by_season(season):
             team_strength
         ))
 
-        conn.commit()
-    conn.close()
+    write_rows('team_xgoals', '''
+        INSERT OR REPLACE INTO team_xgoals (
+            id, team_id, count_games, shots_for, shots_against, goals_for, 
+            goals_against, goal_difference, xgoals_for, xgoals_against, 
+            xgoal_difference, goal_difference_minus_xgoal_difference, 
+            points, xpoints, season, predicted_points, point_diff, 
+            goalfor_xgoalfor_diff, psxg, psxg_xg_diff, team_strength
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
 
 
 '''
@@ -107,8 +106,7 @@ def insert_teams_xgoals_by_season(season):
 '''
 def get_top_team_xgoals_stat(season, sorting_stat = "points"):
     print('Teams - Xgoals in {} for: {}.'.format(sorting_stat, season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = f'''
@@ -135,8 +133,7 @@ def get_top_team_xgoals_stat(season, sorting_stat = "points"):
 
 def get_team_xgoals_by_season(team_id, season):
     print('Team - Xgoals in {} for: {}.'.format(team_id, season))
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = f'''
@@ -161,8 +158,7 @@ def get_team_xgoals_by_season(team_id, season):
 
 def get_all_team_xgoals_by_season(season):
     print('Fetching all team xGoals data for season:', season)
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     
@@ -259,7 +255,7 @@ def calculate_team_strength(team, feature_mins, feature_maxs, season):
 
 def insert_team_strength_history(season):
     print(f"Checking team strength update needs for season {season}...")
-    conn = sqlite3.connect(get_db_path())
+    conn = get_write_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -341,7 +337,7 @@ def get_team_strength_for_season(cursor, season):
     return cursor.fetchall()
 
 def get_team_strength_by_season(season):
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -370,43 +366,15 @@ def get_team_xga_per_game(team_id, season):
     """
     Returns xGA per game for the specified team in the given season.
     """
-    conn = sqlite3.connect(get_db_path())
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    query = """
-    SELECT xgoals_against, count_games
-    FROM team_xgoals
-    WHERE team_id = ? AND season = ?
-    """
-    cursor.execute(query, (team_id, season))
-    row = cursor.fetchone()
-    conn.close()
-
-    if row and row['count_games'] > 0:
-        return row['xgoals_against'] / row['count_games']
-    return None
+    summary = get_team_season_summary(team_id, season)
+    return summary['xga_per_game'] if summary else None
 
 def get_league_avg_xga_per_game(season):
     """
     Returns the league-wide average xGA per game for the given season.
     """
-    conn = sqlite3.connect(get_db_path())
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    query = """
-    SELECT SUM(xgoals_against) AS total_xga, SUM(count_games) AS total_games
-    FROM team_xgoals
-    WHERE season = ?
-    """
-    cursor.execute(query, (season,))
-    row = cursor.fetchone()
-    conn.close()
-
-    if row and row['total_games'] > 0:
-        return row['total_xga'] / row['total_games']
-    return None
+    summary = get_league_season_summary(season)
+    return summary['league_xga_per_game'] if summary else None
 
 def get_team_shots_against_per_game(team_id, season):
     """
@@ -419,22 +387,8 @@ def get_team_shots_against_per_game(team_id, season):
     Returns:
         float or None: The average shots against per game, or None if data is unavailable.
     """
-    conn = sqlite3.connect(get_db_path())
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    query = """
-    SELECT shots_against, count_games
-    FROM team_xgoals
-    WHERE team_id = ? AND season = ?
-    """
-    cursor.execute(query, (team_id, season))
-    row = cursor.fetchone()
-    conn.close()
-
-    if row and row['count_games'] > 0:
-        return row['shots_against'] / row['count_games']
-    return None
+    summary = get_team_season_summary(team_id, season)
+    return summary['shots_against_per_game'] if summary else None
 
 def get_league_avg_shots_against_per_game(season):
     """
@@ -446,22 +400,8 @@ def get_league_avg_shots_against_per_game(season):
     Returns:
         float or None: The league average shots against per game.
     """
-    conn = sqlite3.connect(get_db_path())
-    conn.row_factory = sqlite3.Row
-    cursor = conn.cursor()
-
-    query = """
-    SELECT SUM(shots_against) AS total_sa, SUM(count_games) AS total_games
-    FROM team_xgoals
-    WHERE season = ?
-    """
-    cursor.execute(query, (season,))
-    row = cursor.fetchone()
-    conn.close()
-
-    if row and row['total_games'] > 0:
-        return row['total_sa'] / row['total_games']
-    return None
+    summary = get_league_season_summary(season)
+    return summary['league_shots_against_per_game'] if summary else None
 
 '''
 ======================
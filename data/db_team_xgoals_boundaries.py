@@ -1,6 +1,6 @@
 import sqlite3
 from .db_team_xgoals import get_top_team_xgoals_stat
-from .data_util import get_db_path
+from .data_util import get_read_connection, get_write_connection
 
 def insert_team_xgoal_boundaries(season):
     """
@@ -22,7 +22,7 @@ def insert_season_boundaries_to_db(season_data, stats_to_track):
     """
     Inserts one season-wide row into team_xgoals_boundaries.
     """
-    conn = sqlite3.connect(get_db_path())
+    conn = get_write_connection()
     cursor = conn.cursor()
 
     cursor.execute('''
@@ -144,7 +144,7 @@ def aggregate_season_stats(team_data, stats_to_track):
 
 def get_team_xgoal_boundaries_by_season(season):
     print('Attempting to get team xGoal boundaries for season:', season)
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -1,14 +1,12 @@
 from api import make_asa_api_call
-from .data_util import get_db_path
+from .data_util import get_read_connection, write_rows
 import sqlite3
 
 def insert_teams_xpass_by_season(season):
     print('Inserting teams data (xpasses) for season:', season)
     api_string = 'nwsl/teams/xpass?season_name={}&stage_name=Regular Season'.format(str(season))
     teams_data = make_asa_api_call(api_string)[1]
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    rows = []
     for team in teams_data:
         team_id = team.get('team_id', 'Unknown Team ID')
         obj_id = team_id + str(season)
@@ -28,18 +26,7 @@ def insert_teams_xpass_by_season(season):
         passes_completed_over_expected_difference = team.get('passes_completed_over_expected_difference', 0.0)
         avg_vertical_distance_difference = team.get('avg_vertical_distance_difference', 0.0)
 
-        cursor.execute('''
-            INSERT OR REPLACE INTO team_xpass (
-                id, team_id, count_games, attempted_passes_for, pass_completion_percentage_for, 
-                xpass_completion_percentage_for, passes_completed_over_expected_for, 
-                passes_completed_over_expected_p100_for, avg_vertical_distance_for, 
-                attempted_passes_against, pass_completion_percentage_against, 
-                xpass_completion_percentage_against, passes_completed_over_expected_against, 
-                passes_completed_over_expected_p100_against, avg_vertical_distance_against, 
-                passes_completed_over_expected_difference, avg_vertical_distance_difference,
-                season
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
+        rows.append((
             obj_id, team_id, count_games,attempted_passes_for,
             round((pass_completion_percentage_for * 100), 1),
             round((xpass_completion_percentage_for * 100), 1),
@@ -57,14 +44,23 @@ def insert_teams_xpass_by_season(season):
             int(season)
         ))
 
-        conn.commit()
-    conn.close()
+    write_rows('team_xpass', '''
+        INSERT OR REPLACE INTO team_xpass (
+            id, team_id, count_games, attempted_passes_for, pass_completion_percentage_for, 
+            xpass_completion_percentage_for, passes_completed_over_expected_for, 
+            passes_completed_over_expected_p100_for, avg_vertical_distance_for, 
+            attempted_passes_against, pass_completion_percentage_against, 
+            xpass_completion_percentage_against, passes_completed_over_expected_against, 
+            passes_completed_over_expected_p100_against, avg_vertical_distance_against, 
+            passes_completed_over_expected_difference, avg_vertical_distance_difference,
+            season
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', rows)
 
 def get_team_xpass_by_season(team_id, season):
     print('Fetching team xpasses for:{}, Season: {}'.format(team_id, season))
     obj_id = team_id + str(season)
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = f'''
@@ -89,8 +85,7 @@ def get_team_xpass_by_season(team_id, season):
 
 def get_all_teams_xpass_by_season(season):
     print(f'Attempting to get all teams xpass data from data base, season: {season}.')
-    db_path = get_db_path()
-    conn = sqlite3.connect(db_path)
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
     query = f'''
@@ -1,6 +1,6 @@
 import sqlite3
 from .db_team_xpass import get_all_teams_xpass_by_season
-from .data_util import get_db_path
+from .data_util import get_read_connection, get_write_connection
 
 def insert_team_xpass_boundaries(season):
     """
@@ -25,7 +25,7 @@ def insert_xpass_boundaries_to_db(season_data, stats_to_track):
     """
     Inserts one season-wide row into team_xpass_boundaries with clear formatting.
     """
-    conn = sqlite3.connect(get_db_path())
+    conn = get_write_connection()
     cursor = conn.cursor()
 
     cursor.execute('''
@@ -148,7 +148,7 @@ def aggregate_season_stats(team_data, stats_to_track):
 
 def get_team_xpass_boundaries_by_season(season):
     print('Attempting to get team xPass boundaries for season:', season)
-    conn = sqlite3.connect(get_db_path())
+    conn = get_read_connection()
     conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
@@ -0,0 +1,199 @@
+'''
+Ingestion steps for setup.py and update.py, declared as a `Pipeline` graph.
+
+Each step names the tables it reads and writes, and the pipeline orders and
+parallelises them from that. Season aggregates from the API list `games` as
+an input: ASA derives them from the season's games, so in an incremental
+update a season with no new or changed games skips them all.
+'''
+from . import (db_games_xgoals, db_games, db_goalkeeper_goals_added, db_goalkeeper_xgoals, db_midfielder_strength,
+               db_player_goals_added, db_player_info, db_player_xgoals, db_player_xpass,
+               db_team_goals_added, db_team_info, db_team_xgoals, db_team_xpass, db_game_flow,
+               db_manager_info, db_referee_info, db_stadium_info, db_game_shots,
+               db_team_xgoals_boundaries, db_team_xpass_boundaries, db_team_goals_added_boundaries,
+               db_game_goals, db_defender_strength, db_goalkeeper_strength, db_attacker_strength, db_game_watermarks,
+               db_team_season_summary, db_game_team_summary)
+from .pipeline import Pipeline, UNCHANGED, DEFAULT_MAX_WORKERS
+from .data_util import bump_data_generation, get_tables_checksum
+from datetime import datetime
+
+# Tables the player and team getters join for names and positions
+REFERENCE_TABLES = ('player_info', 'player_seasons', 'team_info')
+
+def add_reference_steps(pipeline):
+    """
+    Adds the steps that load season-independent reference tables.
+
+    They reload every row on each run, so each reports `UNCHANGED` when its
+    tables' contents are the same afterwards (see `report_changes()`).
+
+    Args:
+        pipeline (Pipeline): Pipeline to add to.
+    """
+    steps = [
+        ('player_info', db_player_info.insert_all_players_info, ['player_info', 'player_seasons']),
+        ('team_info', db_team_info.insert_team_info, ['team_info']),
+        ('manager_info', db_manager_info.insert_all_manager_info, ['manager_info']),
+        ('referee_info', db_referee_info.insert_all_referee_info, ['referee_info']),
+        ('stadium_info', db_stadium_info.insert_all_stadium_info, ['stadium_info'])
+    ]
+    for name, func, outputs in steps:
+        pipeline.add(name, report_changes(func, outputs), outputs=outputs)
+
+def report_changes(func, tables):
+    """
+    Wraps a step so it returns `UNCHANGED` when it leaves its tables as they were.
+
+    Args:
+        func (Callable[[], Any]): Step function that rewrites `tables`.
+        tables (Iterable[str]): Tables the step writes.
+
+    Returns:
+        Callable[[], Any]: The wrapped step.
+    """
+    def step():
+        before = get_tables_checksum(tables)
+        result = func()
+        if result is not UNCHANGED and get_tables_checksum(tables) == before:
+            return UNCHANGED
+        return result
+    return step
+
+def add_season_steps(pipeline, season, incremental=False, replace=False):
+    """
+    Adds every step that loads or derives one season's tables.
+
+    Game-level data is refreshed from the API for the current season or when
+    `replace` is set; closed seasons replay from the API response cache.
+
+    Args:
+        pipeline (Pipeline): Pipeline to add to.
+        season (int): Season to load.
+        incremental (bool, optional): Only re-ingest games whose `last_updated_utc` moved
+            (see data/db_game_watermarks.py), and skip the season if there are none.
+            Defaults to False.
+        replace (bool, optional): Replace the season's game shots rather than adding to
+            them. Ignored when `incremental`, which replaces changed games only. Defaults to False.
+    """
+    refresh = replace or season >= datetime.now().year
+    # Game IDs to (re-)ingest, set by the games step
+    state = {}
+
+    def load_games():
+        db_games.insert_all_games_by_season(season)
+        state['game_ids'] = db_games.get_game_ids_by_season(season)
+        if not incremental:
+            state['changed_game_ids'] = state['game_ids']
+            return None
+        state['changed_game_ids'] = db_game_watermarks.get_changed_game_ids(season)
+        if not state['changed_game_ids']:
+            print(f'No new or changed games in {season}, skipping.')
+            return UNCHANGED
+        print(f'Replacing {len(state["changed_game_ids"])} of {len(state["game_ids"])} games in {season}...')
+        return None
+
+    def load_game_shots():
+        if incremental:
+            return db_game_shots.replace_game_shots_by_game_ids(season, state['changed_game_ids'])
+        return db_game_shots.insert_game_shots_by_season(season, state['game_ids'], replace=replace, refresh=refresh)
+
+    def load_game_flow():
+        if incremental:
+            return db_game_flow.replace_flow_by_game_ids(state['changed_game_ids'])
+        return db_game_flow.insert_flow_by_game_ids(state['game_ids'], refresh=refresh)
+
+    def load_game_goals():
+        if incremental:
+            return db_game_goals.replace_game_goals_by_game_ids(state['changed_game_ids'])
+        return db_game_goals.insert_game_goals_by_season(season)
+
+    steps = [
+        ('games', load_games, [], ['games']),
+        ('games_xgoals', lambda: db_games_xgoals.insert_all_games_xgoals_by_season(season),
+         ['games'], ['games_xgoals']),
+        ('game_shots', load_game_shots, ['games'], ['game_shots']),
+        ('game_flow', load_game_flow, ['games'], ['game_flow']),
+        ('game_goals', load_game_goals, ['game_shots'], ['game_goals']),
+        ('game_team_summary', lambda: db_game_team_summary.update_game_team_summary(season),
+         ['game_shots'], ['game_team_summary']),
+
+        ('goalkeeper_goals_added', lambda: db_goalkeeper_goals_added.insert_goalkeeper_goals_added_by_season(season),
+         ['games'], ['goalkeeper_goals_added']),
+        ('goalkeeper_xgoals', lambda: db_goalkeeper_xgoals.insert_goalkeeper_xgoals_by_season(season),
+         ['games'], ['goalkeeper_xgoals']),
+        ('player_goals_added', lambda: db_player_goals_added.insert_player_goals_added_by_season(season),
+         ['games'], ['player_goals_added']),
+        ('player_xgoals', lambda: db_player_xgoals.insert_player_xgoals_by_season(season),
+         ['games'], ['player_xgoals']),
+        ('player_xgoals_per_90', lambda: db_player_xgoals.update_xgoals_xassists_per_90(season),
+         ['player_xgoals', *REFERENCE_TABLES], ['player_xgoals']),
+        ('player_xpass', lambda: db_player_xpass.insert_player_xpass_by_season(season),
+         ['games'], ['player_xpass']),
+
+        # Strength scores discount penalties, so they read game_shots
+        ('midfielder_strength', lambda: db_midfielder_strength.update_midfielder_strength(season),
+         ['player_xgoals', 'player_xpass', 'player_goals_added', 'game_shots', *REFERENCE_TABLES], ['player_xgoals']),
+        ('attacker_strength', lambda: db_attacker_strength.update_attacker_strength(season),
+         ['player_xgoals', 'player_goals_added', 'game_shots', *REFERENCE_TABLES], ['player_xgoals']),
+        ('defender_strength', lambda: db_defender_strength.update_defender_strength(season),
+         ['player_xgoals', 'player_xpass', 'player_goals_added', 'game_shots', *REFERENCE_TABLES], ['player_xgoals']),
+        ('goalkeeper_strength', lambda: db_goalkeeper_strength.update_goalkeeper_strength(season),
+         ['goalkeeper_xgoals', 'goalkeeper_goals_added', *REFERENCE_TABLES], ['goalkeeper_xgoals']),
+
+        ('team_goals_added', lambda: db_team_goals_added.insert_team_goals_added_by_season(season),
+         ['games'], ['team_goals_added']),
+        ('team_season_shot_summary', lambda: db_team_season_summary.update_team_season_shot_summary(season),
+         ['game_shots'], ['team_season_summary']),
+        # PSxG and the penalty adjustment to team strength come from the shot summary
+        ('team_xgoals', lambda: db_team_xgoals.insert_teams_xgoals_by_season(season),
+         ['games', 'team_season_summary'], ['team_xgoals', 'team_strength']),
+        ('team_season_defense_summary', lambda: db_team_season_summary.update_team_season_defense_summary(season),
+         ['team_xgoals'], ['team_season_summary']),
+        ('team_strength_history', lambda: db_team_xgoals.insert_team_strength_history(season),
+         ['team_xgoals'], ['team_strength_history']),
+        ('team_xpass', lambda: db_team_xpass.insert_teams_xpass_by_season(season),
+         ['games'], ['team_xpass']),
+        ('team_xgoals_boundaries', lambda: db_team_xgoals_boundaries.insert_team_xgoal_boundaries(season),
+         ['team_xgoals', 'team_info'], ['team_xgoals_boundaries']),
+        ('team_xpass_boundaries', lambda: db_team_xpass_boundaries.insert_team_xpass_boundaries(season),
+         ['team_xpass', 'team_info'], ['team_xpass_boundaries']),
+        ('team_goals_added_boundaries', lambda: db_team_goals_added_boundaries.insert_team_goals_add_boundaries(season),
+         ['team_goals_added', 'team_info'], ['team_goals_add_boundaries'])
+    ]
+    for name, func, inputs, outputs in steps:
+        pipeline.add(name, func, season, inputs, outputs)
+
+    # Watermarks go last, so a failed step leaves its games marked as changed for the next run
+    season_tables = sorted({table for _, _, _, outputs in steps for table in outputs})
+    pipeline.add('game_watermarks', lambda: db_game_watermarks.set_game_watermarks(state['changed_game_ids']),
+                 season, season_tables, ['game_watermarks'])
+
+def build_pipeline(seasons, incremental=False, replace=False, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Builds the ingestion pipeline for reference data and a list of seasons.
+
+    Seasons share only the reference tables, so their steps overlap.
+
+    Args:
+        seasons (Iterable[int]): Seasons to load.
+        incremental (bool, optional): See `add_season_steps()`. Defaults to False.
+        replace (bool, optional): See `add_season_steps()`. Defaults to False.
+        max_workers (int, optional): Steps run at once. Defaults to DEFAULT_MAX_WORKERS.
+
+    Returns:
+        Pipeline: The pipeline, ready to `run()`.
+
+    Example:
+        >>> pipeline = build_pipeline([2024, 2025], incremental=True)
+        >>> pipeline.run()
+        >>> pipeline.print_report()
+    """
+    pipeline = Pipeline(max_workers)
+    add_reference_steps(pipeline)
+    for season in seasons:
+        add_season_steps(pipeline, season, incremental, replace)
+    # Bumped once after every table is written, so cached pages are rebuilt once per run.
+    # Skipped, like any step, when every step before it was skipped or unchanged.
+    tables = sorted({table for step in pipeline.steps for table in step.outputs})
+    pipeline.add('data_generation', bump_data_generation, inputs=tables, outputs=['data_generation'])
+    return pipeline
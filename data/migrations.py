@@ -0,0 +1,234 @@
+'''
+Numbered forward migrations for nwsl.db.
+
+Each migration runs in its own transaction and is recorded in the
+`schema_version` table, so schema changes (indexes, columns, derived tables)
+reach an existing database without re-ingesting it from the API. To change
+the schema, append a new migration to MIGRATIONS; never edit one that has
+shipped.
+'''
+from .data_util import get_write_connection
+from . import db_setup, db_team_season_summary, db_game_team_summary
+from datetime import datetime, timezone
+
+def _create_base_tables(conn):
+    db_setup.create_tables(conn)
+
+def _create_secondary_indexes(conn):
+    for statement in db_setup.INDEXES:
+        conn.execute(statement)
+    # Gives the query planner statistics to choose between the new indexes
+    conn.execute('ANALYZE')
+
+def _add_team_goals_added_season(conn):
+    # The base DDL lost this column to a missing comma, so every insert and season lookup failed
+    if 'season' not in _get_columns(conn, 'team_goals_added'):
+        conn.execute('ALTER TABLE team_goals_added ADD COLUMN season INTEGER')
+    # Row IDs are team_id + season
+    conn.execute('UPDATE team_goals_added SET season = CAST(substr(id, -4) AS INTEGER) WHERE season IS NULL')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_team_goals_added_season ON team_goals_added (season)')
+
+def _create_game_watermarks(conn):
+    # last_updated_utc of each game when its shots, flow and goals were last ingested
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS game_watermarks (
+            game_id TEXT PRIMARY KEY,
+            season INTEGER NOT NULL,
+            last_updated_utc TEXT,
+            ingested_at TEXT NOT NULL
+        )
+    ''')
+
+def _create_team_season_summary(conn):
+    # Per team and season aggregates of game_shots and team_xgoals; see data/db_team_season_summary.py
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS team_season_summary (
+            season INTEGER NOT NULL,
+            team_id TEXT NOT NULL,
+            shots INTEGER NOT NULL DEFAULT 0,
+            games_with_shots INTEGER NOT NULL DEFAULT 0,
+            shots_per_game REAL NOT NULL DEFAULT 0,
+            psxg REAL NOT NULL DEFAULT 0,
+            penalty_shots INTEGER NOT NULL DEFAULT 0,
+            penalty_xg REAL NOT NULL DEFAULT 0,
+            penalty_psxg REAL NOT NULL DEFAULT 0,
+            penalty_goals INTEGER NOT NULL DEFAULT 0,
+            count_games INTEGER,
+            xgoals_against REAL,
+            shots_against INTEGER,
+            xga_per_game REAL,
+            shots_against_per_game REAL,
+            league_xga_per_game REAL,
+            league_shots_against_per_game REAL,
+            PRIMARY KEY (season, team_id)
+        )
+    ''')
+    db_team_season_summary.refresh_all_team_season_summaries(conn)
+
+def _create_game_team_summary(conn):
+    # Per game and team shot aggregates for the game page; see data/db_game_team_summary.py
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS game_team_summary (
+            game_id TEXT NOT NULL,
+            team_id TEXT NOT NULL,
+            season INTEGER NOT NULL,
+            shots INTEGER NOT NULL,
+            shots_on_target INTEGER NOT NULL,
+            psxg REAL NOT NULL,
+            xg REAL NOT NULL,
+            goals INTEGER NOT NULL,
+            PRIMARY KEY (game_id, team_id)
+        )
+    ''')
+    conn.execute('CREATE INDEX IF NOT EXISTS idx_game_team_summary_season ON game_team_summary (season)')
+    db_game_team_summary.refresh_all_game_team_summaries(conn)
+
+def _create_data_generation(conn):
+    # Single-row counter bumped by each ingestion run; see data_util.get_data_generation()
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS data_generation (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            generation INTEGER NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    ''')
+
+# (version, description, function taking an open write connection)
+MIGRATIONS = [
+    (1, 'Create base tables', _create_base_tables),
+    (2, 'Add secondary indexes for getter predicates', _create_secondary_indexes),
+    (3, 'Add missing team_goals_added.season column', _add_team_goals_added_season),
+    (4, 'Add game_watermarks for incremental updates', _create_game_watermarks),
+    (5, 'Add team_season_summary', _create_team_season_summary),
+    (6, 'Add game_team_summary', _create_game_team_summary),
+    (7, 'Add data_generation counter', _create_data_generation)
+]
+
+# Databases indexed before schema_version existed have PRAGMA user_version = 1
+LEGACY_INDEXED_VERSION = 2
+
+def get_latest_version():
+    """Returns the version the newest migration brings a database to."""
+    return MIGRATIONS[-1][0]
+
+def get_schema_version(conn):
+    """
+    Returns the highest migration version applied to a database.
+
+    Args:
+        conn (sqlite3.Connection): Open connection.
+
+    Returns:
+        int: The applied version, or 0 for a database with no schema_version table.
+    """
+    if not _table_exists(conn, 'schema_version'):
+        return 0
+    return conn.execute('SELECT COALESCE(MAX(version), 0) FROM schema_version').fetchone()[0]
+
+def get_migration_status(conn):
+    """
+    Lists every known migration and when it was applied.
+
+    Args:
+        conn (sqlite3.Connection): Open connection.
+
+    Returns:
+        list[dict]: One entry per migration, in order:
+            - version (int)
+            - description (str)
+            - applied_at (str or None): UTC ISO timestamp, or None if pending.
+    """
+    applied = {}
+    if _table_exists(conn, 'schema_version'):
+        applied = dict(conn.execute('SELECT version, applied_at FROM schema_version').fetchall())
+    return [{'version': version, 'description': description, 'applied_at': applied.get(version)}
+            for version, description, _ in MIGRATIONS]
+
+def apply_migrations(target=None, conn=None):
+    """
+    Brings a database up to `target` by applying each pending migration in order.
+
+    A database built before migrations existed is adopted first: if it already
+    has the base tables it is recorded at version 1, or at version 2 if the
+    earlier index step had set `PRAGMA user_version`. Each migration commits
+    together with its schema_version row, so a failure leaves the database at
+    the last good version.
+
+    Args:
+        target (int, optional): Version to stop at. Defaults to the latest migration.
+        conn (sqlite3.Connection, optional): Open write connection. Defaults to a new
+            connection from `get_write_connection()`, which is closed afterwards.
+
+    Returns:
+        list[int]: Versions applied by this call, empty if the database was current.
+
+    Raises:
+        ValueError: If `target` is unknown or older than the database's version.
+
+    Example:
+        >>> apply_migrations()
+        Applying migration 3: Add missing team_goals_added.season column
+        Schema is at version 3.
+        [3]
+    """
+    target = get_latest_version() if target is None else target
+    if target not in {version for version, _, _ in MIGRATIONS}:
+        raise ValueError(f'Unknown schema version: {target}')
+
+    own_conn = conn is None
+    if own_conn:
+        conn = get_write_connection()
+    try:
+        _ensure_version_table(conn)
+        current = get_schema_version(conn)
+        if target < current:
+            raise ValueError(f'Database is at version {current}; migrations only move forward.')
+
+        applied = []
+        for version, description, migrate in MIGRATIONS:
+            if version <= current or version > target:
+                continue
+            print(f'Applying migration {version}: {description}')
+            conn.execute('BEGIN')
+            try:
+                migrate(conn)
+                _record_version(conn, version, description)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            applied.append(version)
+        print(f'Schema is at version {get_schema_version(conn)}.')
+        return applied
+    finally:
+        if own_conn:
+            conn.close()
+
+def _ensure_version_table(conn):
+    if _table_exists(conn, 'schema_version'):
+        return
+    conn.execute('BEGIN')
+    conn.execute('''
+        CREATE TABLE schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+    ''')
+    if _table_exists(conn, 'player_info'):
+        legacy = LEGACY_INDEXED_VERSION if conn.execute('PRAGMA user_version').fetchone()[0] >= 1 else 1
+        print(f'Adopting existing database at schema version {legacy}.')
+        for version, description, _ in MIGRATIONS:
+            if version <= legacy:
+                _record_version(conn, version, description)
+    conn.commit()
+
+def _record_version(conn, version, description):
+    conn.execute('INSERT INTO schema_version (version, description, applied_at) VALUES (?, ?, ?)',
+                 (version, description, datetime.now(timezone.utc).isoformat(timespec='seconds')))
+
+def _table_exists(conn, table):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone() is not None
+
+def _get_columns(conn, table):
+    return {row[1] for row in conn.execute(f'PRAGMA table_info({table})')}
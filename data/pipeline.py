@@ -0,0 +1,170 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+import time
+
+DEFAULT_MAX_WORKERS = 4
+
+# Returned by a step function to say its output tables did not change
+UNCHANGED = object()
+
+class PipelineStep:
+    def __init__(self, name, func, season=None, inputs=(), outputs=()):
+        """
+        One unit of work in a `Pipeline`: a function plus the tables it reads and writes.
+
+        Tables are scoped to the step's season, so the same step for two seasons
+        never conflicts. A step with no season (reference data such as
+        player_info) works on the whole table and conflicts with every season.
+
+        Args:
+            name (str): Step name, unique within a season.
+            func (Callable[[], Any]): Work to run. Returning `UNCHANGED` lets dependents be skipped.
+            season (int, optional): Season the step works on. Defaults to None (all seasons).
+            inputs (Iterable[str]): Tables the step reads. Defaults to ().
+            outputs (Iterable[str]): Tables the step writes. Defaults to ().
+        """
+        self.name = name
+        self.func = func
+        self.season = season
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        self.dependencies = []
+        self.status = 'pending'
+        self.started = None
+        self.seconds = None
+        self.error = None
+
+    @property
+    def key(self):
+        return self.name if self.season is None else f'{self.name}[{self.season}]'
+
+    def touches(self, tables, season):
+        """Returns True if any of `tables`, scoped to `season`, overlaps this step's outputs."""
+        scoped = self.season is None or season is None or self.season == season
+        return scoped and bool(set(tables) & set(self.outputs))
+
+class Pipeline:
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        """
+        Runs ingestion steps as a dependency graph instead of one serial sequence.
+
+        A step depends on every earlier-added step that writes a table it reads
+        or writes, or that reads a table it writes. Declaration order therefore
+        settles which of two writers of a table goes first. Steps whose
+        dependencies are done run in parallel on `max_workers` threads, so
+        independent steps and later seasons overlap with earlier ones.
+
+        A step is skipped when every dependency in its own season (reference
+        steps only provide context) was skipped or returned `UNCHANGED`, so one
+        unchanged step at the head of a season skips the season's derived steps.
+        When a step fails, the steps that depend
+        on it are skipped as well; the rest still run, and `run()` raises at the end.
+
+        Args:
+            max_workers (int, optional): Steps run at once. Defaults to DEFAULT_MAX_WORKERS.
+
+        Example:
+            >>> pipeline = Pipeline()
+            >>> pipeline.add('games', lambda: insert_all_games_by_season(2024), 2024, outputs=['games'])
+            >>> pipeline.add('game_shots', lambda: ..., 2024, inputs=['games'], outputs=['game_shots'])
+            >>> pipeline.run()
+            >>> pipeline.print_report()
+        """
+        self.max_workers = max_workers
+        self.steps = []
+
+    def add(self, name, func, season=None, inputs=(), outputs=()):
+        """
+        Adds a step after the ones already added.
+
+        Args:
+            name (str): Step name, unique within a season.
+            func (Callable[[], Any]): Work to run.
+            season (int, optional): Season the step works on. Defaults to None.
+            inputs (Iterable[str]): Tables the step reads. Defaults to ().
+            outputs (Iterable[str]): Tables the step writes. Defaults to ().
+
+        Returns:
+            PipelineStep: The new step.
+
+        Raises:
+            ValueError: If a step with the same name and season already exists.
+        """
+        step = PipelineStep(name, func, season, inputs, outputs)
+        if any(existing.key == step.key for existing in self.steps):
+            raise ValueError(f'Duplicate pipeline step: {step.key}')
+        for earlier in self.steps:
+            if (earlier.touches(step.inputs + step.outputs, step.season)
+                    or step.touches(earlier.inputs, earlier.season)):
+                step.dependencies.append(earlier)
+        self.steps.append(step)
+        return step
+
+    def get_step(self, name, season=None):
+        """Returns the step with a name and season, or None."""
+        return next((step for step in self.steps if step.name == name and step.season == season), None)
+
+    def run(self):
+        """
+        Runs every step once its dependencies are done.
+
+        Returns:
+            list[PipelineStep]: The steps, with status 'done', 'unchanged', 'skipped' or 'failed'.
+
+        Raises:
+            RuntimeError: If any step failed, after all runnable steps have finished.
+        """
+        start = time.perf_counter()
+        pending = list(self.steps)
+        running = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                for step in list(pending):
+                    if any(dependency.status in ('pending', 'running') for dependency in step.dependencies):
+                        continue
+                    pending.remove(step)
+                    if any(dependency.error is not None for dependency in step.dependencies):
+                        step.status = 'skipped'
+                        step.error = 'upstream failure'
+                        continue
+                    triggers = [dependency for dependency in step.dependencies
+                                if step.season is None or dependency.season == step.season]
+                    if triggers and all(dependency.status in ('skipped', 'unchanged') for dependency in triggers):
+                        step.status = 'skipped'
+                        continue
+                    step.status = 'running'
+                    step.started = time.perf_counter() - start
+                    running[executor.submit(self._run_step, step)] = step
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+
+        failed = [step.key for step in self.steps if step.status == 'failed']
+        if failed:
+            raise RuntimeError(f'Pipeline steps failed: {", ".join(failed)}')
+        return self.steps
+
+    def print_report(self):
+        """Prints each step's status, start offset and duration in the order steps ran."""
+        print(f'\n{"step":<40} {"status":<10} {"start s":>8} {"seconds":>8}')
+        for step in sorted(self.steps, key=lambda step: (step.started is None, step.started or 0)):
+            started = f'{step.started:>8.2f}' if step.started is not None else f'{"-":>8}'
+            seconds = f'{step.seconds:>8.2f}' if step.seconds is not None else f'{"-":>8}'
+            print(f'{step.key:<40} {step.status:<10} {started} {seconds}')
+        total = sum(step.seconds or 0 for step in self.steps)
+        print(f'{len(self.steps)} steps, {total:.2f}s of step time.')
+
+    def _run_step(self, step):
+        print(f'Starting step {step.key}...')
+        step_start = time.perf_counter()
+        try:
+            result = step.func()
+        except Exception as e:
+            step.seconds = time.perf_counter() - step_start
+            step.error = e
+            step.status = 'failed'
+            print(f'Step {step.key} failed: {e!r}')
+            return
+        step.seconds = time.perf_counter() - step_start
+        step.status = 'unchanged' if result is UNCHANGED else 'done'
@@ -0,0 +1,259 @@
+from . import db_games
+from .sim import MatchSimulator, simulate_goals_batch
+from .sim_context import get_simulation_context
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+POINTS_FOR_WIN = 3
+POINTS_FOR_DRAW = 1
+
+# Seasons projected per request: each chunk holds several (n, teams) arrays
+DEFAULT_PROJECTIONS = 10000
+MAX_PROJECTIONS = 50000
+
+class SeasonProjection:
+    def __init__(self, season, home_advantage=1.05, away_advantage=0.95, context=None, played_games=None, unplayed_games=None):
+        """
+        Projects the final league table by simulating every remaining fixture of a
+        season many times with the NumPy match engine.
+
+        The current table is built from completed games, then each of the N
+        projected seasons plays out the unplayed fixtures (games whose `home_score`
+        is NULL). Every fixture's shot arrays and shot volume are prepared once from
+        the season's `SimulationContext`, so the simulation loop never touches the
+        database.
+
+        Args:
+            season (int): Season year to project.
+            home_advantage (float, optional): Shot volume modifier for home teams. Defaults to 1.05.
+            away_advantage (float, optional): Shot volume modifier for away teams. Defaults to 0.95.
+            context (SimulationContext, optional): Preloaded season data. Defaults to the cached
+                context from `get_simulation_context(season)`.
+            played_games (list, optional): Completed games with team IDs and scores. Defaults to
+                `db_games.get_played_games_by_season(season)`.
+            unplayed_games (list, optional): Remaining fixtures with team IDs. Defaults to
+                `db_games.get_unplayed_games_by_season(season)`.
+
+        Attributes:
+            team_ids (list[str]): Every team in the season, in table index order.
+            current_points (np.ndarray): Points per team from completed games.
+            current_goals_for (np.ndarray): Goals scored per team from completed games.
+            current_goals_against (np.ndarray): Goals conceded per team from completed games.
+            current_played (np.ndarray): Completed games per team.
+            fixtures (list[dict]): Remaining fixtures with their team indices and engine payloads.
+            n_simulations (int): Number of seasons simulated.
+            points_totals (np.ndarray): Sum of final points per team across all simulations.
+            goal_difference_totals (np.ndarray): Sum of final goal difference per team across all simulations.
+            position_counts (np.ndarray): (team, position) matrix counting final table positions.
+
+        Example:
+            >>> projection = SeasonProjection(2025)
+            >>> projection.run_projections(10000, seed=1, workers=4)
+            >>> projection.get_table()[0]["team_name"]
+            'Kansas City Current'
+        """
+        self.season = season
+        self.home_advantage = home_advantage
+        self.away_advantage = away_advantage
+        self.context = context or get_simulation_context(season)
+
+        if played_games is None:
+            played_games = db_games.get_played_games_by_season(season)
+        if unplayed_games is None:
+            unplayed_games = db_games.get_unplayed_games_by_season(season)
+
+        self.team_ids = sorted({
+            team_id
+            for game in list(played_games) + list(unplayed_games)
+            for team_id in (game["home_team_id"], game["away_team_id"])
+        })
+        team_index = {team_id: idx for idx, team_id in enumerate(self.team_ids)}
+        n_teams = len(self.team_ids)
+
+        self.current_points = np.zeros(n_teams, dtype=np.int64)
+        self.current_goals_for = np.zeros(n_teams, dtype=np.int64)
+        self.current_goals_against = np.zeros(n_teams, dtype=np.int64)
+        self.current_played = np.zeros(n_teams, dtype=np.int64)
+        for game in played_games:
+            home, away = team_index[game["home_team_id"]], team_index[game["away_team_id"]]
+            home_points, away_points = get_match_points(game["home_score"], game["away_score"])
+            self.current_points[[home, away]] += [home_points, away_points]
+            self.current_goals_for[[home, away]] += [game["home_score"], game["away_score"]]
+            self.current_goals_against[[home, away]] += [game["away_score"], game["home_score"]]
+            self.current_played[[home, away]] += 1
+
+        self.fixtures = []
+        for game in unplayed_games:
+            simulator = MatchSimulator(game["home_team_id"], game["away_team_id"], season,
+                                       home_advantage, away_advantage, context=self.context)
+            self.fixtures.append({
+                "game_id": game["game_id"],
+                "home": team_index[game["home_team_id"]],
+                "away": team_index[game["away_team_id"]],
+                "payload": simulator.get_engine_payload()
+            })
+
+        self.n_simulations = 0
+        self.points_totals = np.zeros(n_teams, dtype=np.int64)
+        self.goal_difference_totals = np.zeros(n_teams, dtype=np.int64)
+        self.position_counts = np.zeros((n_teams, n_teams), dtype=np.int64)
+
+    def run_projections(self, n, seed=None, workers=None):
+        """
+        Simulates the rest of the season N times and accumulates final points,
+        goal difference and table positions for every team.
+
+        Seasons are split into one chunk per worker, each drawn from its own RNG
+        stream spawned from `seed`, exactly like `MatchSimulator.run_simulations()`
+        with the NumPy engine, so a given (seed, n, workers) is reproducible.
+
+        Args:
+            n (int): Number of seasons to simulate.
+            seed (int, optional): Root seed for the chunk RNG streams. Defaults to None (unseeded).
+            workers (int, optional): Number of worker processes. Defaults to None (serial).
+
+        Side Effects:
+            - Updates `self.n_simulations`, `self.points_totals`,
+              `self.goal_difference_totals` and `self.position_counts`.
+
+        Example:
+            >>> projection.run_projections(10000, seed=42, workers=4)
+            >>> projection.position_counts[0].sum()
+            10000
+        """
+        table = {
+            "points": self.current_points,
+            "goals_for": self.current_goals_for,
+            "goals_against": self.current_goals_against
+        }
+        fixtures = [
+            (fixture["home"], fixture["away"], fixture["payload"]["home"], fixture["payload"]["away"])
+            for fixture in self.fixtures
+        ]
+        n_chunks = max(1, min(workers or 1, n))
+        chunk_sizes = [len(chunk) for chunk in np.array_split(np.arange(n), n_chunks)]
+        seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+
+        if n_chunks > 1:
+            with ProcessPoolExecutor(max_workers=n_chunks) as pool:
+                chunks = list(pool.map(simulate_season_chunk, [table] * n_chunks, [fixtures] * n_chunks, seeds, chunk_sizes))
+        else:
+            chunks = [simulate_season_chunk(table, fixtures, seeds[0], n)]
+
+        self.n_simulations += n
+        for chunk in chunks:
+            self.points_totals += chunk["points"]
+            self.goal_difference_totals += chunk["goal_difference"]
+            self.position_counts += chunk["positions"]
+
+    def get_table(self):
+        """
+        Returns the projected final table, ordered by expected points.
+
+        This method should be called after `run_projections()` has been executed.
+
+        Returns:
+            list[dict]: One dictionary per team containing:
+                - team_id (str): The team's ID.
+                - team_name (str): Full team name.
+                - team_abbreviation (str): Team abbreviation.
+                - played (int): Games already completed.
+                - points (int): Points from completed games.
+                - goal_difference (int): Goal difference from completed games.
+                - remaining (int): Unplayed fixtures left for the team.
+                - expected_points (float): Mean final points across simulations.
+                - expected_goal_difference (float): Mean final goal difference across simulations.
+                - position_probs (list[float]): Probability of finishing in each position, 1st first.
+
+        Example:
+            >>> projection.get_table()[0]
+            {"team_id": "...", "team_name": "...", "expected_points": 61.3, "position_probs": [0.71, 0.22, ...], ...}
+        """
+        remaining = np.zeros(len(self.team_ids), dtype=np.int64)
+        for fixture in self.fixtures:
+            remaining[[fixture["home"], fixture["away"]]] += 1
+
+        table = []
+        for idx, team_id in enumerate(self.team_ids):
+            table.append({
+                "team_id": team_id,
+                "team_name": self.context.team_name_map.get(team_id, team_id),
+                "team_abbreviation": self.context.team_abbreviation_map.get(team_id, team_id),
+                "played": int(self.current_played[idx]),
+                "points": int(self.current_points[idx]),
+                "goal_difference": int(self.current_goals_for[idx] - self.current_goals_against[idx]),
+                "remaining": int(remaining[idx]),
+                "expected_points": self.points_totals[idx] / self.n_simulations,
+                "expected_goal_difference": self.goal_difference_totals[idx] / self.n_simulations,
+                "position_probs": (self.position_counts[idx] / self.n_simulations).tolist()
+            })
+        return sorted(table, key=lambda row: (row["expected_points"], row["expected_goal_difference"]), reverse=True)
+
+def get_match_points(home_goals, away_goals):
+    """
+    Returns the league points each side earns from a result.
+
+    Args:
+        home_goals (int): Goals scored by the home team.
+        away_goals (int): Goals scored by the away team.
+
+    Returns:
+        tuple[int, int]: (home_points, away_points).
+    """
+    if home_goals > away_goals:
+        return POINTS_FOR_WIN, 0
+    if home_goals < away_goals:
+        return 0, POINTS_FOR_WIN
+    return POINTS_FOR_DRAW, POINTS_FOR_DRAW
+
+def simulate_season_chunk(table, fixtures, seed_sequence, n):
+    """
+    Simulates the remaining fixtures for N seasons with one RNG stream.
+
+    This is the unit of work for `SeasonProjection.run_projections()`; like
+    `simulate_chunk()` in data.sim it only takes picklable arguments so it can
+    run in a worker process. Each fixture is drawn for all N seasons at once with
+    `simulate_goals_batch()`. Final positions are ranked by points, then goal
+    difference, then goals scored, with remaining ties broken at random.
+
+    Args:
+        table (dict): Current "points", "goals_for" and "goals_against" arrays per team.
+        fixtures (list[tuple]): (home_index, away_index, home_payload, away_payload) per fixture,
+            where the payloads are the sides of `MatchSimulator.get_engine_payload()`.
+        seed_sequence (np.random.SeedSequence): Seed for this chunk's RNG stream.
+        n (int): Number of seasons to simulate.
+
+    Returns:
+        dict:
+            - points (np.ndarray): Sum of final points per team across the N seasons.
+            - goal_difference (np.ndarray): Sum of final goal difference per team.
+            - positions (np.ndarray): (team, position) counts of final table positions.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    n_teams = len(table["points"])
+    points = np.tile(table["points"], (n, 1))
+    goals_for = np.tile(table["goals_for"], (n, 1))
+    goals_against = np.tile(table["goals_against"], (n, 1))
+
+    for home, away, home_payload, away_payload in fixtures:
+        home_goals, _ = simulate_goals_batch(rng, home_payload["probs"], home_payload["sample_mean"], n)
+        away_goals, _ = simulate_goals_batch(rng, away_payload["probs"], away_payload["sample_mean"], n)
+        points[:, home] += np.select([home_goals > away_goals, home_goals == away_goals], [POINTS_FOR_WIN, POINTS_FOR_DRAW], 0)
+        points[:, away] += np.select([away_goals > home_goals, away_goals == home_goals], [POINTS_FOR_WIN, POINTS_FOR_DRAW], 0)
+        goals_for[:, home] += home_goals
+        goals_for[:, away] += away_goals
+        goals_against[:, home] += away_goals
+        goals_against[:, away] += home_goals
+
+    goal_difference = goals_for - goals_against
+    # np.lexsort sorts by the last key first; negate so higher values rank first.
+    order = np.lexsort((rng.random((n, n_teams)), -goals_for, -goal_difference, -points), axis=1)
+    positions = np.bincount(
+        (order * n_teams + np.arange(n_teams)).ravel(), minlength=n_teams * n_teams
+    ).reshape(n_teams, n_teams)
+
+    return {
+        "points": points.sum(axis=0),
+        "goal_difference": goal_difference.sum(axis=0),
+        "positions": positions
+    }
@@ -0,0 +1,299 @@
+from .data_util import get_read_connection, get_data_generation, validate_season
+import numpy as np
+import sqlite3
+import threading
+
+_store_cache = {}
+_store_lock = threading.Lock()
+
+# Columns kept from game_shots, with the dtype each is stored as. Nullable
+# floats become NaN; nullable integer flags become 0.
+SHOT_COLUMNS = {
+    "shot_xg": np.float64,
+    "shot_psxg": np.float64,
+    "shot_location_x": np.float32,
+    "shot_location_y": np.float32,
+    "expanded_minute": np.int16,
+    "shot_order": np.int32,
+    "goal": np.int8,
+    "blocked": np.int8
+}
+
+class ShotStore:
+    def __init__(self, season, columns, game_ids, team_ids, player_ids, patterns):
+        """
+        Columnar store of every shot in a season.
+
+        Each column is a typed NumPy array with one entry per shot. Game, team,
+        shooter and pattern-of-play strings are interned into the `game_index`,
+        `team_index`, `shooter_index` and `pattern_code` columns. Rows are sorted
+        by team, game and shot order, so every team's shots, and every team's
+        shots within a game, are contiguous and are returned as zero-copy views.
+
+        Args:
+            season (int): The season the shots belong to.
+            columns (dict[str, np.ndarray]): Equal-length columns: the keys of `SHOT_COLUMNS`
+                plus "game_index", "team_index", "shooter_index" and "pattern_code".
+            game_ids (list[str]): Game ID for each value of `game_index`.
+            team_ids (list[str]): Team ID for each value of `team_index`.
+            player_ids (list[str]): Player ID for each value of `shooter_index`.
+            patterns (list[str]): Pattern of play for each value of `pattern_code`.
+
+        Example:
+            >>> store = get_shot_store(2024)
+            >>> xg, shooter_index, player_ids = store.get_shot_arrays(team_id)
+            >>> store.get_total_psxg(team_id)
+            31.84
+        """
+        self.season = season
+        self.game_ids = game_ids
+        self.team_ids = team_ids
+        self.player_ids = player_ids
+        self.patterns = patterns
+        self.game_lookup = {game_id: idx for idx, game_id in enumerate(game_ids)}
+        self.team_lookup = {team_id: idx for idx, team_id in enumerate(team_ids)}
+        self.player_lookup = {player_id: idx for idx, player_id in enumerate(player_ids)}
+
+        order = np.lexsort((columns["shot_order"], columns["game_index"], columns["team_index"]))
+        if not np.array_equal(order, np.arange(len(order))):
+            columns = {name: column[order] for name, column in columns.items()}
+        self.columns = columns
+
+        # Contiguous row ranges per team and per (team, game)
+        self.team_slices = _group_slices(columns["team_index"])
+        self.team_game_slices = _group_slices(
+            columns["team_index"].astype(np.int64) * max(1, len(game_ids)) + columns["game_index"]
+        )
+
+    def __len__(self):
+        return len(self.columns["game_index"])
+
+    @property
+    def nbytes(self):
+        """Total bytes held by the column arrays."""
+        return sum(column.nbytes for column in self.columns.values())
+
+    def get_team_slice(self, team_id):
+        """Returns the row range of a team's shots (empty if the team has none)."""
+        team_index = self.team_lookup.get(team_id)
+        return self.team_slices.get(team_index, slice(0, 0))
+
+    def get_team_columns(self, team_id):
+        """
+        Returns views of every column restricted to one team's shots.
+
+        Args:
+            team_id (str): The team ID.
+
+        Returns:
+            dict[str, np.ndarray]: Column name to a zero-copy view of the team's rows.
+        """
+        rows = self.get_team_slice(team_id)
+        return {name: column[rows] for name, column in self.columns.items()}
+
+    def get_game_columns(self, game_id, team_id):
+        """
+        Returns views of every column restricted to one team's shots in one game.
+
+        Args:
+            game_id (str): The game ID.
+            team_id (str): The team ID.
+
+        Returns:
+            dict[str, np.ndarray]: Column name to a zero-copy view, ordered by shot order.
+        """
+        game_index = self.game_lookup.get(game_id)
+        team_index = self.team_lookup.get(team_id)
+        rows = slice(0, 0)
+        if game_index is not None and team_index is not None:
+            rows = self.team_game_slices.get(team_index * max(1, len(self.game_ids)) + game_index, rows)
+        return {name: column[rows] for name, column in self.columns.items()}
+
+    def get_shot_arrays(self, team_id, excluded_player_ids=None):
+        """
+        Returns a team's shots in the form the simulation engines consume.
+
+        Without exclusions the arrays are views into the store. Excluding players
+        filters them, which copies only the team's rows.
+
+        Args:
+            team_id (str): The team ID.
+            excluded_player_ids (set[str], optional): Shooters to drop. Defaults to None.
+
+        Returns:
+            tuple:
+                xg (np.ndarray): xG per shot, NaN where the shot has no xG.
+                shooter_index (np.ndarray): Index into `player_ids` for each shot.
+                player_ids (list[str]): The store's interned player IDs.
+        """
+        rows = self.get_team_slice(team_id)
+        xg = self.columns["shot_xg"][rows]
+        shooter_index = self.columns["shooter_index"][rows]
+        excluded = [self.player_lookup[pid] for pid in excluded_player_ids or [] if pid in self.player_lookup]
+        if excluded:
+            keep = ~np.isin(shooter_index, excluded)
+            xg, shooter_index = xg[keep], shooter_index[keep]
+        return xg, shooter_index, self.player_ids
+
+    def get_avg_shots(self, team_id):
+        """Returns a team's shots per game played, or 0.0 if it has no shots."""
+        rows = self.get_team_slice(team_id)
+        n_games = len(np.unique(self.columns["game_index"][rows]))
+        return (rows.stop - rows.start) / n_games if n_games > 0 else 0.0
+
+    def get_total_psxg(self, team_id):
+        """Returns a team's total post-shot xG for the season, ignoring shots without PSxG."""
+        return float(np.nansum(self.columns["shot_psxg"][self.get_team_slice(team_id)]))
+
+    def get_game_psxg(self, game_id):
+        """
+        Returns each team's total post-shot xG in a game.
+
+        Args:
+            game_id (str): The game ID.
+
+        Returns:
+            dict[str, float]: Team ID to total PSxG, rounded to 2 decimals.
+        """
+        return {
+            team_id: round(float(np.nansum(columns["shot_psxg"])), 2)
+            for team_id, columns in self._iter_game_teams(game_id)
+        }
+
+    def get_game_shot_counts(self, game_id):
+        """Returns each team's number of shots in a game, keyed by team ID."""
+        return {team_id: len(columns["shot_order"]) for team_id, columns in self._iter_game_teams(game_id)}
+
+    def get_game_shots_on_target(self, game_id):
+        """
+        Returns each team's shots on target in a game, using the rule in
+        `db_game_shots.get_total_shots_on_target_by_game_id()`: unblocked shots
+        with a positive PSxG.
+
+        Args:
+            game_id (str): The game ID.
+
+        Returns:
+            dict[str, int]: Team ID to shots on target, for teams with at least one.
+        """
+        counts = {}
+        for team_id, columns in self._iter_game_teams(game_id):
+            on_target = int(np.count_nonzero((columns["shot_psxg"] > 0) & (columns["blocked"] == 0)))
+            if on_target:
+                counts[team_id] = on_target
+        return counts
+
+    def _iter_game_teams(self, game_id):
+        for team_id in self.team_ids:
+            columns = self.get_game_columns(game_id, team_id)
+            if len(columns["shot_order"]):
+                yield team_id, columns
+
+    @classmethod
+    def from_records(cls, season, records):
+        """
+        Builds a store from shot records (sqlite3.Row or dict), interning string columns.
+
+        Records need "game_id", "team_id" and "shooter_player_id"; other columns of
+        `SHOT_COLUMNS` and "pattern_of_play" are optional.
+
+        Args:
+            season (int): The season the shots belong to.
+            records (Iterable): Shot records.
+
+        Returns:
+            ShotStore: The populated store.
+        """
+        records = [dict(record) for record in records]
+        # Games and teams are numbered in ID order so index order matches the SQL ordering
+        lookups = {
+            "game_id": {game_id: idx for idx, game_id in enumerate(sorted({r["game_id"] for r in records}))},
+            "team_id": {team_id: idx for idx, team_id in enumerate(sorted({r["team_id"] for r in records}))},
+            "shooter_player_id": {},
+            "pattern_of_play": {}
+        }
+
+        def intern(field):
+            lookup = lookups[field]
+            return np.array(
+                [lookup.setdefault(record.get(field), len(lookup)) for record in records],
+                dtype=np.int32
+            )
+
+        columns = {
+            "game_index": intern("game_id"),
+            "team_index": intern("team_id").astype(np.int16),
+            "shooter_index": intern("shooter_player_id"),
+            "pattern_code": intern("pattern_of_play").astype(np.int8)
+        }
+        for name, dtype in SHOT_COLUMNS.items():
+            missing = np.nan if np.issubdtype(dtype, np.floating) else 0
+            columns[name] = np.array(
+                [missing if record.get(name) is None else record[name] for record in records],
+                dtype=dtype
+            )
+        return cls(season, columns, *[list(lookups[field]) for field in lookups])
+
+def _group_slices(keys):
+    """Maps each value of a sorted key array to the slice of rows holding it."""
+    if len(keys) == 0:
+        return {}
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    stops = np.r_[starts[1:], len(keys)]
+    return {int(keys[start]): slice(int(start), int(stop)) for start, stop in zip(starts, stops)}
+
+def load_shot_store(season, conn=None):
+    """
+    Loads every shot of a season from game_shots into a `ShotStore`.
+
+    Args:
+        season (int): The season to load.
+        conn (sqlite3.Connection, optional): Connection to read from. Defaults to a pooled read connection.
+
+    Returns:
+        ShotStore: The season's shots.
+    """
+    validate_season(season)
+    print(f'Loading shot store for season {season}...')
+    owns_connection = conn is None
+    if owns_connection:
+        conn = get_read_connection()
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+    cursor.execute(f'''
+        SELECT game_id, team_id, shooter_player_id, pattern_of_play, {', '.join(SHOT_COLUMNS)}
+        FROM game_shots
+        WHERE season = ?
+        ORDER BY team_id ASC, game_id ASC, shot_order ASC
+    ''', (season,))
+    store = ShotStore.from_records(season, cursor.fetchall())
+    if owns_connection:
+        conn.close()
+    print(f'Shot store loaded with {len(store)} shots ({store.nbytes / 1024:.0f} KiB) for season {season}.')
+    return store
+
+def get_shot_store(season):
+    """
+    Returns the cached shot store for a season, reloading it whenever an
+    ingestion run has bumped the data generation since it was cached.
+
+    Args:
+        season (int): The season to load.
+
+    Returns:
+        ShotStore: The store for the season at the current data generation.
+    """
+    key = (season, get_data_generation())
+    with _store_lock:
+        store = _store_cache.get(key)
+        if store is None:
+            store = load_shot_store(season)
+            for stale_key in [k for k in _store_cache if k[0] == season]:
+                del _store_cache[stale_key]
+            _store_cache[key] = store
+    return store
+
+def clear_shot_store_cache():
+    """Removes every cached shot store."""
+    with _store_lock:
+        _store_cache.clear()
@@ -1,22 +1,36 @@
+import math
 import random
 from collections import Counter, defaultdict
-from data.db_game_shots import get_shots_for_team, get_avg_shots_for_team
-from data.db_goalkeeper_xgoals import get_goalkeepers_for_team
-from data.db_player_info import get_player_name_map
-from data.db_team_info import get_team_name_map, get_team_abbreviation_map
-from data.db_team_xgoals import (
-    get_team_xga_per_game,
-    get_league_avg_xga_per_game,
-    get_team_shots_against_per_game,
-    get_league_avg_shots_against_per_game
-)
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from data.sim_context import get_simulation_context
+
+ENGINES = ("python", "numpy")
+
+# Upper bound on the number of (simulation x shot) cells drawn per batch by the
+# NumPy engine, so large runs stay within a few tens of MB of memory.
+MAX_BATCH_CELLS = 2_000_000
+
+# Standard deviation of the Gaussian each match's shot count is drawn from.
+SHOT_COUNT_SD = 2
+
+# Convergence mode: z-score of the reported 95% confidence intervals, default
+# simulations per batch, and how many goals of tolerance correspond to one unit
+# of probability tolerance (a ±1 percentage point target allows ±0.1 goals).
+CONFIDENCE_Z = 1.96
+DEFAULT_BATCH_SIZE = 5000
+GOALS_TOLERANCE_RATIO = 10
 
 class MatchSimulator:
-    def __init__(self, home_team_id, away_team_id, season, home_advantage, away_advantage, excluded_player_ids=None):
+    def __init__(self, home_team_id, away_team_id, season, home_advantage, away_advantage, excluded_player_ids=None, context=None):
         """
         Initializes the MatchSimulator with preloaded shot-level data, modifiers, and
         team-specific filters for use in Monte Carlo match simulations.
 
+        All inputs come from a season-level `SimulationContext`, so building a
+        simulator performs no database I/O once the season's context is cached.
+        Shots are read from the context's `ShotStore` rather than copied per simulator.
+
         Args:
             home_team_id (str): ID of the home team.
             away_team_id (str): ID of the away team.
@@ -24,10 +38,13 @@ class MatchSimulator:
             home_advantage (float): Modifier applied to the home team's shot volume (e.g., 1.05 = +5%).
             away_advantage (float): Modifier applied to the away team's shot volume.
             excluded_player_ids (list[str], optional): List of player IDs to exclude from all simulations. Defaults to None.
+            context (SimulationContext, optional): Preloaded season data. Defaults to the cached context
+                from `get_simulation_context(season)`.
 
         Attributes:
-            cached_team_shots (dict): All shot events per team, filtered for penalties if configured.
-            filtered_team_shots (dict): Further-filtered shots excluding any from `excluded_player_ids`.
+            context (SimulationContext): The season data this simulator reads from.
+            team_shots (dict): Per-team (xG, shooter ID) tuples for the Python engine, built lazily
+                from the shot store with `excluded_player_ids` removed.
             cached_avg_shots (dict): Average number of shots per game for each team.
             cached_avg_xg_per_game (dict): Team-level average xG per game, for possible contextual use.
             cached_goalkeepers (dict): Opponent goalkeeper over/under-performance metrics.
@@ -46,28 +63,38 @@ class MatchSimulator:
             outcomes (Counter): Tally of "home_win", "away_win", or "draw" across all simulations.
             goal_totals (defaultdict): Per-side list of goals scored in each simulation (for mean calculation).
             scorer_totals (defaultdict): Per-team tallies of goals scored per player across simulations.
+            shot_arrays (dict): Per-team (xg, shooter_index, player_ids) arrays from the shot store,
+                views when no players are excluded.
+            random (module or random.Random): Source of randomness for the Python engine; replaced by a
+                seeded `random.Random` for the duration of a `run_simulations()` call given a seed.
+            batches (int): Number of batches the last `run_simulations()` call ran in.
+            converged (bool | None): Whether a tolerance run met its target, or None for fixed-size runs.
 
         Example:
             >>> sim = MatchSimulator(1234, 5678, 2024, 1.05, 0.95)
             >>> sim.run_simulations(1000)
             >>> print(sim.get_summary())
         """
+        self.context = context or get_simulation_context(season)
         self.home_team_id = home_team_id
         self.away_team_id = away_team_id
         self.season = season
         self.n_simulations = 0
-        self.cached_team_shots = {}
+        self.batches = 0
+        self.converged = None
+        self.team_shots = {}
         self.cached_avg_shots = {}
         self.cached_goalkeepers = {}
         self.cached_avg_xg_per_game = {}
-        self.filtered_team_shots = {}
+        self.shot_arrays = {}
+        self.random = random
         self.cached_xga_per_game = {
-            team_id: get_team_xga_per_game(team_id, self.season)
+            team_id: self.context.xga_per_game.get(team_id)
             for team_id in [self.home_team_id, self.away_team_id]
         }
-        self.player_name_map = get_player_name_map()
-        self.team_name_map = get_team_name_map()
-        self.team_abbreviation_map = get_team_abbreviation_map()
+        self.player_name_map = self.context.player_name_map
+        self.team_name_map = self.context.team_name_map
+        self.team_abbreviation_map = self.context.team_abbreviation_map
         self.scorelines = Counter()
         self.outcomes = Counter()
         self.goal_totals = defaultdict(list)
@@ -75,30 +102,20 @@ class MatchSimulator:
         self.home_advantage = home_advantage
         self.away_advantage = away_advantage
         self.excluded_player_ids = set(excluded_player_ids or [])
-        self.league_avg_xga = get_league_avg_xga_per_game(season)
-        self.league_avg_sapg = get_league_avg_shots_against_per_game(season)
+        self.league_avg_xga = self.context.league_avg_xga
+        self.league_avg_sapg = self.context.league_avg_sapg
 
         # Shots Against Per Game for each team in the current match.
         self.cached_sapg_per_game = {
-            team_id: get_team_shots_against_per_game(team_id, season)
+            team_id: self.context.sapg_per_game.get(team_id)
             for team_id in [self.home_team_id, self.away_team_id]
         }
 
-        # Shot filtering logic
         for team_id in [self.home_team_id, self.away_team_id]:
-            # Get all shots
-            all_shots = get_shots_for_team(team_id, self.season)
-            # Cache unfiltered shots
-            self.cached_team_shots[team_id] = all_shots
             # Cache average shots per game
-            self.cached_avg_shots[team_id] = get_avg_shots_for_team(team_id, self.season)
+            self.cached_avg_shots[team_id] = self.context.avg_shots.get(team_id, 0.0)
             # Cache goalkeeper stats
-            self.cached_goalkeepers[team_id] = get_goalkeepers_for_team(team_id, self.season)
-            # Cache filtered shots (exclude players)
-            self.filtered_team_shots[team_id] = [
-                s for s in all_shots
-                if s["shooter_player_id"] not in self.excluded_player_ids
-            ]
+            self.cached_goalkeepers[team_id] = self.context.goalkeepers.get(team_id)
 
     def simulate_match(self):
         """
@@ -168,7 +185,7 @@ class MatchSimulator:
         scorers = []
         goals = 0
 
-        shots = self.filtered_team_shots[team_id]
+        shots = self.get_team_shots(team_id)
         avg_shots = self.cached_avg_shots[team_id]
 
         adjusted_avg_shots = self.get_adjusted_avg_shots(avg_shots, opponent_id)
@@ -176,45 +193,122 @@ class MatchSimulator:
         gk_modifier = self.get_goalkeeper_modifier(opponent_id)
 
         # Simulate shot outcomes
-        for shot in sampled:
-            base_prob = shot["shot_xg"]
+        for base_prob, shooter_id in sampled:
             if base_prob is None:
                 continue
             else:
                 adj_prob = max(0.01, min(0.95, base_prob * (1.0 + gk_modifier)))
 
-            if random.random() < adj_prob:
+            if self.random.random() < adj_prob:
                 goals += 1
-                scorers.append(shot["shooter_player_id"])
+                scorers.append(shooter_id)
         return goals, scorers
 
-    def run_simulations(self, n):
+    def get_team_shots(self, team_id):
+        """
+        Returns a team's eligible shots as (xG, shooter ID) tuples for the Python engine.
+
+        Built once per team from the shot store's arrays, so each simulated shot
+        is a tuple unpack rather than a row lookup. Shots without xG have None.
+
+        Args:
+            team_id (str): The team ID.
+
+        Returns:
+            list[tuple[float | None, str]]: The team's shots in store order.
+        """
+        if team_id not in self.team_shots:
+            xg, shooter_index, player_ids = self.context.get_shot_arrays(team_id, self.excluded_player_ids)
+            self.team_shots[team_id] = [
+                (None if math.isnan(value) else value, player_ids[idx])
+                for value, idx in zip(xg.tolist(), shooter_index.tolist())
+            ]
+        return self.team_shots[team_id]
+
+    def run_simulations(self, n, engine="python", seed=None, workers=None, tolerance=None,
+                        goals_tolerance=None, batch_size=DEFAULT_BATCH_SIZE, progress=None):
         """
         Runs N full-match simulations between the selected home and away teams.
 
         This method:
-            1. Repeatedly calls `simulate_match()` N times.
+            1. Simulates N matches with the selected engine.
             2. Records the resulting scoreline (e.g., 2–1) in a frequency counter.
             3. Tracks goal totals per team across all simulations.
             4. Aggregates match outcomes as home wins, away wins, or draws.
             5. Updates internal state used by other summary/reporting functions.
 
+        Two engines produce statistically equivalent results:
+            - "python": Calls `simulate_match()` once per simulation.
+            - "numpy": Draws every simulation's shot counts, shot selections and
+              Bernoulli outcomes as batched array operations (see `_run_simulations_numpy()`).
+
+        Simulations run in batches of `batch_size`, and `progress` is called after
+        each one, so callers can publish interim estimates.
+
+        Passing a seed makes a run reproducible. With the NumPy engine, every batch
+        draws from its own RNG stream spawned from the seed, and `workers` splits
+        each batch into one chunk per worker process, so a given (seed, n, workers,
+        batch_size) always returns bit-identical results.
+
+        Passing a tolerance switches to convergence mode: N becomes the maximum
+        budget, and the run stops after the first batch where the 95% confidence
+        intervals of the win/draw/loss rates are within ±`tolerance` and those of
+        the average goals within ±`goals_tolerance` (see `get_errors()`).
+
         Args:
-            n (int): Number of match simulations to run.
+            n (int): Number of match simulations to run, or the maximum budget in convergence mode.
+            engine (str, optional): Either "python" or "numpy". Defaults to "python".
+            seed (int, optional): Seed for the random number generator. Defaults to None (unseeded).
+            workers (int, optional): Number of worker processes for the NumPy engine. Defaults to None (serial).
+            tolerance (float, optional): Target half-width for the outcome probabilities. Defaults to None (run all N).
+            goals_tolerance (float, optional): Target half-width for the average goals. Defaults to
+                `tolerance * GOALS_TOLERANCE_RATIO`.
+            batch_size (int, optional): Simulations per batch. Defaults to 5000.
+            progress (callable, optional): Called with the simulator after each batch, once its
+                tallies, `n_simulations`, `batches` and `converged` are updated. Defaults to None.
+
+        Raises:
+            ValueError: If `engine` is not one of `ENGINES`, or `workers` is used with the Python engine.
 
         Side Effects:
             - Updates `self.n_simulations` to reflect the count.
+            - Updates `self.batches` and `self.converged`.
             - Populates or updates:
                 - `self.scorelines`: Counter of (home_goals, away_goals)
                 - `self.goal_totals`: Dict of all home and away goal values
                 - `self.outcomes`: Counter of win/draw categories
-                - `self.scorer_totals`: (via `simulate_match()`)
+                - `self.scorer_totals`: (via `simulate_match()` or the NumPy engine)
 
         Example:
             >>> sim = MatchSimulator(...)
             >>> sim.run_simulations(1000)
             >>> sim.scorelines[(1, 0)]  # Number of 1–0 results
             243
+            >>> sim.run_simulations(100000, engine="numpy", seed=42, workers=4)
+            >>> sim.run_simulations(1000000, engine="numpy", tolerance=0.005)
+            >>> sim.n_simulations, sim.batches
+            (40000, 8)
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"Invalid engine. Available engines are: {', '.join(ENGINES)}")
+        if workers is not None and engine != "numpy":
+            raise ValueError("Parallel workers require the numpy engine.")
+
+        # A seeded run must not leave later unseeded runs continuing its sequence
+        previous_random = self.random
+        if engine == "python" and seed is not None:
+            self.random = random.Random(seed)
+        try:
+            self._run_batches(n, engine, seed, workers, tolerance, goals_tolerance, batch_size, progress)
+        finally:
+            self.random = previous_random
+
+    def _run_simulations_python(self, n):
+        """
+        Runs N simulations with `simulate_match()` and records their tallies.
+
+        Args:
+            n (int): Number of match simulations to run.
         """
         self.n_simulations = n
         for _ in range(n):
@@ -230,6 +324,180 @@ class MatchSimulator:
             else:
                 self.outcomes["draw"] += 1
 
+    def _run_batches(self, max_n, engine, seed, workers, tolerance, goals_tolerance, batch_size, progress):
+        """
+        Runs batches until `max_n` simulations have run or, given a tolerance,
+        every confidence interval meets it. NumPy batches draw from successive
+        streams spawned from `seed`, so a seeded run is reproducible.
+
+        Args:
+            max_n (int): Maximum number of simulations.
+            engine (str): Either "python" or "numpy".
+            seed (int | None): Root seed.
+            workers (int | None): Worker processes per NumPy batch.
+            tolerance (float | None): Target half-width for the outcome probabilities, or None to run all `max_n`.
+            goals_tolerance (float | None): Target half-width for the average goals.
+            batch_size (int): Simulations per batch.
+            progress (callable | None): Called with the simulator after each batch.
+        """
+        seed_sequence = np.random.SeedSequence(seed)
+        total = 0
+        self.batches = 0
+        self.converged = None if tolerance is None else False
+        # One pool serves every batch rather than starting new processes per batch
+        pool = ProcessPoolExecutor(max_workers=workers) if engine == "numpy" and workers and workers > 1 else None
+        try:
+            while total < max_n and not self.converged:
+                size = min(batch_size, max_n - total)
+                if engine == "numpy":
+                    self._run_simulations_numpy(size, seed=seed_sequence.spawn(1)[0], workers=workers, pool=pool)
+                else:
+                    self._run_simulations_python(size)
+                total += size
+                self.n_simulations = total
+                self.batches += 1
+
+                if tolerance is not None:
+                    self.converged = self.has_converged(tolerance, goals_tolerance)
+                if progress is not None:
+                    progress(self)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+
+    def _run_simulations_numpy(self, n, seed=None, workers=None, pool=None):
+        """
+        Array-backed equivalent of the pure Python loop in `run_simulations()`.
+
+        Each team's shots are packed into NumPy arrays once (`get_shot_arrays()`),
+        then the N matches are split into chunks and drawn by `simulate_chunk()`,
+        either in-process or across a process pool. Every chunk gets an independent
+        RNG stream spawned from `seed`, and chunk results are merged in order into
+        the same `scorelines`, `outcomes`, `goal_totals` and `scorer_totals`
+        structures used by the Python engine.
+
+        Args:
+            n (int): Number of match simulations to run.
+            seed (int | np.random.SeedSequence, optional): Root seed for the chunk RNG streams. Defaults to None.
+            workers (int, optional): Number of worker processes. Defaults to None (serial).
+            pool (ProcessPoolExecutor, optional): Pool to run the chunks in. Defaults to None
+                (a pool of `workers` processes is started for this call).
+        """
+        payload = self.get_engine_payload()
+        n_chunks = max(1, min(workers or 1, n))
+        chunk_sizes = get_chunk_sizes(n, n_chunks)
+        if not isinstance(seed, np.random.SeedSequence):
+            seed = np.random.SeedSequence(seed)
+        seeds = seed.spawn(n_chunks)
+
+        if n_chunks > 1 and pool is not None:
+            chunks = list(pool.map(simulate_chunk, [payload] * n_chunks, seeds, chunk_sizes))
+        elif n_chunks > 1:
+            with ProcessPoolExecutor(max_workers=n_chunks) as pool:
+                chunks = list(pool.map(simulate_chunk, [payload] * n_chunks, seeds, chunk_sizes))
+        else:
+            chunks = [simulate_chunk(payload, seeds[0], n)]
+
+        self.n_simulations = n
+        self.record_chunks(payload, chunks)
+
+    def get_engine_payload(self):
+        """
+        Collects everything the NumPy engine needs into a picklable dictionary, so
+        chunks can be simulated in worker processes without database access.
+
+        Returns:
+            dict: Keyed by "home" and "away", each holding the team ID, adjusted
+                shot probabilities, shooter index, shooter IDs and mean shot count.
+        """
+        payload = {}
+        for side, team_id, opponent_id in [
+            ("home", self.home_team_id, self.away_team_id),
+            ("away", self.away_team_id, self.home_team_id)
+        ]:
+            probs, shooter_index, shooter_ids = self.get_shot_arrays(team_id, opponent_id)
+            payload[side] = {
+                "team_id": team_id,
+                "probs": probs,
+                "shooter_index": shooter_index,
+                "shooter_ids": shooter_ids,
+                "sample_mean": self.get_sample_mean(team_id, opponent_id)
+            }
+        return payload
+
+    def record_chunks(self, payload, chunks):
+        """
+        Merges chunk results from `simulate_chunk()` into the simulator's tallies.
+
+        Args:
+            payload (dict): The payload the chunks were simulated from.
+            chunks (list[dict]): Chunk results, in chunk order.
+        """
+        home_goals = np.concatenate([chunk["home"]["goals"] for chunk in chunks])
+        away_goals = np.concatenate([chunk["away"]["goals"] for chunk in chunks])
+        self.goal_totals["home"].extend(home_goals.tolist())
+        self.goal_totals["away"].extend(away_goals.tolist())
+
+        for side in ["home", "away"]:
+            team_id = payload[side]["team_id"]
+            shooter_ids = payload[side]["shooter_ids"]
+            player_goals = sum(chunk[side]["player_goals"] for chunk in chunks)
+            for idx in np.flatnonzero(player_goals):
+                self.scorer_totals[team_id][shooter_ids[idx]] += int(player_goals[idx])
+
+        pairs, counts = np.unique(np.stack([home_goals, away_goals], axis=1), axis=0, return_counts=True)
+        for (h, a), count in zip(pairs.tolist(), counts.tolist()):
+            self.scorelines[(h, a)] += count
+
+        self.outcomes["home_win"] += int(np.count_nonzero(home_goals > away_goals))
+        self.outcomes["away_win"] += int(np.count_nonzero(home_goals < away_goals))
+        self.outcomes["draw"] += int(np.count_nonzero(home_goals == away_goals))
+
+    def get_shot_arrays(self, team_id, opponent_id):
+        """
+        Returns a team's eligible shots as NumPy arrays for the NumPy engine.
+
+        The xG values and shooter indices come from the shot store, as views when
+        no players are excluded, and are cached in `self.shot_arrays`; the
+        goalkeeper-adjusted probabilities are derived from them on each call
+        because they depend on the opponent.
+
+        Args:
+            team_id (str): The ID of the attacking team.
+            opponent_id (str): The ID of the defending team.
+
+        Returns:
+            tuple:
+                probs (np.ndarray): Adjusted scoring probability per shot, clamped to
+                    [0.01, 0.95] as in `simulate_team_goals()`. Shots without xG get 0.0.
+                shooter_index (np.ndarray): Index into `shooter_ids` for each shot.
+                shooter_ids (list[str]): The season's interned player IDs.
+        """
+        if team_id not in self.shot_arrays:
+            self.shot_arrays[team_id] = self.context.get_shot_arrays(team_id, self.excluded_player_ids)
+
+        xg, shooter_index, shooter_ids = self.shot_arrays[team_id]
+        gk_modifier = self.get_goalkeeper_modifier(opponent_id)
+        probs = np.clip(xg * (1.0 + gk_modifier), 0.01, 0.95)
+        probs[np.isnan(xg)] = 0.0
+        return probs, shooter_index, shooter_ids
+
+    def get_sample_mean(self, team_id, opponent_id):
+        """
+        Returns the mean number of shots a team takes per simulated match, after
+        defensive modifiers and home/away advantage (see `get_sampled_shots()`).
+
+        Args:
+            team_id (str): The ID of the attacking team.
+            opponent_id (str): The ID of the defending team.
+
+        Returns:
+            float: The mean of the Gaussian used to draw each match's shot count.
+        """
+        adjusted_avg_shots = self.get_adjusted_avg_shots(self.cached_avg_shots[team_id], opponent_id)
+        advantage = self.home_advantage if team_id == self.home_team_id else self.away_advantage
+        return adjusted_avg_shots * advantage
+
     def get_summary(self):
         """
         Returns a high-level summary of simulation results, including team identifiers,
@@ -250,12 +518,18 @@ class MatchSimulator:
                 - draw_pct (float): Proportion of simulations that ended in a draw.
                 - avg_home_goals (float): Average number of goals scored by the home team.
                 - avg_away_goals (float): Average number of goals scored by the away team.
+                - n_simulations (int): Number of simulations the estimates are based on.
+                - batches (int): Number of batches run.
+                - converged (bool | None): Whether a convergence run met its tolerance; None for fixed-size runs.
+                - errors (dict): 95% confidence interval half-widths of the five estimates above (see `get_errors()`).
 
         Example:
             >>> sim.run_simulations(1000)
             >>> summary = sim.get_summary()
             >>> summary["home_win_pct"]
             0.41
+            >>> summary["errors"]["home_win_pct"]
+            0.0305
         """
         return {
             "home_team_id": self.home_team_id,
@@ -268,9 +542,70 @@ class MatchSimulator:
             "away_win_pct": self.outcomes["away_win"] / self.n_simulations,
             "draw_pct": self.outcomes["draw"] / self.n_simulations,
             "avg_home_goals": sum(self.goal_totals["home"]) / self.n_simulations,
-            "avg_away_goals": sum(self.goal_totals["away"]) / self.n_simulations
+            "avg_away_goals": sum(self.goal_totals["away"]) / self.n_simulations,
+            "n_simulations": self.n_simulations,
+            "batches": self.batches,
+            "converged": self.converged,
+            "errors": self.get_errors()
         }
 
+    def get_errors(self):
+        """
+        Returns the half-widths of 95% confidence intervals for the summary estimates.
+
+        Outcome rates use the Agresti–Coull interval, which stays non-zero when an
+        outcome has not been observed yet. Average goals use the normal interval
+        with the sample standard deviation, computed from the scoreline tallies so
+        the cost does not grow with the number of simulations.
+
+        Returns:
+            dict: Half-widths keyed by "home_win_pct", "draw_pct", "away_win_pct",
+                "avg_home_goals" and "avg_away_goals".
+
+        Example:
+            >>> sim.run_simulations(10000, engine="numpy")
+            >>> sim.get_errors()
+            {"home_win_pct": 0.0097, "draw_pct": 0.0078, "away_win_pct": 0.0084,
+             "avg_home_goals": 0.0251, "avg_away_goals": 0.0229}
+        """
+        n = self.n_simulations
+        z_squared = CONFIDENCE_Z ** 2
+        errors = {}
+        for key, outcome in [("home_win_pct", "home_win"), ("draw_pct", "draw"), ("away_win_pct", "away_win")]:
+            p = (self.outcomes[outcome] + z_squared / 2) / (n + z_squared)
+            errors[key] = CONFIDENCE_Z * math.sqrt(p * (1 - p) / (n + z_squared))
+
+        counts = np.array(list(self.scorelines.values()), dtype=np.float64)
+        goals = np.array(list(self.scorelines.keys()), dtype=np.float64).reshape(-1, 2)
+        for key, side in [("avg_home_goals", 0), ("avg_away_goals", 1)]:
+            if n < 2:
+                errors[key] = math.inf
+                continue
+            mean = counts @ goals[:, side] / n
+            variance = counts @ (goals[:, side] - mean) ** 2 / (n - 1)
+            errors[key] = CONFIDENCE_Z * math.sqrt(variance / n)
+        return errors
+
+    def has_converged(self, tolerance, goals_tolerance=None):
+        """
+        Checks whether every confidence interval from `get_errors()` is within tolerance.
+
+        Args:
+            tolerance (float): Maximum half-width for the outcome probabilities.
+            goals_tolerance (float, optional): Maximum half-width for the average goals.
+                Defaults to `tolerance * GOALS_TOLERANCE_RATIO`.
+
+        Returns:
+            bool: True if all five estimates are precise enough.
+        """
+        if goals_tolerance is None:
+            goals_tolerance = tolerance * GOALS_TOLERANCE_RATIO
+        errors = self.get_errors()
+        return (
+            max(errors["home_win_pct"], errors["draw_pct"], errors["away_win_pct"]) <= tolerance
+            and max(errors["avg_home_goals"], errors["avg_away_goals"]) <= goals_tolerance
+        )
+
     def get_scoreline_distribution(self):
         """
         Returns a list of scoreline outcomes sorted by frequency, based on all simulations run.
@@ -345,6 +680,104 @@ class MatchSimulator:
             for pid, count in scorers
         ]
 
+    def get_goal_distribution(self, team_id, opponent_id):
+        """
+        Returns the exact probability of a team scoring 0, 1, 2, ... goals against an
+        opponent under the same model `simulate_team_goals()` samples from.
+
+        Args:
+            team_id (str): The ID of the attacking team.
+            opponent_id (str): The ID of the defending team.
+
+        Returns:
+            np.ndarray: Goal-count probabilities, indexed by number of goals (see `goal_count_distribution()`).
+        """
+        probs, _, _ = self.get_shot_arrays(team_id, opponent_id)
+        return goal_count_distribution(probs, self.get_sample_mean(team_id, opponent_id))
+
+    def get_exact_scoreline_matrix(self):
+        """
+        Returns the exact scoreline probabilities without running any simulations.
+
+        Both teams' goal counts are independent in the simulation model, so the
+        scoreline matrix is the outer product of the two goal distributions.
+
+        Returns:
+            np.ndarray: Matrix where entry [h, a] is the probability of an h–a final score.
+
+        Example:
+            >>> matrix = sim.get_exact_scoreline_matrix()
+            >>> matrix[1, 0]  # Probability of a 1–0 home win
+            0.0931
+        """
+        home = self.get_goal_distribution(self.home_team_id, self.away_team_id)
+        away = self.get_goal_distribution(self.away_team_id, self.home_team_id)
+        return np.outer(home, away)
+
+    def get_exact_summary(self):
+        """
+        Returns the team, outcome and average goal fields of `get_summary()`,
+        computed exactly from `get_exact_scoreline_matrix()` instead of from
+        simulation tallies.
+
+        Does not require `run_simulations()`.
+
+        Returns:
+            dict: The team, probability and average goal keys documented in `get_summary()`.
+
+        Example:
+            >>> sim.get_exact_summary()["home_win_pct"]
+            0.4127
+        """
+        matrix = self.get_exact_scoreline_matrix()
+        home_goals = np.arange(matrix.shape[0])
+        away_goals = np.arange(matrix.shape[1])
+        return {
+            "home_team_id": self.home_team_id,
+            "away_team_id": self.away_team_id,
+            "home_team_name": self.team_name_map.get(self.home_team_id, "Home"),
+            "away_team_name": self.team_name_map.get(self.away_team_id, "Away"),
+            "home_team_abbreviation": self.team_abbreviation_map.get(self.home_team_id, "Home"),
+            "away_team_abbreviation": self.team_abbreviation_map.get(self.away_team_id, "Away"),
+            "home_win_pct": float(np.tril(matrix, -1).sum()),
+            "away_win_pct": float(np.triu(matrix, 1).sum()),
+            "draw_pct": float(np.trace(matrix)),
+            "avg_home_goals": float(home_goals @ matrix.sum(axis=1)),
+            "avg_away_goals": float(away_goals @ matrix.sum(axis=0))
+        }
+
+    def get_exact_scoreline_distribution(self, min_pct=0.0001):
+        """
+        Returns exact scoreline probabilities sorted from most to least likely,
+        in the format of `get_scoreline_distribution()` without the `count` field.
+
+        Args:
+            min_pct (float, optional): Scorelines less likely than this are omitted. Defaults to 0.0001.
+
+        Returns:
+            list[dict]: List of dictionaries, each containing:
+                - scoreline (str): Formatted as "X-Y" (home-away goals).
+                - home_goals (int): Number of goals scored by the home team.
+                - away_goals (int): Number of goals scored by the away team.
+                - pct (float): Probability of the scoreline.
+
+        Example:
+            >>> sim.get_exact_scoreline_distribution()[0]
+            {"scoreline": "1-1", "home_goals": 1, "away_goals": 1, "pct": 0.1248}
+        """
+        matrix = self.get_exact_scoreline_matrix()
+        home_goals, away_goals = np.nonzero(matrix >= min_pct)
+        order = np.argsort(-matrix[home_goals, away_goals], kind="stable")
+        return [
+            {
+                "scoreline": f"{h}-{a}",
+                "home_goals": h,
+                "away_goals": a,
+                "pct": float(matrix[h, a])
+            }
+            for h, a in zip(home_goals[order].tolist(), away_goals[order].tolist())
+        ]
+
     def get_adjusted_avg_shots(self, avg_shots, opponent_id):
         """
         Calculates the average number of shots to simulate for a team
@@ -388,11 +821,11 @@ class MatchSimulator:
 
         Args:
             team_id (str): The team ID.
-            shots (list[dict]): List of eligible shots for this simulation.
+            shots (list[tuple]): Eligible (xG, shooter ID) shots from `get_team_shots()`.
             adjusted_avg_shots (float): Adjusted shot volume based on defensive modifiers.
 
         Returns:
-            list[dict]: Sampled shot dictionaries for this simulation.
+            list[tuple]: Sampled shots for this simulation.
 
         Example:
             If adjusted_avg_shots = 14.0 and home_advantage = 1.05, then
@@ -400,8 +833,8 @@ class MatchSimulator:
         """
         advantage = self.home_advantage if team_id == self.home_team_id else self.away_advantage
         sample_mean = adjusted_avg_shots * advantage
-        sample_size = max(1, int(random.gauss(sample_mean, 2)))
-        return random.sample(shots, min(sample_size, len(shots)))
+        sample_size = max(1, int(self.random.gauss(sample_mean, SHOT_COUNT_SD)))
+        return self.random.sample(shots, min(sample_size, len(shots)))
 
     def get_goalkeeper_modifier(self, opponent_id):
         """
@@ -429,4 +862,195 @@ class MatchSimulator:
             over = gk["goals_minus_xgoals_gk"]
             faced = gk["xgoals_gk_faced"]
             return -1.0 * (over / faced)
-        return 0.0
\ No newline at end of file
+        return 0.0
+
+
+def get_chunk_sizes(n, n_chunks):
+    """
+    Splits N simulations into chunks whose sizes differ by at most one, larger
+    chunks first, as `np.array_split()` would, without allocating N elements.
+
+    Args:
+        n (int): Number of simulations.
+        n_chunks (int): Number of chunks.
+
+    Returns:
+        list[int]: Size of each chunk.
+
+    Example:
+        >>> get_chunk_sizes(10, 3)
+        [4, 3, 3]
+    """
+    size, remainder = divmod(n, n_chunks)
+    return [size + 1] * remainder + [size] * (n_chunks - remainder)
+
+def simulate_chunk(payload, seed_sequence, n):
+    """
+    Simulates N matches for both sides of a fixture with one RNG stream.
+
+    This is the unit of work for the NumPy engine. It is a module-level function
+    taking only picklable arguments so it can run in a worker process.
+
+    Args:
+        payload (dict): Output of `MatchSimulator.get_engine_payload()`.
+        seed_sequence (np.random.SeedSequence): Seed for this chunk's RNG stream.
+        n (int): Number of matches to simulate.
+
+    Returns:
+        dict: Keyed by "home" and "away", each holding:
+            - goals (np.ndarray): Goals scored in each match.
+            - player_goals (np.ndarray): Goals per entry in the side's `shooter_ids`.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    results = {}
+    for side in ["home", "away"]:
+        team = payload[side]
+        goals, shot_goals = simulate_goals_batch(rng, team["probs"], team["sample_mean"], n)
+        results[side] = {
+            "goals": goals,
+            "player_goals": np.bincount(
+                team["shooter_index"], weights=shot_goals, minlength=len(team["shooter_ids"])
+            ).astype(np.int64)
+        }
+    return results
+
+def simulate_goals_batch(rng, probs, sample_mean, n):
+    """
+    Simulates one team's goals for N matches at once.
+
+    Mirrors `MatchSimulator.simulate_team_goals()`: each match draws a shot count
+    of max(1, int(Normal(sample_mean, SHOT_COUNT_SD))) capped at the number of available shots,
+    samples that many distinct shots, and runs a Bernoulli trial per sampled shot.
+
+    Distinct shots are drawn by sampling indices with replacement and redrawing
+    any duplicates until every row is duplicate-free. The procedure treats every
+    shot symmetrically, so each row is a uniform sample without replacement,
+    exactly like `random.sample`.
+
+    Args:
+        rng (np.random.Generator): Source of randomness.
+        probs (np.ndarray): Adjusted scoring probability per available shot.
+        sample_mean (float): Mean shot count per match.
+        n (int): Number of matches to simulate.
+
+    Returns:
+        tuple:
+            goals (np.ndarray): Goals scored in each of the N matches.
+            shot_goals (np.ndarray): Number of goals produced by each shot across all matches.
+
+    Example:
+        >>> goals, shot_goals = simulate_goals_batch(np.random.default_rng(1), probs, 13.2, 10000)
+        >>> goals.mean()
+        1.41
+    """
+    n_shots = len(probs)
+    goals = np.zeros(n, dtype=np.int64)
+    shot_goals = np.zeros(n_shots, dtype=np.int64)
+    counts = np.maximum(1, np.trunc(rng.normal(sample_mean, SHOT_COUNT_SD, n)).astype(np.int64))
+    if n_shots == 0 or n == 0:
+        return goals, shot_goals
+    counts = np.minimum(counts, n_shots)
+
+    max_k = int(counts.max())
+    columns = np.arange(max_k)
+    batch_size = max(1, MAX_BATCH_CELLS // max_k)
+    for start in range(0, n, batch_size):
+        k = counts[start:start + batch_size]
+        rows = len(k)
+
+        # Columns past a row's shot count hold sentinels (>= n_shots) that never collide.
+        picked = np.where(
+            columns < k[:, None],
+            rng.integers(0, n_shots, (rows, max_k)),
+            n_shots + columns
+        )
+        while True:
+            picked.sort(axis=1)
+            duplicate = np.zeros(picked.shape, dtype=bool)
+            duplicate[:, 1:] = picked[:, 1:] == picked[:, :-1]
+            n_duplicates = np.count_nonzero(duplicate)
+            if not n_duplicates:
+                break
+            picked[duplicate] = rng.integers(0, n_shots, n_duplicates)
+
+        in_sample = picked < n_shots
+        shot_probs = probs[np.where(in_sample, picked, 0)]
+        scored = in_sample & (rng.random((rows, max_k)) < shot_probs)
+
+        goals[start:start + rows] = scored.sum(axis=1)
+        shot_goals += np.bincount(picked[scored], minlength=n_shots)
+
+    return goals, shot_goals
+
+def shot_count_distribution(sample_mean, n_shots):
+    """
+    Returns the exact distribution of the number of shots sampled per match.
+
+    Matches `MatchSimulator.get_sampled_shots()`: the count is
+    max(1, int(X)) with X ~ Normal(sample_mean, SHOT_COUNT_SD), capped at the
+    number of available shots. Since `int()` truncates toward zero, a count of 1
+    covers every X < 2, a count c covers c <= X < c + 1, and the cap absorbs the
+    upper tail. Counts more than 12 standard deviations above the mean are
+    folded into the last entry.
+
+    Args:
+        sample_mean (float): Mean shot count per match.
+        n_shots (int): Number of shots available to sample from.
+
+    Returns:
+        np.ndarray: Probabilities indexed by shot count; entry 0 is only non-zero when there are no shots.
+    """
+    if n_shots == 0:
+        return np.ones(1)
+
+    max_count = min(n_shots, max(1, math.ceil(sample_mean + 12 * SHOT_COUNT_SD)))
+
+    def cdf(x):
+        return 0.5 * math.erfc((sample_mean - x) / (SHOT_COUNT_SD * math.sqrt(2)))
+
+    pmf = np.zeros(max_count + 1)
+    for count in range(1, max_count + 1):
+        lower = cdf(count) if count > 1 else 0.0
+        upper = cdf(count + 1) if count < max_count else 1.0
+        pmf[count] = upper - lower
+    return pmf
+
+def goal_count_distribution(probs, sample_mean):
+    """
+    Returns the exact goal-count distribution of one team in one match.
+
+    Each match samples k distinct shots uniformly (k from
+    `shot_count_distribution()`) and each sampled shot scores independently with
+    its adjusted probability, so given k the goal count is a Poisson-binomial
+    averaged over every k-subset of shots. A dynamic programme over the shots
+    keeps, for every subset size j, the goal distribution averaged over all
+    j-subsets seen so far; adding shot i + 1 mixes "shot excluded" and "shot
+    included" with weights (i + 1 - j) / (i + 1) and j / (i + 1). This costs
+    O(n_shots * k_max^2) and never forms binomial coefficients, so it cannot overflow.
+
+    Args:
+        probs (np.ndarray): Adjusted scoring probability per available shot.
+        sample_mean (float): Mean shot count per match.
+
+    Returns:
+        np.ndarray: Probabilities indexed by number of goals.
+
+    Example:
+        >>> goal_count_distribution(np.array([0.5, 0.5]), 1.0)
+        array([0.42286562, 0.5       , 0.07713438])
+    """
+    count_pmf = shot_count_distribution(sample_mean, len(probs))
+    max_count = len(count_pmf) - 1
+
+    # averages[j, g]: P(g goals) averaged over all j-subsets of the shots processed so far
+    averages = np.zeros((max_count + 1, max_count + 1))
+    averages[0, 0] = 1.0
+    subset_sizes = np.arange(1, max_count + 1)[:, None]
+    for i, p in enumerate(probs):
+        seen = i + 1
+        included = np.zeros((max_count, max_count + 1))
+        included[:, :] = averages[:-1] * (1.0 - p)
+        included[:, 1:] += averages[:-1, :-1] * p
+        averages[1:] = averages[1:] * ((seen - subset_sizes) / seen) + included * (subset_sizes / seen)
+
+    return count_pmf @ averages
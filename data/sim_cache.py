@@ -0,0 +1,281 @@
+from .data_util import get_data_generation
+from .sim import MatchSimulator
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 60 * 60
+
+# Largest simulation count `/simulation_results` runs within a request; bigger
+# runs belong in a background job (see sim_jobs).
+MAX_SIMULATIONS = 200_000
+
+class SimulationCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl_seconds=DEFAULT_TTL_SECONDS, db_path=None):
+        """
+        A bounded, thread-safe LRU cache of simulation results with a time-to-live,
+        optionally backed by a SQLite table so results survive a restart.
+
+        The backing table lives in its own database file rather than nwsl.db, so
+        the cache never writes to the data the site serves.
+
+        Args:
+            max_entries (int, optional): Maximum number of results kept in memory. Defaults to 256.
+            ttl_seconds (float, optional): Seconds a result stays valid. Defaults to one hour.
+            db_path (str, optional): Path of the SQLite file to persist results to. Defaults to None (memory only).
+
+        Example:
+            >>> cache = SimulationCache(max_entries=64, ttl_seconds=600)
+            >>> cache.put("abc", {"summary": {...}})
+            >>> cache.get("abc")
+            {"summary": {...}}
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.db_path = db_path
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        if db_path:
+            self._create_table()
+
+    def get(self, key):
+        """
+        Returns the cached result for a key, or None if it is missing or expired.
+
+        A miss in memory falls back to the SQLite table when one is configured.
+
+        Args:
+            key (str): Cache key from `make_cache_key()`.
+
+        Returns:
+            dict | None: The cached result.
+        """
+        now = time.time()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                created_at, result = entry
+                if now - created_at < self.ttl_seconds:
+                    self.entries.move_to_end(key)
+                    return result
+                del self.entries[key]
+
+        if not self.db_path:
+            return None
+        conn = sqlite3.connect(self.db_path)
+        cursor = conn.cursor()
+        cursor.execute('SELECT created_at, result FROM simulation_cache WHERE cache_key = ?', (key,))
+        row = cursor.fetchone()
+        if row and now - row[0] >= self.ttl_seconds:
+            cursor.execute('DELETE FROM simulation_cache WHERE cache_key = ?', (key,))
+            conn.commit()
+            row = None
+        conn.close()
+        if row is None:
+            return None
+
+        result = json.loads(row[1])
+        self._remember(key, row[0], result)
+        return result
+
+    def put(self, key, result):
+        """
+        Stores a result, evicting the least recently used entries beyond `max_entries`.
+
+        Args:
+            key (str): Cache key from `make_cache_key()`.
+            result (dict): JSON-serialisable simulation result.
+        """
+        created_at = time.time()
+        self._remember(key, created_at, result)
+        if self.db_path:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('''
+                INSERT OR REPLACE INTO simulation_cache (cache_key, created_at, result)
+                VALUES (?, ?, ?)
+            ''', (key, created_at, json.dumps(result)))
+            conn.execute('DELETE FROM simulation_cache WHERE created_at <= ?', (created_at - self.ttl_seconds,))
+            conn.commit()
+            conn.close()
+
+    def clear(self):
+        """Removes every cached result, including persisted ones."""
+        with self.lock:
+            self.entries.clear()
+        if self.db_path:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('DELETE FROM simulation_cache')
+            conn.commit()
+            conn.close()
+
+    def _remember(self, key, created_at, result):
+        with self.lock:
+            self.entries[key] = (created_at, result)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def _create_table(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS simulation_cache (
+            cache_key TEXT PRIMARY KEY,
+            created_at REAL,
+            result TEXT
+        )
+        ''')
+        conn.commit()
+        conn.close()
+
+def make_cache_key(home_team_id, away_team_id, season, home_advantage, away_advantage,
+                   excluded_player_ids, n_simulations, seed=None, data_version=None, tolerance=None):
+    """
+    Builds a canonical hash of every input that affects a simulation result.
+
+    Exclusions are sorted and advantages normalised to floats, so equivalent
+    requests map to the same key regardless of form ordering or formatting.
+
+    Args:
+        home_team_id (str): ID of the home team.
+        away_team_id (str): ID of the away team.
+        season (int): Season year.
+        home_advantage (float): Home shot volume modifier.
+        away_advantage (float): Away shot volume modifier.
+        excluded_player_ids (Iterable[str] | None): Excluded player IDs.
+        n_simulations (int): Number of simulations.
+        seed (int, optional): Explicit seed, if any. Defaults to None.
+        data_version (int, optional): Data generation the result was computed from.
+            Defaults to the current `get_data_generation()`.
+        tolerance (float, optional): Convergence tolerance, if any. Defaults to None.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    if data_version is None:
+        data_version = get_data_generation()
+    canonical = json.dumps({
+        "home_team_id": home_team_id,
+        "away_team_id": away_team_id,
+        "season": int(season),
+        "home_advantage": float(home_advantage),
+        "away_advantage": float(away_advantage),
+        "excluded_player_ids": sorted(excluded_player_ids or []),
+        "n_simulations": int(n_simulations),
+        "seed": seed,
+        "data_version": data_version,
+        "tolerance": None if tolerance is None else float(tolerance)
+    }, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+def seed_from_key(key):
+    """
+    Derives a deterministic 64-bit simulation seed from a cache key.
+
+    Args:
+        key (str): Hex digest from `make_cache_key()`.
+
+    Returns:
+        int: The seed.
+    """
+    return int(key[:16], 16)
+
+def run_cached_simulation(home_team_id, away_team_id, season, home_advantage, away_advantage,
+                          excluded_player_ids, n_simulations, seed=None, cache=None, scorer_limit=5, tolerance=None,
+                          progress=None):
+    """
+    Returns the results `/simulation_results` renders, serving them from the cache
+    when an identical request has been simulated against the same data.
+
+    Simulations always run seeded: with the caller's seed if given, otherwise with
+    a seed derived from the cache key. A cached result is therefore exactly what
+    re-running the request would produce, so a cache hit, a miss and an expiry
+    are indistinguishable to the user.
+
+    Args:
+        home_team_id (str): ID of the home team.
+        away_team_id (str): ID of the away team.
+        season (int): Season year.
+        home_advantage (float): Home shot volume modifier.
+        away_advantage (float): Away shot volume modifier.
+        excluded_player_ids (Iterable[str] | None): Player IDs to exclude.
+        n_simulations (int): Number of simulations.
+        seed (int, optional): Explicit seed. Defaults to None (derived from the key).
+        cache (SimulationCache, optional): Cache to use. Defaults to `SIMULATION_CACHE`.
+        scorer_limit (int, optional): Number of top scorers to keep per side. Defaults to 5.
+        tolerance (float, optional): Stop early once estimates are this precise, treating
+            `n_simulations` as the budget (see `MatchSimulator.run_simulations()`). Defaults to None.
+        progress (callable, optional): Called with the simulator after each batch (see
+            `MatchSimulator.run_simulations()`); never called on a cache hit. Defaults to None.
+
+    Returns:
+        dict: Contains "summary", "scorelines", "home_scorers" and "away_scorers".
+
+    Example:
+        >>> result = run_cached_simulation(home_id, away_id, 2024, 1.05, 0.95, [], 10000)
+        >>> result["summary"]["home_win_pct"]
+        0.4521
+    """
+    cache = cache or SIMULATION_CACHE
+    key = make_cache_key(home_team_id, away_team_id, season, home_advantage, away_advantage,
+                         excluded_player_ids, n_simulations, seed, tolerance=tolerance)
+    result = cache.get(key)
+    if result is not None:
+        return result
+
+    simulator = MatchSimulator(home_team_id=home_team_id,
+                               away_team_id=away_team_id,
+                               season=season,
+                               home_advantage=home_advantage,
+                               away_advantage=away_advantage,
+                               excluded_player_ids=set(excluded_player_ids or []))
+    simulator.run_simulations(n_simulations, engine="numpy", seed=seed if seed is not None else seed_from_key(key),
+                              tolerance=tolerance, progress=progress)
+    result = {
+        "summary": simulator.get_summary(),
+        "scorelines": simulator.get_scoreline_distribution(),
+        "home_scorers": simulator.get_top_scorers("home", limit=scorer_limit),
+        "away_scorers": simulator.get_top_scorers("away", limit=scorer_limit)
+    }
+    cache.put(key, result)
+    return result
+
+def get_exact_results(home_team_id, away_team_id, season, home_advantage, away_advantage, excluded_player_ids):
+    """
+    Returns `/simulation_results` data computed exactly from the model's scoreline
+    probabilities (see `MatchSimulator.get_exact_summary()`) instead of by simulation.
+
+    No simulations run, so there is nothing to cache. The summary has no
+    confidence intervals and the exact model has no per-player tallies, so the
+    scorer lists are empty.
+
+    Args:
+        home_team_id (str): ID of the home team.
+        away_team_id (str): ID of the away team.
+        season (int): Season year.
+        home_advantage (float): Home shot volume modifier.
+        away_advantage (float): Away shot volume modifier.
+        excluded_player_ids (Iterable[str] | None): Player IDs to exclude.
+
+    Returns:
+        dict: Contains "summary", "scorelines", "home_scorers" and "away_scorers", like
+            `run_cached_simulation()`. Scorelines carry "pct" but no "count".
+    """
+    simulator = MatchSimulator(home_team_id=home_team_id,
+                               away_team_id=away_team_id,
+                               season=season,
+                               home_advantage=home_advantage,
+                               away_advantage=away_advantage,
+                               excluded_player_ids=set(excluded_player_ids or []))
+    return {
+        "summary": simulator.get_exact_summary(),
+        "scorelines": simulator.get_exact_scoreline_distribution(),
+        "home_scorers": [],
+        "away_scorers": []
+    }
+
+SIMULATION_CACHE = SimulationCache(db_path=os.environ.get('SIMULATION_CACHE_DB'))
@@ -0,0 +1,176 @@
+from .data_util import get_read_connection, get_data_generation, validate_season
+from .shot_store import get_shot_store, load_shot_store
+import sqlite3
+import threading
+
+_context_cache = {}
+_context_lock = threading.Lock()
+
+class SimulationContext:
+    def __init__(self, season, shot_store, avg_shots, xga_per_game, sapg_per_game, goalkeepers,
+                 league_avg_xga, league_avg_sapg, player_name_map, team_name_map, team_abbreviation_map):
+        """
+        Holds every season-level input `MatchSimulator` needs, so any fixture in the
+        season can be simulated without touching the database.
+
+        Args:
+            season (int): The season the data belongs to.
+            shot_store (ShotStore): Every shot of the season in columnar form.
+            avg_shots (dict[str, float]): Average shots per game per team.
+            xga_per_game (dict[str, float | None]): Expected goals against per game per team.
+            sapg_per_game (dict[str, float | None]): Shots against per game per team.
+            goalkeepers (dict[str, sqlite3.Row | dict]): Primary goalkeeper record per team.
+            league_avg_xga (float | None): League-wide xGA per team per game.
+            league_avg_sapg (float | None): League-wide shots against per team per game.
+            player_name_map (dict): Maps player IDs to names.
+            team_name_map (dict): Maps team IDs to full team names.
+            team_abbreviation_map (dict): Maps team IDs to abbreviations.
+
+        Example:
+            >>> context = get_simulation_context(2024)
+            >>> sim = MatchSimulator(home_id, away_id, 2024, 1.05, 0.95, context=context)
+        """
+        self.season = season
+        self.shot_store = shot_store
+        self.avg_shots = avg_shots
+        self.xga_per_game = xga_per_game
+        self.sapg_per_game = sapg_per_game
+        self.goalkeepers = goalkeepers
+        self.league_avg_xga = league_avg_xga
+        self.league_avg_sapg = league_avg_sapg
+        self.player_name_map = player_name_map
+        self.team_name_map = team_name_map
+        self.team_abbreviation_map = team_abbreviation_map
+
+    def get_shot_arrays(self, team_id, excluded_player_ids=None):
+        """
+        Returns a team's shots as arrays, see `ShotStore.get_shot_arrays()`.
+
+        Args:
+            team_id (str): The team ID.
+            excluded_player_ids (set[str], optional): Shooters to drop. Defaults to None.
+
+        Returns:
+            tuple: (xg, shooter_index, player_ids).
+        """
+        return self.shot_store.get_shot_arrays(team_id, excluded_player_ids)
+
+def load_simulation_context(season, conn=None, shot_store=None):
+    """
+    Loads a season's simulation inputs for every team using a single connection.
+
+    The values match the per-team getters the simulator used to call
+    (`get_shots_for_team`, `get_avg_shots_for_team`, `get_team_xga_per_game`,
+    `get_team_shots_against_per_game`, `get_goalkeepers_for_team` and the league
+    averages and name maps), computed in one pass per table.
+
+    Args:
+        season (int): The season to load.
+        conn (sqlite3.Connection, optional): Connection to read from. Defaults to a pooled read connection.
+        shot_store (ShotStore, optional): The season's shots. Defaults to loading them through `conn`.
+
+    Returns:
+        SimulationContext: The loaded context.
+    """
+    validate_season(season)
+    print(f'Loading simulation context for season {season}...')
+    owns_connection = conn is None
+    if owns_connection:
+        conn = get_read_connection()
+    conn.row_factory = sqlite3.Row
+    cursor = conn.cursor()
+
+    if shot_store is None:
+        shot_store = load_shot_store(season, conn)
+    avg_shots = {team_id: shot_store.get_avg_shots(team_id) for team_id in shot_store.team_ids}
+
+    # Defensive modifiers and league averages, as in db_team_xgoals
+    cursor.execute('''
+        SELECT team_id, xgoals_against, shots_against, count_games
+        FROM team_xgoals
+        WHERE season = ?
+    ''', (season,))
+    xga_per_game = {}
+    sapg_per_game = {}
+    total_xga = total_sa = total_games = 0
+    for row in cursor.fetchall():
+        count_games = row['count_games'] or 0
+        has_games = count_games > 0
+        xga_per_game[row['team_id']] = row['xgoals_against'] / count_games if has_games else None
+        sapg_per_game[row['team_id']] = row['shots_against'] / count_games if has_games else None
+        total_xga += row['xgoals_against'] or 0
+        total_sa += row['shots_against'] or 0
+        total_games += count_games
+    league_avg_xga = total_xga / total_games if total_games > 0 else None
+    league_avg_sapg = total_sa / total_games if total_games > 0 else None
+
+    # Primary goalkeeper per team, as in get_goalkeepers_for_team
+    cursor.execute('''
+        SELECT
+            gk.*,
+            pi.*
+        FROM
+            goalkeeper_xgoals AS gk
+        JOIN
+            player_info AS pi
+            ON gk.player_id = pi.player_id
+        WHERE
+            gk.season = ?
+        ORDER BY
+            gk.team_id, gk.minutes_played DESC
+    ''', (season,))
+    goalkeepers = {}
+    for row in cursor.fetchall():
+        goalkeepers.setdefault(row['team_id'], row)
+
+    cursor.execute('SELECT player_id, player_name FROM player_info')
+    player_name_map = {row['player_id']: row['player_name'] for row in cursor.fetchall()}
+    cursor.execute('SELECT team_id, team_name, team_abbreviation FROM team_info')
+    team_rows = cursor.fetchall()
+    team_name_map = {row['team_id']: row['team_name'] for row in team_rows}
+    team_abbreviation_map = {row['team_id']: row['team_abbreviation'] for row in team_rows}
+
+    if owns_connection:
+        conn.close()
+
+    print(f'Simulation context loaded for {len(shot_store.team_ids)} teams in season {season}.')
+    return SimulationContext(
+        season=season,
+        shot_store=shot_store,
+        avg_shots=avg_shots,
+        xga_per_game=xga_per_game,
+        sapg_per_game=sapg_per_game,
+        goalkeepers=goalkeepers,
+        league_avg_xga=league_avg_xga,
+        league_avg_sapg=league_avg_sapg,
+        player_name_map=player_name_map,
+        team_name_map=team_name_map,
+        team_abbreviation_map=team_abbreviation_map
+    )
+
+def get_simulation_context(season):
+    """
+    Returns the cached simulation context for a season, loading it on first use
+    or whenever an ingestion run has bumped the data generation since it was cached.
+
+    Args:
+        season (int): The season to load.
+
+    Returns:
+        SimulationContext: The context for the season at the current data generation.
+    """
+    key = (season, get_data_generation())
+    with _context_lock:
+        context = _context_cache.get(key)
+        if context is None:
+            context = load_simulation_context(season, shot_store=get_shot_store(season))
+            # Drop contexts for this season from older data generations
+            for stale_key in [k for k in _context_cache if k[0] == season]:
+                del _context_cache[stale_key]
+            _context_cache[key] = context
+    return context
+
+def clear_simulation_context_cache():
+    """Removes every cached simulation context."""
+    with _context_lock:
+        _context_cache.clear()
@@ -0,0 +1,235 @@
+from .sim_cache import run_cached_simulation
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import uuid
+
+MAX_RETAINED_JOBS = 100
+
+# Largest simulation count a job may request, and how many jobs may be queued
+# or running at once before new submissions are turned away.
+MAX_SIMULATIONS = 1_000_000
+MAX_PENDING_JOBS = 20
+
+class SimulationJob:
+    def __init__(self, job_id, params):
+        """
+        Tracks one background simulation: its inputs, progress and interim estimates.
+
+        Args:
+            job_id (str): Unique job identifier.
+            params (dict): Keyword arguments for `run_cached_simulation()`.
+
+        Attributes:
+            status (str): One of "queued", "running", "done" or "failed".
+            completed (int): Simulations finished so far.
+            batches_done (int): Batches finished so far.
+            summary (dict | None): `MatchSimulator.get_summary()` after the latest batch.
+            result (dict | None): Final results once the job is done.
+            error (str | None): Error message if the job failed.
+        """
+        self.job_id = job_id
+        self.params = params
+        self.total = params["n_simulations"]
+        self.status = "queued"
+        self.completed = 0
+        self.batches_done = 0
+        self.summary = None
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.lock = threading.Lock()
+
+    def get_status(self):
+        """
+        Returns a JSON-serialisable snapshot of the job's progress.
+
+        While the job runs, `estimates` holds win/draw/loss rates and average
+        goals over the simulations completed so far, plus their 95% confidence
+        interval half-widths under "errors".
+
+        Returns:
+            dict: job_id, status, completed, total, progress (0–1), estimates and error.
+
+        Example:
+            >>> job.get_status()
+            {"job_id": "...", "status": "running", "completed": 30000, "total": 100000,
+             "progress": 0.3, "estimates": {"home_win_pct": 0.452, ...}, "error": None}
+        """
+        with self.lock:
+            estimates = None
+            if self.summary is not None:
+                estimates = {
+                    key: self.summary[key]
+                    for key in ["home_win_pct", "draw_pct", "away_win_pct", "avg_home_goals", "avg_away_goals", "errors"]
+                }
+            return {
+                "job_id": self.job_id,
+                "status": self.status,
+                "completed": self.completed,
+                "total": self.total,
+                "progress": 1.0 if self.status == "done" or not self.total else self.completed / self.total,
+                "estimates": estimates,
+                "error": self.error
+            }
+
+class SimulationJobManager:
+    def __init__(self, max_workers=2, max_jobs=MAX_RETAINED_JOBS, max_pending=MAX_PENDING_JOBS, cache=None):
+        """
+        Runs match simulations in a local thread pool so requests can return
+        immediately and poll for progress. No external broker is involved.
+
+        Each job runs through `run_cached_simulation()`, the same path as
+        `/simulation_results`, so a job and a synchronous request with the same
+        inputs give the same results and share one cache entry. Estimates are
+        published after each of the simulator's batches, and jobs given a
+        tolerance stop at the first batch where they are precise enough.
+
+        Args:
+            max_workers (int, optional): Jobs that may run concurrently. Defaults to 2.
+            max_jobs (int, optional): Finished jobs retained for polling. Defaults to 100.
+            max_pending (int, optional): Jobs that may be queued or running at once. Defaults to 20.
+            cache (SimulationCache, optional): Cache results are read from and stored in.
+                Defaults to `SIMULATION_CACHE`.
+
+        Example:
+            >>> manager = SimulationJobManager()
+            >>> job_id = manager.submit(home_id, away_id, 2024, 1.05, 0.95, [], 1000000)
+            >>> manager.get_status(job_id)["progress"]
+            0.12
+        """
+        self.max_jobs = max_jobs
+        self.max_pending = max_pending
+        self.cache = cache
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="simulation-job")
+        self.jobs = OrderedDict()
+        self.lock = threading.Lock()
+
+    def submit(self, home_team_id, away_team_id, season, home_advantage, away_advantage,
+               excluded_player_ids, n_simulations, seed=None, tolerance=None):
+        """
+        Queues a simulation and returns its job ID without waiting for it, or
+        None when `max_pending` jobs are already queued or running.
+
+        Without an explicit seed, the seed is derived from the request's cache key
+        (see `sim_cache.run_cached_simulation()`), so identical requests give identical results.
+
+        Args:
+            home_team_id (str): ID of the home team.
+            away_team_id (str): ID of the away team.
+            season (int): Season year.
+            home_advantage (float): Home shot volume modifier.
+            away_advantage (float): Away shot volume modifier.
+            excluded_player_ids (Iterable[str] | None): Player IDs to exclude.
+            n_simulations (int): Number of simulations.
+            seed (int, optional): Root seed. Defaults to None (derived from the inputs).
+            tolerance (float, optional): Finish early once the outcome confidence intervals are
+                this narrow, treating `n_simulations` as the budget. Defaults to None (run every batch).
+
+        Returns:
+            str | None: The job ID, or None if the queue is full.
+        """
+        params = {
+            "home_team_id": home_team_id,
+            "away_team_id": away_team_id,
+            "season": season,
+            "home_advantage": home_advantage,
+            "away_advantage": away_advantage,
+            "excluded_player_ids": set(excluded_player_ids or []),
+            "n_simulations": n_simulations,
+            "seed": seed,
+            "tolerance": tolerance
+        }
+        job = SimulationJob(uuid.uuid4().hex, params)
+        with self.lock:
+            if self._count_pending() >= self.max_pending:
+                return None
+            self.jobs[job.job_id] = job
+            self._prune()
+        self.executor.submit(self._run, job)
+        return job.job_id
+
+    def get_job(self, job_id):
+        """Returns the job with the given ID, or None if it is unknown or was pruned."""
+        with self.lock:
+            return self.jobs.get(job_id)
+
+    def get_status(self, job_id):
+        """
+        Returns the progress snapshot of a job.
+
+        Args:
+            job_id (str): The job ID.
+
+        Returns:
+            dict | None: See `SimulationJob.get_status()`, or None for an unknown job.
+        """
+        job = self.get_job(job_id)
+        return job.get_status() if job else None
+
+    def wait(self, job_id, timeout=None, poll_interval=0.05):
+        """
+        Blocks until a job finishes or the timeout elapses.
+
+        Args:
+            job_id (str): The job ID.
+            timeout (float, optional): Maximum seconds to wait. Defaults to None (no limit).
+            poll_interval (float, optional): Seconds between checks. Defaults to 0.05.
+
+        Returns:
+            dict | None: The job's final status snapshot, or its latest one on timeout.
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            status = self.get_status(job_id)
+            if status is None or status["status"] in ("done", "failed"):
+                return status
+            if deadline is not None and time.time() >= deadline:
+                return status
+            time.sleep(poll_interval)
+
+    def _run(self, job):
+        def publish(simulator):
+            summary = simulator.get_summary()
+            with job.lock:
+                job.completed = simulator.n_simulations
+                job.batches_done = simulator.batches
+                job.summary = summary
+
+        try:
+            with job.lock:
+                job.status = "running"
+            result = run_cached_simulation(**job.params, cache=self.cache, progress=publish)
+            with job.lock:
+                job.result = result
+                job.summary = result["summary"]
+                job.completed = result["summary"]["n_simulations"]
+                job.batches_done = result["summary"]["batches"]
+                job.status = "done"
+        except Exception as e:
+            print(f'Simulation job {job.job_id} failed: {e}')
+            with job.lock:
+                job.status = "failed"
+                job.error = str(e)
+
+    def _count_pending(self):
+        pending = 0
+        for job in self.jobs.values():
+            with job.lock:
+                if job.status in ("queued", "running"):
+                    pending += 1
+        return pending
+
+    def _prune(self):
+        # Drop the oldest finished jobs once more than max_jobs are retained
+        finished = []
+        for job_id, job in self.jobs.items():
+            # Status is written by the worker thread under the job's lock
+            with job.lock:
+                if job.status in ("done", "failed"):
+                    finished.append(job_id)
+        for job_id in finished[:max(0, len(self.jobs) - self.max_jobs)]:
+            del self.jobs[job_id]
+
+SIMULATION_JOBS = SimulationJobManager()
@@ -0,0 +1,163 @@
+'''
+Cache of the Plotly figure JSON behind the team and game pages.
+
+Building and serialising a figure costs far more than the queries feeding it,
+and a figure only changes when the data does. Each figure is therefore built
+once per entity (team or game), season and data generation, on its first
+request, and served from here until the next ingestion run bumps the
+generation (data_util.get_data_generation()).
+'''
+from data.data_util import get_data_generation
+from collections import OrderedDict
+import json
+import os
+import sqlite3
+import threading
+
+DEFAULT_MAX_ENTRIES = 1024
+
+class FigureCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, db_path=None, get_generation=get_data_generation):
+        """
+        A bounded, thread-safe LRU cache of (figure JSON, config) pairs, optionally
+        backed by a SQLite table so figures survive a restart.
+
+        The backing table lives in its own database file rather than nwsl.db, like
+        `SimulationCache`'s.
+
+        Args:
+            max_entries (int, optional): Maximum number of figures kept in memory. Defaults to 1024.
+            db_path (str, optional): Path of the SQLite file to persist figures to. Defaults to None (memory only).
+            get_generation (Callable[[], int], optional): Returns the current data generation.
+                Defaults to `data_util.get_data_generation`.
+
+        Example:
+            >>> cache = FigureCache()
+            >>> cache.get_or_build('goals_donut', team_id, 2024, lambda: get_donut_plot_for_goals(30, 21))
+            ('{"data": [...], "layout": {...}}', {'displayModeBar': False})
+        """
+        self.max_entries = max_entries
+        self.db_path = db_path
+        self.get_generation = get_generation
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if db_path:
+            self._create_table()
+
+    def get_or_build(self, figure, entity_id, season, build):
+        """
+        Returns a figure's JSON and config, building and storing them on a miss.
+
+        As in `PageCache`, a figure built while an update bumped the generation is
+        returned but not stored.
+
+        Args:
+            figure (str): Figure name, e.g. "team_strength_donut".
+            entity_id (str): Team or game ID the figure is drawn for.
+            season (int): Season the figure's data comes from.
+            build (Callable[[], tuple[str | None, dict | None]]): Builds the figure, returning
+                what the plotting function returns.
+
+        Returns:
+            tuple[str | None, dict | None]: The figure JSON and its Plotly config.
+        """
+        generation = self.get_generation()
+        key = (figure, entity_id, season, generation)
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+
+        stored = self._load(key)
+        if stored is not None:
+            self._remember(key, stored)
+            with self.lock:
+                self.hits += 1
+            return stored
+
+        with self.lock:
+            self.misses += 1
+        fig_json, config = build()
+        if self.get_generation() != generation:
+            # Built while an update ran: it may mix old and new data
+            return fig_json, config
+        self._remember(key, (fig_json, config))
+        self._store(key, fig_json, config)
+        return fig_json, config
+
+    def clear(self):
+        """Removes every cached figure, including persisted ones."""
+        with self.lock:
+            self.entries.clear()
+        if self.db_path:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute('DELETE FROM figure_cache')
+            conn.commit()
+            conn.close()
+
+    def get_stats(self):
+        """
+        Returns the cache's size and hit counts.
+
+        Returns:
+            dict: "entries", "hits" and "misses".
+        """
+        with self.lock:
+            return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses}
+
+    def _remember(self, key, value):
+        with self.lock:
+            # Figures from older generations are never read again
+            for stale_key in [k for k in self.entries if k[:3] == key[:3] and k[3] != key[3]]:
+                del self.entries[stale_key]
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def _load(self, key):
+        if not self.db_path:
+            return None
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute('''
+            SELECT fig_json, config
+            FROM figure_cache
+            WHERE figure = ? AND entity_id = ? AND season = ? AND generation = ?
+        ''', key).fetchone()
+        conn.close()
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def _store(self, key, fig_json, config):
+        if not self.db_path:
+            return
+        conn = sqlite3.connect(self.db_path)
+        # One row per figure: a new generation replaces the old one
+        conn.execute('''
+            INSERT OR REPLACE INTO figure_cache (figure, entity_id, season, generation, fig_json, config)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', key + (fig_json, json.dumps(config)))
+        conn.commit()
+        conn.close()
+
+    def _create_table(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''
+        CREATE TABLE IF NOT EXISTS figure_cache (
+            figure TEXT NOT NULL,
+            entity_id TEXT NOT NULL,
+            season INTEGER NOT NULL,
+            generation INTEGER NOT NULL,
+            fig_json TEXT,
+            config TEXT,
+            PRIMARY KEY (figure, entity_id, season)
+        )
+        ''')
+        conn.commit()
+        conn.close()
+
+FIGURE_CACHE = FigureCache(db_path=os.environ.get('FIGURE_CACHE_DB'))
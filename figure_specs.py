@@ -0,0 +1,107 @@
+'''
+Plotly figures as plain dicts.
+
+plotly.graph_objects validates every property as a figure is built and again
+as it is serialised, which costs more than the rest of a chart's work, and
+importing it adds to startup. The charts here only use a handful of trace and
+layout properties, so they are written as the JSON Plotly.js receives:
+
+    fig = figure(
+        data=[trace('pie', values=[30, 21], hole=0.6)],
+        layout={'showlegend': False, 'height': 250}
+    )
+    fig_json = to_json(fig)
+
+Specs are not validated. Properties are written in their nested form
+(`marker={'color': ...}`, not `marker_color=...`) and titles as
+`{'text': ...}`, the form Plotly itself serialises to.
+
+Like `go.Figure`, each figure embeds a layout template. The templates are read
+from the JSON files shipped in the plotly package, so the output matches what
+Plotly produced without importing it.
+'''
+from functools import lru_cache
+import importlib.util
+import json
+import math
+import os
+
+DEFAULT_TEMPLATE = 'plotly'
+
+def figure(data, layout, template=DEFAULT_TEMPLATE):
+    """
+    Builds a figure spec.
+
+    Args:
+        data (list[dict]): Traces, from `trace()`.
+        layout (dict): Layout properties.
+        template (str, optional): Name of the Plotly template to embed. Defaults to "plotly".
+
+    Returns:
+        dict: The figure, with "data" and "layout".
+
+    Example:
+        >>> fig = figure([trace('bar', x=[1, 2], y=['A', 'B'], orientation='h')], {'height': 180})
+        >>> fig['data']
+        [{'x': [1, 2], 'y': ['A', 'B'], 'orientation': 'h', 'type': 'bar'}]
+    """
+    return {'data': data, 'layout': {'template': get_template(template), **layout}}
+
+def trace(trace_type, **props):
+    """
+    Builds a trace spec. Properties set to None are left out, as Plotly does.
+
+    Args:
+        trace_type (str): Plotly trace type, e.g. "pie", "bar" or "scatter".
+        **props: Trace properties.
+
+    Returns:
+        dict: The trace.
+    """
+    spec = {key: value for key, value in props.items() if value is not None}
+    spec['type'] = trace_type
+    return spec
+
+def to_json(fig):
+    """
+    Serialises a figure spec.
+
+    NaN and infinite values in the traces become null, as in Plotly's encoder.
+
+    Args:
+        fig (dict): Figure from `figure()`.
+
+    Returns:
+        str: The figure JSON.
+    """
+    fig = {**fig, 'data': [_replace_non_finite(spec) for spec in fig['data']]}
+    return json.dumps(fig, separators=(',', ':'))
+
+@lru_cache(maxsize=None)
+def get_template(name):
+    """
+    Loads a Plotly template from the plotly package's data files.
+
+    The returned dict is shared by every figure: do not modify it.
+
+    Args:
+        name (str): Template name, e.g. "plotly" or "plotly_white".
+
+    Returns:
+        dict: The template, with "data" and "layout".
+    """
+    spec = importlib.util.find_spec('plotly')
+    if spec is None:
+        raise ImportError('plotly is required for its figure templates; run pip install -r requirements.txt')
+    path = os.path.join(spec.submodule_search_locations[0], 'package_data', 'templates', f'{name}.json')
+    with open(path) as file:
+        return json.load(file)
+
+def _replace_non_finite(value):
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _replace_non_finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_replace_non_finite(item) for item in value]
+    return value
@@ -1,12 +1,14 @@
-from flask import Flask, render_template, request, redirect, url_for, abort, session, make_response
+from flask import Flask, render_template, request, redirect, url_for, abort, session, make_response, jsonify
 from data import (db_games_xgoals, db_games, db_goalkeeper_goals_added,db_goalkeeper_xgoals,
                 db_player_goals_added, db_player_info, db_player_xgoals, db_player_xpass,
                 db_team_goals_added, db_team_info, db_team_xgoals, db_team_xpass, db_game_flow,
                 db_stadium_info, db_team_strength, db_team_xgoals_boundaries, db_team_xpass_boundaries,
-                db_team_goals_added_boundaries, db_game_shots, db_game_goals, sim, data_util)
+                db_team_goals_added_boundaries, db_game_shots, db_game_goals, db_game_team_summary, sim_cache, sim_jobs, sim_sweep, sim_context, season_projection, shot_store, data_util)
 from plots import (plot_deviation_from_average_chart, plot_team_strength_donut, get_donut_plot_for_team_results, get_donut_plot_for_goals,
                 get_donut_plot_for_pass_completion, plot_bar_chart, generate_shot_marker_plot)
 from momentum_plot import generate_momentum_plot
+from page_cache import PAGE_CACHE, cached_page, conditional
+from figure_cache import FIGURE_CACHE
 from datetime import datetime
 from collections import defaultdict
 from blog_loader import load_blog_posts, get_post_by_slug
@@ -15,6 +17,8 @@ import random
 import os
 from dotenv import load_dotenv
 from pathlib import Path
+import functools
+import math
 
 env_path = Path(__file__).resolve().parent / '.env'
 load_dotenv(dotenv_path=env_path)
@@ -24,9 +28,10 @@ app.config["DEBUG"] = True
 app.secret_key = os.environ.get('KEY')
 
 SEASONS = data_util.ALL_SEASONS
+FIRST_SEASON = min(SEASONS)
 
 def nocache(view):
-    """Decorator to set headers that disable caching."""
+    """Decorator to set headers that disable caching, for responses that change while a simulation job runs."""
     def no_cache(*args, **kwargs):
         response = make_response(view(*args, **kwargs))
         response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate, max-age=0"
@@ -37,46 +42,60 @@ def nocache(view):
     no_cache.__name__ = view.__name__
     return no_cache
 
+def season_page(view):
+    """
+    Decorator for views routed both as `/<int:season>/...` and, with
+    `defaults={'season': None}`, without the season.
+
+    A page's content then depends only on its URL. A GET without a season is
+    redirected to the selected season's URL (the session only holds that
+    default); other methods fall back to it, so older form posts keep working.
+    Seasons outside FIRST_SEASON to the current year are a 404.
+    """
+    @functools.wraps(view)
+    def season_view(season=None, **kwargs):
+        if season is None:
+            season = get_selected_season()
+            if request.method == 'GET':
+                # Path arguments and the season win over query arguments of the same name
+                return redirect(url_for(request.endpoint, **{**request.args.to_dict(), **kwargs, 'season': season}))
+        elif not FIRST_SEASON <= season <= datetime.now().year:
+            abort(404)
+        return view(season=season, **kwargs)
+    return season_view
+
 '''
 Renders the index template.
 '''
-@app.route('/', methods=['GET', 'POST'])
-@nocache
-def index():
+@app.route('/', methods=['GET', 'POST'], defaults={'season': None})
+@app.route('/<int:season>/')
+@season_page
+@conditional
+@cached_page
+def index(season):
     if request.method == 'POST':
         new_season = request.form.get('season_year')
         if new_season:
             session['season'] = int(new_season)
-            return redirect(url_for('index'))
-    selected_season = get_selected_season()
-    teams_data = db_team_xgoals.get_top_team_xgoals_stat(selected_season, 'points')
-    top_5_goalscorers = db_player_xgoals.get_top_player_xgoals_stat(selected_season, 'goals', 5)
-    top_5_assists = db_player_xgoals.get_top_player_xgoals_stat(selected_season, 'primary_assists', 5)
-    shots_on_target = db_player_xgoals.get_player_xgoals_minimum_shots(selected_season, 'shots_on_target_perc', 5, 10)
-    total_shots = db_player_xgoals.get_top_player_xgoals_stat(selected_season, 'shots', 5)
-    minutes_played_df = db_player_xgoals.get_defender_minutes_played(selected_season, 'minutes_played', 5)
-    minutes_played_non_df = db_player_xgoals.get_minutes_played_non_df(selected_season, 'minutes_played', 5)
+            return redirect(url_for('index', season=int(new_season)))
+    teams_data = db_team_xgoals.get_top_team_xgoals_stat(season, 'points')
     return render_template('index.html',
                            teams_data = teams_data,
-                           top_scorers = top_5_goalscorers,
-                           top_assists = top_5_assists,
-                           shots_on_target = shots_on_target,
-                           minutes_played_df = minutes_played_df,
-                           minutes_played_non_df = minutes_played_non_df,
-                           total_shots = total_shots,
-                           season = selected_season,
+                           season = season,
                            seasons = SEASONS)
 
-@app.route('/league')
-@nocache
-def league():
-    selected_season = get_selected_season()
-    top_5_goalscorers = db_player_xgoals.get_top_player_xgoals_stat(selected_season, 'goals', 5)
-    top_5_assists = db_player_xgoals.get_top_player_xgoals_stat(selected_season, 'primary_assists', 5)
-    shots_on_target = db_player_xgoals.get_player_xgoals_minimum_shots(selected_season, 'shots_on_target_perc', 5, 10)
-    total_shots = db_player_xgoals.get_top_player_xgoals_stat(selected_season, 'shots', 5)
-    minutes_played_df = db_player_xgoals.get_defender_minutes_played(selected_season, 'minutes_played', 5)
-    minutes_played_non_df = db_player_xgoals.get_minutes_played_non_df(selected_season, 'minutes_played', 5)
+@app.route('/league', defaults={'season': None})
+@app.route('/<int:season>/league')
+@season_page
+@conditional
+@cached_page
+def league(season):
+    top_5_goalscorers = db_player_xgoals.get_top_player_xgoals_stat(season, 'goals', 5)
+    top_5_assists = db_player_xgoals.get_top_player_xgoals_stat(season, 'primary_assists', 5)
+    shots_on_target = db_player_xgoals.get_player_xgoals_minimum_shots(season, 'shots_on_target_perc', 5, 10)
+    total_shots = db_player_xgoals.get_top_player_xgoals_stat(season, 'shots', 5)
+    minutes_played_df = db_player_xgoals.get_defender_minutes_played(season, 'minutes_played', 5)
+    minutes_played_non_df = db_player_xgoals.get_minutes_played_non_df(season, 'minutes_played', 5)
     return render_template('league.html',
                             top_scorers = top_5_goalscorers,
                             top_assists = top_5_assists,
@@ -84,46 +103,51 @@ def league():
                             minutes_played_df = minutes_played_df,
                             minutes_played_non_df = minutes_played_non_df,
                             total_shots = total_shots,
-                            season = selected_season,
+                            season = season,
                             seasons = SEASONS)
 
-@app.route('/teams')
-@nocache
-def teams():
-    selected_season = get_selected_season()
-    team_data = db_team_xgoals.get_top_team_xgoals_stat(selected_season, 'team_strength')
-    team_strength_history = db_team_xgoals.get_team_strength_by_season(selected_season)
+@app.route('/teams', defaults={'season': None})
+@app.route('/<int:season>/teams')
+@season_page
+@conditional
+@cached_page
+def teams(season):
+    team_data = db_team_xgoals.get_top_team_xgoals_stat(season, 'team_strength')
+    team_strength_history = db_team_xgoals.get_team_strength_by_season(season)
     return render_template('teams.html',
                            teams = team_data,
                            team_strength_history = team_strength_history,
-                           season = selected_season,
+                           season = season,
                            seasons = SEASONS)
 
-@app.route('/team/<team_id>')
-@nocache
-def team(team_id):
-    selected_season = get_selected_season()
+@app.route('/team/<team_id>', defaults={'season': None})
+@app.route('/<int:season>/team/<team_id>')
+@season_page
+@conditional
+@cached_page
+def team(season, team_id):
 
-    team_xgoals_data = db_team_xgoals.get_team_xgoals_by_season(team_id, selected_season)
-    team_xpass_data = db_team_xpass.get_team_xpass_by_season(team_id, selected_season)
-    team_goals_added_data = db_team_goals_added.get_team_goals_added_by_season(team_id, selected_season)
-    team_strength_data = db_team_strength.get_team_strength(team_id, selected_season)
-    team_xgoal_boundary_data = db_team_xgoals_boundaries.get_team_xgoal_boundaries_by_season(selected_season)
-    team_xpass_boundary_data = db_team_xpass_boundaries.get_team_xpass_boundaries_by_season(selected_season)
-    team_goals_added_boundaries = db_team_goals_added_boundaries.get_team_goals_add_boundaries_by_season(selected_season)
+    team_xgoals_data = db_team_xgoals.get_team_xgoals_by_season(team_id, season)
+    team_xpass_data = db_team_xpass.get_team_xpass_by_season(team_id, season)
+    team_goals_added_data = db_team_goals_added.get_team_goals_added_by_season(team_id, season)
+    team_xgoal_boundary_data = db_team_xgoals_boundaries.get_team_xgoal_boundaries_by_season(season)
+    team_xpass_boundary_data = db_team_xpass_boundaries.get_team_xpass_boundaries_by_season(season)
+    team_goals_added_boundaries = db_team_goals_added_boundaries.get_team_goals_add_boundaries_by_season(season)
 
-    team_goalkeepers = db_goalkeeper_xgoals.get_goalkeepers_for_team(team_id, selected_season, limit=3)
-    team_players = db_player_xgoals.get_all_player_xgoal_by_team(team_id, selected_season)
+    team_goalkeepers = db_goalkeeper_xgoals.get_goalkeepers_for_team(team_id, season, limit=3)
+    team_players = db_player_xgoals.get_all_player_xgoal_by_team(team_id, season)
 
     team_strength = team_xgoals_data['team_strength']
-    strength_fig_json, strength_config = plot_team_strength_donut(team_strength)
+    strength_fig_json, strength_config = FIGURE_CACHE.get_or_build(
+        'team_strength_donut', team_id, season, lambda: plot_team_strength_donut(team_strength)
+    )
 
-    team_record = db_games.get_team_record_by_season(team_id, selected_season)
-    game_results = db_games.get_team_game_results(team_id, selected_season)
+    team_record = db_games.get_team_record_by_season(team_id, season)
+    game_results = db_games.get_team_game_results(team_id, season)
     five_recent_games = game_results[:5][::-1]
 
     stadium = db_stadium_info.get_stadium_by_id(
-        db_games.get_most_recent_home_stadium_id(team_id, selected_season)
+        db_games.get_most_recent_home_stadium_id(team_id, season)
     )
 
     strength_stats_to_plot = [
@@ -135,18 +159,29 @@ def team(team_id):
         "goalfor_xgoalfor_diff",
         "psxg_xg_diff"
     ]
-    strength_bar_json, strength_bar_config = plot_bar_chart(strength_stats_to_plot, team_strength_data)
+    strength_bar_json, strength_bar_config = FIGURE_CACHE.get_or_build(
+        'team_strength_bar', team_id, season,
+        lambda: plot_bar_chart(strength_stats_to_plot, db_team_strength.get_team_strength(team_id, season))
+    )
 
-    results_fig_json, results_config = get_donut_plot_for_team_results(
-        team_record['wins'], team_record['losses'], team_record['draws'], team_xgoals_data['points']
+    results_fig_json, results_config = FIGURE_CACHE.get_or_build(
+        'team_results_donut', team_id, season, lambda: get_donut_plot_for_team_results(
+            team_record['wins'], team_record['losses'], team_record['draws'], team_xgoals_data['points']
+        )
+    )
+    goals_fig_json, goals_config = FIGURE_CACHE.get_or_build(
+        'team_goals_donut', team_id, season,
+        lambda: get_donut_plot_for_goals(team_xgoals_data['goals_for'], team_xgoals_data['goals_against'])
+    )
+    pass_fig_json, pass_config = FIGURE_CACHE.get_or_build(
+        'team_pass_donut', team_id, season,
+        lambda: get_donut_plot_for_pass_completion(team_xpass_data['pass_completion_percentage_for'])
     )
-    goals_fig_json, goals_config = get_donut_plot_for_goals(team_xgoals_data['goals_for'], team_xgoals_data['goals_against'])
-    pass_fig_json, pass_config = get_donut_plot_for_pass_completion(team_xpass_data['pass_completion_percentage_for'])
 
     return render_template(
         'team.html',
         team_xgoals_data=team_xgoals_data,
-        season=selected_season,
+        season=season,
         seasons=SEASONS,
         strength_fig_json=strength_fig_json,
         strength_config=strength_config,
@@ -173,15 +208,16 @@ def team(team_id):
 
 
 
-@app.route('/team_comparison', methods=['GET', 'POST'])
-@nocache
-def team_comparison():
-    selected_season = get_selected_season()
-    team_data = db_team_xgoals.get_top_team_xgoals_stat(selected_season, 'points')
+@app.route('/team_comparison', methods=['GET', 'POST'], defaults={'season': None})
+@app.route('/<int:season>/team_comparison', methods=['GET', 'POST'])
+@season_page
+@conditional
+def team_comparison(season):
+    team_data = db_team_xgoals.get_top_team_xgoals_stat(season, 'points')
     team1_id = request.form.get('team1')
     team2_id = request.form.get('team2')
-    team1_data = db_team_xgoals.get_team_xgoals_by_season(team1_id, selected_season)
-    team2_data = db_team_xgoals.get_team_xgoals_by_season(team2_id, selected_season)
+    team1_data = db_team_xgoals.get_team_xgoals_by_season(team1_id, season)
+    team2_data = db_team_xgoals.get_team_xgoals_by_season(team2_id, season)
     ordered_stats = [
         {'name': 'count_games', 'label': 'Matches Played', 'type': 'neutral'},
         {'name': 'team_strength', 'label': 'Team Strength', 'type': 'positive'},
@@ -206,26 +242,27 @@ def team_comparison():
                             team2_data = team2_data,
                             ordered_stats = ordered_stats,
                             teams = team_data,
-                            season = selected_season,
+                            season = season,
                             seasons = SEASONS)
 
-@app.route('/games')
-@nocache
-def games():
-    selected_season = get_selected_season()
-    games_data = db_games.get_all_games_by_season(selected_season)
-    games_xgoals_data = db_games_xgoals.get_all_games_xgoals_by_season(selected_season)
+@app.route('/games', defaults={'season': None})
+@app.route('/<int:season>/games')
+@season_page
+@conditional
+@cached_page
+def games(season):
+    games_data = db_games.get_all_games_by_season(season)
+    games_xgoals_data = db_games_xgoals.get_all_games_xgoals_by_season(season)
     return render_template('games.html',
                            games_data = games_data,
                            games_xgoals_data = games_xgoals_data,
-                           season = selected_season,
+                           season = season,
                            seasons = SEASONS)
 
 @app.route('/game/<game_id>')
-@nocache
+@conditional
+@cached_page
 def game(game_id):
-    selected_season = get_selected_season()
-
     # GAME DATA
     game_data = db_games.get_game_by_id(game_id)
     if not game_data:
@@ -247,20 +284,30 @@ def game(game_id):
     # SHOT DATA
     all_shots_data = db_game_shots.get_shots_by_game_id(game_id)
     all_shot_data_with_markers = _insert_event_markers(all_shots_data, home_team_id, away_team_id)
-    home_shots_data = [shot for shot in all_shots_data if shot['team_id'] == home_team_id]
-    away_shots_data = [shot for shot in all_shots_data if shot['team_id'] == away_team_id]
+    game_season = game_data['season']
 
-    home_shot_map_json, home_shot_map_config = generate_shot_marker_plot(game_id, game_data, player_info, home_shots_data, home_team_abbr)
-    away_shot_map_json, away_shot_map_config = generate_shot_marker_plot(game_id, game_data, player_info, away_shots_data, away_team_abbr)
+    home_shot_map_json, home_shot_map_config = FIGURE_CACHE.get_or_build(
+        'home_shot_map', game_id, game_season, lambda: generate_shot_marker_plot(
+            game_id, game_data, player_info, shot_store.get_shot_store(game_season), home_team_id, home_team_abbr
+        )
+    )
+    away_shot_map_json, away_shot_map_config = FIGURE_CACHE.get_or_build(
+        'away_shot_map', game_id, game_season, lambda: generate_shot_marker_plot(
+            game_id, game_data, player_info, shot_store.get_shot_store(game_season), away_team_id, away_team_abbr
+        )
+    )
 
     goal_data = db_game_goals.get_goals_by_game_id(game_id)
-    team_psxgs = db_game_shots.get_total_psxg_by_game_id(game_id)
-    team_total_shots = db_game_shots.get_total_shots_by_game_id(game_id)
-    team_shots_on_target = db_game_shots.get_total_shots_on_target_by_game_id(game_id)
+    team_summary = db_game_team_summary.get_game_team_summary(game_id)
+    team_psxgs = {team_id: row['psxg'] for team_id, row in team_summary.items()}
+    team_total_shots = {team_id: row['shots'] for team_id, row in team_summary.items()}
+    team_shots_on_target = {team_id: row['shots_on_target'] for team_id, row in team_summary.items()}
 
     # GAME FLOW DATA
     game_flow_data = db_game_flow.get_game_flow_by_game_id(game_id)
-    game_flow_json, game_flow_config = generate_momentum_plot(game_id)
+    game_flow_json, game_flow_config = FIGURE_CACHE.get_or_build(
+        'momentum', game_id, game_season, lambda: generate_momentum_plot(game_id)
+    )
 
     # XGOALS DATA
     game_xgoals_data = db_games_xgoals.get_game_xgoals_by_id(game_id)
@@ -271,7 +318,7 @@ def game(game_id):
                             game_flow_data=game_flow_data,
                             game_flow_json=game_flow_json, 
                             game_flow_config=game_flow_config,
-                            season=selected_season,
+                            season=game_season,
                             seasons=SEASONS,
                             shot_data=all_shot_data_with_markers,
                             player_info_data=player_info_data,
@@ -285,23 +332,26 @@ def game(game_id):
                             away_shot_map_json=away_shot_map_json,
                             away_shot_map_config=away_shot_map_config)
 
-@app.route('/players')
-@nocache
-def players():
-    selected_season = get_selected_season()
-    players_xgoals_data = db_player_xgoals.get_top_player_xgoals_stat(selected_season)
-    players_xpass_data = db_player_xpass.get_all_player_xpass(selected_season)
+@app.route('/players', defaults={'season': None})
+@app.route('/<int:season>/players')
+@season_page
+@conditional
+@cached_page
+def players(season):
+    players_xgoals_data = db_player_xgoals.get_top_player_xgoals_stat(season)
+    players_xpass_data = db_player_xpass.get_all_player_xpass(season)
 
     combined_data = zip(players_xgoals_data, players_xpass_data)
     return render_template('players.html',
                            player_data = combined_data,
-                           season = selected_season,
+                           season = season,
                            seasons = SEASONS)
 
-@app.route('/player', methods=['GET', 'POST'])
-@nocache
-def player():
-    selected_season = get_selected_season()
+@app.route('/player', methods=['GET', 'POST'], defaults={'season': None})
+@app.route('/<int:season>/player', methods=['GET', 'POST'])
+@season_page
+@conditional
+def player(season):
     if request.method == 'POST':
         x_goals_stats_to_plot = [
         'shots', 'shots_on_target', 'shots_on_target_perc', 'xgoals_xassists_per_90',
@@ -324,9 +374,9 @@ def player():
         player_id = request.form.get('player_id')
         obj_id = request.form.get('obj_id')
         
-        player_xgoals_data = db_player_xgoals.get_player_xgoal_data(player_id, selected_season)
-        player_xpass_data = db_player_xpass.get_player_xpass(player_id, selected_season)
-        player_goals_added_data = db_player_goals_added.get_player_goals_added_by_season(player_id, selected_season)
+        player_xgoals_data = db_player_xgoals.get_player_xgoal_data(player_id, season)
+        player_xpass_data = db_player_xpass.get_player_xpass(player_id, season)
+        player_goals_added_data = db_player_goals_added.get_player_goals_added_by_season(player_id, season)
         player_xgoals_all_seasons_data = db_player_xgoals.get_player_xgoal_data_all_seasons(player_id)
 
         xgoals_fig_json, xgoals_config = plot_deviation_from_average_chart(x_goals_stats_to_plot, player_xgoals_data)
@@ -345,30 +395,32 @@ def player():
                                xpass_config = xpass_config,
                                defense_fig_json = defense_fig_json,
                                defense_config = defense_config,
-                               season = selected_season,
+                               season = season,
                                seasons = SEASONS,
                                player_season_data = player_xgoals_all_seasons_data)
-    return redirect(url_for('players'))
-
-@app.route('/goalkeepers', methods=['GET', 'POST'])
-@nocache
-def goalkeepers():
-    selected_season = get_selected_season()
-    goalkeeper_data = db_goalkeeper_xgoals.get_all_goalkeepers_xgoals_by_season(selected_season)
+    return redirect(url_for('players', season=season))
+
+@app.route('/goalkeepers', methods=['GET', 'POST'], defaults={'season': None})
+@app.route('/<int:season>/goalkeepers', methods=['GET', 'POST'])
+@season_page
+@conditional
+def goalkeepers(season):
+    goalkeeper_data = db_goalkeeper_xgoals.get_all_goalkeepers_xgoals_by_season(season)
     return render_template('goalkeepers.html',
                            keeper_data = goalkeeper_data,
-                           season = selected_season,
+                           season = season,
                            seasons = SEASONS)
 
-@app.route('/goalkeeper', methods=['GET', 'POST'])
-@nocache
-def goalkeeper():
-    selected_season = get_selected_season()
+@app.route('/goalkeeper', methods=['GET', 'POST'], defaults={'season': None})
+@app.route('/<int:season>/goalkeeper', methods=['GET', 'POST'])
+@season_page
+@conditional
+def goalkeeper(season):
     if request.method == 'POST':
         player_id = request.form.get('player_id')
         obj_id = request.form.get('obj_id')
-        keeper_xgoal_data = db_goalkeeper_xgoals.get_goalkeeper_xgoals_by_season(player_id=player_id, season=selected_season)
-        keeper_goals_added_data = db_goalkeeper_goals_added.get_goalkeeper_goals_added_by_season(player_id=player_id, season=selected_season)
+        keeper_xgoal_data = db_goalkeeper_xgoals.get_goalkeeper_xgoals_by_season(player_id=player_id, season=season)
+        keeper_goals_added_data = db_goalkeeper_goals_added.get_goalkeeper_goals_added_by_season(player_id=player_id, season=season)
         for key in keeper_xgoal_data.keys():
             print(f"{key}: {keeper_xgoal_data[key]}")
         
@@ -415,72 +467,202 @@ def goalkeeper():
                                 keeper_config_xgoals = keeper_config_xgoals,
                                 keeper_fig_json_goals_added = keeper_fig_json_goals_added,
                                 keeper_config_goals_added = keeper_config_goals_added,
-                                season = selected_season,
+                                season = season,
                                 seasons = SEASONS)
     
-    goalkeeper_data = db_goalkeeper_xgoals.get_all_goalkeepers_xgoals_by_season(selected_season)
+    goalkeeper_data = db_goalkeeper_xgoals.get_all_goalkeepers_xgoals_by_season(season)
     return render_template('goalkeepers.html',
                            keeper_data = goalkeeper_data,
-                           season = selected_season,
+                           season = season,
                            seasons = SEASONS)
 
-@app.route('/simulations')
-@nocache
-def simulations():
-    selected_season = get_selected_season()
-    team_data = db_team_xgoals.get_top_team_xgoals_stat(selected_season, 'points')
+@app.route('/simulations', defaults={'season': None})
+@app.route('/<int:season>/simulations')
+@season_page
+@conditional
+def simulations(season):
+    team_data = db_team_xgoals.get_top_team_xgoals_stat(season, 'points')
     teams_dict = [dict(team) for team in team_data]
 
-    players_data = db_player_xgoals.get_top_player_xgoals_stat(season=selected_season)
+    players_data = db_player_xgoals.get_top_player_xgoals_stat(season=season)
     players_by_team = defaultdict(list)
     for player in players_data:
         players_by_team[player['team_id']].append(dict(player))  # Convert sqlite3.Row → dict
 
     return render_template('simulations.html',
-                           season=selected_season,
+                           season=season,
                            seasons=SEASONS,
                            teams=team_data,
                            teams_dict = teams_dict,
                            players_by_team=dict(players_by_team))
 
 
-@app.route('/simulation_results', methods=['GET', 'POST'])
-@nocache
-def simulation_results():
-    selected_season = get_selected_season()
+@app.route('/simulation_results', methods=['GET', 'POST'], defaults={'season': None})
+@app.route('/<int:season>/simulation_results', methods=['GET', 'POST'])
+@season_page
+def simulation_results(season):
     home_team_id = request.form.get("home_team")
     away_team_id = request.form.get("away_team")           
-    n_simulations = int(request.form.get("num_sims", 0))
-    home_advantage = float(request.form.get("home_advantage", 1.05))
-    away_advantage = float(request.form.get("away_advantage", 0.95))
     excluded_player_ids = set(request.form.getlist("exclude_players"))
 
-    simulator = sim.MatchSimulator(home_team_id=home_team_id,
-                                   away_team_id=away_team_id,
-                                   season=selected_season,
-                                   home_advantage=home_advantage,
-                                   away_advantage=away_advantage,
-                                   excluded_player_ids=excluded_player_ids)
-    simulator.run_simulations(n_simulations)
-
-    summary = simulator.get_summary()
-    scorelines = simulator.get_scoreline_distribution()
-    home_scorers = simulator.get_top_scorers("home", limit = 5)
-    away_scorers = simulator.get_top_scorers("away", limit = 5)
+    # mode=exact computes the model's probabilities directly instead of simulating
+    if request.form.get("mode") == "exact":
+        home_advantage, away_advantage = _get_advantages()
+        results = sim_cache.get_exact_results(home_team_id=home_team_id,
+                                              away_team_id=away_team_id,
+                                              season=season,
+                                              home_advantage=home_advantage,
+                                              away_advantage=away_advantage,
+                                              excluded_player_ids=excluded_player_ids)
+    else:
+        n_simulations, home_advantage, away_advantage, tolerance = _get_simulation_form(sim_cache.MAX_SIMULATIONS)
+        results = sim_cache.run_cached_simulation(home_team_id=home_team_id,
+                                                  away_team_id=away_team_id,
+                                                  season=season,
+                                                  home_advantage=home_advantage,
+                                                  away_advantage=away_advantage,
+                                                  excluded_player_ids=excluded_player_ids,
+                                                  n_simulations=n_simulations,
+                                                  tolerance=tolerance)
 
     return render_template('simulation_results.html',
-                            summary=summary,
-                            scorelines=scorelines,
-                            home_scorers=home_scorers,
-                            away_scorers=away_scorers,
-                            n_simulations=n_simulations,
-                            season=selected_season,
+                            summary=results["summary"],
+                            scorelines=results["scorelines"],
+                            home_scorers=results["home_scorers"],
+                            away_scorers=results["away_scorers"],
+                            n_simulations=results["summary"].get("n_simulations"),
+                            season=season,
                             seasons = SEASONS)
 
-@app.route("/blog")
+@app.route('/simulation_jobs', methods=['POST'], defaults={'season': None})
+@app.route('/<int:season>/simulation_jobs', methods=['POST'])
+@season_page
+def submit_simulation_job(season):
+    n_simulations, home_advantage, away_advantage, tolerance = _get_simulation_form(sim_jobs.MAX_SIMULATIONS)
+    job_id = sim_jobs.SIMULATION_JOBS.submit(home_team_id=request.form.get("home_team"),
+                                             away_team_id=request.form.get("away_team"),
+                                             season=season,
+                                             home_advantage=home_advantage,
+                                             away_advantage=away_advantage,
+                                             excluded_player_ids=request.form.getlist("exclude_players"),
+                                             n_simulations=n_simulations,
+                                             tolerance=tolerance)
+    if job_id is None:
+        # Too many jobs queued or running; the client should retry later
+        abort(503)
+    return jsonify({
+        "job_id": job_id,
+        "status_url": url_for('simulation_job_status', job_id=job_id),
+        "results_url": url_for('simulation_job_results', job_id=job_id)
+    }), 202
+
+@app.route('/simulation_jobs/<job_id>')
 @nocache
-def blog():
-    selected_season = get_selected_season()
+def simulation_job_status(job_id):
+    status = sim_jobs.SIMULATION_JOBS.get_status(job_id)
+    if status is None:
+        abort(404)
+    return jsonify(status)
+
+@app.route('/simulation_jobs/<job_id>/results')
+@nocache
+def simulation_job_results(job_id):
+    job = sim_jobs.SIMULATION_JOBS.get_job(job_id)
+    if job is None:
+        abort(404)
+    if job.status != "done":
+        return jsonify(job.get_status()), 202
+
+    return render_template('simulation_results.html',
+                            summary=job.result["summary"],
+                            scorelines=job.result["scorelines"],
+                            home_scorers=job.result["home_scorers"],
+                            away_scorers=job.result["away_scorers"],
+                            n_simulations=job.completed,
+                            season=job.params["season"],
+                            seasons = SEASONS)
+
+@app.route('/simulation_sweep', methods=['POST'], defaults={'season': None})
+@app.route('/<int:season>/simulation_sweep', methods=['POST'])
+@season_page
+def simulation_sweep(season):
+    home_team_id = request.form.get("home_team")
+    away_team_id = request.form.get("away_team")
+    excluded_player_ids = set(request.form.getlist("exclude_players"))
+    n_simulations, home_advantage, away_advantage, _ = _get_simulation_form(sim_sweep.MAX_SWEEP_SIMULATIONS,
+                                                                           sim_sweep.DEFAULT_SWEEP_SIMULATIONS)
+    try:
+        max_shooters = int(request.form["max_shooters"]) if request.form.get("max_shooters") else None
+        seed = int(request.form["seed"]) if request.form.get("seed") else None
+    except ValueError:
+        abort(400)
+    if (max_shooters is not None and max_shooters <= 0) or (seed is not None and seed < 0):
+        abort(400)
+    context = sim_context.get_simulation_context(season)
+
+    # Each "scenario" value is a comma-separated set of players; without any, sweep every shooter in turn
+    scenarios = [
+        [player_id for player_id in scenario.split(",") if player_id]
+        for scenario in request.form.getlist("scenario")
+    ][:sim_sweep.MAX_SCENARIOS]
+    if not scenarios:
+        # Split the scenario limit between the two teams
+        limit = min(max_shooters or sim_sweep.MAX_SCENARIOS, sim_sweep.MAX_SCENARIOS // 2)
+        scenarios = sim_sweep.get_shooter_scenarios(context, [home_team_id, away_team_id],
+                                                    excluded_player_ids, limit=limit)
+
+    sweep = sim_sweep.ExclusionSweep(home_team_id=home_team_id,
+                                     away_team_id=away_team_id,
+                                     season=season,
+                                     home_advantage=home_advantage,
+                                     away_advantage=away_advantage,
+                                     scenarios=scenarios,
+                                     excluded_player_ids=excluded_player_ids,
+                                     context=context)
+    sweep.run_sweep(n_simulations, seed=seed)
+    return jsonify(sweep.get_results())
+
+@app.route('/season_projection', defaults={'season': None})
+@app.route('/<int:season>/season_projection')
+@season_page
+@conditional
+def season_projection_view(season):
+    try:
+        n_simulations = int(request.args.get("num_sims", season_projection.DEFAULT_PROJECTIONS))
+        home_advantage = float(request.args.get("home_advantage", 1.05))
+        away_advantage = float(request.args.get("away_advantage", 0.95))
+    except ValueError:
+        abort(400)
+    if n_simulations <= 0 or not all(math.isfinite(value) and value > 0 for value in (home_advantage, away_advantage)):
+        abort(400)
+    n_simulations = min(n_simulations, season_projection.MAX_PROJECTIONS)
+
+    def project():
+        projection = season_projection.SeasonProjection(season=season,
+                                                        home_advantage=home_advantage,
+                                                        away_advantage=away_advantage)
+        # Serial: 10k seasons take well under a second. Seeded so a table rebuilt
+        # after eviction is the one the page's ETag was issued for.
+        projection.run_projections(n_simulations, seed=0)
+        return projection.get_table(), len(projection.fixtures)
+
+    # PAGE_CACHE drops the table when the data generation changes
+    table, remaining_games = PAGE_CACHE.get_or_set(
+        ('season_projection', season, home_advantage, away_advantage, n_simulations), project
+    )
+
+    return render_template('season_projection.html',
+                           table=table,
+                           remaining_games=remaining_games,
+                           n_simulations=n_simulations,
+                           season=season,
+                           seasons=SEASONS)
+
+@app.route("/blog", defaults={'season': None})
+@app.route("/<int:season>/blog")
+@season_page
+@conditional
+def blog(season):
     posts = load_blog_posts()
     subheaders = [
         "If it looks smart, it was probably an accident.",
@@ -496,13 +678,14 @@ def blog():
     return render_template("blog.html",
                            posts=posts,
                            subheader=random.choice(subheaders),
-                           season=selected_season,
+                           season=season,
                            seasons = SEASONS)
 
-@app.route("/blog/<slug>")
-@nocache
-def blog_post(slug):
-    selected_season = get_selected_season()
+@app.route("/blog/<slug>", defaults={'season': None})
+@app.route("/<int:season>/blog/<slug>")
+@season_page
+@conditional
+def blog_post(season, slug):
     post = get_post_by_slug(slug)
     if not post:
         abort(404)
@@ -523,10 +706,52 @@ def blog_post(slug):
                            post=post,
                            html_body=html_body,
                            meta=meta,
-                           season=selected_season,
+                           season=season,
                            seasons = SEASONS)
 
 
+def _get_simulation_form(max_simulations, default_simulations=None):
+    """
+    Reads the simulation size, advantages and tolerance posted by the simulations form.
+
+    Aborts with 400 if a value is malformed, non-positive or not finite, so bad
+    input never reaches the simulator. The simulation count is capped at `max_simulations`.
+
+    Args:
+        max_simulations (int): Largest simulation count to run.
+        default_simulations (int, optional): Count used when "num_sims" is missing. Defaults to None (required).
+
+    Returns:
+        tuple: (n_simulations, home_advantage, away_advantage, tolerance), with tolerance None if not given.
+    """
+    home_advantage, away_advantage = _get_advantages()
+    try:
+        n_simulations = int(request.form.get("num_sims", default_simulations))
+        tolerance = float(request.form["tolerance"]) if request.form.get("tolerance") else None
+    except (TypeError, ValueError):
+        abort(400)
+    if n_simulations <= 0 or (tolerance is not None and not (math.isfinite(tolerance) and tolerance > 0)):
+        abort(400)
+    return min(n_simulations, max_simulations), home_advantage, away_advantage, tolerance
+
+def _get_advantages():
+    """
+    Reads the home and away advantages posted by the simulations form.
+
+    Aborts with 400 unless both are finite and positive.
+
+    Returns:
+        tuple: (home_advantage, away_advantage).
+    """
+    try:
+        home_advantage = float(request.form.get("home_advantage", 1.05))
+        away_advantage = float(request.form.get("away_advantage", 0.95))
+    except ValueError:
+        abort(400)
+    if not all(math.isfinite(value) and value > 0 for value in (home_advantage, away_advantage)):
+        abort(400)
+    return home_advantage, away_advantage
+
 def _insert_event_markers(shot_data, home_team_id, away_team_id):
     new_data = []
     halftime_inserted = False
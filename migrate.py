@@ -0,0 +1,30 @@
+'''
+Applies pending schema migrations (data/migrations.py) to nwsl.db, or to the
+database named by NWSL_DB_PATH, without re-ingesting anything from the API.
+
+Run from the repository root:
+    python migrate.py               # apply every pending migration
+    python migrate.py --status      # list applied and pending migrations
+    python migrate.py --target 2    # stop at version 2
+'''
+import argparse
+from data import migrations
+from data.data_util import get_db_path, get_write_connection
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--status', action='store_true', help='show migration status without applying anything')
+    parser.add_argument('--target', type=int, help='version to migrate to (default: latest)')
+    args = parser.parse_args()
+
+    conn = get_write_connection()
+    try:
+        if args.status:
+            print(f'{get_db_path()} is at schema version {migrations.get_schema_version(conn)}.')
+            for migration in migrations.get_migration_status(conn):
+                applied = migration['applied_at'] or 'pending'
+                print(f'{migration["version"]:>4}  {applied:<26} {migration["description"]}')
+        else:
+            migrations.apply_migrations(args.target, conn=conn)
+    finally:
+        conn.close()
@@ -1,7 +1,5 @@
-import plotly.graph_objects as go
 from data import db_game_flow
-import plotly
-import json
+from figure_specs import figure, trace, to_json
 
 def generate_momentum_plot(game_id):
     rows = db_game_flow.get_game_flow_by_game_id(game_id)
@@ -35,41 +33,39 @@ def generate_momentum_plot(game_id):
         if halftime_minute is None and row['period_id'] == 2:
             halftime_minute = minute
 
-    fig = go.Figure()
-
     # Split net values into positive and negative traces
     positive_minutes, positive_values, negative_minutes,  negative_values = _split_positive_negative(minutes, net_values)
 
-    # Add positive (home-dominant) momentum trace
-    fig.add_trace(go.Scatter(
-        x=positive_minutes,
-        y=positive_values,
-        mode='none',
-        fill='tozeroy',
-        line=dict(color='blue'),
-        fillcolor='rgba(0, 100, 255, 0.5)',
-        name='Home Momentum',
-    ))
-
-    # Add negative (away-dominant) momentum trace
-    fig.add_trace(go.Scatter(
-        x=negative_minutes,
-        y=negative_values,
-        mode='none',
-        fill='tozeroy',
-        line=dict(color='red'),
-        fillcolor='rgba(255, 0, 0, 0.5)',
-        name='Away Momentum',
-    ))
-
-    # Add zero baseline
-    fig.add_trace(go.Scatter(
-        x=[min(minutes), max(minutes)],
-        y=[0, 0],
-        mode='lines',
-        line=dict(color='black', dash='dash'),
-        showlegend=False
-    ))
+    traces = [
+        # Positive (home-dominant) momentum
+        trace('scatter',
+            x=positive_minutes,
+            y=positive_values,
+            mode='none',
+            fill='tozeroy',
+            line=dict(color='blue'),
+            fillcolor='rgba(0, 100, 255, 0.5)',
+            name='Home Momentum',
+        ),
+        # Negative (away-dominant) momentum
+        trace('scatter',
+            x=negative_minutes,
+            y=negative_values,
+            mode='none',
+            fill='tozeroy',
+            line=dict(color='red'),
+            fillcolor='rgba(255, 0, 0, 0.5)',
+            name='Away Momentum',
+        ),
+        # Zero baseline
+        trace('scatter',
+            x=[min(minutes), max(minutes)],
+            y=[0, 0],
+            mode='lines',
+            line=dict(color='black', dash='dash'),
+            showlegend=False
+        )
+    ]
 
     # Add halftime line
     if halftime_minute:
@@ -98,30 +94,30 @@ def generate_momentum_plot(game_id):
     ))
     annotations.append(_fulltime_annotation())
 
-    fig.update_layout(
-        title=f"Momentum Chart {home_abbr} vs {away_abbr}",
-        xaxis_title="Minute",
-        yaxis_title="Game Momentum",
-        hovermode="x unified",
-        template="plotly_white",
-        shapes=shapes,
-        images=images,
-        showlegend=False,
-        yaxis=dict(
-            title="Game Momentum",
-            range=[-.75, .75],
-            tickvals=[],
-            ticks='',
-            showticklabels=False,
-            showgrid=False,
-            zeroline=False
-        )
+    fig = figure(
+        data=traces,
+        layout=dict(
+            title=dict(text=f"Momentum Chart {home_abbr} vs {away_abbr}"),
+            xaxis=dict(title=dict(text="Minute")),
+            hovermode="x unified",
+            shapes=shapes,
+            images=images,
+            showlegend=False,
+            yaxis=dict(
+                title=dict(text="Game Momentum"),
+                range=[-.75, .75],
+                tickvals=[],
+                ticks='',
+                showticklabels=False,
+                showgrid=False,
+                zeroline=False
+            ),
+            annotations=annotations
+        ),
+        template="plotly_white"
     )
 
-    for annotation in annotations:
-        fig.add_annotation(**annotation)
-
-    fig_json = json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    fig_json = to_json(fig)
     config = {
         "displayModeBar": False,
         "staticPlot": True
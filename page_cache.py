@@ -0,0 +1,209 @@
+'''
+In-memory cache of rendered pages.
+
+The site's data only changes when setup.py or update.py runs, so a page
+rendered once can be served from memory until then. Entries are tied to the
+data generation counter that each ingestion run bumps
+(data_util.get_data_generation()); when it moves, the whole cache is dropped.
+
+Whole pages are cached with the `cached_page` decorator, keyed by path and
+query string (the season is part of the path).
+
+Browsers get the same pages through HTTP revalidation: the `conditional`
+decorator sends an ETag and Last-Modified with each page and answers a
+matching `If-None-Match` with 304 before rendering.
+'''
+from data.data_util import get_data_generation, get_data_updated_at
+from flask import request, make_response
+from collections import OrderedDict
+from datetime import datetime
+import hashlib
+import json
+import os
+import threading
+
+DEFAULT_MAX_ENTRIES = 512
+
+# Seconds browsers may reuse a page before revalidating it. Past seasons only
+# change when setup.py reloads them; the current season changes with each update.
+ARCHIVE_MAX_AGE = 24 * 60 * 60
+CURRENT_SEASON_MAX_AGE = 60
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+# Sources whose changes alter rendered pages, by directory and file suffix
+BUILD_SOURCES = {'.': '.py', 'data': '.py', 'data/blog': '.md', 'templates': ''}
+
+class PageCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, get_generation=get_data_generation):
+        """
+        A bounded, thread-safe LRU cache that empties itself when the data generation changes.
+
+        Args:
+            max_entries (int, optional): Maximum number of entries kept. Defaults to 512.
+            get_generation (Callable[[], int], optional): Returns the current data generation.
+                Defaults to `data_util.get_data_generation`.
+
+        Example:
+            >>> cache = PageCache(max_entries=64)
+            >>> cache.get_or_set(('standings', 2024), lambda: render_standings(2024))
+            '<table>...</table>'
+        """
+        self.max_entries = max_entries
+        self.get_generation = get_generation
+        self.generation = None
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_set(self, key, build, store_if=None):
+        """
+        Returns the cached value for a key, building and storing it on a miss.
+
+        A value built while an update bumped the generation is returned but not
+        stored, so it cannot outlive the data it was built from.
+
+        Args:
+            key (Hashable): Cache key.
+            build (Callable[[], Any]): Builds the value on a miss.
+            store_if (Callable[[Any], bool], optional): Stores a built value only if this
+                returns True. Defaults to None (always store).
+
+        Returns:
+            Any: The cached or newly built value.
+        """
+        generation = self.get_generation()
+        with self.lock:
+            if generation != self.generation:
+                self.entries.clear()
+                self.generation = generation
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key]
+            self.misses += 1
+
+        value = build()
+        if store_if is not None and not store_if(value):
+            return value
+        with self.lock:
+            if self.generation == generation:
+                self.entries[key] = value
+                self.entries.move_to_end(key)
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        """Removes every entry."""
+        with self.lock:
+            self.entries.clear()
+
+    def get_stats(self):
+        """
+        Returns the cache's size and hit counts.
+
+        Returns:
+            dict: "entries", "hits", "misses" and "generation".
+        """
+        with self.lock:
+            return {'entries': len(self.entries), 'hits': self.hits, 'misses': self.misses,
+                    'generation': self.generation}
+
+PAGE_CACHE = PageCache()
+
+def cached_page(view):
+    """
+    Decorator that serves a view's rendered HTML from `PAGE_CACHE` for GET requests.
+
+    The key is the request path and query string. Only string results are
+    cached; redirects and other responses pass through.
+    """
+    def cached(*args, **kwargs):
+        if request.method != 'GET':
+            return view(*args, **kwargs)
+        key = ('page', request.path, tuple(sorted(request.args.items(multi=True))))
+        return PAGE_CACHE.get_or_set(key, lambda: view(*args, **kwargs),
+                                     store_if=lambda result: isinstance(result, str))
+    # Maintain Flask route metadata
+    cached.__name__ = view.__name__
+    return cached
+
+def conditional(view):
+    """
+    Decorator for pages that depend only on their URL and the data, in place of `nocache`.
+
+    GET responses carry a strong ETag built from the path, query string, data
+    generation and BUILD_VERSION, plus Last-Modified (the last data update, when
+    there has been one) and a public Cache-Control
+    max-age: ARCHIVE_MAX_AGE when the view's `season` argument is a past season,
+    CURRENT_SEASON_MAX_AGE otherwise. A request whose `If-None-Match` still
+    matches gets an empty 304 and the view is not called. `If-Modified-Since`
+    alone never does: Last-Modified only tracks the data, so it would keep
+    serving pages rendered by the previous deploy. Other methods, and responses
+    other than 200, pass through unchanged.
+    """
+    def conditional_view(*args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return view(*args, **kwargs)
+        etag = get_etag(get_data_generation())
+        last_modified = get_data_updated_at()
+
+        if request.if_none_match.contains(etag):
+            response = make_response('', 304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+        response.set_etag(etag)
+        if last_modified is not None:
+            response.last_modified = last_modified
+        season = kwargs.get('season')
+        max_age = ARCHIVE_MAX_AGE if season is not None and season < datetime.now().year else CURRENT_SEASON_MAX_AGE
+        response.headers['Cache-Control'] = f'public, max-age={max_age}'
+        return response
+    # Maintain Flask route metadata
+    conditional_view.__name__ = view.__name__
+    return conditional_view
+
+def get_build_version():
+    """
+    Returns a version string for the deployed code, templates and blog posts, part of every ETag.
+
+    The BUILD_VERSION environment variable is used when set (e.g. a release tag
+    or commit); otherwise it is a hash of the Python files, blog posts and
+    templates in BUILD_SOURCES. Either way every worker, and every restart of the same
+    build, issues the same validators, while a deploy that changes what pages
+    render changes them.
+
+    Returns:
+        str: The version.
+    """
+    if os.environ.get('BUILD_VERSION'):
+        return os.environ['BUILD_VERSION']
+    digest = hashlib.sha256()
+    for source, suffix in BUILD_SOURCES.items():
+        directory = os.path.join(ROOT_DIR, source)
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if os.path.isfile(path) and name.endswith(suffix):
+                digest.update(f'{source}/{name}'.encode())
+                with open(path, 'rb') as file:
+                    digest.update(file.read())
+    return digest.hexdigest()[:16]
+
+BUILD_VERSION = get_build_version()
+
+def get_etag(generation):
+    """
+    Returns the ETag of the current request's page at a data generation.
+
+    Args:
+        generation (int): Data generation from `get_data_generation()`.
+
+    Returns:
+        str: Hex digest, unquoted.
+    """
+    parts = [request.path, sorted(request.args.items(multi=True)), generation, BUILD_VERSION]
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()[:32]
@@ -1,9 +1,7 @@
-import plotly.graph_objects as go
 from data import (db_games, db_team_xgoals, db_game_shots)
 from plot_util import TEAM_STYLE_MAP, _make_logo_image
-import plotly
+from figure_specs import figure, trace, to_json
 import json
-import matplotlib.pyplot as plt
 
 def plot_deviation_from_average_chart(stats_to_plot, player_data):
     """
@@ -52,31 +50,32 @@ def plot_deviation_from_average_chart(stats_to_plot, player_data):
         deltas.append(delta)
         hover_text.append(f"{stat_label}: {val:.2f} (avg {avg:.2f})")
 
-    fig = go.Figure(go.Bar(
-        x=deltas,
-        y=categories,
-        orientation='h',
-        marker_color=['#003049' if d >= 0 else '#c1121f' for d in deltas],
-        textposition='auto',
-        hovertext=hover_text,
-        hoverinfo='text'
-    ))
-
-    fig.update_layout(
-        xaxis=dict(
-            zeroline=True,
-            zerolinewidth=2,
-            zerolinecolor='gray',
-            showticklabels=False
-        ),
-        yaxis=dict(autorange='reversed'),
-        height=40 * len(stats_to_plot) + 100,
-        width=1000,
-        margin=dict(l=120, r=60, t=60, b=40),
-        showlegend=False
+    fig = figure(
+        data=[trace('bar',
+            x=deltas,
+            y=categories,
+            orientation='h',
+            marker=dict(color=['#003049' if d >= 0 else '#c1121f' for d in deltas]),
+            textposition='auto',
+            hovertext=hover_text,
+            hoverinfo='text'
+        )],
+        layout=dict(
+            xaxis=dict(
+                zeroline=True,
+                zerolinewidth=2,
+                zerolinecolor='gray',
+                showticklabels=False
+            ),
+            yaxis=dict(autorange='reversed'),
+            height=40 * len(stats_to_plot) + 100,
+            width=1000,
+            margin=dict(l=120, r=60, t=60, b=40),
+            showlegend=False
+        )
     )
 
-    fig_json = json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    fig_json = to_json(fig)
     config = json.dumps({
         "displayModeBar": False,
         "staticPlot": True
@@ -91,34 +90,15 @@ def plot_team_strength_donut(score):
     score = max(0, min(100, score))  # Clamp to [0, 100]
     fill_color = strength_to_color(score)
 
-    fig = go.Figure(go.Pie(
+    pie = trace('pie',
         values=[score, 100 - score],
         hole=0.7,
-        marker_colors=[fill_color, "#d3dbe3"],
+        marker=dict(colors=[fill_color, "#d3dbe3"]),
         textinfo="none",
         sort=False,
-        hoverinfo="skip",
-        hovertemplate=None
-    ))
-
-    fig.update_layout(
-        showlegend=False,
-        margin=dict(t=0, b=0, l=0, r=0),
-        annotations=[
-            dict(
-                text=f"<b>{score}</b><br><span style='font-size:14px;'>TEAM STRENGTH</span>", 
-                x=0.5, y=0.5, font_size=24, showarrow=False, align='center'
-            )
-        ],
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        height=250,
-        width=250
+        hoverinfo="skip"
     )
-
-    fig_json = fig.to_json()
-    config = {'displayModeBar': False}
-    return fig_json, config
+    return _donut(pie, f"<b>{score}</b><br><span style='font-size:14px;'>TEAM STRENGTH</span>", 24)
 
 def strength_to_color(score):
     """
@@ -131,124 +111,69 @@ def strength_to_color(score):
     else:
         return "#003049"  # Navy
 
-import plotly.graph_objects as go
-
 def get_donut_plot_for_team_results(wins, losses, draws, points):
-    labels = ['Wins', 'Losses', 'Draws']
-    values = [wins, losses, draws]
-    colors = ['#003049', '#c1121f', '#d3dbe3']
-
-    fig = go.Figure(go.Pie(
-        labels=labels,
-        values=values,
+    pie = trace('pie',
+        labels=['Wins', 'Losses', 'Draws'],
+        values=[wins, losses, draws],
         hole=0.6,
-        marker=dict(colors=colors),
+        marker=dict(colors=['#003049', '#c1121f', '#d3dbe3']),
         textinfo='none',
         sort=False,
         hoverinfo='skip'  # Disable all hover text
-    ))
-
-    fig.update_layout(
-        showlegend=False,
-        margin=dict(t=0, b=0, l=0, r=0),
-        annotations=[
-            dict(
-                text=f"<b>{points}</b><br><span style='font-size:12px;'>POINTS</span>",
-                x=0.5, y=0.5,
-                font_size=22,
-                showarrow=False,
-                align='center'
-            )
-        ],
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        height=250,
-        width=250
     )
-    fig_json = fig.to_json()
-    config = {'displayModeBar': False}
-
-    return fig_json, config
-
+    return _donut(pie, f"<b>{points}</b><br><span style='font-size:12px;'>POINTS</span>", 22)
 
 def get_donut_plot_for_goals(goals_for, goals_against):
-    labels = ['Goals For', 'Goals Against']
-    values = [goals_for, goals_against]
-    colors = ['#003049', '#c1121f']
-
-    fig = go.Figure(go.Pie(
-        labels=labels,
-        values=values,
+    pie = trace('pie',
+        labels=['Goals For', 'Goals Against'],
+        values=[goals_for, goals_against],
         hole=0.6,
-        marker=dict(colors=colors),
+        marker=dict(colors=['#003049', '#c1121f']),
         textinfo='none',
         sort=False,
         hoverinfo='skip'
-    ))
-
-    fig.update_layout(
-        showlegend=False,
-        margin=dict(t=0, b=0, l=0, r=0),
-        annotations=[
-            dict(
-                text=f"<b>{goals_for}-{goals_against}</b><br><span style='font-size:12px;'>GOALS</span>",
-                x=0.5, y=0.5,
-                font_size=20,
-                showarrow=False,
-                align='center'
-            )
-        ],
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        height=250,
-        width=250
     )
-
-    fig_json = fig.to_json()
-    config = {'displayModeBar': False}
-
-    return fig_json, config
+    return _donut(pie, f"<b>{goals_for}-{goals_against}</b><br><span style='font-size:12px;'>GOALS</span>", 20)
 
 def get_donut_plot_for_pass_completion(percentage):
     percentage = max(0, min(100, percentage))  # Clamp between 0 and 100
     incomplete = 100 - percentage
 
-    labels = ['Completed', 'Incomplete']
-    values = [percentage, incomplete]
-    colors = ['#003049', '#d3dbe3']  # Blue for completed, gray for incomplete
-
-    fig = go.Figure(go.Pie(
-        labels=labels,
-        values=values,
+    pie = trace('pie',
+        labels=['Completed', 'Incomplete'],
+        values=[percentage, incomplete],
         hole=0.6,
-        marker=dict(colors=colors),
+        marker=dict(colors=['#003049', '#d3dbe3']),  # Blue for completed, gray for incomplete
         textinfo='none',
         sort=False,
         hoverinfo='skip'
-    ))
-
-    fig.update_layout(
-        showlegend=False,
-        margin=dict(t=0, b=0, l=0, r=0),
-        annotations=[
-            dict(
-                text=f"<b>{percentage}%</b><br><span style='font-size:12px;'>PASS</span>",
-                x=0.5, y=0.5,
-                font_size=20,
-                showarrow=False,
-                align='center'
-            )
-        ],
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        height=250,
-        width=250
     )
-
-    fig_json = fig.to_json()
+    return _donut(pie, f"<b>{percentage}%</b><br><span style='font-size:12px;'>PASS</span>", 20)
+
+def _donut(pie, text, font_size):
+    # Shared 250x250 transparent layout with the label in the hole
+    fig = figure(
+        data=[pie],
+        layout=dict(
+            showlegend=False,
+            margin=dict(t=0, b=0, l=0, r=0),
+            annotations=[
+                dict(
+                    text=text,
+                    x=0.5, y=0.5,
+                    font=dict(size=font_size),
+                    showarrow=False,
+                    align='center'
+                )
+            ],
+            paper_bgcolor="rgba(0,0,0,0)",
+            plot_bgcolor="rgba(0,0,0,0)",
+            height=250,
+            width=250
+        )
+    )
     config = {'displayModeBar': False}
-
-    return fig_json, config
+    return to_json(fig), config
 
 def plot_bar_chart(stats_to_plot, team_data, title="Team Strength Breakdown"):
     """
@@ -274,39 +199,40 @@ def plot_bar_chart(stats_to_plot, team_data, title="Team Strength Breakdown"):
             values.append(val)
             bar_labels.append(f"{val:.2f}")
 
-    fig = go.Figure(go.Bar(
-        x=values,
-        y=categories,
-        orientation='h',
-        marker_color='#003049',
-        text=bar_labels,
-        textposition='inside',
-        hoverinfo='skip'
-    ))
-
-    fig.update_layout(
-        title=dict(
-            text=f"<b>{title}</b>",
-            font=dict(
-                family="Montserrat, Arial, sans-serif",
-                size=27,
-                color="#003049"
+    fig = figure(
+        data=[trace('bar',
+            x=values,
+            y=categories,
+            orientation='h',
+            marker=dict(color='#003049'),
+            text=bar_labels,
+            textposition='inside',
+            hoverinfo='skip'
+        )],
+        layout=dict(
+            title=dict(
+                text=f"<b>{title}</b>",
+                font=dict(
+                    family="Montserrat, Arial, sans-serif",
+                    size=27,
+                    color="#003049"
+                ),
+                x=0.5,
+                xanchor="center"
             ),
-            x=0.5,
-            xanchor="center"
-        ),
-        xaxis=dict(
-            showline=False,
-            showticklabels=False
-        ),
-        yaxis=dict(autorange='reversed'),
-        height=40 * len(categories) + 100,
-        width=1000,
-        margin=dict(l=120, r=60, t=60, b=40),
-        showlegend=False
+            xaxis=dict(
+                showline=False,
+                showticklabels=False
+            ),
+            yaxis=dict(autorange='reversed'),
+            height=40 * len(categories) + 100,
+            width=1000,
+            margin=dict(l=120, r=60, t=60, b=40),
+            showlegend=False
+        )
     )
 
-    fig_json = json.dumps(fig, cls=plotly.utils.PlotlyJSONEncoder)
+    fig_json = to_json(fig)
     config = {
         "displayModeBar": False,
         "staticPlot": True
@@ -314,11 +240,14 @@ def plot_bar_chart(stats_to_plot, team_data, title="Team Strength Breakdown"):
 
     return fig_json, config
 
-def add_soccer_pitch(fig):
+def get_soccer_pitch_shapes():
+    """
+    Returns the layout shapes that draw the attacking half of a pitch in white.
+    """
     line_color = "white"
     line_width = 2
 
-    pitch_shapes = [
+    return [
         # Outer box (half-pitch)
         dict(type="rect", x0=50, y0=0, x1=100, y1=100, line=dict(color=line_color, width=line_width)),
 
@@ -335,93 +264,95 @@ def add_soccer_pitch(fig):
         dict(type="line", x0=100, y0=44.5, x1=100, y1=55.5, line=dict(color=line_color, width=line_width)),
     ]
 
-    fig.update_layout(shapes=pitch_shapes)
-    return fig
 
+def generate_shot_marker_plot(game_id, game_data, player_info, shot_store, team_id, team_abbr):
+    """
+    Generates a shot map of one team's shots in a game.
 
-def generate_shot_marker_plot(game_id, game_data, player_info, shot_data, team_abbr):
-    if not shot_data:
-        return None, None
+    Marker positions, outcomes and hover values are read straight from the
+    season's `ShotStore` columns for the team's shots in the game.
 
-    home_id = game_data["home_team_id"]
-    away_id = game_data["away_team_id"]
+    Args:
+        game_id (str): The game ID.
+        game_data (sqlite3.Row): The game being plotted.
+        player_info (dict | list): Player ID to name, or player rows with "player_id" and "player_name".
+        shot_store (ShotStore): The game's season of shots.
+        team_id (str): The team whose shots are plotted.
+        team_abbr (str): Team abbreviation, used for the logo.
 
-    team_ids = [home_id, away_id]
-    fig = go.Figure()
+    Returns:
+        Tuple[str, str]: JSON-encoded Plotly figure and config, or (None, None) if the team has no shots.
+    """
+    shots = shot_store.get_game_columns(game_id, team_id)
+    if not len(shots["shot_order"]):
+        return None, None
 
     if isinstance(player_info, list):
         player_info = {p['player_id']: p['player_name'] for p in player_info}
 
-    for team_id in team_ids:
-        team_shots = [s for s in shot_data if s['team_id'] == team_id]
-        x = []
-        y = []
-        symbols = []
-        for shot in team_shots:
-            x.append(shot['shot_location_x'])
-            y.append(shot['shot_location_y'])
-            if shot['goal'] == 1:
-                symbols.append('star')
-            else:
-                symbols.append('circle')
-
-        hover_texts = []
-        for shot in team_shots:
-            player_name = player_info.get(shot['shooter_player_id'], 'Unknown Player')
-            minute = shot['expanded_minute']
-            xg = round(shot['shot_xg'], 3)
-            psxg = round(shot['shot_psxg'], 3)
-            pattern = shot['pattern_of_play'].lower()
-            is_penalty = " (Penalty)" if pattern == "penalty" else ""
-            hover_texts.append(f"{player_name} - {minute}'{is_penalty}<br>xG: {xg}<br>PSxG: {psxg}")
-
-
-
-        style = TEAM_STYLE_MAP.get(team_id, {
-            "dot_color": "#cccccc",
-            "stroke_color": "#000000",
-            "abbreviation": "UNK"
-        })
-
-        fig.add_trace(go.Scatter(
-            x=x,
-            y=y,
-            mode='markers',
-            marker=dict(
-                size=14,
-                color=style["dot_color"],
-                symbol=symbols,  # ← add this line
-                line=dict(
-                    width=2,
-                    color=style["stroke_color"]
-                )
-            ),
-            name=style["abbreviation"],
-            hoverinfo="text",
-            text=hover_texts
-        ))
-    logo_abbr = team_abbr
-    logo_path = f"/static/img/{logo_abbr}.png"
+    x = shots["shot_location_x"].tolist()
+    y = shots["shot_location_y"].tolist()
+    symbols = ['star' if goal == 1 else 'circle' for goal in shots["goal"].tolist()]
+
+    hover_texts = []
+    for shooter, minute, xg, psxg, pattern_code in zip(shots["shooter_index"].tolist(),
+                                                       shots["expanded_minute"].tolist(),
+                                                       shots["shot_xg"].tolist(),
+                                                       shots["shot_psxg"].tolist(),
+                                                       shots["pattern_code"].tolist()):
+        player_name = player_info.get(shot_store.player_ids[shooter], 'Unknown Player')
+        xg = round(xg, 3)
+        psxg = round(psxg, 3)
+        pattern = (shot_store.patterns[pattern_code] or '').lower()
+        is_penalty = " (Penalty)" if pattern == "penalty" else ""
+        hover_texts.append(f"{player_name} - {minute}'{is_penalty}<br>xG: {xg}<br>PSxG: {psxg}")
+
+    style = TEAM_STYLE_MAP.get(team_id, {
+        "dot_color": "#cccccc",
+        "stroke_color": "#000000",
+        "abbreviation": "UNK"
+    })
+
+    shots_trace = trace('scatter',
+        x=x,
+        y=y,
+        mode='markers',
+        marker=dict(
+            size=14,
+            color=style["dot_color"],
+            symbol=symbols,
+            line=dict(
+                width=2,
+                color=style["stroke_color"]
+            )
+        ),
+        name=style["abbreviation"],
+        hoverinfo="text",
+        text=hover_texts
+    )
 
     # Layout & pitch visuals
-    fig.update_layout(
-        xaxis=dict(range=[50, 101], showgrid=False, zeroline=False, showticklabels=False),
-        yaxis=dict(range=[0, 100], showgrid=False, zeroline=False, showticklabels=False),
-        height=600,
-        width=900,
-        paper_bgcolor='#00611c',
-        plot_bgcolor='#00611c',
-        margin=dict(t=40, b=40, l=40, r=40),
-        showlegend=False,
-        images=[_make_logo_image(f"/static/img/{team_abbr}.png", x=0.3, y=0.5, xanchor="center")]
+    fig = figure(
+        data=[shots_trace],
+        layout=dict(
+            xaxis=dict(range=[50, 101], showgrid=False, zeroline=False, showticklabels=False),
+            yaxis=dict(range=[0, 100], showgrid=False, zeroline=False, showticklabels=False,
+                       scaleanchor="x", scaleratio=0.4),
+            height=600,
+            width=900,
+            paper_bgcolor='#00611c',
+            plot_bgcolor='#00611c',
+            margin=dict(t=40, b=40, l=40, r=40),
+            showlegend=False,
+            images=[_make_logo_image(f"/static/img/{team_abbr}.png", x=0.3, y=0.5, xanchor="center")],
+            shapes=get_soccer_pitch_shapes()
+        )
     )
-    fig.update_yaxes(scaleanchor="x", scaleratio=0.4)
-    fig = add_soccer_pitch(fig)
 
     config = {
         'displayModeBar': False,
         'responsive': True
     }
 
-    return fig.to_json(), config
+    return to_json(fig), config
 
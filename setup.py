@@ -1,60 +1,17 @@
-from data import (db_games_xgoals, db_games, db_goalkeeper_goals_added,db_goalkeeper_xgoals, db_midfielder_strength,
-                db_player_goals_added, db_player_info, db_player_xgoals, db_player_xpass,
-                db_team_goals_added, db_team_info, db_team_xgoals, db_team_xpass, db_game_flow,
-                db_manager_info, db_referee_info, db_stadium_info, db_game_shots,
-                db_team_xgoals_boundaries, db_team_xpass_boundaries, db_team_goals_added_boundaries,
-                db_game_goals, db_defender_strength, db_goalkeeper_strength, db_attacker_strength, db_setup)
-
-import time
+from data import ingest, migrations
+from data.data_util import print_write_stats
+from api import get_client
 
 if __name__ == '__main__':
     SEASONS = [2016, 2017, 2018, 2019, 2020, 2021, 2022, 2023, 2024, 2025]
     print('Initial setup has started. This may take a few minutes.')
-    db_setup.create_tables()
-    db_player_info.insert_all_players_info()
-    db_team_info.insert_team_info()
-    db_manager_info.insert_all_manager_info()
-    db_referee_info.insert_all_referee_info()
-    db_stadium_info.insert_all_stadium_info()
-
-    for season in SEASONS:
-        print(f'Starting update for {season}')
-        db_games_xgoals.insert_all_games_xgoals_by_season(season)
-        db_games.insert_all_games_by_season(season)
-
-        db_goalkeeper_goals_added.insert_goalkeeper_goals_added_by_season(season)
-        db_goalkeeper_xgoals.insert_goalkeeper_xgoals_by_season(season)
-
-        db_player_goals_added.insert_player_goals_added_by_season(season)
-
-        db_player_xgoals.insert_player_xgoals_by_season(season)
-        db_player_xgoals.update_xgoals_xassists_per_90(season)
-        db_player_xpass.insert_player_xpass_by_season(season)
-
-        db_midfielder_strength.update_midfielder_strength(season)
-
-        db_attacker_strength.update_attacker_strength(season)
-        db_defender_strength.update_defender_strength(season)
-        db_goalkeeper_strength.update_goalkeeper_strength(season)
-
-        
-
-        db_team_goals_added.insert_team_goals_added_by_season(season)
-        db_team_xgoals.insert_teams_xgoals_by_season(season)
-        db_team_xgoals.insert_team_strength_history(season)
-        db_team_xpass.insert_teams_xpass_by_season(season)
-        db_team_xgoals_boundaries.insert_team_xgoal_boundaries(season)
-        db_team_xpass_boundaries.insert_team_xpass_boundaries(season)
-        db_team_goals_added_boundaries.insert_team_goals_add_boundaries(season)
-
-        print('Adding game flow data...')
-        game_ids = db_games.get_game_ids_by_season(season)
-        for game_id in game_ids:
-            db_game_shots.insert_all_game_shots(game_id, season)
-            db_game_flow.insert_flow_by_game_id(game_id)
-            db_game_goals.insert_game_goals_by_game_id(game_id)
-        print('Game flow data added.')
-        print(f'{season} complete, buffering for API limit...')
-        time.sleep(30)
-    
-    print('Initial setup completed.')
\ No newline at end of file
+    migrations.apply_migrations()
+    # Steps run as a dependency graph, with independent steps and seasons in parallel (data/ingest.py)
+    pipeline = ingest.build_pipeline(SEASONS)
+    try:
+        pipeline.run()
+    finally:
+        pipeline.print_report()
+        print_write_stats()
+        get_client().print_stats()
+    print('Initial setup completed.')
@@ -0,0 +1,66 @@
+'''
+Measures per-page SQLite connection overhead with and without the read pool.
+
+"unpooled" opens a fresh connection for every getter, as the data layer did
+before `get_read_connection()`; "pooled" reuses idle connections.
+
+Requires a populated nwsl.db. Run from the repository root:
+    KEY=dev python -m tests.benchmarks.bench_connections 2024 --renders 50
+'''
+import argparse
+import contextlib
+import io
+import sqlite3
+import time
+from data import data_util
+from flask_app import app
+
+def bench_connect(n):
+    start = time.perf_counter()
+    for _ in range(n):
+        conn = sqlite3.connect(data_util.get_db_path())
+        conn.execute('SELECT 1').fetchone()
+        conn.close()
+    fresh = (time.perf_counter() - start) / n
+    start = time.perf_counter()
+    for _ in range(n):
+        conn = data_util.get_read_connection()
+        conn.execute('SELECT 1').fetchone()
+        conn.close()
+    pooled = (time.perf_counter() - start) / n
+    return fresh, pooled
+
+def bench_page(client, url, renders, max_idle):
+    pool = data_util.get_read_pool()
+    pool.close_all()
+    pool.max_idle = max_idle
+    opened, acquired = pool.opened, pool.acquired
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(renders):
+            client.get(url)
+    elapsed = (time.perf_counter() - start) / renders
+    return elapsed, (pool.opened - opened) / renders, (pool.acquired - acquired) / renders
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('season', type=int)
+    parser.add_argument('--renders', type=int, default=50)
+    args = parser.parse_args()
+
+    fresh, pooled = bench_connect(1000)
+    print(f'\nconnect + SELECT 1 + close: fresh {fresh * 1e6:.0f} us, pooled {pooled * 1e6:.0f} us')
+
+    conn = data_util.get_read_connection()
+    game_id = conn.execute('SELECT game_id FROM games WHERE season = ? AND home_score IS NOT NULL LIMIT 1',
+                           (args.season,)).fetchone()[0]
+    conn.close()
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['season'] = args.season
+
+    print(f'\n{"page":<24} {"mode":<9} {"ms/render":>10} {"opened":>7} {"queries":>8}')
+    for url in ['/', '/games', f'/game/{game_id}', '/teams', '/players']:
+        for mode, max_idle in [('unpooled', 0), ('pooled', data_util.MAX_IDLE_READ_CONNECTIONS)]:
+            elapsed, opened, acquired = bench_page(client, url, args.renders, max_idle)
+            print(f'{url:<24} {mode:<9} {elapsed * 1000:>10.2f} {opened:>7.1f} {acquired:>8.1f}')
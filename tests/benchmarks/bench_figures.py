@@ -0,0 +1,65 @@
+'''
+Compares building the site's charts as plain-dict specs (figure_specs) against
+passing the same figures through plotly.graph_objects, and the import time of
+each path in a fresh interpreter.
+
+"plotly" validates each spec with `go.Figure(spec)` and serialises it with
+`to_json()`, the work the charts did before figure_specs. The figures are the
+golden ones from tests/test_figure_specs.py, so no database is needed.
+
+Run from the repository root:
+    python -m tests.benchmarks.bench_figures --renders 200
+'''
+import argparse
+import json
+import subprocess
+import sys
+import time
+from tests.test_figure_specs import get_figure_builders
+
+IMPORTS = {
+    'python': 'pass',
+    'figure_specs': 'import figure_specs; figure_specs.get_template("plotly")',
+    'plots': 'import plots, momentum_plot; plots.get_donut_plot_for_goals(1, 2)',
+    'plotly': 'import plotly.graph_objects as go; go.Figure().to_json()',
+    'matplotlib': 'import matplotlib.pyplot'
+}
+
+def time_renders(render, renders):
+    start = time.perf_counter()
+    for _ in range(renders):
+        render()
+    return (time.perf_counter() - start) / renders
+
+def time_import(code, runs):
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], check=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--renders', type=int, default=200)
+    parser.add_argument('--import-runs', type=int, default=5)
+    args = parser.parse_args()
+
+    import plotly.graph_objects as go
+
+    print(f'\n{"figure":<32} {"spec ms":>8} {"plotly ms":>10} {"speedup":>8}')
+    for name, build in get_figure_builders().items():
+        spec = json.loads(build()[0])
+        spec_ms = time_renders(build, args.renders) * 1000
+        plotly_ms = time_renders(lambda: go.Figure(spec).to_json(), args.renders) * 1000
+        print(f'{name:<32} {spec_ms:>8.3f} {plotly_ms:>10.3f} {plotly_ms / spec_ms:>7.1f}x')
+
+    print(f'\n{"import":<32} {"ms":>8}')
+    for name, code in IMPORTS.items():
+        try:
+            elapsed = time_import(code, args.import_runs)
+        except subprocess.CalledProcessError:
+            print(f'{name:<32} {"n/a":>8}')
+            continue
+        print(f'{name:<32} {elapsed * 1000:>8.1f}')
@@ -0,0 +1,61 @@
+'''
+Compares ingestion throughput for a season of game shots written one row per
+transaction (as the insert_* functions used to) against `write_rows()`, which
+uses one executemany in one transaction.
+
+Uses a synthetic payload and a temporary database, so no API access or
+nwsl.db is needed. Run from the repository root:
+    python -m tests.benchmarks.bench_ingest --shots 5000
+'''
+import argparse
+import contextlib
+import io
+import os
+import random
+import tempfile
+import time
+from data import data_util, migrations
+from data.db_game_shots import INSERT_GAME_SHOT_SQL, _get_game_shot_rows
+
+def make_payload(n_shots, seed=0):
+    rng = random.Random(seed)
+    return [{
+        'game_id': f'game{idx // 25}', 'period_id': 1 + (idx % 25 > 12), 'expanded_minute': idx % 95,
+        'game_minute': idx % 90, 'team_id': f'team{idx % 14}', 'shooter_player_id': f'p{rng.randrange(300)}',
+        'assist_player_id': f'p{rng.randrange(300)}', 'shot_location_x': rng.random() * 100,
+        'shot_location_y': rng.random() * 100, 'distance_from_goal': rng.random() * 30,
+        'distance_from_goal_yds': rng.random() * 30, 'goal': int(rng.random() < 0.1),
+        'shot_xg': rng.random() * 0.5, 'shot_psxg': rng.random() * 0.5, 'shot_order': idx % 25
+    } for idx in range(n_shots)]
+
+def write_per_row(conn, rows):
+    for row in rows:
+        conn.execute(INSERT_GAME_SHOT_SQL, row)
+        conn.commit()
+
+def write_batched(conn, rows):
+    with contextlib.redirect_stdout(io.StringIO()):
+        data_util.write_rows('game_shots', INSERT_GAME_SHOT_SQL, rows, conn=conn)
+
+def bench(write, rows):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, 'bench.db')
+        conn = data_util.get_write_connection(db_path)
+        with contextlib.redirect_stdout(io.StringIO()):
+            migrations.apply_migrations(conn=conn)
+        start = time.perf_counter()
+        write(conn, rows)
+        elapsed = time.perf_counter() - start
+        conn.close()
+    return elapsed
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--shots', type=int, default=5000)
+    args = parser.parse_args()
+
+    rows = _get_game_shot_rows(make_payload(args.shots), 2024)
+    print(f'\n{"mode":<24} {"rows":>7} {"seconds":>9} {"rows/s":>10}')
+    for mode, write in [('commit per row', write_per_row), ('write_rows (batched)', write_batched)]:
+        elapsed = bench(write, rows)
+        print(f'{mode:<24} {len(rows):>7} {elapsed:>9.3f} {len(rows) / elapsed:>10,.0f}')
@@ -0,0 +1,44 @@
+'''
+Compares the memory held by a season of shots as sqlite3.Row lists (as the
+simulation context used to keep them) against the columnar ShotStore.
+
+Requires a populated nwsl.db. Run from the repository root:
+    python -m tests.benchmarks.bench_shot_store 2024 2025
+'''
+import argparse
+import sqlite3
+import time
+import tracemalloc
+from data.data_util import get_db_path
+from data.shot_store import load_shot_store
+
+def measure(load):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = load()
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, peak, elapsed
+
+def load_rows(season):
+    conn = sqlite3.connect(get_db_path())
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute('''
+        SELECT * FROM game_shots
+        WHERE season = ?
+        ORDER BY team_id ASC, game_id ASC, shot_order ASC
+    ''', (season,)).fetchall()
+    conn.close()
+    return rows
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('seasons', type=int, nargs='+')
+    args = parser.parse_args()
+
+    print(f'\n{"season":<7} {"layout":<10} {"shots":>7} {"retained KiB":>13} {"peak KiB":>9} {"seconds":>8}')
+    for season in args.seasons:
+        for layout, load in [('rows', lambda: load_rows(season)), ('store', lambda: load_shot_store(season))]:
+            result, current, peak, elapsed = measure(load)
+            print(f'{season:<7} {layout:<10} {len(result):>7} {current / 1024:>13,.0f} {peak / 1024:>9,.0f} {elapsed:>8.3f}')
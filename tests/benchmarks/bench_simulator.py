@@ -0,0 +1,36 @@
+'''
+Compares MatchSimulator engines in simulations per second.
+
+Requires a populated nwsl.db. Run from the repository root:
+    python -m tests.benchmarks.bench_simulator 315VnJ759x 4wM4Ezg5jB 2024 --sims 100000 --workers 4
+'''
+import argparse
+import time
+from data.sim import MatchSimulator, ENGINES
+
+def bench_engine(args, engine, workers=None):
+    simulator = MatchSimulator(args.home_team_id, args.away_team_id, args.season, 1.05, 0.95)
+    start = time.perf_counter()
+    simulator.run_simulations(args.sims, engine=engine, seed=args.seed, workers=workers)
+    elapsed = time.perf_counter() - start
+    return simulator.get_summary(), elapsed
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('home_team_id')
+    parser.add_argument('away_team_id')
+    parser.add_argument('season', type=int)
+    parser.add_argument('--sims', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=None, help='Also time the NumPy engine across this many processes.')
+    args = parser.parse_args()
+
+    results = {engine: bench_engine(args, engine) for engine in ENGINES}
+    if args.workers:
+        results[f'numpy x{args.workers}'] = bench_engine(args, 'numpy', workers=args.workers)
+
+    serial_elapsed = results['python'][1]
+    print(f'\n{"engine":<10} {"seconds":>9} {"sims/sec":>12} {"speedup":>8} {"home":>7} {"draw":>7} {"away":>7}')
+    for engine, (summary, elapsed) in results.items():
+        print(f'{engine:<10} {elapsed:>9.3f} {args.sims / elapsed:>12,.0f} {serial_elapsed / elapsed:>7.1f}x '
+              f'{summary["home_win_pct"]:>7.3f} {summary["draw_pct"]:>7.3f} {summary["away_win_pct"]:>7.3f}')
@@ -4,6 +4,8 @@ import random
 
 TEAM_IDS = ["4JMAk47qKg", "315VnJ759x", "aDQ0lzvQEv"]
 GAME_IDS = ["2lqRpdR0Mr", "7VqGbYm65v", "Vj58bpE4Q8"]
+# Season-scoped pages live under /<season>/; the bare paths only redirect there
+SEASON = 2025
 
 # Load config for host and wait time
 with open("config.json") as f:
@@ -13,51 +15,62 @@ class WebsiteUser(HttpUser):
     wait_time = between(config["min_wait"], config["max_wait"])
     host = config["host"]
 
+    def on_start(self):
+        # ETag of each page this user has seen, like a browser cache
+        self.etags = {}
+
+    def get(self, path):
+        """GETs a page, revalidating it with its last ETag so unchanged pages come back as 304s."""
+        headers = {"If-None-Match": self.etags[path]} if path in self.etags else {}
+        with self.client.get(path, headers=headers, catch_response=True) as response:
+            if response.status_code in (200, 304):
+                if "ETag" in response.headers:
+                    self.etags[path] = response.headers["ETag"]
+                response.success()
+
     @task
     def visit_homepage(self):
-        self.client.get("/")
+        self.get(f"/{SEASON}/")
 
     @task
     def visit_league(self):
-        self.client.get("/")
-        self.client.get("/league")
+        self.get(f"/{SEASON}/")
+        self.get(f"/{SEASON}/league")
 
     @task
     def visit_players(self):
-        self.client.get("/")
-        self.client.get("/players")
+        self.get(f"/{SEASON}/")
+        self.get(f"/{SEASON}/players")
 
     @task
     def visit_goalkeepers(self):
-        self.client.get("/")
-        self.client.get("/goalkeepers")
+        self.get(f"/{SEASON}/")
+        self.get(f"/{SEASON}/goalkeepers")
 
     @task
     def visit_teams(self):
-        self.client.get("/")
-        self.client.get("/teams")
-        chosen_team = random.choice(TEAM_IDS)
-        self.client.post("/team", data={"team_id": chosen_team})
+        self.get(f"/{SEASON}/")
+        self.get(f"/{SEASON}/teams")
+        self.get(f"/{SEASON}/team/{random.choice(TEAM_IDS)}")
 
     @task
     def visit_team_comparison(self):
-        self.client.get("/")
-        self.client.get("/team_comparison")
+        self.get(f"/{SEASON}/")
+        self.get(f"/{SEASON}/team_comparison")
 
     @task
     def visit_games(self):
-        self.client.get("/")
-        self.client.get("/games")
-        chosen_team = random.choice(GAME_IDS)
-        self.client.post("/game", data={"game_id": chosen_team})
+        self.get(f"/{SEASON}/")
+        self.get(f"/{SEASON}/games")
+        self.get(f"/game/{random.choice(GAME_IDS)}")
 
     @task
     def visit_simulations(self):
-        self.client.get("/")
-        self.client.get("/simulations")
+        self.get(f"/{SEASON}/")
+        self.get(f"/{SEASON}/simulations")
 
     @task
     def visit_blog(self):
-        self.client.get("/")
-        self.client.get("/blog")
+        self.get(f"/{SEASON}/")
+        self.get("/blog")
 
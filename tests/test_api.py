@@ -1,6 +1,173 @@
+import json
+import os
+import tempfile
+import threading
+import time
 import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from api import *
 
+class StubHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so the client can keep connections alive between requests
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.path)
+            server.ports.add(self.client_address[1])
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            status = server.statuses.pop(0) if server.statuses else 200
+        time.sleep(server.delay)
+        body = json.dumps({'path': self.path, 'version': server.version}).encode()
+        etag = f'"v{server.version}"'
+        if status == 200 and self.headers.get('If-None-Match') == etag:
+            status, body = 304, b''
+        self.send_response(status)
+        if status == 429:
+            self.send_header('Retry-After', '0')
+        self.send_header('ETag', etag)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with server.lock:
+            server.in_flight -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+class TestAsaApiClient(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests, self.server.ports, self.server.statuses = [], set(), []
+        self.server.in_flight = self.server.max_in_flight = 0
+        self.server.delay = 0
+        self.server.version = 1
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base_url = f'http://127.0.0.1:{self.server.server_port}/'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def make_client(self, **kwargs):
+        options = {'rate': 1000, 'burst': 1000, 'max_workers': 4, 'max_retries': 2, 'backoff': 0.01}
+        options.update(kwargs)
+        return AsaApiClient(base_url=self.base_url, **options)
+
+    def test_retries_transient_errors(self):
+        """Test that 429 and 5xx responses are retried until the request succeeds."""
+        self.server.statuses = [429, 503]
+        client = self.make_client()
+        self.assertEqual(client.get('nwsl/players'), [200, {'path': '/nwsl/players', 'version': 1}])
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertEqual(client.get_stats()['nwsl/players']['attempts'], 3)
+        self.assertEqual(client.get_stats()['nwsl/players']['errors'], 2)
+
+    def test_gives_up_after_max_retries(self):
+        """Test that the last error response is returned once retries run out."""
+        self.server.statuses = [500, 500, 500, 500]
+        client = self.make_client()
+        self.assertEqual(client.get('nwsl/players')[0], 500)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_client_errors_not_retried(self):
+        """Test that a 404 is returned straight away."""
+        self.server.statuses = [404]
+        self.assertEqual(self.make_client().get('nwsl/missing')[0], 404)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_get_many_bounded_and_ordered(self):
+        """Test that get_many keeps input order, caps requests in flight and reuses connections."""
+        self.server.delay = 0.02
+        client = self.make_client(max_workers=3)
+        endpoints = [f'nwsl/games/shots?game_id=g{idx}' for idx in range(12)]
+        responses = client.get_many(endpoints)
+        self.assertEqual([body['path'] for _, body in responses], ['/' + endpoint for endpoint in endpoints])
+        self.assertLessEqual(self.server.max_in_flight, 3)
+        self.assertGreater(self.server.max_in_flight, 1)
+        self.assertLessEqual(len(self.server.ports), 3)
+        self.assertEqual(client.get_stats()['nwsl/games/shots']['calls'], 12)
+
+    def test_in_flight_bounded_across_threads(self):
+        """Test that concurrent get_many calls from several threads share one in-flight limit."""
+        self.server.delay = 0.02
+        client = self.make_client(max_workers=2)
+        threads = [threading.Thread(target=client.get_many, args=([f'nwsl/games/shots?game_id={name}{idx}'
+                                                                    for idx in range(4)],))
+                   for name in 'abc']
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(self.server.requests), 12)
+        self.assertLessEqual(self.server.max_in_flight, 2)
+
+    def test_rate_limit(self):
+        """Test that requests beyond the burst wait for the token bucket to refill."""
+        client = self.make_client(rate=20, burst=2)
+        start = time.monotonic()
+        client.get_many(['nwsl/players'] * 6)
+        self.assertGreaterEqual(time.monotonic() - start, 4 / 20 * 0.9)
+
+class TestResponseCache(TestAsaApiClient):
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(os.path.join(self.tmpdir.name, 'api_cache.db'))
+
+    def tearDown(self):
+        super().tearDown()
+        self.tmpdir.cleanup()
+
+    def make_client(self, **kwargs):
+        return super().make_client(cache=self.cache, **kwargs)
+
+    def test_closed_season_replayed(self):
+        """Test that a closed season and per-game responses are served from the cache without a request."""
+        client = self.make_client()
+        for endpoint in ['nwsl/teams/xgoals?season_name=2019&stage_name=Regular Season', 'nwsl/games/shots?game_id=g1']:
+            first = client.get(endpoint)
+            self.server.version = 2
+            self.assertEqual(client.get(endpoint), first)
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(client.get_stats()['nwsl/games/shots']['cache_hits'], 1)
+
+    def test_current_data_revalidated(self):
+        """Test that reference and refreshed responses are revalidated with their ETag."""
+        client = self.make_client()
+        client.get('nwsl/teams')
+        self.assertEqual(client.get('nwsl/teams')[1]['version'], 1)
+        self.server.version = 2
+        self.assertEqual(client.get('nwsl/teams')[1]['version'], 2)
+
+        client.get('nwsl/games/shots?game_id=g1')
+        self.server.version = 3
+        self.assertEqual(client.get('nwsl/games/shots?game_id=g1', refresh=True)[1]['version'], 3)
+        self.assertEqual(len(self.server.requests), 5)
+
+    def test_offline_replay(self):
+        """Test that an offline client replays cached responses and refuses uncached ones."""
+        self.make_client().get('nwsl/teams?b=2&a=1')
+        self.server.statuses = [500]
+        offline = self.make_client(offline=True)
+        self.assertEqual(offline.get('nwsl/teams?a=1&b=2')[0], 200)
+        with self.assertRaises(LookupError):
+            offline.get('nwsl/players')
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_errors_not_cached(self):
+        """Test that an error response is not stored."""
+        self.server.statuses = [404]
+        client = self.make_client()
+        self.assertEqual(client.get('nwsl/games/shots?game_id=g1')[0], 404)
+        self.assertEqual(client.get('nwsl/games/shots?game_id=g1')[0], 200)
+        self.assertIsNone(self.cache.get('nwsl/players'))
+
 class TestAPI(unittest.TestCase):
     def test_api_no_endpoint(self):
         response = make_asa_api_call('')
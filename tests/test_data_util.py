@@ -1,6 +1,10 @@
 import unittest
 import os
-from data import data_util
+import sqlite3
+import tempfile
+import threading
+from unittest import mock
+from data import data_util, migrations
 
 class TestDataUtils(unittest.TestCase):
     
@@ -190,6 +194,169 @@ class TestDataUtils(unittest.TestCase):
         """Test that an empty string raises a ValueError."""
         with self.assertRaises(ValueError):
             data_util.convert_utc_to_est("")
-        
+
+class TestConnectionPool(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'test.db')
+        conn = data_util.get_write_connection(self.db_path)
+        conn.execute('CREATE TABLE team_info (team_id TEXT, team_name TEXT)')
+        conn.execute("INSERT INTO team_info VALUES ('A', 'Team A')")
+        conn.commit()
+        conn.close()
+        self.pool = data_util.get_read_pool(self.db_path)
+
+    def tearDown(self):
+        self.pool.close_all()
+        self.tmpdir.cleanup()
+
+    def test_connections_are_reused(self):
+        """Test that closing a pooled connection returns it for the next caller."""
+        opened = self.pool.opened
+        for _ in range(5):
+            conn = data_util.get_read_connection(self.db_path)
+            conn.execute('SELECT 1').fetchone()
+            conn.close()
+        self.assertEqual(self.pool.opened - opened, 1)
+
+    def test_row_factory_is_per_handle(self):
+        """Test that one caller's row factory does not leak into the next caller's rows."""
+        conn = data_util.get_read_connection(self.db_path)
+        conn.row_factory = sqlite3.Row
+        row = conn.cursor().execute('SELECT * FROM team_info').fetchone()
+        conn.close()
+        self.assertEqual(row['team_name'], 'Team A')
+
+        conn = data_util.get_read_connection(self.db_path)
+        self.assertEqual(conn.execute('SELECT * FROM team_info').fetchone(), ('A', 'Team A'))
+        conn.close()
+
+    def test_read_connections_are_read_only(self):
+        """Test that pooled connections reject writes and use WAL with the read PRAGMAs."""
+        conn = data_util.get_read_connection(self.db_path)
+        self.assertEqual(conn.execute('PRAGMA journal_mode').fetchone()[0], 'wal')
+        self.assertEqual(conn.execute('PRAGMA query_only').fetchone()[0], 1)
+        with self.assertRaises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO team_info VALUES ('B', 'Team B')")
+        conn.close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conn.cursor()
+
+    def test_readers_see_committed_writes(self):
+        """Test that a reused read connection sees rows committed after it was opened."""
+        conn = data_util.get_read_connection(self.db_path)
+        conn.execute('SELECT * FROM team_info').fetchall()
+        conn.close()
+
+        writer = data_util.get_write_connection(self.db_path)
+        writer.execute("INSERT INTO team_info VALUES ('B', 'Team B')")
+        writer.commit()
+        writer.close()
+
+        conn = data_util.get_read_connection(self.db_path)
+        self.assertEqual(conn.execute('SELECT COUNT(*) FROM team_info').fetchone()[0], 2)
+        conn.close()
+
+    def test_concurrent_threads(self):
+        """Test that threads each get their own connection and the pool stays bounded."""
+        barrier = threading.Barrier(4)
+        errors = []
+
+        def read():
+            try:
+                conn = data_util.get_read_connection(self.db_path)
+                barrier.wait()
+                conn.execute('SELECT * FROM team_info').fetchall()
+                conn.close()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(self.pool.idle), self.pool.max_idle)
+
+    def test_db_path_override(self):
+        """Test that NWSL_DB_PATH overrides the default database location."""
+        with mock.patch.dict(os.environ, {'NWSL_DB_PATH': self.db_path}):
+            self.assertEqual(data_util.get_db_path(), self.db_path)
+            conn = data_util.get_read_connection()
+            self.assertEqual(conn.execute('SELECT team_name FROM team_info').fetchone()[0], 'Team A')
+            conn.close()
+
+class TestWriteRows(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'test.db')
+        self.conn = data_util.get_write_connection(self.db_path)
+        self.conn.execute('CREATE TABLE team_info (team_id TEXT PRIMARY KEY, team_name TEXT)')
+        self.conn.commit()
+        data_util.reset_write_stats()
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmpdir.cleanup()
+        data_util.reset_write_stats()
+
+    def test_rows_written_and_counted(self):
+        """Test that a batch is written and its rows are added to the per-table stats."""
+        rows = [(f'T{idx}', f'Team {idx}') for idx in range(100)]
+        self.assertEqual(data_util.write_rows('team_info', 'INSERT INTO team_info VALUES (?, ?)', rows, conn=self.conn), 100)
+        data_util.write_rows('team_info', 'INSERT INTO team_info VALUES (?, ?)', [('X', 'Team X')], conn=self.conn)
+        self.assertEqual(self.conn.execute('SELECT COUNT(*) FROM team_info').fetchone()[0], 101)
+        stats = data_util.get_write_stats()['team_info']
+        self.assertEqual((stats['rows'], stats['batches']), (101, 2))
+        self.assertFalse(self.conn.in_transaction)
+
+    def test_failed_batch_writes_nothing(self):
+        """Test that a failing row rolls back the whole batch."""
+        rows = [('A', 'Team A'), ('B', 'Team B'), ('A', 'Duplicate')]
+        with self.assertRaises(sqlite3.IntegrityError):
+            data_util.write_rows('team_info', 'INSERT INTO team_info VALUES (?, ?)', rows, conn=self.conn)
+        self.assertEqual(self.conn.execute('SELECT COUNT(*) FROM team_info').fetchone()[0], 0)
+
+    def test_joins_open_transaction(self):
+        """Test that rows join a caller's open transaction, so a delete and its replacement commit together."""
+        data_util.write_rows('team_info', 'INSERT INTO team_info VALUES (?, ?)', [('A', 'Old')], conn=self.conn)
+        self.conn.execute('BEGIN')
+        self.conn.execute('DELETE FROM team_info')
+        reader = sqlite3.connect(self.db_path)
+        self.assertEqual(reader.execute('SELECT team_name FROM team_info').fetchone()[0], 'Old')
+        data_util.write_rows('team_info', 'INSERT INTO team_info VALUES (?, ?)', [('A', 'New')], conn=self.conn)
+        self.assertEqual(reader.execute('SELECT team_name FROM team_info').fetchall(), [('New',)])
+        reader.close()
+
+class TestDataGeneration(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {'NWSL_DB_PATH': os.path.join(self.tmpdir.name, 'test.db')})
+        self.env.start()
+        migrations.apply_migrations()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def test_bump_increments(self):
+        """Test that the generation starts at 0 and each bump adds one."""
+        self.assertEqual(data_util.get_data_generation(), 0)
+        self.assertEqual(data_util.bump_data_generation(), 1)
+        self.assertEqual(data_util.bump_data_generation(), 2)
+        self.assertEqual(data_util.get_data_generation(), 2)
+        self.assertIsNotNone(data_util.get_data_updated_at())
+
+    def test_unmigrated_database(self):
+        """Test that a database without the data_generation table reads as never updated."""
+        conn = sqlite3.connect(os.environ['NWSL_DB_PATH'])
+        conn.execute('DROP TABLE data_generation')
+        conn.commit()
+        conn.close()
+        data_util.close_read_connections()
+        self.assertEqual(data_util.get_data_generation(), 0)
+        self.assertIsNone(data_util.get_data_updated_at())
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,4 +1,8 @@
-from data import db_game_shots
+from data import db_game_goals, db_game_shots, migrations
+from unittest import mock
+import os
+import sqlite3
+import tempfile
 import unittest
 
 class TestShotDataValidity(unittest.TestCase):
@@ -156,5 +160,57 @@ class TestGetTotalShotsOnTargetByGameId(unittest.TestCase):
         with self.assertRaises(ValueError):
             db_game_shots.get_total_shots_on_target_by_game_id(self.invalid_game_id)
 
+def _make_shot(game_id, shot_order, goal=0):
+    return {'game_id': game_id, 'team_id': 'T1', 'shooter_player_id': f'p{shot_order}',
+            'assist_player_id': None, 'expanded_minute': shot_order * 10, 'shot_xg': 0.1234,
+            'shot_psxg': 0.2, 'goal': goal, 'pattern_of_play': 'Regular', 'shot_order': shot_order}
+
+class TestInsertGameShotsBySeason(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'test.db')
+        self.env = mock.patch.dict(os.environ, {'NWSL_DB_PATH': self.db_path})
+        self.env.start()
+        migrations.apply_migrations()
+        self.payloads = {'g1': [_make_shot('g1', 1), _make_shot('g1', 2, goal=1)], 'g2': [_make_shot('g2', 1, goal=1)]}
+        self.api = mock.patch.object(db_game_shots, 'make_asa_api_calls',
+                                     side_effect=lambda endpoints, refresh=False: [[200, self.payloads[endpoint.split('=')[-1]]]
+                                                                    for endpoint in endpoints])
+        self.api.start()
+
+    def tearDown(self):
+        self.api.stop()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def count(self, table):
+        conn = sqlite3.connect(self.db_path)
+        total = conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+        conn.close()
+        return total
+
+    def test_season_written_once(self):
+        """Test that every game's shots are mapped and written, and goals are derived from them."""
+        self.assertEqual(db_game_shots.insert_game_shots_by_season(2024, ['g1', 'g2']), 3)
+        self.assertEqual(self.count('game_shots'), 3)
+        self.assertEqual(db_game_goals.insert_game_goals_by_season(2024), 2)
+        self.assertEqual(self.count('game_goals'), 2)
+
+    def test_replace_clears_season(self):
+        """Test that replacing a season drops shots the API no longer returns."""
+        db_game_shots.insert_game_shots_by_season(2024, ['g1', 'g2'])
+        db_game_shots.insert_game_shots_by_season(2024, ['g2'], replace=True)
+        self.assertEqual(self.count('game_shots'), 1)
+
+    def test_replace_by_game_ids(self):
+        """Test that replacing some games swaps only their shots and goals and leaves the rest of the season."""
+        db_game_shots.insert_game_shots_by_season(2024, ['g1', 'g2'])
+        db_game_goals.insert_game_goals_by_season(2024)
+        self.payloads['g1'] = [_make_shot('g1', 1)]
+        self.assertEqual(db_game_shots.replace_game_shots_by_game_ids(2024, ['g1']), 1)
+        self.assertEqual(db_game_goals.replace_game_goals_by_game_ids(['g1']), 0)
+        self.assertEqual(self.count('game_shots'), 2)
+        self.assertEqual(self.count('game_goals'), 1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,56 @@
+from data import db_game_team_summary, migrations
+from unittest import mock
+import os
+import sqlite3
+import tempfile
+import unittest
+
+class TestGameTeamSummary(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'test.db')
+        self.env = mock.patch.dict(os.environ, {'NWSL_DB_PATH': self.db_path})
+        self.env.start()
+        migrations.apply_migrations()
+        # (game_id, team_id, shot_order, shot_xg, shot_psxg, blocked, goal)
+        self.execute('''
+            INSERT INTO game_shots (game_id, team_id, shot_order, shot_xg, shot_psxg, blocked, goal, season)
+            VALUES (?, ?, ?, ?, ?, ?, ?, 2024)
+        ''', [
+            ('g1', 'A', 1, 0.1, 0.2, 0, 0),
+            ('g1', 'A', 2, 0.3, 0.9, 0, 1),
+            ('g1', 'A', 3, 0.2, None, 1, 0),
+            ('g1', 'B', 4, 0.05, 0.0, 0, 0),
+            ('g2', 'B', 1, 0.4, 0.5, None, 1),
+        ])
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def execute(self, sql, rows=()):
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany(sql, rows)
+        conn.commit()
+        conn.close()
+
+    def test_aggregates_per_team(self):
+        """Test that shots, shots on target, PSxG, xG and goals are aggregated per game and team."""
+        self.assertEqual(db_game_team_summary.update_game_team_summary(2024), 3)
+        summary = db_game_team_summary.get_game_team_summary('g1')
+        self.assertEqual(list(summary), ['A', 'B'])
+        self.assertEqual((summary['A']['shots'], summary['A']['shots_on_target'], summary['A']['goals']), (3, 2, 1))
+        self.assertAlmostEqual(summary['A']['psxg'], 1.1)
+        self.assertAlmostEqual(summary['A']['xg'], 0.6)
+        self.assertEqual((summary['B']['shots'], summary['B']['shots_on_target']), (1, 0))
+        self.assertEqual(db_game_team_summary.get_game_team_summary('g2')['B']['shots_on_target'], 1)
+
+    def test_refresh_drops_removed_games(self):
+        """Test that a refresh removes rows for games whose shots are gone."""
+        db_game_team_summary.update_game_team_summary(2024)
+        self.execute('DELETE FROM game_shots WHERE game_id = ?', [('g2',)])
+        db_game_team_summary.update_game_team_summary(2024)
+        self.assertEqual(db_game_team_summary.get_game_team_summary('g2'), {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+from data import db_game_watermarks, migrations
+from unittest import mock
+import os
+import sqlite3
+import tempfile
+import unittest
+
+class TestGameWatermarks(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'test.db')
+        self.env = mock.patch.dict(os.environ, {'NWSL_DB_PATH': self.db_path})
+        self.env.start()
+        migrations.apply_migrations()
+        for game_id, kickoff in [('g1', '2024-03-16 19:00:00'), ('g2', '2024-03-17 19:00:00')]:
+            self.set_game(game_id, kickoff, '2024-03-18 10:00:00')
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def set_game(self, game_id, kickoff, last_updated_utc):
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''
+            INSERT OR REPLACE INTO games (game_id, date_time_utc, last_updated_utc, season)
+            VALUES (?, ?, ?, 2024)
+        ''', (game_id, kickoff, last_updated_utc))
+        conn.commit()
+        conn.close()
+
+    def test_new_games_changed(self):
+        """Test that games never ingested are reported in kickoff order."""
+        self.assertEqual(db_game_watermarks.get_changed_game_ids(2024), ['g1', 'g2'])
+        self.assertEqual(db_game_watermarks.get_changed_game_ids(2023), [])
+
+    def test_watermarked_games_unchanged(self):
+        """Test that ingested games drop out until their last_updated_utc moves."""
+        self.assertEqual(db_game_watermarks.set_game_watermarks(['g1', 'g2']), 2)
+        self.assertEqual(db_game_watermarks.get_changed_game_ids(2024), [])
+
+        self.set_game('g2', '2024-03-17 19:00:00', '2024-03-20 08:00:00')
+        self.set_game('g3', '2024-03-23 19:00:00', None)
+        self.assertEqual(db_game_watermarks.get_changed_game_ids(2024), ['g2', 'g3'])
+
+        db_game_watermarks.set_game_watermarks(['g2', 'g3'])
+        self.assertEqual(db_game_watermarks.get_changed_game_ids(2024), [])
+
+if __name__ == '__main__':
+    unittest.main()
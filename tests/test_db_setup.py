@@ -0,0 +1,83 @@
+import ast
+import glob
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+from data import migrations
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+# sim_cache.py keeps its own database and migrations.py only reads the schema catalogue
+SKIPPED_MODULES = {'sim_cache.py', 'migrations.py'}
+
+# (module, function) pairs allowed to scan, with the reason
+KNOWN_SCANS = {
+    # Fits stat weights over every player season, so a scan is the cheapest plan
+    ('player_xgoal_strength.py', '_get_player_xgoal_data'),
+}
+
+def render_sql(node):
+    # f-string substitutions are column names after a '.', otherwise values such as LIMIT
+    if isinstance(node, ast.Constant):
+        return node.value
+    sql = ''
+    for value in node.values:
+        if isinstance(value, ast.Constant):
+            sql += value.value
+        else:
+            sql += 'rowid' if sql.endswith('.') else '1'
+    return sql
+
+def get_select_queries():
+    """Returns (module, function, line, sql) for every SELECT with a WHERE clause in data/."""
+    queries = []
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, '*.py'))):
+        module = os.path.basename(path)
+        if module in SKIPPED_MODULES:
+            continue
+        with open(path) as f:
+            tree = ast.parse(f.read())
+        for function in ast.walk(tree):
+            if not isinstance(function, ast.FunctionDef):
+                continue
+            inner = {id(value) for node in ast.walk(function) if isinstance(node, ast.JoinedStr)
+                     for value in node.values}
+            for node in ast.walk(function):
+                if id(node) in inner or not isinstance(node, (ast.Constant, ast.JoinedStr)):
+                    continue
+                sql = render_sql(node)
+                if not isinstance(sql, str):
+                    continue
+                words = sql.upper().split()
+                if words and words[0] in ('SELECT', 'WITH') and 'FROM' in words and 'WHERE' in words:
+                    queries.append((module, function.name, node.lineno, sql))
+    return queries
+
+class TestQueryPlans(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'test.db')
+        with mock.patch.dict(os.environ, {'NWSL_DB_PATH': self.db_path}):
+            migrations.apply_migrations()
+        self.conn = sqlite3.connect(self.db_path)
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmpdir.cleanup()
+
+    def test_getters_do_not_scan(self):
+        """Test that no filtered query in data/ plans a full table scan."""
+        queries = get_select_queries()
+        self.assertGreater(len(queries), 50)
+        for module, function, line, sql in queries:
+            if (module, function) in KNOWN_SCANS:
+                continue
+            with self.subTest(query=f'{module}:{line} {function}'):
+                plan = self.conn.execute(f'EXPLAIN QUERY PLAN {sql}', [None] * sql.count('?')).fetchall()
+                scans = [row[3] for row in plan if row[3].startswith('SCAN') and 'INDEX' not in row[3]]
+                self.assertEqual(scans, [], ' '.join(sql.split()))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+from data import db_game_shots, db_team_season_summary, db_team_xgoals, migrations
+from unittest import mock
+import os
+import sqlite3
+import tempfile
+import unittest
+
+class TestTeamSeasonSummary(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'test.db')
+        self.env = mock.patch.dict(os.environ, {'NWSL_DB_PATH': self.db_path})
+        self.env.start()
+        migrations.apply_migrations()
+        # (game_id, team_id, shot_order, pattern_of_play, shot_xg, shot_psxg, goal)
+        self.insert_shots([
+            ('g1', 'A', 1, 'Regular', 0.1, 0.2, 0),
+            ('g1', 'A', 2, 'Penalty', 0.8, 0.9, 1),
+            ('g1', 'B', 3, 'Regular', 0.3, 0.0, 0),
+            ('g2', 'A', 1, 'Regular', 0.2, 0.4, 1),
+            ('g2', 'A', 2, 'Penalty', 0.8, 0.0, 0),
+        ])
+        # (team_id, count_games, xgoals_against, shots_against)
+        self.insert_team_xgoals([('A', 2, 3.0, 20), ('B', 2, 1.0, 10)])
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def insert_shots(self, shots, season=2024):
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany('''
+            INSERT INTO game_shots (game_id, team_id, shot_order, pattern_of_play, shot_xg, shot_psxg, goal, season)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', [shot + (season,) for shot in shots])
+        conn.commit()
+        conn.close()
+
+    def insert_team_xgoals(self, teams, season=2024):
+        conn = sqlite3.connect(self.db_path)
+        conn.executemany('''
+            INSERT OR REPLACE INTO team_xgoals (id, team_id, count_games, xgoals_against, shots_against, season)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', [(team[0] + str(season),) + team + (season,) for team in teams])
+        conn.commit()
+        conn.close()
+
+    def update(self):
+        db_team_season_summary.update_team_season_shot_summary(2024)
+        db_team_season_summary.update_team_season_defense_summary(2024)
+
+    def test_shot_totals(self):
+        """Test that shot counts, PSxG and penalty totals are summed per team."""
+        self.update()
+        summary = db_team_season_summary.get_team_season_summary('A', 2024)
+        self.assertEqual((summary['shots'], summary['games_with_shots'], summary['penalty_shots']), (4, 2, 2))
+        self.assertAlmostEqual(summary['psxg'], 1.5)
+        self.assertAlmostEqual(summary['penalty_xg'], 1.6)
+        self.assertAlmostEqual(summary['penalty_psxg'], 0.9)
+        self.assertEqual(summary['penalty_goals'], 1)
+        self.assertAlmostEqual(db_game_shots.get_total_psxg_by_team_and_season('A', 2024), 1.5)
+        self.assertAlmostEqual(db_game_shots.get_avg_shots_for_team('A', 2024), 2.0)
+        self.assertEqual(db_game_shots.get_avg_shots_for_team('C', 2024), 0.0)
+
+    def test_defensive_rates(self):
+        """Test that per-game rates and league averages come from team_xgoals."""
+        self.update()
+        self.assertAlmostEqual(db_team_xgoals.get_team_xga_per_game('A', 2024), 1.5)
+        self.assertAlmostEqual(db_team_xgoals.get_team_shots_against_per_game('B', 2024), 5.0)
+        self.assertAlmostEqual(db_team_xgoals.get_league_avg_xga_per_game(2024), 1.0)
+        self.assertAlmostEqual(db_team_xgoals.get_league_avg_shots_against_per_game(2024), 7.5)
+        self.assertIsNone(db_team_xgoals.get_team_xga_per_game('C', 2024))
+        self.assertIsNone(db_team_xgoals.get_league_avg_xga_per_game(2023))
+
+    def test_refresh_replaces_stale_totals(self):
+        """Test that a refresh zeroes teams whose shots were removed and follows team_xgoals changes."""
+        self.update()
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DELETE FROM game_shots WHERE team_id = 'B'")
+        conn.commit()
+        conn.close()
+        self.insert_team_xgoals([('A', 3, 3.0, 30)])
+        self.update()
+        self.assertEqual(db_team_season_summary.get_team_season_summary('B', 2024)['shots'], 0)
+        self.assertAlmostEqual(db_team_xgoals.get_team_xga_per_game('A', 2024), 1.0)
+        self.assertAlmostEqual(db_team_xgoals.get_league_avg_xga_per_game(2024), 0.8)
+
+    def test_migration_fills_existing_rows(self):
+        """Test that the migration builds summaries from rows already in the database."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('DELETE FROM team_season_summary')
+        db_team_season_summary.refresh_all_team_season_summaries(conn)
+        conn.commit()
+        conn.close()
+        summary = db_team_season_summary.get_team_season_summary('B', 2024)
+        self.assertEqual(summary['shots'], 1)
+        self.assertAlmostEqual(summary['xga_per_game'], 0.5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+from figure_cache import FigureCache
+from unittest import mock
+import os
+import tempfile
+import unittest
+
+class TestFigureCache(unittest.TestCase):
+    def setUp(self):
+        self.generation = 1
+        self.cache = FigureCache(max_entries=2, get_generation=lambda: self.generation)
+
+    def test_hit_after_miss(self):
+        """Test that a figure is built once and then served from the cache."""
+        build = mock.Mock(return_value=('{"data": []}', {'displayModeBar': False}))
+        first = self.cache.get_or_build('goals_donut', 'team1', 2024, build)
+        second = self.cache.get_or_build('goals_donut', 'team1', 2024, build)
+        self.assertEqual(first, second)
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(self.cache.get_stats(), {'entries': 1, 'hits': 1, 'misses': 1})
+
+    def test_key_includes_entity_and_season(self):
+        """Test that the same figure for another team or season is built separately."""
+        build = mock.Mock(return_value=('{}', {}))
+        self.cache.get_or_build('goals_donut', 'team1', 2024, build)
+        self.cache.get_or_build('goals_donut', 'team2', 2024, build)
+        self.cache.get_or_build('goals_donut', 'team1', 2023, build)
+        self.assertEqual(build.call_count, 3)
+
+    def test_generation_change_rebuilds(self):
+        """Test that a new data generation rebuilds the figure and drops the old one."""
+        self.cache.get_or_build('momentum', 'game1', 2024, lambda: ('old', {}))
+        self.generation = 2
+        self.assertEqual(self.cache.get_or_build('momentum', 'game1', 2024, lambda: ('new', {})), ('new', {}))
+        self.assertEqual(list(self.cache.entries), [('momentum', 'game1', 2024, 2)])
+
+    def test_figure_built_across_bump_not_stored(self):
+        """Test that a figure built while the generation moved is returned but not kept."""
+        def build():
+            self.generation = 2
+            return 'stale', {}
+        self.assertEqual(self.cache.get_or_build('momentum', 'game1', 2024, build), ('stale', {}))
+        self.assertEqual(self.cache.get_or_build('momentum', 'game1', 2024, lambda: ('fresh', {})), ('fresh', {}))
+
+    def test_missing_figure_cached(self):
+        """Test that a plot function's (None, None) result is cached like any other."""
+        build = mock.Mock(return_value=(None, None))
+        self.assertEqual(self.cache.get_or_build('home_shot_map', 'game1', 2024, build), (None, None))
+        self.assertEqual(self.cache.get_or_build('home_shot_map', 'game1', 2024, build), (None, None))
+        self.assertEqual(build.call_count, 1)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used figure is evicted past max_entries."""
+        for entity_id in ['a', 'b', 'a', 'c']:
+            self.cache.get_or_build('goals_donut', entity_id, 2024, lambda: ('{}', {}))
+        self.assertEqual([key[1] for key in self.cache.entries], ['a', 'c'])
+
+class TestPersistentFigureCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, 'figure_cache.db')
+        self.generation = 1
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _cache(self):
+        return FigureCache(db_path=self.db_path, get_generation=lambda: self.generation)
+
+    def test_survives_restart(self):
+        """Test that a figure stored by one cache is loaded by a new one without rebuilding."""
+        self._cache().get_or_build('goals_donut', 'team1', 2024, lambda: ('{"data": []}', {'responsive': True}))
+        build = mock.Mock()
+        self.assertEqual(self._cache().get_or_build('goals_donut', 'team1', 2024, build),
+                         ('{"data": []}', {'responsive': True}))
+        build.assert_not_called()
+
+    def test_stored_figure_from_old_generation_ignored(self):
+        """Test that a persisted figure from an older generation is rebuilt."""
+        self._cache().get_or_build('goals_donut', 'team1', 2024, lambda: ('old', {}))
+        self.generation = 2
+        self.assertEqual(self._cache().get_or_build('goals_donut', 'team1', 2024, lambda: ('new', {})), ('new', {}))
+
+    def test_clear_removes_stored_figures(self):
+        """Test that clear() also empties the backing table."""
+        cache = self._cache()
+        cache.get_or_build('goals_donut', 'team1', 2024, lambda: ('old', {}))
+        cache.clear()
+        self.assertEqual(self._cache().get_or_build('goals_donut', 'team1', 2024, lambda: ('new', {})), ('new', {}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+from data.shot_store import ShotStore
+from unittest import mock
+import figure_specs
+import momentum_plot
+import plots
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+# Outputs of the plotly.graph_objects implementations these figures replaced
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), 'golden')
+
+TEAM_ID = 'KPqjw8PQ6v'
+
+SHOT_RECORDS = [
+    {'game_id': 'g1', 'team_id': TEAM_ID, 'shooter_player_id': 'p1', 'pattern_of_play': 'Regular',
+     'shot_xg': 0.1234, 'shot_psxg': 0.4567, 'shot_location_x': 88.2, 'shot_location_y': 41.5,
+     'expanded_minute': 12, 'shot_order': 1, 'goal': 1},
+    {'game_id': 'g1', 'team_id': TEAM_ID, 'shooter_player_id': 'p2', 'pattern_of_play': 'Penalty',
+     'shot_xg': 0.7644, 'shot_psxg': 0.0, 'shot_location_x': 89.5, 'shot_location_y': 50.0,
+     'expanded_minute': 58, 'shot_order': 2, 'goal': 0},
+    {'game_id': 'g1', 'team_id': TEAM_ID, 'shooter_player_id': 'unknown', 'pattern_of_play': None,
+     'shot_xg': None, 'shot_psxg': None, 'shot_location_x': None, 'shot_location_y': 12.0,
+     'expanded_minute': 93, 'shot_order': 3, 'goal': 0},
+    {'game_id': 'g1', 'team_id': 'other', 'shooter_player_id': 'p3', 'pattern_of_play': 'Regular',
+     'shot_xg': 0.3, 'shot_psxg': 0.2, 'shot_location_x': 75.0, 'shot_location_y': 60.0,
+     'expanded_minute': 30, 'shot_order': 1, 'goal': 0}
+]
+PLAYERS = [{'player_id': 'p1', 'player_name': 'Player One'}, {'player_id': 'p2', 'player_name': 'Player Two'}]
+
+FLOW_ROWS = [
+    {'expanded_minute': minute, 'period_id': 1 if minute <= 47 else 2, 'home_team_value': home,
+     'away_team_value': away, 'home_abbreviation': 'CHI', 'away_abbreviation': 'NC'}
+    for minute, home, away in [(1, 0.2, 0.1), (20, 0.05, 0.3), (45, 0.4, 0.4), (48, 0.1, 0.0), (70, 0.0, 0.25), (95, 0.3, 0.1)]
+]
+
+PLAYER_STATS = {'goals': 6, 'avg_goals': 3.2, 'min_goals': 0, 'max_goals': 14,
+                'xgoals': 4.8, 'avg_xgoals': 3.0, 'min_xgoals': 0.1, 'max_xgoals': 11.5,
+                'goals_conceded': 20, 'avg_goals_conceded': 25, 'min_goals_conceded': 12, 'max_goals_conceded': 40,
+                'shots': 3, 'avg_shots': 3, 'min_shots': 3, 'max_shots': 3}
+TEAM_STRENGTH = {'xgoal_difference': 5.123, 'goal_difference': -2.0, 'points_per_game': 1.6667}
+
+def get_figure_builders():
+    """Returns each golden figure's name and a function that builds it."""
+    store = ShotStore.from_records(2024, SHOT_RECORDS)
+
+    def momentum():
+        with mock.patch.object(momentum_plot.db_game_flow, 'get_game_flow_by_game_id', return_value=FLOW_ROWS):
+            return momentum_plot.generate_momentum_plot('g1')
+
+    return {
+        'deviation_chart': lambda: plots.plot_deviation_from_average_chart(
+            ['goals', 'xgoals', 'goals_conceded', 'shots'], PLAYER_STATS),
+        'team_strength_donut_low': lambda: plots.plot_team_strength_donut(-5),
+        'team_strength_donut_mid': lambda: plots.plot_team_strength_donut(50),
+        'team_strength_donut_high': lambda: plots.plot_team_strength_donut(87),
+        'team_results_donut': lambda: plots.get_donut_plot_for_team_results(10, 5, 3, 33),
+        'goals_donut': lambda: plots.get_donut_plot_for_goals(30, 21),
+        'pass_completion_donut': lambda: plots.get_donut_plot_for_pass_completion(81.4),
+        'team_strength_bar': lambda: plots.plot_bar_chart(
+            ['xgoal_difference', 'goal_difference', 'points_per_game', 'missing'], TEAM_STRENGTH),
+        'shot_marker_plot': lambda: plots.generate_shot_marker_plot('g1', {}, PLAYERS, store, TEAM_ID, 'CHI'),
+        'shot_marker_plot_default_style': lambda: plots.generate_shot_marker_plot('g1', {}, {}, store, 'other', 'OTH'),
+        'momentum_plot': momentum
+    }
+
+def load_golden(name):
+    with open(os.path.join(GOLDEN_DIR, f'{name}.json')) as file:
+        return json.load(file)
+
+class TestFigureSpecs(unittest.TestCase):
+    def test_trace_drops_none(self):
+        """Test that trace properties set to None are left out and the type comes last."""
+        self.assertEqual(list(figure_specs.trace('pie', values=[1, 2], hovertemplate=None, sort=False)),
+                         ['values', 'sort', 'type'])
+
+    def test_figure_embeds_template(self):
+        """Test that a figure's layout starts with the named template from the plotly package."""
+        fig = figure_specs.figure([], {'height': 250}, template='plotly_white')
+        self.assertEqual(list(fig['layout']), ['template', 'height'])
+        self.assertIs(fig['layout']['template'], figure_specs.get_template('plotly_white'))
+        self.assertIn('layout', fig['layout']['template'])
+
+    def test_non_finite_values_serialised_as_null(self):
+        """Test that NaN and infinite trace values become null instead of invalid JSON."""
+        fig = figure_specs.figure([figure_specs.trace('scatter', x=[1.0, float('nan')], y=(float('inf'), 2))], {})
+        self.assertEqual(json.loads(figure_specs.to_json(fig))['data'][0], {'x': [1.0, None], 'y': [None, 2], 'type': 'scatter'})
+
+    def test_plotly_not_imported(self):
+        """Test that building figures does not import plotly or matplotlib."""
+        code = ('import sys, plots, momentum_plot; plots.get_donut_plot_for_goals(1, 2); '
+                'print(sorted(m for m in sys.modules if m.split(".")[0] in ("plotly", "matplotlib")))')
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        self.assertEqual(result.stdout.strip().splitlines()[-1], '[]')
+
+class TestFigureGoldens(unittest.TestCase):
+    def test_figures_match_plotly_output(self):
+        """Test that every figure decodes to the same JSON as the Plotly implementation produced."""
+        for name, build in get_figure_builders().items():
+            with self.subTest(figure=name):
+                fig_json, config = build()
+                golden = load_golden(name)
+                self.assertEqual(json.loads(fig_json), golden['figure'])
+                self.assertEqual(config, golden['config'])
+
+    def test_no_shots(self):
+        """Test that a team without shots in the game gets no shot map."""
+        store = ShotStore.from_records(2024, SHOT_RECORDS)
+        self.assertEqual(plots.generate_shot_marker_plot('g1', {}, PLAYERS, store, 'absent', 'ABS'), (None, None))
@@ -0,0 +1,231 @@
+from datetime import datetime
+from page_cache import PageCache
+from unittest import mock
+import flask_app
+import page_cache
+import unittest
+
+class TestSeasonPage(unittest.TestCase):
+    def setUp(self):
+        flask_app.app.secret_key = flask_app.app.secret_key or 'test'
+        self.client = flask_app.app.test_client()
+        self.year = datetime.now().year
+
+    def test_redirect_to_selected_season(self):
+        """Test that a GET without a season redirects to the session's season, keeping the query."""
+        with self.client.session_transaction() as session:
+            session['season'] = flask_app.FIRST_SEASON
+        response = self.client.get('/players?sort=goals')
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers['Location'], f'/{flask_app.FIRST_SEASON}/players?sort=goals')
+
+    def test_redirect_with_colliding_query_args(self):
+        """Test that query arguments named like the season or a path argument do not break the redirect."""
+        response = self.client.get('/players?season=2024')
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers['Location'], f'/{self.year}/players')
+
+        response = self.client.get('/team/abc?team_id=xyz&season=2024')
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.headers['Location'], f'/{self.year}/team/abc')
+
+    def test_season_out_of_range(self):
+        """Test that a season outside the data's range is a 404."""
+        self.assertEqual(self.client.get(f'/{flask_app.FIRST_SEASON - 1}/players').status_code, 404)
+        self.assertEqual(self.client.get(f'/{self.year + 1}/players').status_code, 404)
+
+    def test_route_metadata_kept(self):
+        """Test that season pages stay registered under their view names."""
+        self.assertEqual(flask_app.players.__name__, 'players')
+        self.assertIs(flask_app.app.view_functions['players'], flask_app.players)
+
+class TestCacheHeaders(unittest.TestCase):
+    def setUp(self):
+        self.patches = [mock.patch.object(flask_app, 'load_blog_posts', return_value=[]),
+                        mock.patch.object(page_cache, 'get_data_generation', lambda: 1),
+                        mock.patch.object(page_cache, 'get_data_updated_at', lambda: None)]
+        for patch in self.patches:
+            patch.start()
+        self.client = flask_app.app.test_client()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def test_blog_revalidates(self):
+        """Test that the blog is a season page with an ETag and public caching instead of no-store."""
+        self.assertEqual(self.client.get('/blog').headers['Location'], f'/{datetime.now().year}/blog')
+        response = self.client.get(f'/{datetime.now().year}/blog')
+        self.assertEqual(response.headers['Cache-Control'], f'public, max-age={page_cache.CURRENT_SEASON_MAX_AGE}')
+        response = self.client.get(f'/{datetime.now().year}/blog', headers={'If-None-Match': response.headers['ETag']})
+        self.assertEqual(response.status_code, 304)
+
+    def test_job_status_not_stored(self):
+        """Test that per-job status responses stay no-store while the job runs."""
+        with mock.patch.object(flask_app.sim_jobs, 'SIMULATION_JOBS') as jobs:
+            jobs.get_status.return_value = {'status': 'running'}
+            response = self.client.get('/simulation_jobs/abc')
+        self.assertIn('no-store', response.headers['Cache-Control'])
+
+class TestSeasonProjectionView(unittest.TestCase):
+    def setUp(self):
+        self.projections = []
+        test = self
+
+        class FakeProjection:
+            def __init__(self, season, home_advantage, away_advantage):
+                self.fixtures = [{}] * 3
+
+            def run_projections(self, n, seed=None, workers=None):
+                test.projections.append((n, seed, workers))
+
+            def get_table(self):
+                return []
+
+        self.patches = [mock.patch.object(flask_app.season_projection, 'SeasonProjection', FakeProjection),
+                        mock.patch.object(flask_app, 'PAGE_CACHE', PageCache(get_generation=lambda: 1)),
+                        mock.patch.object(page_cache, 'get_data_generation', lambda: 1),
+                        mock.patch.object(page_cache, 'get_data_updated_at', lambda: None)]
+        for patch in self.patches:
+            patch.start()
+        self.client = flask_app.app.test_client()
+        self.url = f'/{datetime.now().year}/season_projection'
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def test_num_sims_clamped_and_run_serially(self):
+        """Test that num_sims is capped at MAX_PROJECTIONS and projected in-process."""
+        self.assertEqual(self.client.get(f'{self.url}?num_sims=10000000').status_code, 200)
+        self.assertEqual(self.projections, [(flask_app.season_projection.MAX_PROJECTIONS, 0, None)])
+
+    def test_invalid_parameters_rejected(self):
+        """Test that non-positive or malformed parameters are a 400 without projecting."""
+        for query in ['num_sims=0', 'num_sims=-5', 'num_sims=abc', 'home_advantage=nan', 'away_advantage=-1']:
+            with self.subTest(query=query):
+                self.assertEqual(self.client.get(f'{self.url}?{query}').status_code, 400)
+        self.assertEqual(self.projections, [])
+
+    def test_table_cached(self):
+        """Test that repeated requests with equivalent parameters reuse one projection."""
+        self.client.get(f'{self.url}?num_sims=500')
+        self.client.get(f'{self.url}?num_sims=500&home_advantage=1.050')
+        self.client.get(f'{self.url}?num_sims=600')
+        self.assertEqual([n for n, _, _ in self.projections], [500, 600])
+
+class TestSimulationJobsView(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(flask_app.sim_jobs, 'SIMULATION_JOBS')
+        self.jobs = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.jobs.submit.return_value = 'abc'
+        self.client = flask_app.app.test_client()
+        self.url = f'/{datetime.now().year}/simulation_jobs'
+
+    def test_num_sims_clamped(self):
+        """Test that a job's num_sims is capped at MAX_SIMULATIONS."""
+        response = self.client.post(self.url, data={'home_team': 'h', 'away_team': 'a', 'num_sims': '10000000000'})
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.get_json()['job_id'], 'abc')
+        self.assertEqual(self.jobs.submit.call_args.kwargs['n_simulations'], flask_app.sim_jobs.MAX_SIMULATIONS)
+
+    def test_invalid_parameters_rejected(self):
+        """Test that missing, non-positive or malformed parameters are a 400 without submitting."""
+        for data in [{}, {'num_sims': '0'}, {'num_sims': 'abc'}, {'num_sims': '10', 'home_advantage': 'inf'},
+                     {'num_sims': '10', 'tolerance': '-0.01'}]:
+            with self.subTest(data=data):
+                self.assertEqual(self.client.post(self.url, data=data).status_code, 400)
+        self.jobs.submit.assert_not_called()
+
+    def test_full_queue_rejected(self):
+        """Test that a submission is a 503 once the job queue is full."""
+        self.jobs.submit.return_value = None
+        self.assertEqual(self.client.post(self.url, data={'num_sims': '1000'}).status_code, 503)
+
+class TestSimulationSweepView(unittest.TestCase):
+    def setUp(self):
+        self.sweeps = []
+        test = self
+
+        class FakeSweep:
+            def __init__(self, scenarios, **kwargs):
+                self.scenarios = scenarios
+
+            def run_sweep(self, n, seed=None):
+                test.sweeps.append((self.scenarios, n, seed))
+
+            def get_results(self):
+                return {}
+
+        self.patches = [mock.patch.object(flask_app.sim_sweep, 'ExclusionSweep', FakeSweep),
+                        mock.patch.object(flask_app.sim_context, 'get_simulation_context'),
+                        mock.patch.object(flask_app.sim_sweep, 'get_shooter_scenarios',
+                                          side_effect=lambda context, team_ids, excluded, limit: [[str(limit)]])]
+        for patch in self.patches:
+            patch.start()
+        self.client = flask_app.app.test_client()
+        self.url = f'/{datetime.now().year}/simulation_sweep'
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def test_sweep_size_clamped(self):
+        """Test that num_sims, posted scenarios and max_shooters are capped by the sim_sweep limits."""
+        scenarios = [f'p{i}' for i in range(flask_app.sim_sweep.MAX_SCENARIOS + 10)]
+        self.assertEqual(self.client.post(self.url, data={'num_sims': '10000000', 'scenario': scenarios}).status_code, 200)
+        self.assertEqual(self.client.post(self.url, data={'max_shooters': '1000'}).status_code, 200)
+        self.assertEqual(self.client.post(self.url, data={'max_shooters': '3', 'seed': '5'}).status_code, 200)
+
+        (posted, n, _), (shooters, default_n, _), (few_shooters, _, seed) = self.sweeps
+        self.assertEqual(n, flask_app.sim_sweep.MAX_SWEEP_SIMULATIONS)
+        self.assertEqual(len(posted), flask_app.sim_sweep.MAX_SCENARIOS)
+        self.assertEqual(default_n, flask_app.sim_sweep.DEFAULT_SWEEP_SIMULATIONS)
+        self.assertEqual(shooters, [[str(flask_app.sim_sweep.MAX_SCENARIOS // 2)]])
+        self.assertEqual((few_shooters, seed), ([['3']], 5))
+
+    def test_invalid_parameters_rejected(self):
+        """Test that malformed or non-positive sweep parameters are a 400 without sweeping."""
+        for data in [{'num_sims': 'abc'}, {'num_sims': '0'}, {'home_advantage': 'x'}, {'max_shooters': 'x'},
+                     {'max_shooters': '0'}, {'seed': '1.5'}, {'seed': '-1'}]:
+            with self.subTest(data=data):
+                self.assertEqual(self.client.post(self.url, data=data).status_code, 400)
+        self.assertEqual(self.sweeps, [])
+
+class TestSimulationResultsView(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(flask_app.sim_cache, 'run_cached_simulation')
+        self.run = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = flask_app.app.test_client()
+        self.url = f'/{datetime.now().year}/simulation_results'
+
+    def test_num_sims_clamped(self):
+        """Test that num_sims is capped at MAX_SIMULATIONS before simulating."""
+        # Stop before rendering; only the arguments matter here
+        self.run.side_effect = lambda **kwargs: flask_app.abort(418)
+        response = self.client.post(self.url, data={'home_team': 'h', 'away_team': 'a', 'num_sims': '100000000'})
+        self.assertEqual(response.status_code, 418)
+        self.assertEqual(self.run.call_args.kwargs['n_simulations'], flask_app.sim_cache.MAX_SIMULATIONS)
+
+    def test_exact_mode_skips_simulation(self):
+        """Test that mode=exact renders exact probabilities without num_sims or simulating."""
+        with mock.patch.object(flask_app.sim_cache, 'get_exact_results', side_effect=lambda **kwargs: flask_app.abort(418)) as exact:
+            response = self.client.post(self.url, data={'home_team': 'h', 'away_team': 'a', 'mode': 'exact'})
+        self.assertEqual(response.status_code, 418)
+        self.assertEqual(exact.call_args.kwargs['home_advantage'], 1.05)
+        self.run.assert_not_called()
+        self.assertEqual(self.client.post(self.url, data={'mode': 'exact', 'away_advantage': '-1'}).status_code, 400)
+
+    def test_invalid_parameters_rejected(self):
+        """Test that a GET without a form, or non-positive or malformed parameters, are a 400 without simulating."""
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        for data in [{'num_sims': '0'}, {'num_sims': '1e6'}, {'num_sims': '10', 'away_advantage': '0'},
+                     {'num_sims': '10', 'tolerance': 'nan'}]:
+            with self.subTest(data=data):
+                self.assertEqual(self.client.post(self.url, data=data).status_code, 400)
+        self.run.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
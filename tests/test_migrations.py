@@ -0,0 +1,80 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest import mock
+from data import data_util, db_setup, migrations
+
+class TestMigrations(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, 'test.db')
+        self.conn = data_util.get_write_connection(self.db_path)
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmpdir.cleanup()
+
+    def get_index_names(self):
+        return {row[0] for row in self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+
+    def get_columns(self, table):
+        return {row[1] for row in self.conn.execute(f'PRAGMA table_info({table})')}
+
+    def test_new_database(self):
+        """Test that a new database gets every migration, recorded in order."""
+        applied = migrations.apply_migrations(conn=self.conn)
+        self.assertEqual(applied, [version for version, _, _ in migrations.MIGRATIONS])
+        self.assertEqual(migrations.get_schema_version(self.conn), migrations.get_latest_version())
+        self.assertTrue(all(status['applied_at'] for status in migrations.get_migration_status(self.conn)))
+        self.assertTrue({statement.split()[5] for statement in db_setup.INDEXES} <= self.get_index_names())
+        self.assertIn('season', self.get_columns('team_goals_added'))
+
+    def test_rerun_is_noop(self):
+        """Test that applying migrations to a current database changes nothing."""
+        migrations.apply_migrations(conn=self.conn)
+        self.assertEqual(migrations.apply_migrations(conn=self.conn), [])
+
+    def test_target_version(self):
+        """Test that a target stops early, later runs continue from it and downgrades are refused."""
+        self.assertEqual(migrations.apply_migrations(target=1, conn=self.conn), [1])
+        self.assertNotIn('idx_games_season_date', self.get_index_names())
+        self.assertEqual(migrations.apply_migrations(conn=self.conn)[0], 2)
+        with self.assertRaises(ValueError):
+            migrations.apply_migrations(target=1, conn=self.conn)
+        with self.assertRaises(ValueError):
+            migrations.apply_migrations(target=999, conn=self.conn)
+
+    def test_adopts_unversioned_database(self):
+        """Test that a database built by create_tables keeps its data and only gets the newer migrations."""
+        db_setup.create_tables(self.conn)
+        self.conn.execute("INSERT INTO team_goals_added (id, team_id) VALUES ('A2024', 'A')")
+        self.conn.commit()
+
+        self.assertEqual(migrations.apply_migrations(conn=self.conn), list(range(2, migrations.get_latest_version() + 1)))
+        row = self.conn.execute('SELECT team_id, season FROM team_goals_added').fetchone()
+        self.assertEqual(tuple(row), ('A', 2024))
+
+    def test_adopts_indexed_database(self):
+        """Test that a database from the earlier user_version index step skips the index migration."""
+        db_setup.create_tables(self.conn)
+        self.conn.execute('PRAGMA user_version = 1')
+        self.conn.commit()
+        self.assertEqual(migrations.apply_migrations(conn=self.conn), list(range(3, migrations.get_latest_version() + 1)))
+
+    def test_failed_migration_rolls_back(self):
+        """Test that a failing migration leaves neither its changes nor its version row behind."""
+        def broken(conn):
+            conn.execute('CREATE TABLE half_done (id INTEGER)')
+            raise sqlite3.OperationalError('boom')
+
+        failing = migrations.MIGRATIONS + [(99, 'Broken', broken)]
+        migrations.apply_migrations(conn=self.conn)
+        with mock.patch.object(migrations, 'MIGRATIONS', failing):
+            with self.assertRaises(sqlite3.OperationalError):
+                migrations.apply_migrations(conn=self.conn)
+        self.assertEqual(migrations.get_schema_version(self.conn), migrations.get_latest_version())
+        self.assertEqual(self.conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'half_done'").fetchone()[0], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+from flask import Flask, render_template_string
+from page_cache import PageCache, cached_page, conditional
+from datetime import datetime, timezone
+from unittest import mock
+import page_cache
+import unittest
+
+class TestPageCache(unittest.TestCase):
+    def setUp(self):
+        self.generation = 1
+        self.cache = PageCache(max_entries=2, get_generation=lambda: self.generation)
+
+    def test_hit_after_miss(self):
+        """Test that a value is built once and then served from the cache."""
+        build = mock.Mock(return_value='page')
+        self.assertEqual(self.cache.get_or_set('a', build), 'page')
+        self.assertEqual(self.cache.get_or_set('a', build), 'page')
+        self.assertEqual(build.call_count, 1)
+        self.assertEqual(self.cache.get_stats()['hits'], 1)
+
+    def test_generation_change_clears(self):
+        """Test that bumping the data generation drops every entry."""
+        self.cache.get_or_set('a', lambda: 'old')
+        self.generation = 2
+        self.assertEqual(self.cache.get_or_set('a', lambda: 'new'), 'new')
+        self.assertEqual(self.cache.get_stats()['generation'], 2)
+
+    def test_value_built_across_bump_not_stored(self):
+        """Test that a value built while the generation moved is returned but not kept."""
+        def build():
+            self.generation = 2
+            return 'stale'
+        self.assertEqual(self.cache.get_or_set('a', build), 'stale')
+        self.assertEqual(self.cache.get_or_set('a', lambda: 'fresh'), 'fresh')
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted past max_entries."""
+        for key in ['a', 'b', 'a', 'c']:
+            self.cache.get_or_set(key, lambda: key)
+        self.assertEqual(list(self.cache.entries), ['a', 'c'])
+
+class TestCachedPage(unittest.TestCase):
+    def setUp(self):
+        self.generation = 1
+        self.renders = []
+        self.cache = PageCache(get_generation=lambda: self.generation)
+        self.patch = mock.patch.object(page_cache, 'PAGE_CACHE', self.cache)
+        self.patch.start()
+
+        app = Flask(__name__)
+        app.secret_key = 'test'
+
+        @app.route('/<int:season>/teams', methods=['GET', 'POST'])
+        @cached_page
+        def teams(season):
+            self.renders.append('teams')
+            return render_template_string("{{ season }}:{{ count }}", season=season, count=len(self.renders))
+
+        self.client = app.test_client()
+
+    def tearDown(self):
+        self.patch.stop()
+
+    def test_page_served_from_cache(self):
+        """Test that repeat GETs render once and POSTs always render."""
+        self.assertEqual(self.client.get('/2025/teams').text, '2025:1')
+        self.assertEqual(self.client.get('/2025/teams').text, '2025:1')
+        self.client.post('/2025/teams')
+        self.assertEqual(self.renders, ['teams', 'teams'])
+
+    def test_keyed_by_path_and_query(self):
+        """Test that the season in the path and the query string are part of the page key."""
+        self.client.get('/2025/teams')
+        self.client.get('/2025/teams?sort=points')
+        self.assertEqual(self.client.get('/2024/teams').text, '2024:3')
+        self.assertEqual(len(self.renders), 3)
+
+    def test_bump_rerenders(self):
+        """Test that a new data generation renders the page again."""
+        self.client.get('/2025/teams')
+        self.generation = 2
+        self.assertEqual(self.client.get('/2025/teams').text, '2025:2')
+
+class TestConditional(unittest.TestCase):
+    def setUp(self):
+        self.generation = 1
+        self.renders = 0
+        self.patches = [mock.patch.object(page_cache, 'get_data_generation', lambda: self.generation),
+                        mock.patch.object(page_cache, 'get_data_updated_at',
+                                          lambda: datetime(2030, 1, 1, tzinfo=timezone.utc))]
+        for patch in self.patches:
+            patch.start()
+
+        app = Flask(__name__)
+        app.secret_key = 'test'
+
+        @app.route('/<int:season>/teams', methods=['GET', 'POST'])
+        @conditional
+        def teams(season):
+            self.renders += 1
+            return f'teams {season}'
+
+        self.client = app.test_client()
+        self.current = f'/{datetime.now().year}/teams'
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+
+    def test_not_modified_without_rendering(self):
+        """Test that a matching If-None-Match gets an empty 304 and skips the view."""
+        first = self.client.get(self.current)
+        self.assertEqual(first.status_code, 200)
+        response = self.client.get(self.current, headers={'If-None-Match': first.headers['ETag']})
+        self.assertEqual((response.status_code, response.data), (304, b''))
+        self.assertEqual(response.headers['ETag'], first.headers['ETag'])
+        self.assertEqual(self.renders, 1)
+
+    def test_etag_changes_with_generation_season_and_query(self):
+        """Test that a data bump, another season or another query string gives a new ETag."""
+        etags = {self.client.get(self.current).headers['ETag'],
+                 self.client.get(self.current + '?sort=points').headers['ETag'],
+                 self.client.get('/2019/teams').headers['ETag']}
+        self.generation = 2
+        etags.add(self.client.get(self.current).headers['ETag'])
+        self.assertEqual(len(etags), 4)
+
+    def test_if_modified_since_alone_renders(self):
+        """Test that Last-Modified is the last data update but If-Modified-Since alone never gets a 304."""
+        last_modified = self.client.get(self.current).headers['Last-Modified']
+        self.assertEqual(last_modified, 'Tue, 01 Jan 2030 00:00:00 GMT')
+        response = self.client.get(self.current, headers={'If-Modified-Since': last_modified})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.renders, 2)
+
+    def test_etag_stable_across_workers_and_changes_with_build(self):
+        """Test that the ETag depends on the build version, not on when the process started."""
+        etag = self.client.get(self.current).headers['ETag']
+        with mock.patch.dict('os.environ', {'BUILD_VERSION': 'abc'}):
+            self.assertEqual(page_cache.get_build_version(), 'abc')
+        self.assertEqual(page_cache.get_build_version(), page_cache.BUILD_VERSION)
+        with mock.patch.object(page_cache, 'BUILD_VERSION', 'next-release'):
+            self.assertNotEqual(self.client.get(self.current).headers['ETag'], etag)
+
+    def test_no_last_modified_before_first_update(self):
+        """Test that a database never updated sends no Last-Modified."""
+        with mock.patch.object(page_cache, 'get_data_updated_at', lambda: None):
+            self.assertNotIn('Last-Modified', self.client.get(self.current).headers)
+
+    def test_cache_control_by_season(self):
+        """Test that pages are publicly cacheable, past seasons for longer than the current one."""
+        current = self.client.get(self.current)
+        self.assertEqual(current.headers['Cache-Control'], f'public, max-age={page_cache.CURRENT_SEASON_MAX_AGE}')
+        self.assertNotIn('Vary', current.headers)
+        archive = self.client.get('/2019/teams')
+        self.assertEqual(archive.headers['Cache-Control'], f'public, max-age={page_cache.ARCHIVE_MAX_AGE}')
+
+    def test_post_passes_through(self):
+        """Test that a POST is rendered and gets no validators."""
+        response = self.client.post(self.current)
+        self.assertNotIn('ETag', response.headers)
+        self.assertEqual(self.renders, 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,170 @@
+from data import data_util, ingest, pipeline
+from unittest import mock
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+
+class TestPipeline(unittest.TestCase):
+    def setUp(self):
+        self.log = []
+        self.lock = threading.Lock()
+
+    def record(self, name, delay=0, result=None):
+        def step():
+            with self.lock:
+                self.log.append(('start', name))
+            time.sleep(delay)
+            with self.lock:
+                self.log.append(('end', name))
+            return result
+        return step
+
+    def run_quietly(self, runner):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return runner.run()
+
+    def position(self, event, name):
+        return self.log.index((event, name))
+
+    def test_dependencies_ordered_and_independent_steps_overlap(self):
+        """Test that readers wait for writers while unrelated steps run at the same time."""
+        runner = pipeline.Pipeline(max_workers=4)
+        runner.add('games', self.record('games', 0.05), 2024, outputs=['games'])
+        runner.add('player_xpass', self.record('player_xpass', 0.05), 2024, outputs=['player_xpass'])
+        runner.add('shots', self.record('shots'), 2024, inputs=['games'], outputs=['game_shots'])
+        self.run_quietly(runner)
+
+        self.assertLess(self.position('end', 'games'), self.position('start', 'shots'))
+        self.assertLess(self.position('start', 'player_xpass'), self.position('end', 'games'))
+        self.assertEqual({step.status for step in runner.steps}, {'done'})
+
+    def test_writers_follow_declaration_order(self):
+        """Test that two writers of a table run one after the other, in the order they were added."""
+        runner = pipeline.Pipeline(max_workers=4)
+        runner.add('insert', self.record('insert', 0.02), 2024, outputs=['player_xgoals'])
+        runner.add('strength', self.record('strength'), 2024, inputs=['player_xpass'], outputs=['player_xgoals'])
+        self.run_quietly(runner)
+        self.assertLess(self.position('end', 'insert'), self.position('start', 'strength'))
+
+    def test_seasons_pipelined(self):
+        """Test that the same step for different seasons is independent, but waits for reference steps."""
+        runner = pipeline.Pipeline(max_workers=4)
+        runner.add('player_info', self.record('player_info'), outputs=['player_info'])
+        for season in (2023, 2024):
+            runner.add('strength', self.record(f'strength{season}', 0.05), season,
+                       inputs=['player_info'], outputs=['player_xgoals'])
+        self.assertEqual([step.key for step in runner.get_step('strength', 2024).dependencies], ['player_info'])
+        self.run_quietly(runner)
+        self.assertLess(self.position('start', 'strength2024'), self.position('end', 'strength2023'))
+
+    def test_unchanged_skips_season_dependents(self):
+        """Test that an unchanged head step skips the season's dependents but not reference steps."""
+        runner = pipeline.Pipeline()
+        runner.add('player_info', self.record('player_info'), outputs=['player_info'])
+        runner.add('games', self.record('games', result=pipeline.UNCHANGED), 2024, outputs=['games'])
+        runner.add('xgoals', self.record('xgoals'), 2024, inputs=['games'], outputs=['player_xgoals'])
+        runner.add('strength', self.record('strength'), 2024, inputs=['player_xgoals', 'player_info'],
+                   outputs=['player_xgoals'])
+        self.run_quietly(runner)
+        self.assertEqual([step.status for step in runner.steps], ['done', 'unchanged', 'skipped', 'skipped'])
+
+    def test_failure_skips_dependents_only(self):
+        """Test that a failed step skips its dependents, lets other steps finish and fails the run."""
+        def broken():
+            raise ValueError('boom')
+
+        runner = pipeline.Pipeline()
+        runner.add('games', broken, 2024, outputs=['games'])
+        runner.add('shots', self.record('shots'), 2024, inputs=['games'], outputs=['game_shots'])
+        runner.add('goals', self.record('goals'), 2024, inputs=['game_shots'], outputs=['game_goals'])
+        runner.add('teams', self.record('teams'), outputs=['team_info'])
+        with self.assertRaises(RuntimeError):
+            self.run_quietly(runner)
+        self.assertEqual([step.status for step in runner.steps], ['failed', 'skipped', 'skipped', 'done'])
+
+    def test_no_bump_when_nothing_changed(self):
+        """Test that the data generation step runs only when a step before it changed data."""
+        for reference_result, expected in [(pipeline.UNCHANGED, 'skipped'), (None, 'done')]:
+            runner = pipeline.Pipeline()
+            runner.add('player_info', self.record('player_info', result=reference_result), outputs=['player_info'])
+            runner.add('games', self.record('games', result=pipeline.UNCHANGED), 2024, outputs=['games'])
+            runner.add('xgoals', self.record('xgoals'), 2024, inputs=['games'], outputs=['player_xgoals'])
+            runner.add('data_generation', self.record('data_generation'),
+                       inputs=['player_info', 'games', 'player_xgoals'], outputs=['data_generation'])
+            self.run_quietly(runner)
+            self.assertEqual(runner.get_step('data_generation').status, expected)
+
+    def test_duplicate_step(self):
+        """Test that adding the same step twice for a season is refused."""
+        runner = pipeline.Pipeline()
+        runner.add('games', self.record('games'), 2024)
+        with self.assertRaises(ValueError):
+            runner.add('games', self.record('games'), 2024)
+
+class TestIngestPipeline(unittest.TestCase):
+    def test_shot_readers_follow_game_shots(self):
+        """Test that the shot summary and player strength steps run after the season's shots are loaded."""
+        runner = ingest.build_pipeline([2024, 2025])
+        for name in ('team_season_shot_summary', 'midfielder_strength', 'attacker_strength', 'defender_strength'):
+            with self.subTest(step=name):
+                dependencies = [step.key for step in runner.get_step(name, 2024).dependencies]
+                self.assertIn('game_shots[2024]', dependencies)
+                self.assertNotIn('game_shots[2025]', dependencies)
+
+    def test_team_summary_around_team_xgoals(self):
+        """Test that team xgoals reads the shot summary and the defensive summary follows team xgoals."""
+        runner = ingest.build_pipeline([2024])
+        team_xgoals = [step.key for step in runner.get_step('team_xgoals', 2024).dependencies]
+        self.assertIn('team_season_shot_summary[2024]', team_xgoals)
+        defense = [step.key for step in runner.get_step('team_season_defense_summary', 2024).dependencies]
+        self.assertIn('team_xgoals[2024]', defense)
+
+    def test_watermarks_last(self):
+        """Test that a season's watermarks wait for every other step of that season."""
+        runner = ingest.build_pipeline([2024])
+        season_steps = {step.key for step in runner.steps if step.season == 2024} - {'game_watermarks[2024]'}
+        dependencies = {step.key for step in runner.get_step('game_watermarks', 2024).dependencies}
+        self.assertEqual(dependencies, season_steps)
+
+    def test_data_generation_last(self):
+        """Test that the data generation is bumped once, after every other step."""
+        runner = ingest.build_pipeline([2024, 2025])
+        dependencies = {step.key for step in runner.get_step('data_generation').dependencies}
+        self.assertEqual(dependencies, {step.key for step in runner.steps} - {'data_generation'})
+
+class TestReportChanges(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = mock.patch.dict(os.environ, {'NWSL_DB_PATH': os.path.join(self.tmpdir.name, 'test.db')})
+        self.env.start()
+        self.write([('a', 'Alice'), ('b', 'Bea')])
+
+    def tearDown(self):
+        data_util.close_read_connections()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def write(self, rows):
+        conn = sqlite3.connect(os.environ['NWSL_DB_PATH'])
+        conn.execute('CREATE TABLE IF NOT EXISTS team_info (team_id TEXT PRIMARY KEY, team_name TEXT)')
+        conn.executemany('INSERT OR REPLACE INTO team_info VALUES (?, ?)', rows)
+        conn.commit()
+        conn.close()
+
+    def test_rewrite_with_same_rows_unchanged(self):
+        """Test that replacing rows with identical ones, in another order, reports UNCHANGED."""
+        step = ingest.report_changes(lambda: self.write([('b', 'Bea'), ('a', 'Alice')]), ['team_info'])
+        self.assertIs(step(), pipeline.UNCHANGED)
+
+    def test_changed_rows_reported(self):
+        """Test that a step that changes a row returns its own result."""
+        step = ingest.report_changes(lambda: self.write([('b', 'Beatrice')]), ['team_info'])
+        self.assertIsNone(step())
+
+if __name__ == '__main__':
+    unittest.main()
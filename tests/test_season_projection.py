@@ -0,0 +1,66 @@
+from data import season_projection
+from tests.test_sim import build_context, HOME_ID, AWAY_ID, SEASON
+import numpy as np
+import unittest
+
+PLAYED = [
+    {'home_team_id': HOME_ID, 'away_team_id': AWAY_ID, 'home_score': 2, 'away_score': 0},
+    {'home_team_id': AWAY_ID, 'away_team_id': HOME_ID, 'home_score': 1, 'away_score': 1}
+]
+UNPLAYED = [
+    {'game_id': 'g3', 'home_team_id': HOME_ID, 'away_team_id': AWAY_ID},
+    {'game_id': 'g4', 'home_team_id': AWAY_ID, 'away_team_id': HOME_ID}
+]
+
+def build_projection(played=PLAYED, unplayed=UNPLAYED):
+    return season_projection.SeasonProjection(SEASON, context=build_context(), played_games=played, unplayed_games=unplayed)
+
+class TestSeasonProjection(unittest.TestCase):
+    def test_current_table(self):
+        """Test that points and goals are tallied from completed games."""
+        projection = build_projection()
+        home = projection.team_ids.index(HOME_ID)
+        away = projection.team_ids.index(AWAY_ID)
+        self.assertEqual(projection.current_points[[home, away]].tolist(), [4, 1])
+        self.assertEqual(projection.current_goals_for[[home, away]].tolist(), [3, 1])
+        self.assertEqual(projection.current_goals_against[[home, away]].tolist(), [1, 3])
+
+    def test_positions_are_probabilities(self):
+        """Test that every team finishes somewhere and every position is filled once per season."""
+        n = 3000
+        projection = build_projection()
+        projection.run_projections(n, seed=3)
+        self.assertTrue(np.array_equal(projection.position_counts.sum(axis=0), [n, n]))
+        self.assertTrue(np.array_equal(projection.position_counts.sum(axis=1), [n, n]))
+        for row in projection.get_table():
+            self.assertAlmostEqual(sum(row['position_probs']), 1.0)
+            self.assertEqual(row['remaining'], 2)
+            self.assertGreaterEqual(row['expected_points'], row['points'])
+            self.assertLessEqual(row['expected_points'], row['points'] + 6)
+
+    def test_no_remaining_games(self):
+        """Test that a finished season projects the current table with certainty."""
+        projection = build_projection(unplayed=[])
+        projection.run_projections(100, seed=1)
+        table = projection.get_table()
+        self.assertEqual(table[0]['team_id'], HOME_ID)
+        self.assertEqual(table[0]['position_probs'], [1.0, 0.0])
+        self.assertEqual(table[0]['expected_points'], 4)
+
+    def test_parallel_is_reproducible(self):
+        """Test that the same (seed, n, workers) give identical projections."""
+        first = build_projection()
+        first.run_projections(2000, seed=11, workers=2)
+        second = build_projection()
+        second.run_projections(2000, seed=11, workers=2)
+        self.assertTrue(np.array_equal(first.position_counts, second.position_counts))
+        self.assertTrue(np.array_equal(first.points_totals, second.points_totals))
+
+    def test_match_points(self):
+        """Test the points awarded for wins, draws and losses."""
+        self.assertEqual(season_projection.get_match_points(2, 1), (3, 0))
+        self.assertEqual(season_projection.get_match_points(0, 1), (0, 3))
+        self.assertEqual(season_projection.get_match_points(1, 1), (1, 1))
+
+if __name__ == '__main__':
+    unittest.main()
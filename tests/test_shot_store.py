@@ -0,0 +1,84 @@
+from data import shot_store
+from tests.test_sim_context import build_connection, SEASON
+from unittest import mock
+import numpy as np
+import unittest
+
+RECORDS = [
+    {'game_id': 'g2', 'team_id': 'B', 'shooter_player_id': 'b1', 'pattern_of_play': 'Regular',
+     'shot_xg': 0.2, 'shot_psxg': 0.4, 'shot_order': 1, 'goal': 1, 'blocked': 0},
+    {'game_id': 'g1', 'team_id': 'A', 'shooter_player_id': 'a1', 'pattern_of_play': 'Penalty',
+     'shot_xg': 0.76, 'shot_psxg': 0.9, 'shot_order': 2, 'goal': 1, 'blocked': 0},
+    {'game_id': 'g1', 'team_id': 'A', 'shooter_player_id': 'a2', 'pattern_of_play': 'Regular',
+     'shot_xg': None, 'shot_psxg': None, 'shot_order': 1, 'goal': 0, 'blocked': None},
+    {'game_id': 'g1', 'team_id': 'A', 'shooter_player_id': 'a1', 'pattern_of_play': 'Regular',
+     'shot_xg': 0.1, 'shot_psxg': 0.3, 'shot_order': 3, 'goal': 0, 'blocked': 1},
+    {'game_id': 'g2', 'team_id': 'A', 'shooter_player_id': 'a2', 'pattern_of_play': 'Regular',
+     'shot_xg': 0.05, 'shot_psxg': 0.0, 'shot_order': 2, 'goal': 0, 'blocked': 0}
+]
+
+class TestShotStore(unittest.TestCase):
+    def setUp(self):
+        self.store = shot_store.ShotStore.from_records(SEASON, RECORDS)
+
+    def test_rows_sorted_and_interned(self):
+        """Test that rows are ordered by team, game and shot order with interned string columns."""
+        columns = self.store.columns
+        self.assertEqual(len(self.store), 5)
+        self.assertEqual([self.store.team_ids[idx] for idx in columns['team_index']], ['A', 'A', 'A', 'A', 'B'])
+        self.assertEqual([self.store.game_ids[idx] for idx in columns['game_index']], ['g1', 'g1', 'g1', 'g2', 'g2'])
+        self.assertEqual(columns['shot_order'].tolist(), [1, 2, 3, 2, 1])
+        self.assertEqual(columns['shot_xg'].dtype, np.float64)
+        self.assertEqual(columns['goal'].dtype, np.int8)
+        self.assertTrue(np.isnan(columns['shot_xg'][0]))
+
+    def test_team_and_game_columns_are_views(self):
+        """Test that per-team and per-game columns share memory with the store."""
+        team = self.store.get_team_columns('A')
+        game = self.store.get_game_columns('g1', 'A')
+        self.assertEqual(len(team['shot_xg']), 4)
+        self.assertEqual(len(game['shot_xg']), 3)
+        self.assertTrue(np.shares_memory(team['shot_xg'], self.store.columns['shot_xg']))
+        self.assertTrue(np.shares_memory(game['shooter_index'], self.store.columns['shooter_index']))
+        self.assertEqual(len(self.store.get_game_columns('g1', 'Z')['shot_xg']), 0)
+
+    def test_shot_arrays_with_exclusions(self):
+        """Test that excluding a shooter drops only their shots."""
+        xg, shooter_index, player_ids = self.store.get_shot_arrays('A', {'a2', 'unknown'})
+        self.assertEqual([player_ids[idx] for idx in shooter_index], ['a1', 'a1'])
+        self.assertEqual(xg.tolist(), [0.76, 0.1])
+        xg, _, _ = self.store.get_shot_arrays('A')
+        self.assertTrue(np.shares_memory(xg, self.store.columns['shot_xg']))
+
+    def test_aggregates(self):
+        """Test that season and per-game aggregates follow the SQL definitions."""
+        self.assertAlmostEqual(self.store.get_total_psxg('A'), 1.2)
+        self.assertAlmostEqual(self.store.get_avg_shots('A'), 2.0)
+        self.assertEqual(self.store.get_avg_shots('Z'), 0.0)
+        self.assertEqual(self.store.get_game_psxg('g1'), {'A': 1.2})
+        self.assertEqual(self.store.get_game_shot_counts('g2'), {'A': 1, 'B': 1})
+        self.assertEqual(self.store.get_game_shots_on_target('g1'), {'A': 1})
+        self.assertEqual(self.store.get_game_shots_on_target('g2'), {'B': 1})
+
+class TestLoadShotStore(unittest.TestCase):
+    def test_loads_one_season(self):
+        """Test that only the requested season's shots are loaded."""
+        store = shot_store.load_shot_store(SEASON, conn=build_connection())
+        self.assertEqual(len(store), 4)
+        self.assertEqual(store.team_ids, ['A', 'B'])
+        self.assertEqual(store.patterns, ['Regular', 'Penalty'])
+
+    def test_cached_per_generation(self):
+        """Test that stores are reused until the data generation changes."""
+        shot_store.clear_shot_store_cache()
+        with mock.patch.object(shot_store, 'load_shot_store', side_effect=lambda season: object()) as loader, \
+             mock.patch.object(shot_store, 'get_data_generation', return_value=1) as generation:
+            first = shot_store.get_shot_store(SEASON)
+            self.assertIs(shot_store.get_shot_store(SEASON), first)
+            generation.return_value = 2
+            self.assertIsNot(shot_store.get_shot_store(SEASON), first)
+            self.assertEqual(loader.call_count, 2)
+        shot_store.clear_shot_store_cache()
+
+if __name__ == '__main__':
+    unittest.main()
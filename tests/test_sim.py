@@ -0,0 +1,269 @@
+from concurrent.futures import ProcessPoolExecutor
+from data import sim
+from data.shot_store import ShotStore
+from data.sim_context import SimulationContext
+from itertools import combinations
+from unittest import mock
+import math
+import numpy as np
+import random
+import unittest
+
+HOME_ID = 'HOMEteam01'
+AWAY_ID = 'AWAYteam01'
+SEASON = 2024
+
+def _make_shots(team_id, prefix, n_shots, n_players, seed):
+    rnd = random.Random(seed)
+    return [
+        {
+            'game_id': f'game{i // 12:02d}',
+            'team_id': team_id,
+            'shot_order': i,
+            'shot_xg': None if i % 25 == 0 else round(rnd.random() ** 2 * 0.6, 2),
+            'shooter_player_id': f'{prefix}{i % n_players}'
+        }
+        for i in range(n_shots)
+    ]
+
+SHOTS = {
+    HOME_ID: _make_shots(HOME_ID, 'home_p', 300, 12, 1),
+    AWAY_ID: _make_shots(AWAY_ID, 'away_p', 260, 10, 2)
+}
+
+def build_context():
+    """Builds a SimulationContext from in-memory fixture data instead of nwsl.db."""
+    return SimulationContext(
+        season=SEASON,
+        shot_store=ShotStore.from_records(SEASON, SHOTS[HOME_ID] + SHOTS[AWAY_ID]),
+        avg_shots={HOME_ID: 12.5, AWAY_ID: 10.0},
+        xga_per_game={HOME_ID: 1.1, AWAY_ID: 1.5},
+        sapg_per_game={HOME_ID: 11.0, AWAY_ID: 14.0},
+        goalkeepers={
+            HOME_ID: {'xgoals_gk_faced': 30.0, 'goals_minus_xgoals_gk': -3.0},
+            AWAY_ID: {'xgoals_gk_faced': 28.0, 'goals_minus_xgoals_gk': 2.0}
+        },
+        league_avg_xga=1.3,
+        league_avg_sapg=12.5,
+        player_name_map={},
+        team_name_map={HOME_ID: 'Home FC', AWAY_ID: 'Away FC'},
+        team_abbreviation_map={HOME_ID: 'HOM', AWAY_ID: 'AWY'}
+    )
+
+def build_simulator(excluded_player_ids=None):
+    return sim.MatchSimulator(HOME_ID, AWAY_ID, SEASON, 1.05, 0.95, excluded_player_ids, context=build_context())
+
+class TestNumpyEngine(unittest.TestCase):
+    def test_fills_result_structures(self):
+        """Test that the NumPy engine populates the same tallies as the Python engine."""
+        n = 5000
+        simulator = build_simulator()
+        simulator.run_simulations(n, engine='numpy')
+
+        self.assertEqual(simulator.n_simulations, n)
+        self.assertEqual(sum(simulator.scorelines.values()), n)
+        self.assertEqual(sum(simulator.outcomes.values()), n)
+        self.assertEqual(len(simulator.goal_totals['home']), n)
+        self.assertEqual(len(simulator.goal_totals['away']), n)
+        self.assertEqual(sum(simulator.scorer_totals[HOME_ID].values()), sum(simulator.goal_totals['home']))
+        self.assertEqual(sum(simulator.scorer_totals[AWAY_ID].values()), sum(simulator.goal_totals['away']))
+        for (home_goals, away_goals), count in simulator.scorelines.items():
+            self.assertIsInstance(home_goals, int)
+            self.assertIsInstance(away_goals, int)
+            self.assertIsInstance(count, int)
+
+    def test_matches_python_engine(self):
+        """Test that both engines agree on outcome rates and average goals within sampling error."""
+        n = 20000
+        summaries = {}
+        for engine in sim.ENGINES:
+            simulator = build_simulator()
+            simulator.run_simulations(n, engine=engine)
+            summaries[engine] = simulator.get_summary()
+
+        for key in ['home_win_pct', 'draw_pct', 'away_win_pct']:
+            self.assertAlmostEqual(summaries['python'][key], summaries['numpy'][key], delta=0.02)
+        for key in ['avg_home_goals', 'avg_away_goals']:
+            self.assertAlmostEqual(summaries['python'][key], summaries['numpy'][key], delta=0.06)
+
+    def test_excluded_players_never_score(self):
+        """Test that excluded shooters are removed from the NumPy engine's shot arrays."""
+        excluded = {'home_p0', 'home_p1'}
+        simulator = build_simulator(excluded_player_ids=excluded)
+        simulator.run_simulations(2000, engine='numpy')
+        self.assertFalse(excluded & set(simulator.scorer_totals[HOME_ID]))
+
+    def test_invalid_engine_raises(self):
+        """Test that an unknown engine name raises a ValueError."""
+        simulator = build_simulator()
+        with self.assertRaises(ValueError):
+            simulator.run_simulations(10, engine='fortran')
+
+class TestSeededSimulations(unittest.TestCase):
+    def _run(self, engine, seed, workers=None, n=4000):
+        simulator = build_simulator()
+        simulator.run_simulations(n, engine=engine, seed=seed, workers=workers)
+        return simulator
+
+    def _assert_identical(self, first, second):
+        self.assertEqual(first.scorelines, second.scorelines)
+        self.assertEqual(first.outcomes, second.outcomes)
+        self.assertEqual(first.goal_totals, second.goal_totals)
+        self.assertEqual(first.scorer_totals, second.scorer_totals)
+
+    def test_numpy_serial_is_reproducible(self):
+        """Test that the same seed and N give bit-identical NumPy results."""
+        self._assert_identical(self._run('numpy', 7), self._run('numpy', 7))
+
+    def test_numpy_parallel_is_reproducible(self):
+        """Test that the same (seed, N, workers) give bit-identical results across process pools."""
+        first = self._run('numpy', 7, workers=2)
+        self._assert_identical(first, self._run('numpy', 7, workers=2))
+        self.assertEqual(sum(first.scorelines.values()), 4000)
+        self.assertEqual(len(first.goal_totals['home']), 4000)
+
+    def test_one_pool_per_run(self):
+        """Test that a multi-batch parallel run starts one process pool for all its batches."""
+        simulator = build_simulator()
+        with mock.patch.object(sim, 'ProcessPoolExecutor', side_effect=ProcessPoolExecutor) as pool:
+            simulator.run_simulations(4000, engine='numpy', seed=7, workers=2, batch_size=1000)
+        self.assertEqual(pool.call_count, 1)
+        self.assertEqual(simulator.batches, 4)
+        self.assertEqual(sum(simulator.scorelines.values()), 4000)
+
+    def test_python_engine_is_reproducible(self):
+        """Test that seeding also makes the Python engine reproducible."""
+        self._assert_identical(self._run('python', 7, n=500), self._run('python', 7, n=500))
+
+    def test_seed_does_not_persist(self):
+        """Test that a seeded Python run leaves the simulator's generator as it was."""
+        simulator = build_simulator()
+        unseeded = simulator.random
+        simulator.run_simulations(10, engine='python', seed=7)
+        self.assertIs(simulator.random, unseeded)
+
+    def test_different_seeds_differ(self):
+        """Test that different seeds produce different draws."""
+        self.assertNotEqual(self._run('numpy', 1).goal_totals, self._run('numpy', 2).goal_totals)
+
+    def test_workers_require_numpy_engine(self):
+        """Test that requesting workers with the Python engine raises a ValueError."""
+        with self.assertRaises(ValueError):
+            self._run('python', 1, workers=2)
+
+class TestConvergenceMode(unittest.TestCase):
+    def test_stops_once_precise(self):
+        """Test that a tolerance run stops early, within budget, with every interval inside tolerance."""
+        simulator = build_simulator()
+        simulator.run_simulations(1000000, engine='numpy', seed=4, tolerance=0.01, batch_size=2000)
+        summary = simulator.get_summary()
+        self.assertTrue(summary['converged'])
+        self.assertLess(summary['n_simulations'], 1000000)
+        self.assertEqual(summary['n_simulations'], summary['batches'] * 2000)
+        self.assertEqual(sum(simulator.outcomes.values()), summary['n_simulations'])
+        for key in ['home_win_pct', 'draw_pct', 'away_win_pct']:
+            self.assertLessEqual(summary['errors'][key], 0.01)
+        for key in ['avg_home_goals', 'avg_away_goals']:
+            self.assertLessEqual(summary['errors'][key], 0.01 * sim.GOALS_TOLERANCE_RATIO)
+
+    def test_budget_caps_run(self):
+        """Test that an unreachable tolerance stops at the maximum budget."""
+        simulator = build_simulator()
+        simulator.run_simulations(300, engine='python', seed=4, tolerance=0.0001, batch_size=100)
+        self.assertEqual(simulator.n_simulations, 300)
+        self.assertEqual(simulator.batches, 3)
+        self.assertFalse(simulator.converged)
+
+    def test_seeded_convergence_is_reproducible(self):
+        """Test that seeded convergence runs use the same batches and results."""
+        runs = []
+        for _ in range(2):
+            simulator = build_simulator()
+            simulator.run_simulations(100000, engine='numpy', seed=8, tolerance=0.01, batch_size=1000)
+            runs.append(simulator)
+        self.assertEqual(runs[0].batches, runs[1].batches)
+        self.assertEqual(runs[0].scorelines, runs[1].scorelines)
+
+    def test_errors_shrink_with_n(self):
+        """Test that reported errors match the binomial standard error and shrink as N grows."""
+        small, large = build_simulator(), build_simulator()
+        small.run_simulations(1000, engine='numpy', seed=1)
+        large.run_simulations(100000, engine='numpy', seed=1)
+        p = large.get_summary()['home_win_pct']
+        self.assertAlmostEqual(large.get_errors()['home_win_pct'], 1.96 * math.sqrt(p * (1 - p) / 100000), places=4)
+        for key, error in small.get_errors().items():
+            self.assertGreater(error, large.get_errors()[key])
+
+class TestSimulateGoalsBatch(unittest.TestCase):
+    def test_samples_without_replacement(self):
+        """Test that a single certain shot scores at most once per match."""
+        probs = np.array([1.0, 0.0, 0.0, 0.0])
+        goals, shot_goals = sim.simulate_goals_batch(np.random.default_rng(0), probs, 50.0, 1000)
+        self.assertTrue(np.array_equal(goals, np.ones(1000, dtype=np.int64)))
+        self.assertEqual(shot_goals.tolist(), [1000, 0, 0, 0])
+
+    def test_no_shots(self):
+        """Test that a team without shots never scores."""
+        goals, shot_goals = sim.simulate_goals_batch(np.random.default_rng(0), np.array([]), 12.0, 100)
+        self.assertEqual(goals.sum(), 0)
+        self.assertEqual(len(shot_goals), 0)
+
+class TestGetChunkSizes(unittest.TestCase):
+    def test_matches_array_split(self):
+        """Test that chunk sizes match np.array_split for even, uneven and oversized splits."""
+        for n, n_chunks in [(10, 2), (10, 3), (3, 5), (1000001, 7)]:
+            with self.subTest(n=n, n_chunks=n_chunks):
+                expected = [len(chunk) for chunk in np.array_split(np.arange(n), n_chunks)]
+                self.assertEqual(sim.get_chunk_sizes(n, n_chunks), expected)
+
+class TestExactDistribution(unittest.TestCase):
+    def test_shot_count_distribution_matches_sampling(self):
+        """Test that the shot-count pmf matches max(1, int(gauss)) capped at the shot total."""
+        pmf = sim.shot_count_distribution(3.2, 6)
+        self.assertAlmostEqual(pmf.sum(), 1.0)
+        rng = random.Random(5)
+        n = 200000
+        counts = np.bincount([min(max(1, int(rng.gauss(3.2, sim.SHOT_COUNT_SD))), 6) for _ in range(n)], minlength=7)
+        self.assertTrue(np.allclose(counts / n, pmf, atol=0.005))
+
+    def test_goal_distribution_matches_enumeration(self):
+        """Test the dynamic programme against brute-force enumeration of every shot subset."""
+        probs = np.array([0.1, 0.3, 0.6, 0.0, 0.45])
+        count_pmf = sim.shot_count_distribution(2.5, len(probs))
+        expected = np.zeros(len(probs) + 1)
+        for k, p_k in enumerate(count_pmf):
+            subsets = list(combinations(range(len(probs)), k))
+            for subset in subsets:
+                goals = np.ones(1)
+                for i in subset:
+                    goals = np.convolve(goals, [1 - probs[i], probs[i]])
+                expected[:len(goals)] += p_k * goals / len(subsets)
+        actual = sim.goal_count_distribution(probs, 2.5)
+        self.assertTrue(np.allclose(actual, expected[:len(actual)]))
+        self.assertAlmostEqual(expected[len(actual):].sum(), 0.0)
+
+    def test_matches_high_n_monte_carlo(self):
+        """Test that exact probabilities agree with a large seeded Monte Carlo run."""
+        n = 400000
+        simulator = build_simulator()
+        simulator.run_simulations(n, engine='numpy', seed=1)
+        sampled = simulator.get_summary()
+        exact = simulator.get_exact_summary()
+        for key in ['home_win_pct', 'draw_pct', 'away_win_pct']:
+            self.assertAlmostEqual(sampled[key], exact[key], delta=4 * math.sqrt(0.25 / n))
+        for key in ['avg_home_goals', 'avg_away_goals']:
+            self.assertAlmostEqual(sampled[key], exact[key], delta=0.01)
+
+        matrix = simulator.get_exact_scoreline_matrix()
+        self.assertAlmostEqual(matrix.sum(), 1.0)
+        for (h, a), count in simulator.scorelines.items():
+            p = matrix[h, a] if h < matrix.shape[0] and a < matrix.shape[1] else 0.0
+            self.assertAlmostEqual(count / n, p, delta=4 * math.sqrt(p * (1 - p) / n) + 1e-4)
+
+    def test_scoreline_distribution_is_sorted(self):
+        """Test that exact scorelines are ordered by probability."""
+        pcts = [entry['pct'] for entry in build_simulator().get_exact_scoreline_distribution()]
+        self.assertEqual(pcts, sorted(pcts, reverse=True))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+from data import sim, sim_cache
+from tests.test_sim import build_context, HOME_ID, AWAY_ID, SEASON
+from unittest import mock
+import os
+import tempfile
+import unittest
+
+def build_simulator(**kwargs):
+    return sim.MatchSimulator(**kwargs, context=build_context())
+
+class TestSimulationCache(unittest.TestCase):
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        cache = sim_cache.SimulationCache(max_entries=2)
+        cache.put('a', {'v': 1})
+        cache.put('b', {'v': 2})
+        cache.get('a')
+        cache.put('c', {'v': 3})
+        self.assertEqual(cache.get('a'), {'v': 1})
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), {'v': 3})
+
+    def test_ttl_expiry(self):
+        """Test that entries expire after the time-to-live."""
+        cache = sim_cache.SimulationCache(ttl_seconds=10)
+        with mock.patch.object(sim_cache.time, 'time', return_value=100.0) as clock:
+            cache.put('a', {'v': 1})
+            clock.return_value = 109.0
+            self.assertEqual(cache.get('a'), {'v': 1})
+            clock.return_value = 111.0
+            self.assertIsNone(cache.get('a'))
+
+    def test_persisted_across_instances(self):
+        """Test that results stored in the SQLite table are visible to a new cache."""
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, 'cache.db')
+            sim_cache.SimulationCache(db_path=db_path).put('a', {'summary': {'home_win_pct': 0.5}})
+            self.assertEqual(sim_cache.SimulationCache(db_path=db_path).get('a'), {'summary': {'home_win_pct': 0.5}})
+
+class TestCacheKey(unittest.TestCase):
+    def test_canonical(self):
+        """Test that equivalent inputs hash identically and different inputs do not."""
+        key = sim_cache.make_cache_key(HOME_ID, AWAY_ID, SEASON, 1.05, 0.95, ['p2', 'p1'], 1000, data_version=1)
+        self.assertEqual(key, sim_cache.make_cache_key(HOME_ID, AWAY_ID, SEASON, '1.05', 0.95, {'p1', 'p2'}, 1000, data_version=1))
+        self.assertNotEqual(key, sim_cache.make_cache_key(HOME_ID, AWAY_ID, SEASON, 1.05, 0.95, ['p1'], 1000, data_version=1))
+        self.assertNotEqual(key, sim_cache.make_cache_key(HOME_ID, AWAY_ID, SEASON, 1.05, 0.95, ['p1', 'p2'], 1000, data_version=2))
+
+class TestRunCachedSimulation(unittest.TestCase):
+    def _run(self, cache):
+        return sim_cache.run_cached_simulation(HOME_ID, AWAY_ID, SEASON, 1.05, 0.95, [], 2000, cache=cache)
+
+    def test_hits_skip_simulation(self):
+        """Test that a repeated request is served without building a simulator."""
+        cache = sim_cache.SimulationCache()
+        with mock.patch.object(sim_cache, 'MatchSimulator', side_effect=build_simulator) as simulator:
+            first = self._run(cache)
+            second = self._run(cache)
+        self.assertEqual(simulator.call_count, 1)
+        self.assertIs(first, second)
+        self.assertEqual(sum(entry['count'] for entry in first['scorelines']), 2000)
+
+    def test_results_consistent_with_seed(self):
+        """Test that a cache miss reproduces exactly what was cached before."""
+        with mock.patch.object(sim_cache, 'MatchSimulator', side_effect=build_simulator):
+            first = self._run(sim_cache.SimulationCache())
+            second = self._run(sim_cache.SimulationCache())
+        self.assertEqual(first, second)
+
+class TestGetExactResults(unittest.TestCase):
+    def test_exact_results(self):
+        """Test that exact results have the simulation result's shape, with probabilities summing to 1."""
+        with mock.patch.object(sim_cache, 'MatchSimulator', side_effect=build_simulator):
+            result = sim_cache.get_exact_results(HOME_ID, AWAY_ID, SEASON, 1.05, 0.95, [])
+        summary = result['summary']
+        self.assertAlmostEqual(summary['home_win_pct'] + summary['draw_pct'] + summary['away_win_pct'], 1.0)
+        self.assertAlmostEqual(sum(entry['pct'] for entry in result['scorelines']), 1.0, places=2)
+        self.assertEqual((result['home_scorers'], result['away_scorers']), ([], []))
+
+if __name__ == '__main__':
+    unittest.main()
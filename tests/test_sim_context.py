@@ -0,0 +1,104 @@
+from data import sim_context
+from unittest import mock
+import sqlite3
+import unittest
+
+SEASON = 2024
+
+def build_connection():
+    """Creates an in-memory database holding the tables the context loader reads."""
+    conn = sqlite3.connect(':memory:')
+    conn.executescript('''
+        CREATE TABLE game_shots (game_id TEXT, team_id TEXT, shooter_player_id TEXT, pattern_of_play TEXT, shot_xg REAL,
+                                 shot_psxg REAL, shot_location_x REAL, shot_location_y REAL, expanded_minute INTEGER,
+                                 shot_order INTEGER, goal INTEGER, blocked INTEGER, season INTEGER);
+        CREATE TABLE team_xgoals (team_id TEXT, xgoals_against REAL, shots_against INTEGER, count_games INTEGER, season INTEGER);
+        CREATE TABLE goalkeeper_xgoals (player_id TEXT, team_id TEXT, season INTEGER, minutes_played INTEGER,
+                                        xgoals_gk_faced REAL, goals_minus_xgoals_gk REAL);
+        CREATE TABLE player_info (player_id TEXT, player_name TEXT);
+        CREATE TABLE team_info (team_id TEXT, team_name TEXT, team_abbreviation TEXT);
+    ''')
+    conn.executemany('''
+        INSERT INTO game_shots (game_id, team_id, shooter_player_id, pattern_of_play, shot_xg, shot_psxg,
+                                shot_order, goal, blocked, season)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', [
+        ('g2', 'A', 'a1', 'Regular', 0.3, 0.5, 1, 1, 0, SEASON),
+        ('g1', 'A', 'a2', 'Penalty', 0.1, None, 2, 0, None, SEASON),
+        ('g1', 'A', 'a1', 'Regular', None, 0.2, 1, 0, 1, SEASON),
+        ('g1', 'B', 'b1', 'Regular', 0.2, 0.4, 3, 0, 0, SEASON),
+        ('g9', 'A', 'a1', 'Regular', 0.9, 0.9, 1, 1, 0, 2023)
+    ])
+    conn.executemany('INSERT INTO team_xgoals VALUES (?, ?, ?, ?, ?)', [
+        ('A', 10.0, 100, 10, SEASON),
+        ('B', 20.0, 140, 10, SEASON),
+        ('C', 5.0, 50, 0, SEASON)
+    ])
+    conn.executemany('INSERT INTO goalkeeper_xgoals VALUES (?, ?, ?, ?, ?, ?)', [
+        ('gk_backup', 'A', SEASON, 90, 2.0, 1.0),
+        ('gk_starter', 'A', SEASON, 900, 20.0, -2.0)
+    ])
+    conn.executemany('INSERT INTO player_info VALUES (?, ?)', [
+        ('gk_backup', 'Backup'), ('gk_starter', 'Starter'), ('a1', 'Attacker One')
+    ])
+    conn.executemany('INSERT INTO team_info VALUES (?, ?, ?)', [('A', 'Team A', 'TA'), ('B', 'Team B', 'TB')])
+    return conn
+
+class TestLoadSimulationContext(unittest.TestCase):
+    def setUp(self):
+        self.context = sim_context.load_simulation_context(SEASON, conn=build_connection())
+
+    def test_shots_grouped_and_ordered(self):
+        """Test that shots are grouped per team for the season, ordered by game and shot order."""
+        store = self.context.shot_store
+        shots = store.get_team_columns('A')
+        games = [store.game_ids[idx] for idx in shots['game_index']]
+        self.assertEqual(list(zip(games, shots['shot_order'].tolist())), [('g1', 1), ('g1', 2), ('g2', 1)])
+        self.assertEqual(len(store.get_team_columns('Z')['shot_order']), 0)
+
+    def test_team_modifiers(self):
+        """Test per-team averages and defensive modifiers."""
+        self.assertAlmostEqual(self.context.avg_shots['A'], 1.5)
+        self.assertAlmostEqual(self.context.xga_per_game['B'], 2.0)
+        self.assertAlmostEqual(self.context.sapg_per_game['A'], 10.0)
+        self.assertIsNone(self.context.xga_per_game['C'])
+
+    def test_league_averages(self):
+        """Test that league averages are totals divided by total games played."""
+        self.assertAlmostEqual(self.context.league_avg_xga, 35.0 / 20)
+        self.assertAlmostEqual(self.context.league_avg_sapg, 290 / 20)
+
+    def test_primary_goalkeeper(self):
+        """Test that the goalkeeper with the most minutes is selected per team."""
+        self.assertEqual(self.context.goalkeepers['A']['player_id'], 'gk_starter')
+        self.assertNotIn('B', self.context.goalkeepers)
+
+    def test_shot_arrays(self):
+        """Test that shot arrays keep missing xG as NaN and index interned shooter IDs."""
+        xg, shooter_index, shooter_ids = self.context.get_shot_arrays('A')
+        self.assertEqual([shooter_ids[idx] for idx in shooter_index], ['a1', 'a2', 'a1'])
+        self.assertTrue(xg[0] != xg[0])
+        self.assertIs(xg.base, self.context.shot_store.columns['shot_xg'])
+
+class TestGetSimulationContext(unittest.TestCase):
+    def setUp(self):
+        sim_context.clear_simulation_context_cache()
+
+    def tearDown(self):
+        sim_context.clear_simulation_context_cache()
+
+    def test_cached_per_generation(self):
+        """Test that contexts are reused until the data generation changes."""
+        with mock.patch.object(sim_context, 'load_simulation_context', side_effect=lambda season, shot_store: object()) as loader, \
+             mock.patch.object(sim_context, 'get_shot_store'), \
+             mock.patch.object(sim_context, 'get_data_generation', return_value=1) as generation:
+            first = sim_context.get_simulation_context(SEASON)
+            self.assertIs(sim_context.get_simulation_context(SEASON), first)
+            self.assertEqual(loader.call_count, 1)
+
+            generation.return_value = 2
+            self.assertIsNot(sim_context.get_simulation_context(SEASON), first)
+            self.assertEqual(loader.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
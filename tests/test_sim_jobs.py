@@ -0,0 +1,126 @@
+from data import sim, sim_cache, sim_jobs
+from tests.test_sim import build_context, HOME_ID, AWAY_ID, SEASON
+from unittest import mock
+import threading
+import unittest
+
+def build_simulator(**kwargs):
+    return sim.MatchSimulator(**kwargs, context=build_context())
+
+class TestSimulationJobManager(unittest.TestCase):
+    def setUp(self):
+        patches = [mock.patch.object(sim_cache, 'MatchSimulator', side_effect=build_simulator),
+                   mock.patch.object(sim_cache, 'get_data_generation', return_value=1)]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.cache = sim_cache.SimulationCache()
+        self.manager = sim_jobs.SimulationJobManager(max_workers=2, cache=self.cache)
+        self.addCleanup(self.manager.executor.shutdown)
+
+    def _submit(self, n=5 * sim.DEFAULT_BATCH_SIZE, seed=3, manager=None):
+        return (manager or self.manager).submit(HOME_ID, AWAY_ID, SEASON, 1.05, 0.95, [], n, seed=seed)
+
+    def _block_batches(self, block_at):
+        # Blocks the simulator's block_at-th batch until the returned event is set
+        release, reached = threading.Event(), threading.Event()
+        original = sim.simulate_chunk
+        calls = []
+
+        def blocking_chunk(*args):
+            calls.append(1)
+            if len(calls) >= block_at:
+                reached.set()
+                release.wait(10)
+            return original(*args)
+
+        patcher = mock.patch.object(sim, 'simulate_chunk', side_effect=blocking_chunk)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(release.set)
+        return release, reached
+
+    def test_job_completes(self):
+        """Test that a submitted job runs in the background and publishes final results."""
+        n = 5 * sim.DEFAULT_BATCH_SIZE
+        job_id = self._submit(n=n)
+        status = self.manager.wait(job_id, timeout=30)
+        self.assertEqual(status['status'], 'done')
+        self.assertEqual(status['completed'], n)
+        self.assertEqual(status['progress'], 1.0)
+        self.assertAlmostEqual(sum(status['estimates'][k] for k in ['home_win_pct', 'draw_pct', 'away_win_pct']), 1.0)
+
+        job = self.manager.get_job(job_id)
+        self.assertEqual(job.batches_done, 5)
+        self.assertEqual(sum(entry['count'] for entry in job.result['scorelines']), n)
+
+    def test_publishes_partial_tallies(self):
+        """Test that progress and interim estimates are visible between batches."""
+        release, reached = self._block_batches(3)
+        job_id = self._submit()
+        self.assertTrue(reached.wait(10))
+        status = self.manager.get_status(job_id)
+        self.assertEqual(status['status'], 'running')
+        self.assertEqual(status['completed'], 2 * sim.DEFAULT_BATCH_SIZE)
+        self.assertAlmostEqual(status['progress'], 0.4)
+        self.assertIsNotNone(status['estimates'])
+        release.set()
+        self.assertEqual(self.manager.wait(job_id, timeout=30)['status'], 'done')
+
+    def test_matches_synchronous_results(self):
+        """Test that a job gives the /simulation_results result for the same inputs and caches it under the same key."""
+        job_id = self._submit(seed=None)
+        self.manager.wait(job_id, timeout=30)
+        expected = sim_cache.run_cached_simulation(HOME_ID, AWAY_ID, SEASON, 1.05, 0.95, [], 5 * sim.DEFAULT_BATCH_SIZE,
+                                                   cache=sim_cache.SimulationCache())
+        self.assertEqual(self.manager.get_job(job_id).result, expected)
+
+        key = sim_cache.make_cache_key(HOME_ID, AWAY_ID, SEASON, 1.05, 0.95, [], 5 * sim.DEFAULT_BATCH_SIZE)
+        self.assertEqual(self.cache.get(key), expected)
+
+    def test_cached_job_completes_without_simulating(self):
+        """Test that a job for an already simulated request is served from the cache."""
+        self.manager.wait(self._submit(seed=9), timeout=30)
+        with mock.patch.object(sim_cache, 'MatchSimulator', side_effect=AssertionError('simulated')):
+            job_id = self._submit(seed=9)
+            status = self.manager.wait(job_id, timeout=30)
+        self.assertEqual(status['status'], 'done')
+        self.assertEqual(status['completed'], 5 * sim.DEFAULT_BATCH_SIZE)
+        self.assertIsNotNone(status['estimates'])
+
+    def test_tolerance_finishes_early(self):
+        """Test that a job with a tolerance stops before its budget once precise enough."""
+        job_id = self.manager.submit(HOME_ID, AWAY_ID, SEASON, 1.05, 0.95, [], 1000000, seed=2, tolerance=0.02)
+        status = self.manager.wait(job_id, timeout=30)
+        self.assertEqual(status['status'], 'done')
+        self.assertEqual(status['progress'], 1.0)
+        self.assertLess(status['completed'], 1000000)
+        self.assertLessEqual(status['estimates']['errors']['home_win_pct'], 0.02)
+
+    def test_failed_job_reports_error(self):
+        """Test that an exception inside a job marks it failed with the error message."""
+        with mock.patch.object(sim_cache, 'MatchSimulator', side_effect=RuntimeError('boom')):
+            job_id = self._submit()
+            status = self.manager.wait(job_id, timeout=30)
+        self.assertEqual(status['status'], 'failed')
+        self.assertEqual(status['error'], 'boom')
+
+    def test_full_queue_rejects_submissions(self):
+        """Test that submissions beyond max_pending queued or running jobs return None until one finishes."""
+        manager = sim_jobs.SimulationJobManager(max_workers=1, max_pending=2, cache=self.cache)
+        self.addCleanup(manager.executor.shutdown)
+        release, _ = self._block_batches(1)
+        first = self._submit(n=1000, seed=1, manager=manager)
+        second = self._submit(n=1000, seed=2, manager=manager)
+        self.assertIsNone(self._submit(n=1000, seed=3, manager=manager))
+        release.set()
+        manager.wait(first, timeout=30)
+        manager.wait(second, timeout=30)
+        self.assertIsNotNone(self._submit(n=1000, seed=4, manager=manager))
+
+    def test_unknown_job(self):
+        """Test that unknown job IDs return None."""
+        self.assertIsNone(self.manager.get_status('missing'))
+
+if __name__ == '__main__':
+    unittest.main()
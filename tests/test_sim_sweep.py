@@ -0,0 +1,69 @@
+from data import sim_sweep
+from tests.test_sim import build_context, build_simulator, HOME_ID, AWAY_ID, SEASON
+import numpy as np
+import unittest
+
+def build_sweep(scenarios, excluded_player_ids=None):
+    return sim_sweep.ExclusionSweep(HOME_ID, AWAY_ID, SEASON, 1.05, 0.95, scenarios,
+                                    excluded_player_ids=excluded_player_ids, context=build_context())
+
+class TestExclusionSweep(unittest.TestCase):
+    def test_empty_scenario_matches_baseline(self):
+        """Test that a scenario excluding nobody reproduces the baseline draw for draw."""
+        sweep = build_sweep([[], ['unknown_player']])
+        sweep.run_sweep(2000, seed=1)
+        for scenario in sweep.get_results()['scenarios']:
+            self.assertTrue(all(delta == 0 for delta in scenario['deltas'].values()))
+            self.assertTrue(all(error == 0 for error in scenario['errors'].values()))
+
+    def test_other_side_unchanged(self):
+        """Test that excluding a home player leaves every away goal draw untouched."""
+        sweep = build_sweep([['home_p0']])
+        sweep.run_sweep(2000, seed=2)
+        self.assertTrue(np.array_equal(sweep.away_goals[0], sweep.away_goals[1]))
+        self.assertFalse(np.array_equal(sweep.home_goals[0], sweep.home_goals[1]))
+
+    def test_scenario_matches_exact_distribution(self):
+        """Test that each scenario's outcome rates match the exact distribution for its exclusions."""
+        n = 40000
+        sweep = build_sweep([['home_p0', 'home_p1'], ['away_p3']])
+        sweep.run_sweep(n, seed=3)
+        results = sweep.get_results()
+        expected = [build_simulator(excluded).get_exact_summary() for excluded in [None, ['home_p0', 'home_p1'], ['away_p3']]]
+        observed = [results['baseline']] + [scenario['summary'] for scenario in results['scenarios']]
+        for exact, summary in zip(expected, observed):
+            for key in ['home_win_pct', 'draw_pct', 'away_win_pct']:
+                self.assertAlmostEqual(summary[key], exact[key], delta=0.015)
+
+    def test_paired_errors_are_smaller(self):
+        """Test that common random numbers give delta errors well below those of independent runs."""
+        n = 10000
+        sweep = build_sweep([['home_p0']])
+        sweep.run_sweep(n, seed=4)
+        scenario = sweep.get_results()['scenarios'][0]
+        p = scenario['summary']['home_win_pct']
+        independent_error = 1.96 * np.sqrt(2 * p * (1 - p) / n)
+        self.assertLess(scenario['errors']['home_win_pct'], independent_error / 2)
+
+    def test_reproducible_with_seed(self):
+        """Test that the same seed gives identical sweep results."""
+        first = build_sweep([['home_p0'], ['away_p1']])
+        first.run_sweep(1000, seed=5)
+        second = build_sweep([['home_p0'], ['away_p1']])
+        second.run_sweep(1000, seed=5)
+        self.assertEqual(first.get_results(), second.get_results())
+
+    def test_shooter_scenarios(self):
+        """Test that shooter scenarios cover each team's shooters by descending xG, skipping exclusions."""
+        context = build_context()
+        scenarios = sim_sweep.get_shooter_scenarios(context, [HOME_ID], excluded_player_ids={'home_p0'})
+        self.assertEqual(len(scenarios), 11)
+        self.assertNotIn(['home_p0'], scenarios)
+        xg, shooter_index, player_ids = context.get_shot_arrays(HOME_ID)
+        totals = {player_ids[idx]: np.nansum(xg[shooter_index == idx]) for idx in set(shooter_index.tolist())}
+        self.assertEqual([totals[scenario[0]] for scenario in scenarios],
+                         sorted((totals[scenario[0]] for scenario in scenarios), reverse=True))
+        self.assertEqual(len(sim_sweep.get_shooter_scenarios(context, [HOME_ID, AWAY_ID], limit=2)), 4)
+
+if __name__ == '__main__':
+    unittest.main()